@@ -0,0 +1,130 @@
+"""
+Admin Dashboard Summary Service for BD Padel League
+Counters for the admin home computed in one round trip, independent of how
+many teams, challenges and matches exist, plus pagination for the long
+lists on the admin tabs.
+
+All ladder counters come from a single UNION ALL of grouped selects
+(GROUP BY ladder_type, status), returned as {metric: {ladder_type: {status: count}}}.
+"""
+
+from collections import defaultdict
+
+from sqlalchemy import func, literal, null, select, union_all
+
+from models import db, LadderTeam, LadderChallenge, LadderMatch
+
+LADDER_TYPES = ["men", "women", "mixed"]
+ACTIVE_CHALLENGE_STATUSES = ["pending_acceptance", "accepted"]
+PENDING_MATCH_STATUSES = ["pending", "pending_scores", "pending_opponent_score"]
+
+HISTORY_PER_PAGE = 25
+TEAMS_PER_PAGE = 25
+FREE_AGENTS_PER_PAGE = 25
+TOURNAMENTS_PER_PAGE = 12
+
+
+def get_ladder_status_counts():
+    """
+    Grouped ladder counts in one query.
+    Returns: {metric: {ladder_type: {status: count}}} where metric is one of
+        "teams"      - ladder teams by gender (status None)
+        "holiday"    - teams in holiday mode by ladder_type (status None)
+        "challenges" - challenges by challenger's ladder_type and status
+        "matches"    - ladder matches by team A's ladder_type and status
+        "disputed"   - disputed ladder matches (ladder_type and status None)
+    """
+    teams = select(
+        literal("teams").label("metric"),
+        LadderTeam.gender.label("ladder_type"),
+        null().label("status"),
+        func.count().label("total"),
+    ).group_by(LadderTeam.gender)
+
+    holiday = select(
+        literal("holiday").label("metric"),
+        LadderTeam.ladder_type.label("ladder_type"),
+        null().label("status"),
+        func.count().label("total"),
+    ).where(LadderTeam.holiday_mode_active == True).group_by(LadderTeam.ladder_type)
+
+    challenges = select(
+        literal("challenges").label("metric"),
+        LadderTeam.ladder_type.label("ladder_type"),
+        LadderChallenge.status.label("status"),
+        func.count().label("total"),
+    ).join(
+        LadderTeam, LadderChallenge.challenger_team_id == LadderTeam.id
+    ).group_by(LadderTeam.ladder_type, LadderChallenge.status)
+
+    # Outer join so matches are counted by status even if team A is gone
+    matches = select(
+        literal("matches").label("metric"),
+        LadderTeam.ladder_type.label("ladder_type"),
+        LadderMatch.status.label("status"),
+        func.count().label("total"),
+    ).select_from(LadderMatch).outerjoin(
+        LadderTeam, LadderMatch.team_a_id == LadderTeam.id
+    ).group_by(LadderTeam.ladder_type, LadderMatch.status)
+
+    disputed = select(
+        literal("disputed").label("metric"),
+        null().label("ladder_type"),
+        null().label("status"),
+        func.count().label("total"),
+    ).select_from(LadderMatch).where(LadderMatch.disputed == True)
+
+    counts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+    for metric, ladder_type, status, total in db.session.execute(
+        union_all(teams, holiday, challenges, matches, disputed)
+    ).all():
+        counts[metric][ladder_type][status] += total
+    return counts
+
+
+def get_ladder_counters():
+    """
+    Ladder counters for the admin home, keyed by the names admin.html uses
+    (men_teams_count, women_active_challenges, mixed_pending_matches, ...).
+    """
+    counts = get_ladder_status_counts()
+
+    counters = {}
+    for ladder_type in LADDER_TYPES:
+        challenges = counts["challenges"][ladder_type]
+        matches = counts["matches"][ladder_type]
+        counters[f"{ladder_type}_teams_count"] = counts["teams"][ladder_type][None]
+        counters[f"{ladder_type}_active_challenges"] = sum(
+            challenges[status] for status in ACTIVE_CHALLENGE_STATUSES
+        )
+        counters[f"{ladder_type}_pending_matches"] = sum(
+            matches[status] for status in PENDING_MATCH_STATUSES
+        )
+        counters[f"{ladder_type}_on_holiday_count"] = counts["holiday"][ladder_type][None]
+
+    counters["no_show_reports_count"] = sum(
+        by_status["no_show_reported"] for by_status in counts["matches"].values()
+    )
+    counters["disputed_matches_count"] = counts["disputed"][None][None]
+    return counters
+
+
+def get_pending_payments():
+    """Unpaid ladder teams for every division in one query, newest first"""
+    pending = {ladder_type: [] for ladder_type in LADDER_TYPES}
+    teams = LadderTeam.query.filter_by(
+        payment_received=False
+    ).order_by(LadderTeam.created_at.desc()).all()
+    for team in teams:
+        if team.gender in pending:
+            pending[team.gender].append(team)
+    return pending
+
+
+def paginate(query, page, per_page=HISTORY_PER_PAGE):
+    """Flask-SQLAlchemy pagination that clamps bad page numbers instead of 404ing"""
+    page = page if page and page > 0 else 1
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    if pagination.pages and page > pagination.pages:
+        pagination = query.paginate(page=pagination.pages, per_page=per_page, error_out=False)
+    return pagination
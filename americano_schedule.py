@@ -0,0 +1,131 @@
+"""
+Americano Schedule Read Model for BD Padel League
+The round-by-court structure behind the public schedule, the admin court
+schedule and the JSON feed polled by courtside clients.
+
+A tournament's schedule is built with two queries - its matches, then every
+participant in one IN query - into plain snapshots (no ORM objects, so they can
+be shared across requests), and cached per process until the schedule's data
+version changes (see data_versions.py), so a score entered on any worker is
+served by every worker on its next poll.
+"""
+
+import hashlib
+import json
+from collections import namedtuple
+
+from models import db, AmericanoMatch, LadderFreeAgent
+from americano_scheduler import build_timetable
+from data_versions import VersionedCache
+
+ScheduledMatch = namedtuple("ScheduledMatch", [
+    "id", "round_number", "court_number",
+    "player1_id", "player2_id", "player3_id", "player4_id",
+    "status", "score_team_a", "score_team_b",
+])
+ScheduledPlayer = namedtuple("ScheduledPlayer", ["id", "name"])
+
+_schedule_cache = VersionedCache("americano_schedule")
+
+
+def _current_round(matches_by_round):
+    """First round with an unfinished match (one past the last round when all are done)"""
+    current_round = 1
+    for round_num in sorted(matches_by_round.keys()):
+        round_complete = all(
+            m['match'].status == 'completed'
+            for court_matches in matches_by_round[round_num].values()
+            for m in court_matches
+        )
+        if not round_complete:
+            return round_num
+        current_round = round_num + 1
+    return current_round
+
+
+def _compact(tournament, matches, players, current_round):
+    """JSON payload for polling clients: players listed once, matches as short rows"""
+    return {
+        'tournament_id': tournament.id,
+        'status': tournament.status,
+        'current_round': current_round,
+        'total_rounds': tournament.total_rounds,
+        'players': {str(p.id): p.name for p in players.values()},
+        # [match id, round, court, [p1, p2, p3, p4], status, score A, score B]
+        'matches': [
+            [m.id, m.round_number, m.court_number or 1,
+             [m.player1_id, m.player2_id, m.player3_id, m.player4_id],
+             m.status, m.score_team_a, m.score_team_b]
+            for m in matches
+        ],
+    }
+
+
+def build_schedule_view(tournament):
+    """
+    Load and assemble a tournament's schedule (two queries).
+    Returns None if no matches have been generated, otherwise:
+        {
+            'matches_by_round': {round: {court: [{'match', 'p1', 'p2', 'p3', 'p4'}]}},
+            'current_round': first round still in play,
+            'participants': players in the schedule, by name,
+            'timetable': court/time-slot grid (americano_scheduler.build_timetable),
+            'compact': JSON payload for polling clients,
+            'version': content hash of the compact payload (used as the ETag),
+        }
+    """
+    rows = db.session.query(
+        AmericanoMatch.id, AmericanoMatch.round_number, AmericanoMatch.court_number,
+        AmericanoMatch.player1_id, AmericanoMatch.player2_id,
+        AmericanoMatch.player3_id, AmericanoMatch.player4_id,
+        AmericanoMatch.status, AmericanoMatch.score_team_a, AmericanoMatch.score_team_b
+    ).filter(
+        AmericanoMatch.tournament_id == tournament.id
+    ).order_by(
+        AmericanoMatch.round_number, AmericanoMatch.court_number, AmericanoMatch.id
+    ).all()
+    if not rows:
+        return None
+    matches = [ScheduledMatch(*row) for row in rows]
+
+    player_ids = {pid for m in matches for pid in (m.player1_id, m.player2_id, m.player3_id, m.player4_id)}
+    players = {
+        row.id: ScheduledPlayer(row.id, row.name)
+        for row in db.session.query(LadderFreeAgent.id, LadderFreeAgent.name).filter(
+            LadderFreeAgent.id.in_(player_ids)
+        )
+    }
+
+    matches_by_round = {}
+    for m in matches:
+        matches_by_round.setdefault(m.round_number, {}).setdefault(m.court_number or 1, []).append({
+            'match': m,
+            'p1': players.get(m.player1_id),
+            'p2': players.get(m.player2_id),
+            'p3': players.get(m.player3_id),
+            'p4': players.get(m.player4_id),
+        })
+
+    current_round = _current_round(matches_by_round)
+    compact = _compact(tournament, matches, players, current_round)
+    return {
+        'matches_by_round': matches_by_round,
+        'current_round': current_round,
+        'participants': sorted(players.values(), key=lambda p: (p.name or '').lower()),
+        'timetable': build_timetable(
+            [m for courts in matches_by_round.values() for court_matches in courts.values() for m in court_matches],
+            tournament.num_courts or 2,
+            tournament.time_limit_minutes,
+            start=tournament.tournament_date,
+            match_of=lambda match_data: match_data['match']
+        ),
+        'compact': compact,
+        'version': hashlib.sha1(
+            json.dumps(compact, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16],
+    }
+
+
+def get_schedule_view(tournament):
+    """build_schedule_view through the per-process cache"""
+    return _schedule_cache.get(tournament.id, lambda: build_schedule_view(tournament))
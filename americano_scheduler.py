@@ -0,0 +1,465 @@
+"""
+Americano Scheduler for BD Padel League
+Builds Americano rounds (2v2 matches with rotating partners) that spread partners
+and opponents as evenly as possible and share sit-outs fairly.
+
+How a schedule is built:
+0. Whist tables: 8, 9, 12, 13, 16, 17, 20 and 24 players get a whist tournament -
+   everyone partners everyone else once and opposes them exactly twice (4k+1
+   fields sit out once each). It is developed from one base round and is already
+   optimal, so no search runs.
+1. Partners: other 4k and 4k+1 fields take their partnerships from a round-robin
+   table (circle method, with a bye seat for an odd field), so everyone partners
+   everyone else exactly once and the 4k+1 field sits out exactly once each.
+   Other sizes bench the players who have sat out least each round (sit-out
+   counts never differ by more than one) and pair least-met partners greedily.
+2. Opponents: each round's pairs are matched against the pairs they have met least.
+3. Local search: simulated annealing swaps players (or, with table partners, whole
+   pairs) between matches of the same round to lower the cost - the sum of squared
+   partner/opponent meeting counts, partners weighted heavier - and keeps the best
+   schedule seen within the time budget. It stops early at the theoretical floor.
+   Whole-pair swaps can't reach the floor from a circle-method table, which is
+   why the common sizes use whist tables instead.
+
+Moves never bench or un-bench a player, so sit-out balance from step 1 holds.
+32+ players schedule within the default half-second budget.
+
+Court timetable: matches are packed into time slots of `num_courts` courts, which
+become the rounds that are actually played - see assign_courts.
+"""
+
+import itertools
+import math
+import random
+import time
+from datetime import timedelta
+
+PARTNER_WEIGHT = 4
+OPPONENT_WEIGHT = 1
+
+DEFAULT_TIME_BUDGET = 0.5
+START_TEMPERATURE = 2.0
+
+CHANGEOVER_MINUTES = 5  # between the end of one slot and the start of the next
+
+
+def default_num_rounds(num_players):
+    """Standard Americano length: n-1 rounds for an even field, n for an odd one"""
+    return num_players - 1 if num_players % 2 == 0 else num_players
+
+
+class _Counts:
+    """Partner/opponent meeting counts between player indexes"""
+
+    def __init__(self, n):
+        self.partner = [[0] * n for _ in range(n)]
+        self.opponent = [[0] * n for _ in range(n)]
+
+    def match_cost(self, a, b, c, d):
+        """Cost of adding match (a+b vs c+d) to the current counts"""
+        partner, opponent = self.partner, self.opponent
+        return (
+            PARTNER_WEIGHT * (2 * partner[a][b] + 1 + 2 * partner[c][d] + 1)
+            + OPPONENT_WEIGHT * (
+                2 * opponent[a][c] + 1 + 2 * opponent[a][d] + 1
+                + 2 * opponent[b][c] + 1 + 2 * opponent[b][d] + 1
+            )
+        )
+
+    def total_cost(self):
+        """Weighted sum of squared partner/opponent counts over all pairs"""
+        n = len(self.partner)
+        return sum(
+            PARTNER_WEIGHT * self.partner[x][y] ** 2 + OPPONENT_WEIGHT * self.opponent[x][y] ** 2
+            for x in range(n) for y in range(x + 1, n)
+        )
+
+    def apply(self, a, b, c, d, delta):
+        """Add (delta=1) or remove (delta=-1) one match from the counts"""
+        partner, opponent = self.partner, self.opponent
+        partner[a][b] += delta
+        partner[b][a] += delta
+        partner[c][d] += delta
+        partner[d][c] += delta
+        for x in (a, b):
+            for y in (c, d):
+                opponent[x][y] += delta
+                opponent[y][x] += delta
+
+
+# players -> (group, base round). Adding each group element to every point of the
+# base round gives one round; None is a fixed extra point (4k players). The
+# differences within partners cover the group once and within opponents twice.
+_WHIST_BASE_ROUNDS = {
+    8: ((7,), [(5, 0, 6, 2), (1, None, 4, 3)]),
+    9: ((3, 3), [((0, 1), (0, 2), (1, 0), (2, 0)), ((1, 1), (2, 2), (1, 2), (2, 1))]),
+    12: ((11,), [(1, None, 10, 6), (7, 2, 3, 4), (0, 9, 8, 5)]),
+    13: ((13,), [(11, 5, 12, 9), (6, 8, 3, 4), (2, 7, 1, 10)]),
+    16: ((15,), [(5, 12, 3, 0), (6, None, 14, 10), (8, 9, 7, 13), (11, 1, 4, 2)]),
+    17: ((17,), [(12, 13, 10, 5), (2, 16, 15, 8), (9, 1, 14, 3), (6, 4, 7, 11)]),
+    20: ((19,), [(13, 10, 15, 11), (0, 9, 6, 18), (17, 3, None, 7), (12, 1, 4, 5), (2, 8, 16, 14)]),
+    24: ((23,), [(22, 15, 9, 4), (2, 13, 0, 21), (18, 3, 17, 20), (None, 14, 11, 10),
+                 (16, 6, 7, 1), (8, 12, 5, 19)]),
+}
+
+
+def _whist_rounds(n, rng):
+    """Whist tournament for n players as rounds of player-index slots, or None"""
+    if n not in _WHIST_BASE_ROUNDS:
+        return None
+    moduli, base_round = _WHIST_BASE_ROUNDS[n]
+    elements = list(itertools.product(*(range(m) for m in moduli)))
+    labels = list(range(n))
+    rng.shuffle(labels)
+    label = dict(zip(elements + [None], labels))
+
+    def shift(point, element):
+        if point is None:
+            return None
+        point = point if isinstance(point, tuple) else (point,)
+        return tuple((p + e) % m for p, e, m in zip(point, element, moduli))
+
+    rounds = [
+        [label[shift(point, element)] for match in base_round for point in match]
+        for element in elements
+    ]
+    rng.shuffle(rounds)
+    return rounds
+
+
+def _round_robin_pairs(n, num_rounds, rng):
+    """
+    Partnerships per round from the circle method: seat 0 stays put while the
+    others rotate, so no partnership repeats within n-1 (even) or n (odd) rounds.
+    For an odd field the extra seat is a bye and whoever draws it sits out.
+    """
+    seats = list(range(n))
+    rng.shuffle(seats)
+    if n % 2:
+        seats.append(None)
+    size = len(seats)
+
+    rounds = []
+    for _ in range(num_rounds):
+        pairs = [(seats[k], seats[size - 1 - k]) for k in range(size // 2)]
+        rounds.append([pair for pair in pairs if None not in pair])
+        seats = [seats[0], seats[-1]] + seats[1:-1]
+    return rounds
+
+
+def _pick_sit_outs(n, sit_outs, sit_count, last_sat, round_num, rng):
+    """Bench the players who have sat out least, spreading repeats apart"""
+    if not sit_outs:
+        return set()
+    order = list(range(n))
+    rng.shuffle(order)
+    order.sort(key=lambda p: (sit_count[p], last_sat[p]))
+    benched = set(order[:sit_outs])
+    for p in benched:
+        sit_count[p] += 1
+        last_sat[p] = round_num
+    return benched
+
+
+def _greedy_pairs(players, counts, rng):
+    """Pair each player with the partner they have played with least"""
+    remaining = list(players)
+    rng.shuffle(remaining)
+    pairs = []
+    while remaining:
+        a = remaining.pop()
+        b = min(remaining, key=lambda p: counts.partner[a][p])
+        remaining.remove(b)
+        pairs.append((a, b))
+    return pairs
+
+
+def _match_pairs(pairs, counts, rng):
+    """Match pairs against least-met opponents; returns the round as a flat slot list"""
+    pairs = list(pairs)
+    rng.shuffle(pairs)
+    slots = []
+    while pairs:
+        a, b = pairs.pop()
+        c, d = min(pairs, key=lambda pair: counts.match_cost(a, b, pair[0], pair[1]))
+        pairs.remove((c, d))
+        slots += [a, b, c, d]
+        counts.apply(a, b, c, d, 1)
+    return slots
+
+
+def _swap(round_slots, i, j, counts):
+    """
+    Swap slots i and j of a round, keeping the counts in step.
+    Matches in a round share no players, so only the touched matches change.
+    Returns the change in schedule cost; swapping again undoes the move.
+    """
+    matches = {i // 4, j // 4}
+    for m in matches:
+        counts.apply(*round_slots[4 * m:4 * m + 4], -1)
+    before = sum(counts.match_cost(*round_slots[4 * m:4 * m + 4]) for m in matches)
+    round_slots[i], round_slots[j] = round_slots[j], round_slots[i]
+    after = sum(counts.match_cost(*round_slots[4 * m:4 * m + 4]) for m in matches)
+    for m in matches:
+        counts.apply(*round_slots[4 * m:4 * m + 4], 1)
+    return after - before
+
+
+def _random_move(slots_per_round, fixed_partners, rng):
+    """Slot swaps for one move: single players, or whole pairs between matches"""
+    if fixed_partners:
+        p, q = rng.sample(range(slots_per_round // 2), 2)
+        if p // 2 == q // 2:
+            return []  # both pairs in one match: nothing changes
+        return [(2 * p, 2 * q), (2 * p + 1, 2 * q + 1)]
+    i, j = rng.sample(range(slots_per_round), 2)
+    if i // 2 == j // 2:
+        return []  # same pair: nothing changes
+    return [(i, j)]
+
+
+def _spread_cost(meetings, pairs):
+    """Lowest sum of squared counts when `meetings` are spread over `pairs`"""
+    base, extra = divmod(meetings, pairs)
+    return (pairs - extra) * base * base + extra * (base + 1) * (base + 1)
+
+
+def build_americano_schedule(player_ids, num_rounds=None, seed=None,
+                             time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Build an Americano schedule.
+
+    Args:
+        player_ids: participant IDs (LadderFreeAgent IDs)
+        num_rounds: rounds to play (default: n-1 for even n, n for odd n)
+        seed: seed for reproducible schedules (e.g. the tournament ID)
+        time_budget: seconds the local search may spend improving the schedule
+
+    Returns:
+        List of rounds, each a list of (p1, p2, p3, p4) tuples where
+        Team A = p1 + p2 and Team B = p3 + p4. Sitting-out players are absent.
+    """
+    players = list(player_ids)
+    n = len(players)
+    if n < 4:
+        return []
+
+    rng = random.Random(seed)
+    num_rounds = num_rounds or default_num_rounds(n)
+    counts = _Counts(n)
+    rounds = []
+
+    fixed_partners = n % 4 in (0, 1) and num_rounds <= default_num_rounds(n)
+    whist_rounds = _whist_rounds(n, rng) if fixed_partners else None
+    if whist_rounds:
+        for round_slots in whist_rounds[:num_rounds]:
+            for k in range(0, len(round_slots), 4):
+                counts.apply(*round_slots[k:k + 4], 1)
+            rounds.append(round_slots)
+    elif fixed_partners:
+        for pairs in _round_robin_pairs(n, num_rounds, rng):
+            rounds.append(_match_pairs(pairs, counts, rng))
+    else:
+        sit_count = [0] * n
+        last_sat = [-1] * n
+        for round_num in range(num_rounds):
+            benched = _pick_sit_outs(n, n % 4, sit_count, last_sat, round_num, rng)
+            playing = [p for p in range(n) if p not in benched]
+            rounds.append(_match_pairs(_greedy_pairs(playing, counts, rng), counts, rng))
+
+    # Simulated annealing, cooling linearly over the time budget
+    slots_per_round = len(rounds[0])
+    matches_played = num_rounds * slots_per_round // 4
+    pairs = n * (n - 1) // 2
+    cost = counts.total_cost()
+    floor = (PARTNER_WEIGHT * _spread_cost(2 * matches_played, pairs)
+             + OPPONENT_WEIGHT * _spread_cost(4 * matches_played, pairs))
+    best_cost, best = cost, [list(r) for r in rounds]
+
+    if slots_per_round > 4 or not fixed_partners:
+        started = time.perf_counter()
+        temperature = START_TEMPERATURE
+        iteration = 0
+        while best_cost > floor:
+            iteration += 1
+            if iteration % 256 == 0:
+                elapsed = time.perf_counter() - started
+                if elapsed >= time_budget:
+                    break
+                temperature = START_TEMPERATURE * (1 - elapsed / time_budget)
+
+            round_slots = rounds[rng.randrange(num_rounds)]
+            move = _random_move(slots_per_round, fixed_partners, rng)
+            if not move:
+                continue
+            delta = sum(_swap(round_slots, i, j, counts) for i, j in move)
+            if delta <= 0 or rng.random() < math.exp(-delta / max(temperature, 1e-3)):
+                cost += delta
+                if cost < best_cost:
+                    best_cost, best = cost, [list(r) for r in rounds]
+            else:
+                for i, j in reversed(move):
+                    _swap(round_slots, i, j, counts)
+
+    return [
+        [
+            tuple(players[p] for p in round_slots[k:k + 4])
+            for k in range(0, len(round_slots), 4)
+        ]
+        for round_slots in best
+    ]
+
+
+def schedule_summary(rounds, player_ids):
+    """
+    Fairness figures for a schedule: games and sit-outs per player plus the
+    worst partner and opponent repeat counts.
+    """
+    games = {p: 0 for p in player_ids}
+    partners = {}
+    opponents = {}
+    for round_matches in rounds:
+        for a, b, c, d in round_matches:
+            for p in (a, b, c, d):
+                games[p] += 1
+            for pair in ((a, b), (c, d)):
+                key = frozenset(pair)
+                partners[key] = partners.get(key, 0) + 1
+            for x in (a, b):
+                for y in (c, d):
+                    key = frozenset((x, y))
+                    opponents[key] = opponents.get(key, 0) + 1
+
+    return {
+        'games': games,
+        'sit_outs': {p: len(rounds) - g for p, g in games.items()},
+        'max_partner_repeats': max(partners.values(), default=0),
+        'max_opponent_repeats': max(opponents.values(), default=0),
+    }
+
+
+# ============================================================================
+# COURT TIMETABLE
+# ============================================================================
+
+def _match_players(match):
+    """Player IDs of a stored AmericanoMatch"""
+    return (match.player1_id, match.player2_id, match.player3_id, match.player4_id)
+
+
+def assign_courts(rounds, num_courts, players=tuple):
+    """
+    Pack scheduled rounds into court time slots.
+
+    Every slot takes up to `num_courts` matches with no player in two of them,
+    earliest round first, so a round with more matches than courts spills into
+    the next slot and later matches fill courts that would otherwise sit idle.
+
+    Args:
+        rounds: list of rounds, each a list of matches (e.g. the output of
+                build_americano_schedule)
+        num_courts: courts available at once
+        players: returns the player IDs of a match (default: the match tuple itself)
+
+    Returns:
+        List of slots, each a list of matches; court N plays the Nth match.
+    """
+    num_courts = max(1, num_courts or 1)
+    pending = [match for round_matches in rounds for match in round_matches]
+    slots = []
+    while pending:
+        busy = set()
+        slot = []
+        for match in pending:
+            match_players = set(players(match))
+            if busy.isdisjoint(match_players):
+                slot.append(match)
+                busy |= match_players
+                if len(slot) == num_courts:
+                    break
+        for match in slot:
+            pending.remove(match)
+        slots.append(slot)
+    return slots
+
+
+def _match_slots(matches, num_courts):
+    """
+    {match id: (time_slot, court_number)} for stored AmericanoMatch rows.
+    Rounds are time slots for schedules packed by assign_courts; schedules whose
+    rounds need more courts than the tournament has are packed on the fly.
+    """
+    rounds = {}
+    for m in sorted(matches, key=lambda m: (m.round_number, m.court_number or 0, m.id)):
+        rounds.setdefault(m.round_number, []).append(m)
+
+    fits = all(
+        len(round_matches) <= num_courts
+        and len({m.court_number for m in round_matches}) == len(round_matches)
+        and all(m.court_number and m.court_number <= num_courts for m in round_matches)
+        for round_matches in rounds.values()
+    )
+    if fits:
+        order = {round_number: slot for slot, round_number in enumerate(sorted(rounds), start=1)}
+        return {m.id: (order[m.round_number], m.court_number) for m in matches}
+
+    slots = assign_courts([rounds[r] for r in sorted(rounds)], num_courts, players=_match_players)
+    return {
+        m.id: (slot_number, court_number)
+        for slot_number, slot in enumerate(slots, start=1)
+        for court_number, m in enumerate(slot, start=1)
+    }
+
+
+def build_timetable(items, num_courts, match_minutes, start=None, match_of=None):
+    """
+    Court-by-slot timetable for the schedule pages.
+
+    Args:
+        items: stored matches, or per-match dicts/objects wrapping them
+        num_courts: courts available at once
+        match_minutes: playing time per match (tournament.time_limit_minutes)
+        start: tournament start; clock times are shown only if it has a time of day
+        match_of: returns the AmericanoMatch of an item (default: the item itself)
+
+    Returns:
+        {
+            'slots': [{'number', 'start_minute', 'start_time', 'courts': [item or None, ...]}],
+            'duration_minutes': total time from first serve to last point,
+            'idle_courts': empty court slots,
+            'utilization': share of court slots in use (0-100),
+        }
+    """
+    match_of = match_of or (lambda item: item)
+    num_courts = max(1, num_courts or 1)
+    match_minutes = match_minutes or 20
+    by_id = {match_of(item).id: item for item in items}
+    positions = _match_slots([match_of(item) for item in items], num_courts)
+
+    if not positions:
+        return {'slots': [], 'duration_minutes': 0, 'idle_courts': 0, 'utilization': 0}
+
+    num_slots = max(slot for slot, _court in positions.values())
+    show_clock = start is not None and (start.hour or start.minute)
+    slot_minutes = match_minutes + CHANGEOVER_MINUTES
+
+    slots = []
+    for number in range(1, num_slots + 1):
+        offset = (number - 1) * slot_minutes
+        slots.append({
+            'number': number,
+            'start_minute': offset,
+            'start_time': start + timedelta(minutes=offset) if show_clock else None,
+            'courts': [None] * num_courts,
+        })
+    for match_id, (slot, court) in positions.items():
+        slots[slot - 1]['courts'][court - 1] = by_id[match_id]
+
+    used = len(positions)
+    capacity = num_slots * num_courts
+    return {
+        'slots': slots,
+        'duration_minutes': num_slots * slot_minutes - CHANGEOVER_MINUTES,
+        'idle_courts': capacity - used,
+        'utilization': round(100 * used / capacity),
+    }
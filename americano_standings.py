@@ -0,0 +1,228 @@
+"""
+Americano Standings for BD Padel League
+Per-tournament running totals (americano_standing) behind the public and admin
+leaderboards, so a leaderboard view is one ordered read instead of a replay
+of every completed match.
+
+Scores go through record_score(), which updates the match and applies the
+change to the four players' rows with relative UPDATEs (col = col + delta) in
+the same transaction: concurrent score entries can't lose each other's
+updates, the same result is never counted twice, and a corrected score
+replaces the old result instead of adding to it.
+"""
+
+import json
+from collections import namedtuple
+from datetime import datetime
+
+from sqlalchemy import update
+
+from models import (
+    db, AmericanoTournament, AmericanoMatch, AmericanoRegistration,
+    AmericanoStanding, LadderFreeAgent
+)
+
+LeaderboardPlayer = namedtuple("LeaderboardPlayer", ["id", "name", "email"])
+
+STAT_COLUMNS = ("matches_played", "wins", "draws", "losses", "total_points", "points_against")
+
+
+def _player_results(team_a_score, team_b_score):
+    """Per-slot stat deltas for a result: [(slot, {stat: delta}), ...] for players 1-4"""
+    results = []
+    for slot, (scored, conceded) in enumerate(
+        [(team_a_score, team_b_score)] * 2 + [(team_b_score, team_a_score)] * 2
+    ):
+        results.append((slot, {
+            "matches_played": 1,
+            "wins": int(scored > conceded),
+            "draws": int(scored == conceded),
+            "losses": int(scored < conceded),
+            "total_points": scored,
+            "points_against": conceded,
+        }))
+    return results
+
+
+def _match_players(match):
+    return [match.player1_id, match.player2_id, match.player3_id, match.player4_id]
+
+
+def _apply(match, team_a_score, team_b_score, sign):
+    """Add (sign=1) or remove (sign=-1) one result from the players' standings"""
+    players = _match_players(match)
+    now = datetime.now()
+    for slot, stats in _player_results(team_a_score or 0, team_b_score or 0):
+        db.session.execute(
+            update(AmericanoStanding).where(
+                AmericanoStanding.tournament_id == match.tournament_id,
+                AmericanoStanding.player_id == players[slot]
+            ).values(
+                updated_at=now,
+                **{
+                    column: getattr(AmericanoStanding, column) + sign * delta
+                    for column, delta in stats.items()
+                }
+            )
+        )
+
+
+def init_standings(tournament_id, player_ids):
+    """
+    Create zeroed rows for players who don't have one yet (call when matches are
+    generated). A tournament scored before standings existed is rebuilt instead.
+    """
+    existing = {
+        row.player_id for row in db.session.query(AmericanoStanding.player_id).filter(
+            AmericanoStanding.tournament_id == tournament_id
+        )
+    }
+    if not existing and db.session.query(AmericanoMatch.id).filter(
+        AmericanoMatch.tournament_id == tournament_id,
+        AmericanoMatch.status == "completed"
+    ).first():
+        rebuild_standings(tournament_id)
+        existing = set(player_ids)
+    for player_id in player_ids:
+        if player_id not in existing:
+            db.session.add(AmericanoStanding(
+                tournament_id=tournament_id,
+                player_id=player_id,
+                **{column: 0 for column in STAT_COLUMNS}
+            ))
+    db.session.flush()
+
+
+def record_score(match, team_a_score, team_b_score):
+    """
+    Record (or correct) a match score and update the standings.
+    Each player receives their team's points. The caller loads the match with
+    with_for_update() and commits.
+
+    The match is updated only if it still holds the result it was read with,
+    and the standings change only if it was: of two concurrent entries for the
+    same match the second finds its pending match already completed and raises
+    ValueError instead of counting the result twice.
+    """
+    init_standings(match.tournament_id, _match_players(match))
+    previous_status = match.status
+    previous_scores = (match.score_team_a, match.score_team_b)
+
+    unchanged = [AmericanoMatch.id == match.id, AmericanoMatch.status == previous_status]
+    if previous_status == "completed":
+        unchanged += [
+            AmericanoMatch.score_team_a == previous_scores[0],
+            AmericanoMatch.score_team_b == previous_scores[1],
+        ]
+    result = db.session.execute(
+        update(AmericanoMatch).where(*unchanged).values(
+            score_team_a=team_a_score,
+            score_team_b=team_b_score,
+            points_player1=team_a_score,  # Team A Player 1
+            points_player2=team_a_score,  # Team A Player 2
+            points_player3=team_b_score,  # Team B Player 3
+            points_player4=team_b_score,  # Team B Player 4
+            status="completed",
+        )
+    )
+    if result.rowcount != 1:
+        raise ValueError("This match's score was changed while saving; reload and try again")
+
+    if previous_status == "completed":
+        _apply(match, previous_scores[0], previous_scores[1], -1)
+    _apply(match, team_a_score, team_b_score, 1)
+
+
+def rebuild_standings(tournament_id):
+    """Recompute a tournament's standings from its completed matches (backfill / repair)"""
+    AmericanoStanding.query.filter_by(tournament_id=tournament_id).delete()
+
+    totals = {}
+    for player_id in _participant_ids(tournament_id):
+        totals[player_id] = dict.fromkeys(STAT_COLUMNS, 0)
+    matches = AmericanoMatch.query.filter_by(tournament_id=tournament_id).all()
+    for match in matches:
+        players = _match_players(match)
+        for player_id in players:
+            totals.setdefault(player_id, dict.fromkeys(STAT_COLUMNS, 0))
+        if match.status != "completed":
+            continue
+        for slot, stats in _player_results(match.score_team_a or 0, match.score_team_b or 0):
+            for column, delta in stats.items():
+                totals[players[slot]][column] += delta
+
+    now = datetime.now()
+    db.session.add_all([
+        AmericanoStanding(tournament_id=tournament_id, player_id=player_id, updated_at=now, **stats)
+        for player_id, stats in totals.items()
+    ])
+    db.session.flush()
+    return len(totals)
+
+
+def _participant_ids(tournament_id):
+    """Pre-selected free agents plus confirmed registrations linked to a free agent"""
+    tournament = db.session.get(AmericanoTournament, tournament_id)
+    participant_ids = []
+    if tournament and tournament.participating_free_agents:
+        try:
+            participant_ids = json.loads(tournament.participating_free_agents)
+        except (TypeError, ValueError):
+            pass
+    for (agent_id,) in db.session.query(AmericanoRegistration.ladder_free_agent_id).filter(
+        AmericanoRegistration.tournament_id == tournament_id,
+        AmericanoRegistration.status == 'confirmed',
+        AmericanoRegistration.ladder_free_agent_id.isnot(None)
+    ):
+        if agent_id not in participant_ids:
+            participant_ids.append(agent_id)
+    return participant_ids
+
+
+def _read_leaderboard(tournament_id):
+    return db.session.query(
+        AmericanoStanding, LadderFreeAgent.name, LadderFreeAgent.email
+    ).join(
+        LadderFreeAgent, LadderFreeAgent.id == AmericanoStanding.player_id
+    ).filter(
+        AmericanoStanding.tournament_id == tournament_id
+    ).order_by(
+        AmericanoStanding.total_points.desc(),
+        AmericanoStanding.wins.desc(),
+        AmericanoStanding.matches_played.desc(),
+        LadderFreeAgent.name
+    ).all()
+
+
+def get_leaderboard(tournament):
+    """
+    Ranked standings in one query:
+    [{'rank', 'player' (id, name, email), 'matches_played', 'wins', 'draws',
+      'losses', 'total_points', 'points_against'}, ...]
+    Tournaments scored before standings existed are backfilled on first view.
+    """
+    rows = _read_leaderboard(tournament.id)
+    if not rows and tournament.total_rounds:
+        rebuild_standings(tournament.id)
+        db.session.commit()
+        rows = _read_leaderboard(tournament.id)
+
+    leaderboard = []
+    for rank, (standing, name, email) in enumerate(rows, start=1):
+        entry = {column: getattr(standing, column) for column in STAT_COLUMNS}
+        entry['rank'] = rank
+        entry['player'] = LeaderboardPlayer(standing.player_id, name, email)
+        leaderboard.append(entry)
+
+    if not leaderboard and not tournament.total_rounds:
+        # Before matches are generated: everyone signed up so far, no points yet
+        participant_ids = _participant_ids(tournament.id)
+        agents = LadderFreeAgent.query.filter(
+            LadderFreeAgent.id.in_(participant_ids)
+        ).order_by(LadderFreeAgent.name).all() if participant_ids else []
+        for rank, agent in enumerate(agents, start=1):
+            entry = dict.fromkeys(STAT_COLUMNS, 0)
+            entry['rank'] = rank
+            entry['player'] = LeaderboardPlayer(agent.id, agent.name, agent.email)
+            leaderboard.append(entry)
+    return leaderboard
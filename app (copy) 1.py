@@ -20,7 +20,6 @@ from utils import (
     generate_playoff_preview,
     get_team_rankings_with_tiebreaker,
     generate_playoff_bracket,
-    get_playoff_bracket_data,
 )
 
 app = Flask(__name__)
@@ -0,0 +1,215 @@
+"""
+Application Factory for BD Padel League
+create_app() builds the Flask app: configuration and the database, and - for
+processes that serve pages - the query profiler, metrics, error handlers and
+the route blueprints (see blueprints/).
+
+Processes that don't serve pages skip the blueprints, and with them the route
+modules and everything they import:
+
+    from app_factory import create_app
+    app = create_app(blueprints=())     # scheduler worker, migrations, scripts
+
+app.py builds the full app for gunicorn. A serving app checks the database
+(creates missing tables, rebuilds the player directory) once while it is built;
+init_db.py does the same as a release step. Workers booting together take turns
+(a Postgres advisory lock), so only the first one does any work.
+"""
+
+import logging
+import os
+import secrets
+from contextlib import contextmanager
+
+from dotenv import load_dotenv
+from flask import Flask, current_app, render_template
+
+from models import db
+import contact_index  # registers the player_contact sync listeners
+import data_versions  # registers the read-model version bumps
+import seasons  # registers the current-season scoping hooks
+from blueprints import BLUEPRINTS, register_blueprints
+
+
+def get_database_url():
+    """DATABASE_URL (Replit/Render/Heroku) or DATABASE_URI (legacy), SQLite if neither is set"""
+    database_url = os.environ.get("DATABASE_URL") or os.environ.get("DATABASE_URI")
+
+    # Fallback to SQLite only if no database URL is provided
+    if not database_url:
+        database_url = "sqlite:///instance/league.db"
+        logging.warning("No DATABASE_URL found, using SQLite fallback")
+
+    # Fix for Render: postgres:// -> postgresql://
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace("postgres://", "postgresql://", 1)
+    return database_url
+
+
+def create_app(blueprints=BLUEPRINTS):
+    """
+    Build the application. `blueprints` names the route blueprints to register
+    (default: all of them); with none, the app only provides the database.
+    """
+    app = Flask(__name__)
+
+    # Ensure .env values override any existing process variables (helps when a stale
+    # ACCESS_TOKEN is set in the shell/environment)
+    load_dotenv(override=True)
+
+    # Production-ready secret key (CRITICAL: Set SECRET_KEY in environment variables)
+    app.secret_key = os.environ.get("SECRET_KEY", secrets.token_hex(32))
+
+    database_url = get_database_url()
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_url
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "pool_pre_ping": True,  # Verify connections before using
+        "pool_recycle": 280,     # Recycle connections after 4.6 minutes (before 5min timeout)
+        "pool_size": 5,          # Increase pool size
+        "max_overflow": 10,      # Allow more overflow connections
+        "pool_timeout": 30,      # Wait up to 30s for a connection from pool
+        "connect_args": {
+            "connect_timeout": 10,  # 10 second connection timeout
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+        } if database_url.startswith("postgresql://") else {}
+    }
+
+    if not blueprints:
+        db.init_app(app)
+        return app
+
+    import app_metrics
+    import query_profiler
+
+    # QueuePool + checkout wait metrics
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"]["poolclass"] = app_metrics.TimedQueuePool
+    db.init_app(app)
+    query_profiler.init_app(app)  # no-op unless QUERY_PROFILER_ENABLED=true
+    app_metrics.init_app(app)
+
+    app.register_error_handler(404, page_not_found)
+    app.register_error_handler(500, internal_server_error)
+    register_blueprints(app, blueprints)
+
+    setup_production(app)
+
+    # Check the schema here, while the process is still single-threaded, rather than
+    # on a worker's first request. Set DB_INIT_ON_STARTUP=false when a release step
+    # runs init_db.py instead; requests then never touch it.
+    if os.environ.get("DB_INIT_ON_STARTUP", "true").lower() == "true":
+        with app.app_context():
+            if not init_db():
+                app.logger.warning("Database not available - some features will not work")
+    return app
+
+
+# Error Handlers for Production
+def page_not_found(e):
+    """Handle 404 errors"""
+    return render_template('base.html'), 404
+
+def internal_server_error(e):
+    """Handle 500 errors"""
+    db.session.rollback()
+    return render_template('base.html'), 500
+
+# Production Configuration
+def setup_production(app):
+    """Setup production-specific configurations"""
+    # Set up logging
+    if not app.debug:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
+        )
+        app.logger.setLevel(logging.INFO)
+        app.logger.info('Padel League Hub startup')
+
+    # Optional: Initialize Sentry for error monitoring
+    # Uncomment if you've added sentry-sdk to requirements.txt
+    # sentry_dsn = os.environ.get("SENTRY_DSN")
+    # if sentry_dsn:
+    #     import sentry_sdk
+    #     from sentry_sdk.integrations.flask import FlaskIntegration
+    #     sentry_sdk.init(
+    #         dsn=sentry_dsn,
+    #         integrations=[FlaskIntegration()],
+    #         traces_sample_rate=0.1,
+    #         environment=os.environ.get("ENVIRONMENT", "production")
+    #     )
+    #     app.logger.info('Sentry error monitoring initialized')
+
+# Database readiness: settled once per serving process, before it takes requests
+INIT_DB_LOCK_KEY = 7_411_852_001  # any constant shared by every process
+
+@contextmanager
+def _init_db_lock():
+    """
+    Run init_db in one process at a time: every gunicorn worker calls it while
+    booting, and two of them must not drop and rebuild player_contact or open
+    Season 1 at once. The next in line finds everything done. Postgres only;
+    SQLite serializes writers itself.
+    """
+    if db.engine.dialect.name != "postgresql":
+        yield
+        return
+    from sqlalchemy import text
+    with db.engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": INIT_DB_LOCK_KEY})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": INIT_DB_LOCK_KEY})
+
+def init_db():
+    """Initialize database tables if needed (safe for existing databases)"""
+    try:
+        with _init_db_lock():
+            return _init_db()
+    except Exception as e:
+        current_app.logger.error(f"Database initialization failed: {e}")
+        current_app.logger.error("Application will continue but database features may not work")
+        return False
+
+def _init_db():
+    """Create missing tables, open Season 1 and build the player directory as needed"""
+    from sqlalchemy import inspect
+    inspector = inspect(db.engine)
+    existing_tables = inspector.get_table_names()
+
+    # Only create tables if database is empty
+    if not existing_tables:
+        db.create_all()
+        current_app.logger.info("Database tables created")
+    else:
+        current_app.logger.info(f"Database already initialized with {len(existing_tables)} tables")
+
+        # Add tables introduced since the database was created (never alters existing ones)
+        missing_tables = set(db.metadata.tables) - set(existing_tables)
+        if missing_tables:
+            db.create_all()
+            current_app.logger.info(f"Created missing tables: {', '.join(sorted(missing_tables))}")
+
+    # Reads are scoped to the current season, so a league needs one. A database
+    # that predates seasons lacks the season_id columns: migrate_add_seasons.py
+    # adds them and opens Season 1 there.
+    if "team" not in existing_tables or "season_id" in {c["name"] for c in inspector.get_columns("team")}:
+        season = seasons.ensure_first_season()
+        if season is not None:
+            db.session.commit()
+            current_app.logger.info(f"Opened {season.name}")
+    else:
+        current_app.logger.warning("Database predates seasons: run migrate_add_seasons.py")
+
+    if data_versions.ensure_versions():
+        db.session.commit()
+
+    # The player directory is derived data: (re)build it if missing or outdated
+    rows = contact_index.ensure_contact_index()
+    if rows is not None:
+        current_app.logger.info(f"Built player directory with {rows} rows")
+    return True
@@ -0,0 +1,227 @@
+"""
+Prometheus Metrics for BD Padel League
+Served at /metrics in the Prometheus text format:
+
+    - http_request_duration_seconds{endpoint, method, status}  request latency histogram
+    - http_requests_in_progress                                 requests being handled now
+    - db_pool_checkout_wait_seconds                             time to get a pooled connection
+    - db_pool_checkout_timeouts_total                           checkouts that hit pool_timeout
+    - db_pool_size / db_pool_max_overflow                       configured pool capacity
+    - db_pool_checked_out_connections                           connections in use
+    - email_send_duration_seconds / email_send_failures_total / emails_sent_total
+    - scheduled_job_last_run_timestamp_seconds{job} / scheduled_job_last_duration_seconds{job}
+      / scheduled_job_last_success{job}                         read from scheduled_job_run
+
+Gunicorn runs several worker processes, so values live in prometheus_client's
+multiprocess files under PROMETHEUS_MULTIPROC_DIR (gunicorn.conf.py sets it up
+and cleans up after dead workers); any worker answering /metrics reports the
+sum over all of them. Without the variable (flask run, scripts) the metrics
+are per process. Job figures come from the database, so they include runs
+made by the separate worker process.
+
+Set METRICS_TOKEN to require "Authorization: Bearer <token>" on /metrics.
+"""
+
+import os
+import time
+from datetime import datetime
+
+if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+from flask import g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+_EPOCH = datetime(1970, 1, 1)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Request latency by endpoint",
+    ["endpoint", "method", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requests being handled", multiprocess_mode="livesum"
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Time to get a connection from the pool (including connecting)",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after pool_timeout"
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured pool_size, summed over workers", multiprocess_mode="livesum")
+DB_POOL_MAX_OVERFLOW = Gauge(
+    "db_pool_max_overflow", "Configured max_overflow, summed over workers", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections", "Pooled connections in use", multiprocess_mode="livesum"
+)
+
+EMAIL_SEND_LATENCY = Histogram(
+    "email_send_duration_seconds", "SMTP send time",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+EMAIL_SEND_FAILURES = Counter("email_send_failures_total", "Emails that failed to send")
+EMAILS_SENT = Counter("emails_sent_total", "Emails sent")
+
+
+# ============================================================================
+# DATABASE POOL
+# ============================================================================
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits (SQLALCHEMY_ENGINE_OPTIONS poolclass)"""
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        DB_POOL_SIZE.inc(pool_size)
+        DB_POOL_MAX_OVERFLOW.inc(max(max_overflow, 0))
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+    def recreate(self):
+        # dispose() + recreate() swaps in a new pool; keep the capacity gauges for one
+        DB_POOL_SIZE.dec(self.size())
+        DB_POOL_MAX_OVERFLOW.dec(max(self._max_overflow, 0))
+        return super().recreate()
+
+
+@event.listens_for(TimedQueuePool, "checkout")
+def _on_checkout(_dbapi_connection, _connection_record, _connection_proxy):
+    DB_POOL_CHECKED_OUT.inc()
+
+
+@event.listens_for(TimedQueuePool, "checkin")
+def _on_checkin(_dbapi_connection, _connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
+# ============================================================================
+# EMAIL
+# ============================================================================
+
+class email_send_timer:
+    """Times an SMTP send: `with email_send_timer(): ...`; an exception counts as a failure"""
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb):
+        EMAIL_SEND_LATENCY.observe(time.perf_counter() - self._started)
+        if exc_type is None:
+            EMAILS_SENT.inc()
+        else:
+            EMAIL_SEND_FAILURES.inc()
+        return False
+
+
+# ============================================================================
+# SCHEDULED JOBS
+# ============================================================================
+
+class ScheduledJobCollector:
+    """Last run of each scheduled job, read from scheduled_job_run at scrape time"""
+
+    def collect(self):
+        from models import db, ScheduledJobRun
+
+        last_run = GaugeMetricFamily(
+            "scheduled_job_last_run_timestamp_seconds", "Start of the job's last run (unix time)", labels=["job"]
+        )
+        duration = GaugeMetricFamily(
+            "scheduled_job_last_duration_seconds", "Duration of the job's last finished run", labels=["job"]
+        )
+        success = GaugeMetricFamily(
+            "scheduled_job_last_success", "1 if the job's last finished run succeeded", labels=["job"]
+        )
+        try:
+            runs = ScheduledJobRun.query.all()
+        except Exception:
+            db.session.rollback()  # table not created yet (no scheduler has run)
+            runs = []
+        for run in runs:
+            if run.last_run_at:
+                # Stored as naive UTC (job_runner uses utcnow)
+                last_run.add_metric([run.job_id], (run.last_run_at - _EPOCH).total_seconds())
+            if run.last_duration_ms is not None:
+                duration.add_metric([run.job_id], run.last_duration_ms / 1000)
+            if run.last_status in ("success", "failed"):
+                success.add_metric([run.job_id], 1 if run.last_status == "success" else 0)
+        yield last_run
+        yield duration
+        yield success
+
+
+# ============================================================================
+# FLASK
+# ============================================================================
+
+def _start_request():
+    if request.endpoint in (None, "static", "public.metrics"):
+        return
+    g.metrics_started = time.perf_counter()
+    REQUESTS_IN_PROGRESS.inc()
+
+
+def _observe(status):
+    started = g.pop("metrics_started", None)
+    if started is None:
+        return
+    REQUESTS_IN_PROGRESS.dec()
+    REQUEST_LATENCY.labels(request.endpoint, request.method, str(status)).observe(
+        time.perf_counter() - started
+    )
+
+
+def _finish_request(response):
+    _observe(response.status_code)
+    return response
+
+
+def _teardown_request(exception):
+    # Only still pending when a view raised and after_request never ran
+    if exception is not None:
+        _observe(500)
+
+
+def render_metrics():
+    """The /metrics response body for this process (or all workers in multiprocess mode)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    jobs = CollectorRegistry()
+    jobs.register(ScheduledJobCollector())
+    return generate_latest(registry) + generate_latest(jobs)
+
+
+def is_authorized():
+    """True unless METRICS_TOKEN is set and the request doesn't carry it"""
+    return not METRICS_TOKEN or request.headers.get("Authorization") == f"Bearer {METRICS_TOKEN}"
+
+
+def init_app(app):
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    app.teardown_request(_teardown_request)
@@ -0,0 +1,80 @@
+"""
+Startup Benchmark for BD Padel League
+Measures how long each kind of process takes to boot the application and how
+much memory it holds afterwards, each run in a fresh interpreter:
+
+    web        - what a gunicorn worker imports (app:app, every blueprint)
+    scheduler  - the scheduled-job worker (run_scheduled_tasks.py)
+    cli        - a migration / management script (app without blueprints)
+
+Reports the median and best wall time (interpreter start to app ready) and
+the median peak RSS. Run it before and after a change on the same machine
+and database URL to compare.
+
+Usage: python benchmark_startup.py [--runs 10] [web scheduler cli]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = {
+    "web": "from app import app",
+    "scheduler": "from app_factory import create_app; import run_scheduled_tasks, scheduled_tasks, job_runner; "
+                 "app = create_app(blueprints=())",
+    "cli": "from app_factory import create_app; app = create_app(blueprints=())",
+}
+
+# Runs in the child after the target: report its peak resident memory
+_REPORT = (
+    "import json, resource, sys; "
+    "rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss; "
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    "sys.stdout.write(json.dumps({'rss_mb': rss / (1024 * 1024 if sys.platform == 'darwin' else 1024)}))"
+)
+
+
+def measure(code):
+    """Boot one fresh interpreter running `code`; returns (seconds, peak RSS in MB)"""
+    # Deployed workers load cached bytecode; compiling every module on each run would swamp the figures
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\n{_REPORT}"],
+        capture_output=True, text=True, env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    seconds = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed")
+    # The app may print while booting; the report is the last thing written
+    report = json.loads(result.stdout[result.stdout.rindex("{"):])
+    return seconds, report["rss_mb"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure application cold start time and memory")
+    parser.add_argument("targets", nargs="*", help=f"any of {', '.join(TARGETS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per target (default 10)")
+    args = parser.parse_args()
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(sorted(unknown))}")
+
+    print(f"⏱️  Startup benchmark, {args.runs} runs per target (python {sys.version.split()[0]})")
+    print(f"{'target':<10} {'median ms':>10} {'best ms':>10} {'median RSS MB':>14}")
+    for name in args.targets or TARGETS:
+        measure(TARGETS[name])  # warm the bytecode and OS file caches
+        samples = [measure(TARGETS[name]) for _ in range(args.runs)]
+        times = [seconds * 1000 for seconds, _rss in samples]
+        rss = [rss_mb for _seconds, rss_mb in samples]
+        print(f"{name:<10} {statistics.median(times):>10.0f} {min(times):>10.0f} {statistics.median(rss):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Route Blueprints for BD Padel League
+One blueprint per area of the site, registered by app_factory.create_app():
+
+    public     - home, leaderboards, profiles, stats, rounds, rules, health, metrics
+    league     - league registration and the token-based team pages
+    ladder     - ladder registration, ladders, team dashboard, challenges
+    americano  - public Americano tournament pages
+    admin      - everything under /admin
+
+A route module is only imported when its blueprint is registered, so a
+process built without blueprints never loads them. Helpers only a few routes
+use (Americano schedule and standings, live updates, the admin summary) are
+imported inside those routes. Endpoint names are
+prefixed with the blueprint: url_for('ladder.ladder_my_team', token=...).
+"""
+
+import importlib
+
+BLUEPRINTS = ("public", "league", "ladder", "americano", "admin")
+
+
+def register_blueprints(app, names=BLUEPRINTS):
+    """Import the named route modules and register their blueprints on `app`"""
+    for name in names:
+        if name not in BLUEPRINTS:
+            raise ValueError(f"Unknown blueprint: {name}")
+        module = importlib.import_module(f"blueprints.{name}")
+        app.register_blueprint(module.bp)
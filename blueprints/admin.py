@@ -0,0 +1,4647 @@
+"""
+Admin Blueprint for BD Padel League
+Everything under /admin: the dashboard and its tabs, league rounds and
+playoffs, reschedules and substitutes, ladder and Americano management.
+Every view except login requires the admin session (require_admin_auth).
+"""
+
+from flask import (
+    Blueprint, render_template, redirect, url_for, request, flash, session,
+    make_response, abort, current_app
+)
+import logging
+import os
+import re
+from datetime import datetime
+from sqlalchemy.orm import joinedload
+from models import (
+    db, Team, FreeAgent, Match, Reschedule, Substitute, Player, LeagueSettings,
+    LadderTeam, LadderFreeAgent, LadderChallenge, LadderMatch, AmericanoTournament,
+    AmericanoMatch, AmericanoRegistration, LadderSettings
+)
+from utils import (
+    calculate_match_result,
+    normalize_phone_number,
+    normalize_team_name,
+    check_swiss_completion,
+    generate_playoff_preview,
+    get_bracket_preview,
+    get_knockout_round_number,
+    get_playoff_team_ids,
+    load_knockout_bracket,
+    get_max_reschedules_per_round,
+    get_round_date_range,
+)
+import contact_index
+import knockout_bracket
+import query_profiler
+from league_results import recalculate_all_player_stats
+
+bp = Blueprint("admin", __name__)
+
+
+def check_admin_auth():
+    """Check if user is authenticated as admin"""
+    return session.get('admin_authenticated', False)
+
+
+def require_admin_auth(f):
+    """Decorator to require admin authentication for routes"""
+    from functools import wraps
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not check_admin_auth():
+            flash("Please log in to access the admin panel", "error")
+            return redirect(url_for('admin.admin_login'))
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+def check_deadline_violations(dry_run=False):
+    """
+    Check for matches that missed deadlines and apply automatic walkovers
+    TWO types of deadlines:
+    1. Regular matches: Sunday 23:59 of the round week
+    2. Makeup matches (rescheduled): Wednesday 23:59 of the following week
+
+    Delegates to the batched deadline engine (one candidate query, one commit).
+    Returns the engine report: regular and makeup walkovers plus stat deltas
+    """
+    from deadline_engine import run_deadline_enforcement
+    return run_deadline_enforcement(dry_run=dry_run)
+
+@bp.route("/admin/login", methods=["GET", "POST"])
+def admin_login():
+    """Admin login page"""
+    if request.method == "POST":
+        password = request.form.get("password", "").strip()
+        admin_password = os.environ.get("ADMIN_PASSWORD", "admin123")  # Default password if not set
+
+        if password == admin_password:
+            session['admin_authenticated'] = True
+            session.permanent = True  # Keep session across browser restarts
+            flash("Successfully logged in!", "success")
+            return redirect(url_for('admin.admin_panel'))
+        else:
+            flash("Incorrect password. Please try again.", "error")
+            return redirect(url_for('admin.admin_login'))
+
+    # If already authenticated, redirect to admin panel
+    if check_admin_auth():
+        return redirect(url_for('admin.admin_panel'))
+
+    return render_template("admin_login.html")
+
+
+@bp.route("/admin/logout")
+def admin_logout():
+    """Admin logout"""
+    session.pop('admin_authenticated', None)
+    flash("You have been logged out.", "success")
+    return redirect(url_for('public.index'))
+
+
+def _admin_league_tab_context():
+    """Template data for the League tab of the admin panel"""
+    import admin_summary
+    teams = Team.query.all()
+    # Filter out draft matches from main query - only show live matches
+    matches = Match.query.filter(
+        db.or_(Match.is_draft == False, Match.is_draft == None)
+    ).all()
+    reschedules = Reschedule.query.filter_by(status="pending").all()
+    substitutes = Substitute.query.filter_by(status="pending").all()
+    # History (approved/denied), newest first, one page at a time
+    reschedules_history_page = admin_summary.paginate(
+        Reschedule.query.filter(Reschedule.status != "pending").order_by(Reschedule.id.desc()),
+        request.args.get("reschedules_page", 1, type=int)
+    )
+    substitutes_history_page = admin_summary.paginate(
+        Substitute.query.filter(Substitute.status != "pending").order_by(Substitute.id.desc()),
+        request.args.get("substitutes_page", 1, type=int)
+    )
+
+    # Check for pending draft rounds
+    pending_draft = Match.query.filter_by(is_draft=True).first()
+    pending_draft_round = pending_draft.round if pending_draft else None
+
+    # Get reschedule data for dashboard
+    pending_reschedules_count = len(reschedules)
+    max_reschedules = get_max_reschedules_per_round()
+
+    # Calculate current and next round numbers (only from live matches)
+    current_round = 0
+    if matches:
+        # Get the highest round number from existing live matches
+        current_round = max([m.round for m in matches if m.round])
+    next_round = current_round + 1
+
+
+    # Teams Management list: search and one page at a time
+    teams_q = request.args.get("teams_q", "").strip()
+    team_list_query = Team.query.order_by(Team.id)
+    if teams_q:
+        like = f"%{teams_q}%"
+        team_list_query = team_list_query.filter(db.or_(
+            Team.team_name.ilike(like),
+            Team.player1_name.ilike(like),
+            Team.player2_name.ilike(like),
+            Team.player1_phone.ilike(like),
+            Team.player2_phone.ilike(like)
+        ))
+    team_list_page = admin_summary.paginate(
+        team_list_query,
+        request.args.get("teams_page", 1, type=int),
+        per_page=admin_summary.TEAMS_PER_PAGE
+    )
+
+    # Check Swiss completion and playoff status
+    swiss_complete, completed_rounds, total_swiss = check_swiss_completion()
+    settings = LeagueSettings.query.first()
+
+    # Determine if we should show playoff preview button
+    show_playoff_preview = (
+        swiss_complete and
+        settings and
+        settings.current_phase == "swiss" and
+        not settings.playoffs_approved
+    )
+
+    # Get today's date and matches for Today's Matches section
+    from datetime import datetime, date
+    today_date = date.today()
+
+    # Filter today's matches - only show matches that have been booked (confirmed or pending)
+    todays_matches = []
+    for match in matches:
+        is_today = False
+        
+        # Check admin-set booking date first
+        if match.booking_date_admin:
+            try:
+                from datetime import datetime as dt
+                date_part = match.booking_date_admin.split(" at ")[0]
+                admin_date = dt.strptime(date_part, "%Y-%m-%d").date()
+                if admin_date == today_date:
+                    is_today = True
+            except:
+                pass
+        
+        # Check regular match_datetime if not already matched as today
+        if not is_today and match.match_datetime and match.match_datetime.date() == today_date:
+            is_today = True
+        
+        # Add match if it's today and has booking details
+        if is_today:
+            if match.booking_details or match.booking_date_admin:
+                todays_matches.append(match)
+    
+    # Sort today's matches by booking time (handle both admin dates and regular datetimes)
+    def sort_todays_matches(m):
+        if m.booking_date_admin:
+            try:
+                from datetime import datetime as dt
+                date_part = m.booking_date_admin.split(" at ")[0]
+                time_part = m.booking_date_admin.split(" at ")[1] if " at " in m.booking_date_admin else "00:00"
+                return dt.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M")
+            except:
+                return datetime.max
+        elif m.match_datetime:
+            return m.match_datetime
+        else:
+            return datetime.max
+    
+    todays_matches.sort(key=sort_todays_matches)
+
+    # Build Round Summary - grouped by round number, sorted by booking date within each round
+    teams_by_id = {t.id: t for t in teams}
+    rounds_dict = {}
+    for match in matches:
+        round_num = match.round if match.round else 0
+        if round_num not in rounds_dict:
+            rounds_dict[round_num] = []
+        
+        team_a = teams_by_id.get(match.team_a_id)
+        team_b = teams_by_id.get(match.team_b_id) if match.team_b_id else None
+        
+        booking_date = "Yet to be scheduled"
+        booking_confirmed_status = "awaiting"
+        
+        # Check admin-set booking date first, then fall back to match_datetime
+        if match.booking_date_admin:
+            # Parse admin booking date and format consistently: "Wed, Dec 02"
+            try:
+                from datetime import datetime
+                date_part = match.booking_date_admin.split(" at ")[0]  # Extract "2025-12-16" part
+                admin_date = datetime.strptime(date_part, "%Y-%m-%d")
+                booking_date = admin_date.strftime("%a, %b %d")
+            except:
+                booking_date = match.booking_date_admin
+            booking_confirmed_status = "confirmed"
+        elif match.match_datetime:
+            booking_date = match.match_datetime.strftime("%a, %b %d")
+            booking_confirmed_status = "confirmed" if match.booking_confirmed else "awaiting"
+        
+        score = ""
+        score_confirmed_status = "awaiting"
+        is_walkover = False
+        
+        # Check if it's a walkover
+        if match.status == "walkover":
+            is_walkover = True
+            winner_team = teams_by_id.get(match.winner_id) if match.winner_id else None
+            score = f"W - {winner_team.team_name if winner_team else 'Unknown'}"
+            score_confirmed_status = "confirmed"
+        # Check if score has been submitted (by either team or finalized)
+        elif match.score_a and match.score_b:
+            # Score is finalized - both teams have scores recorded
+            score = f"{match.score_a}"
+            # If both scores exist, it's confirmed (either via normal flow or admin entry)
+            score_confirmed_status = "confirmed"
+        elif match.score_submission_a or match.score_submission_b:
+            # At least one team has submitted a score
+            submitted_score = match.score_submission_a if match.score_submission_a else match.score_submission_b
+            score = f"{submitted_score}"
+            score_confirmed_status = "awaiting"
+        elif match.status == "completed":
+            # Match is completed but no score details
+            score = "Completed"
+            score_confirmed_status = "confirmed"
+        
+        # Determine which team needs to confirm booking
+        booking_pending_team = None
+        if booking_confirmed_status == "awaiting" and team_a and team_b:
+            booking_pending_team = team_a.team_name
+        
+        # Determine which team needs to submit score
+        score_pending_team = None
+        if score_confirmed_status == "awaiting" and not is_walkover:
+            if match.score_submission_a and not match.score_submission_b:
+                score_pending_team = team_b.team_name if team_b else "Unknown"
+            elif match.score_submission_b and not match.score_submission_a:
+                score_pending_team = team_a.team_name if team_a else "Unknown"
+            elif not match.score_submission_a and not match.score_submission_b and (match.score_submission_a is None or match.score_submission_b is None):
+                score_pending_team = f"{team_a.team_name if team_a else 'Unknown'}/{team_b.team_name if team_b else 'Unknown'}"
+        
+        rounds_dict[round_num].append({
+            'match': match,
+            'team_a': team_a,
+            'team_b': team_b,
+            'booking_date': booking_date,
+            'booking_confirmed_status': booking_confirmed_status,
+            'booking_pending_team': booking_pending_team,
+            'score': score,
+            'score_confirmed_status': score_confirmed_status,
+            'score_pending_team': score_pending_team,
+            'is_walkover': is_walkover
+        })
+    
+    # Sort matches within each round by booking date
+    def get_sort_key(item):
+        from datetime import datetime
+        
+        # Check admin booking date first
+        if item['match'].booking_date_admin:
+            try:
+                date_part = item['match'].booking_date_admin.split(" at ")[0]
+                date_obj = datetime.strptime(date_part, "%Y-%m-%d")
+                return (0, date_obj)
+            except:
+                pass
+        
+        # Fall back to match_datetime
+        if item['match'].match_datetime:
+            return (0, item['match'].match_datetime)
+        
+        # Unscheduled matches go at the end
+        return (1, '')
+    
+    for round_num in rounds_dict:
+        rounds_dict[round_num].sort(key=get_sort_key)
+    
+    # Create sorted list of rounds (newest first)
+    round_summary = []
+    for round_num in sorted(rounds_dict.keys(), reverse=True):
+        matches_in_round = rounds_dict[round_num]
+        completed_count = len([m for m in matches_in_round if m['match'].status in ('completed', 'walkover')])
+        
+        # Get round deadline from first match in round (all matches share same deadline)
+        round_deadline = None
+        if matches_in_round:
+            first_match = matches_in_round[0]['match']
+            round_deadline = first_match.round_deadline
+        
+        round_summary.append({
+            'round_number': round_num,
+            'matches': matches_in_round,
+            'total_matches': len(matches_in_round),
+            'completed_matches': completed_count,
+            'deadline': round_deadline
+        })
+
+    # Get all walkover matches for admin override tracking
+    walkovers = Match.query.filter_by(status='walkover').order_by(Match.round.desc()).all()
+    walkover_data = []
+    for walkover in walkovers:
+        team_a = teams_by_id.get(walkover.team_a_id)
+        team_b = teams_by_id.get(walkover.team_b_id) if walkover.team_b_id else None
+        winner = teams_by_id.get(walkover.winner_id) if walkover.winner_id else None
+        walkover_data.append({
+            'match': walkover,
+            'team_a': team_a,
+            'team_b': team_b,
+            'winner': winner
+        })
+
+    # Default deadline for new round (1 week from now)
+    from datetime import datetime, timedelta
+    default_deadline = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+
+    # Knockout bracket status for admin panel: one entry per bracket round
+    knockout_status = {
+        'has_knockout': False,
+        'phases': [],
+        'next_phase': None,
+        'final_match': None,
+        'final_complete': False,
+        'champion': None
+    }
+
+    bracket, _ = load_knockout_bracket(settings)
+    if bracket:
+        knockout_status['has_knockout'] = True
+        previous_complete = True
+        for phase, entries in knockout_bracket.bracket_rounds(bracket):
+            phase_matches = [entry['match'] for entry in entries if entry['match']]
+            complete = bool(phase_matches) and all(m.winner_id for m in phase_matches)
+            knockout_status['phases'].append({
+                'phase': phase,
+                'title': knockout_bracket.phase_title(phase),
+                'matches': phase_matches,
+                'complete': complete,
+            })
+            if not phase_matches and previous_complete and not knockout_status['next_phase']:
+                knockout_status['next_phase'] = knockout_status['phases'][-1]
+            previous_complete = complete
+
+        final_match = bracket[knockout_bracket.FINAL_NODE]['match']
+        if final_match:
+            knockout_status['final_match'] = final_match
+            knockout_status['final_complete'] = final_match.winner_id is not None
+            if knockout_status['final_complete']:
+                knockout_status['champion'] = teams_by_id.get(final_match.winner_id)
+
+    return dict(
+        teams=teams,
+        team_list_page=team_list_page,
+        teams_q=teams_q,
+        matches=matches,
+        todays_matches=todays_matches,
+        round_summary=round_summary,
+        reschedules=reschedules,
+        substitutes=substitutes,
+        reschedules_history=reschedules_history_page.items,
+        substitutes_history=substitutes_history_page.items,
+        reschedules_history_page=reschedules_history_page,
+        substitutes_history_page=substitutes_history_page,
+        pending_reschedules_count=pending_reschedules_count,
+        max_reschedules=max_reschedules,
+        swiss_complete=swiss_complete,
+        completed_rounds=completed_rounds,
+        total_swiss=total_swiss,
+        show_playoff_preview=show_playoff_preview,
+        settings=settings,
+        walkover_data=walkover_data,
+        current_round=current_round,
+        next_round=next_round,
+        today_date=today_date,
+        pending_draft_round=pending_draft_round,
+        default_deadline=default_deadline,
+        knockout_status=knockout_status,
+    )
+
+
+def _admin_ladder_tab_context():
+    """Template data for the Ladder tab: division counters and unpaid teams"""
+    import admin_summary
+    # Ladder counters (one grouped query) and unpaid teams (one query)
+    ladder_counters = admin_summary.get_ladder_counters()
+    pending_payments = admin_summary.get_pending_payments()
+
+    return dict(
+        pending_payments_men=pending_payments['men'],
+        pending_payments_women=pending_payments['women'],
+        pending_payments_mixed=pending_payments['mixed'],
+        **ladder_counters,
+    )
+
+
+def _admin_freeagents_tab_context():
+    """Template data for the Free Agents tab"""
+    import admin_summary
+    free_agents = FreeAgent.query.filter_by(paired=False).all()
+
+    # Check for free agent duplicates (already in teams) - one query for all free agents
+    free_agent_teams = contact_index.find_free_agent_team_matches(free_agents, "free_agent")
+    free_agent_status = []
+    for fa in free_agents:
+        existing_team = free_agent_teams[fa.id][0] if free_agent_teams[fa.id] else None
+        free_agent_status.append({
+            'free_agent': fa,
+            'in_team': existing_team,
+            'status': 'duplicate' if existing_team else 'available'
+        })
+
+
+    # All ladder free agents feed the stats cards and the pairing dropdowns
+    ladder_free_agents = LadderFreeAgent.query.order_by(LadderFreeAgent.created_at.desc()).all()
+
+    # Registered Free Agents list: search, division filter and one page at a time
+    free_agents_q = request.args.get("free_agents_q", "").strip()
+    free_agents_gender = request.args.get("free_agents_gender", "").strip()
+    free_agent_list_query = LadderFreeAgent.query.order_by(LadderFreeAgent.created_at.desc())
+    if free_agents_q:
+        like = f"%{free_agents_q}%"
+        free_agent_list_query = free_agent_list_query.filter(db.or_(
+            LadderFreeAgent.name.ilike(like),
+            LadderFreeAgent.email.ilike(like),
+            LadderFreeAgent.phone.ilike(like)
+        ))
+    if free_agents_gender in ("men", "women"):
+        free_agent_list_query = free_agent_list_query.filter(LadderFreeAgent.gender == free_agents_gender)
+    free_agent_list_page = admin_summary.paginate(
+        free_agent_list_query,
+        request.args.get("free_agents_page", 1, type=int),
+        per_page=admin_summary.FREE_AGENTS_PER_PAGE
+    )
+
+    # Check which free agents have matching email/phone with existing ladder teams (Men's and Women's only, exclude Mixed)
+    ladder_free_agent_teams = contact_index.find_free_agent_team_matches(free_agent_list_page.items, "ladder_free_agent")
+    ladder_free_agents_with_matches = []
+    for agent in free_agent_list_page.items:
+        matching_teams = ladder_free_agent_teams[agent.id]
+        ladder_free_agents_with_matches.append({
+            'agent': agent,
+            'has_match': len(matching_teams) > 0,
+            'matching_teams': matching_teams
+        })
+
+    # Americano tournaments data (similar to admin_americano_tournaments route)
+    tournaments = AmericanoTournament.query.order_by(AmericanoTournament.tournament_date.desc()).all()
+    # Match counts for every tournament in one grouped query
+    americano_match_counts = {}
+    for tournament_id, status, total in db.session.query(
+        AmericanoMatch.tournament_id, AmericanoMatch.status, db.func.count(AmericanoMatch.id)
+    ).group_by(AmericanoMatch.tournament_id, AmericanoMatch.status).all():
+        americano_match_counts.setdefault(tournament_id, {})[status] = total
+    tournament_data = []
+    for tournament in tournaments:
+        participating_ids = []
+        if tournament.participating_free_agents:
+            import json
+            try:
+                participating_ids = json.loads(tournament.participating_free_agents)
+            except:
+                pass
+
+        participants_count = len(participating_ids)
+
+        status_counts = americano_match_counts.get(tournament.id, {})
+        matches_count = sum(status_counts.values())
+        completed_matches = status_counts.get('completed', 0)
+
+        tournament_data.append({
+            'tournament': tournament,
+            'participants_count': participants_count,
+            'matches_count': matches_count,
+            'completed_matches': completed_matches
+        })
+
+    return dict(
+        free_agents=free_agents,
+        free_agent_status=free_agent_status,
+        ladder_free_agents=ladder_free_agents,
+        ladder_free_agents_with_matches=ladder_free_agents_with_matches,
+        free_agent_list_page=free_agent_list_page,
+        free_agents_q=free_agents_q,
+        free_agents_gender=free_agents_gender,
+        tournament_data=tournament_data,
+    )
+
+
+def _admin_americano_tab_context():
+    """Template data for the Americano tab: tournaments, filtered by status and paginated"""
+    import admin_summary
+    americano_status = request.args.get("americano_status", "").strip()
+    tournament_query = AmericanoTournament.query.order_by(AmericanoTournament.tournament_date.desc())
+    if americano_status:
+        tournament_query = tournament_query.filter(AmericanoTournament.status == americano_status)
+    americano_tournaments_page = admin_summary.paginate(
+        tournament_query,
+        request.args.get("americano_page", 1, type=int),
+        per_page=admin_summary.TOURNAMENTS_PER_PAGE
+    )
+
+    return dict(
+        americano_tournaments=americano_tournaments_page.items,
+        americano_tournaments_page=americano_tournaments_page,
+        americano_status=americano_status,
+    )
+
+
+# Admin panel tabs, in display order. Each tab is rendered from its own partial
+# with only its own data; the rest load on demand from admin_tab_fragment.
+ADMIN_TABS = {
+    "league": _admin_league_tab_context,
+    "ladder": _admin_ladder_tab_context,
+    "freeagents": _admin_freeagents_tab_context,
+    "americano": _admin_americano_tab_context,
+}
+
+
+@bp.route("/admin")
+@require_admin_auth
+def admin_panel():
+    active_tab = request.args.get("tab", "league")
+    if active_tab not in ADMIN_TABS:
+        active_tab = "league"
+
+    return render_template(
+        "admin.html",
+        active_tab=active_tab,
+        **ADMIN_TABS[active_tab]()
+    )
+
+
+@bp.route("/admin/tab/<tab>")
+@require_admin_auth
+def admin_tab_fragment(tab):
+    """One admin tab as an HTML fragment (lazy loading, paging and filtering)"""
+    if tab not in ADMIN_TABS:
+        abort(404)
+    return render_template(f"admin/_{tab}_tab.html", **ADMIN_TABS[tab]())
+
+
+@bp.route("/admin/ladder/toggle-payment", methods=["POST"])
+@require_admin_auth
+def admin_ladder_toggle_payment():
+    """Toggle payment status for a ladder team"""
+    team_id = request.form.get("team_id", type=int)
+
+    if not team_id:
+        flash("Team ID is required", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    team = LadderTeam.query.get(team_id)
+    if not team:
+        flash("Team not found", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    # Toggle payment status
+    team.payment_received = not team.payment_received
+    db.session.commit()
+
+    if team.payment_received:
+        flash(f"✓ Payment confirmed for {team.team_name}. Team is now visible in rankings.", "success")
+    else:
+        flash(f"Payment status removed for {team.team_name}. Team hidden from rankings.", "success")
+
+    return redirect(url_for('admin.admin_ladder_rankings', ladder_type=team.ladder_type))
+
+
+@bp.route("/admin/ladder/rankings/<ladder_type>")
+@require_admin_auth
+def admin_ladder_rankings(ladder_type):
+    if ladder_type not in ['men', 'women', 'mixed']:
+        flash("Invalid ladder type", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    teams = LadderTeam.query.filter_by(gender=ladder_type).order_by(LadderTeam.current_rank).all()
+
+    total_teams = len(teams)
+    if ladder_type == 'men':
+        division_title = "Men's Division"
+    elif ladder_type == 'women':
+        division_title = "Women's Division"
+    else:
+        division_title = "Mixed Division"
+
+    teams_with_status = []
+    for idx, team in enumerate(teams, start=1):
+        status = 'available'
+        status_color = 'green'
+        status_text = 'Available'
+
+        if team.holiday_mode_active:
+            status = 'holiday'
+            status_color = 'blue'
+            status_text = 'Holiday'
+
+        teams_with_status.append({
+            'team': team,
+            'status': status,
+            'status_color': status_color,
+            'status_text': status_text,
+            'sets_diff': team.sets_for - team.sets_against,
+            'games_diff': team.games_for - team.games_against,
+            'display_rank': idx,
+        })
+
+    return render_template(
+        "admin_ladder_rankings.html",
+        teams=teams_with_status,
+        total_teams=total_teams,
+        ladder_type=ladder_type,
+        division_title=division_title
+    )
+
+
+@bp.route("/admin/ladder/challenges/<ladder_type>")
+@require_admin_auth
+def admin_ladder_challenges(ladder_type):
+    """Admin page to manage all ladder challenges for a division"""
+    from datetime import datetime
+
+    if ladder_type not in ['men', 'women', 'mixed']:
+        flash("Invalid ladder type", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    if ladder_type == 'men':
+        division_title = "Men's Division"
+    elif ladder_type == 'women':
+        division_title = "Women's Division"
+    else:
+        division_title = "Mixed Division"
+
+    all_challenges = LadderChallenge.query.filter_by(ladder_type=ladder_type).options(
+        joinedload(LadderChallenge.challenger),
+        joinedload(LadderChallenge.challenged),
+    ).order_by(
+        LadderChallenge.created_at.desc()
+    ).all()
+
+    now = datetime.now()
+
+    pending_acceptance = []
+    accepted = []
+    expired = []
+    rejected = []
+
+    for challenge in all_challenges:
+        challenge_data = {
+            'challenge': challenge,
+            'challenger': challenge.challenger,
+            'challenged': challenge.challenged,
+            'is_overdue': challenge.acceptance_deadline and now > challenge.acceptance_deadline
+        }
+
+        # Skip challenges that are completed (match was verified)
+        if challenge.status == 'completed':
+            continue
+
+        if challenge.status == 'pending_acceptance':
+            pending_acceptance.append(challenge_data)
+        elif challenge.status == 'accepted':
+            accepted.append(challenge_data)
+        elif challenge.status == 'expired':
+            expired.append(challenge_data)
+        elif challenge.status == 'rejected':
+            rejected.append(challenge_data)
+
+    return render_template(
+        "admin_ladder_challenges.html",
+        ladder_type=ladder_type,
+        division_title=division_title,
+        pending_acceptance=pending_acceptance,
+        accepted=accepted,
+        expired=expired,
+        rejected=rejected
+    )
+
+
+@bp.route("/admin/ladder/challenge/force-accept/<int:challenge_id>", methods=["POST"])
+@require_admin_auth
+def admin_force_accept_challenge(challenge_id):
+    """Admin force accepts a pending challenge"""
+    from utils import send_email_notification
+    
+    challenge = LadderChallenge.query.get(challenge_id)
+    if not challenge:
+        flash("Challenge not found", "error")
+        return redirect(request.referrer or url_for('admin.admin_panel'))
+    
+    if challenge.status != 'pending_acceptance':
+        flash("Challenge is not pending acceptance", "error")
+        return redirect(request.referrer or url_for('admin.admin_panel'))
+    
+    challenger_team = LadderTeam.query.get(challenge.challenger_team_id)
+    challenged_team = LadderTeam.query.get(challenge.challenged_team_id)
+    
+    # Accept the challenge
+    challenge.status = 'accepted'
+    challenger_team.is_locked = True
+    challenged_team.is_locked = True
+    db.session.commit()
+    
+    # Create match if not exists
+    existing_match = LadderMatch.query.filter_by(challenge_id=challenge.id).first()
+    if not existing_match:
+        match = LadderMatch(
+            challenge_id=challenge.id,
+            team_a_id=challenger_team.id,
+            team_b_id=challenged_team.id,
+            ladder_type=challenge.ladder_type,
+            status='pending'
+        )
+        db.session.add(match)
+        db.session.commit()
+    
+    # Send notifications
+    challenger_message = f"""Challenge Accepted (Admin Force)
+
+Your challenge against {challenged_team.team_name} has been accepted by admin.
+
+Challenge Details:
+- Opponent: {challenged_team.team_name} ({challenged_team.player1_name} & {challenged_team.player2_name})
+- Their Rank: #{challenged_team.current_rank}
+- Complete by: {challenge.completion_deadline.strftime('%b %d, %Y') if challenge.completion_deadline else 'N/A'}
+
+Both teams are now locked and must complete the match by the deadline.
+
+Regards,
+BD Padel Ladder Team
+"""
+    
+    challenged_message = f"""Challenge Accepted (Admin Force)
+
+{challenger_team.team_name} has been accepted to challenge you (admin force).
+
+Challenge Details:
+- Challenger: {challenger_team.team_name} ({challenger_team.player1_name} & {challenger_team.player2_name})
+- Their Rank: #{challenger_team.current_rank}
+- Complete by: {challenge.completion_deadline.strftime('%b %d, %Y') if challenge.completion_deadline else 'N/A'}
+
+Both teams are now locked and must complete the match by the deadline.
+
+Regards,
+BD Padel Ladder Team
+"""
+    
+    if challenger_team.contact_preference_email:
+        if challenger_team.player1_email:
+            send_email_notification(challenger_team.player1_email, "Challenge Accepted", challenger_message)
+        if challenger_team.player2_email and challenger_team.player2_email != challenger_team.player1_email:
+            send_email_notification(challenger_team.player2_email, "Challenge Accepted", challenger_message)
+    
+    if challenged_team.contact_preference_email:
+        if challenged_team.player1_email:
+            send_email_notification(challenged_team.player1_email, "Challenge Received", challenged_message)
+        if challenged_team.player2_email and challenged_team.player2_email != challenged_team.player1_email:
+            send_email_notification(challenged_team.player2_email, "Challenge Received", challenged_message)
+    
+    flash("Challenge accepted successfully. Both teams are now locked.", "success")
+    return redirect(request.referrer or url_for('admin.admin_panel'))
+
+
+@bp.route("/admin/ladder/challenge/force-reject/<int:challenge_id>", methods=["POST"])
+@require_admin_auth
+def admin_force_reject_challenge(challenge_id):
+    """Admin force rejects a pending challenge"""
+    from utils import send_email_notification
+    
+    challenge = LadderChallenge.query.get(challenge_id)
+    if not challenge:
+        flash("Challenge not found", "error")
+        return redirect(request.referrer or url_for('admin.admin_panel'))
+    
+    if challenge.status != 'pending_acceptance':
+        flash("Challenge is not pending acceptance", "error")
+        return redirect(request.referrer or url_for('admin.admin_panel'))
+    
+    challenger_team = LadderTeam.query.get(challenge.challenger_team_id)
+    challenged_team = LadderTeam.query.get(challenge.challenged_team_id)
+    
+    # Reject the challenge
+    challenge.status = 'rejected'
+    challenged_team.is_locked = False
+    db.session.commit()
+    
+    # Send notifications
+    challenger_message = f"""Challenge Rejected (Admin Force)
+
+Your challenge against {challenged_team.team_name} has been rejected by admin.
+
+Challenge Details:
+- Challenged Team: {challenged_team.team_name} ({challenged_team.player1_name} & {challenged_team.player2_name})
+- Their Rank: #{challenged_team.current_rank}
+
+You are now unlocked and can send new challenges.
+
+Regards,
+BD Padel Ladder Team
+"""
+    
+    challenged_message = f"""Challenge Rejected (Admin Force)
+
+Your challenge from {challenger_team.team_name} has been rejected by admin.
+
+Challenge Details:
+- Challenger: {challenger_team.team_name} ({challenger_team.player1_name} & {challenger_team.player2_name})
+- Their Rank: #{challenger_team.current_rank}
+
+You are now unlocked and available for new challenges.
+
+Regards,
+BD Padel Ladder Team
+"""
+    
+    if challenger_team.contact_preference_email:
+        if challenger_team.player1_email:
+            send_email_notification(challenger_team.player1_email, "Challenge Rejected", challenger_message)
+        if challenger_team.player2_email and challenger_team.player2_email != challenger_team.player1_email:
+            send_email_notification(challenger_team.player2_email, "Challenge Rejected", challenger_message)
+    
+    if challenged_team.contact_preference_email:
+        if challenged_team.player1_email:
+            send_email_notification(challenged_team.player1_email, "Challenge Rejected", challenged_message)
+        if challenged_team.player2_email and challenged_team.player2_email != challenged_team.player1_email:
+            send_email_notification(challenged_team.player2_email, "Challenge Rejected", challenged_message)
+    
+    flash("Challenge rejected successfully. Teams are now unlocked.", "success")
+    return redirect(request.referrer or url_for('admin.admin_panel'))
+
+
+@bp.route("/admin/ladder/challenge/cancel/<int:challenge_id>", methods=["POST"])
+@require_admin_auth
+def admin_cancel_challenge(challenge_id):
+    """Admin cancels a challenge (pending or accepted)"""
+    from utils import send_email_notification
+    
+    challenge = LadderChallenge.query.get(challenge_id)
+    if not challenge:
+        flash("Challenge not found", "error")
+        return redirect(request.referrer or url_for('admin.admin_panel'))
+    
+    if challenge.status not in ['pending_acceptance', 'accepted']:
+        flash("Can only cancel pending or accepted challenges", "error")
+        return redirect(request.referrer or url_for('admin.admin_panel'))
+    
+    challenger_team = LadderTeam.query.get(challenge.challenger_team_id)
+    challenged_team = LadderTeam.query.get(challenge.challenged_team_id)
+    
+    # Cancel the challenge
+    challenge.status = 'cancelled'
+    challenger_team.is_locked = False
+    challenged_team.is_locked = False
+    db.session.commit()
+    
+    # Delete match if exists and no scores submitted
+    match = LadderMatch.query.filter_by(challenge_id=challenge.id).first()
+    if match and not match.team_a_submitted and not match.team_b_submitted:
+        db.session.delete(match)
+        db.session.commit()
+    
+    # Send notifications
+    challenger_message = f"""Challenge Cancelled (Admin)
+
+Your challenge against {challenged_team.team_name} has been cancelled by admin.
+
+Challenge Details:
+- Challenged Team: {challenged_team.team_name} ({challenged_team.player1_name} & {challenged_team.player2_name})
+- Their Rank: #{challenged_team.current_rank}
+
+Both teams are now unlocked.
+
+Regards,
+BD Padel Ladder Team
+"""
+    
+    challenged_message = f"""Challenge Cancelled (Admin)
+
+The challenge from {challenger_team.team_name} has been cancelled by admin.
+
+Challenge Details:
+- Challenger: {challenger_team.team_name} ({challenger_team.player1_name} & {challenger_team.player2_name})
+- Their Rank: #{challenger_team.current_rank}
+
+Both teams are now unlocked.
+
+Regards,
+BD Padel Ladder Team
+"""
+    
+    if challenger_team.contact_preference_email:
+        if challenger_team.player1_email:
+            send_email_notification(challenger_team.player1_email, "Challenge Cancelled", challenger_message)
+        if challenger_team.player2_email and challenger_team.player2_email != challenger_team.player1_email:
+            send_email_notification(challenger_team.player2_email, "Challenge Cancelled", challenger_message)
+    
+    if challenged_team.contact_preference_email:
+        if challenged_team.player1_email:
+            send_email_notification(challenged_team.player1_email, "Challenge Cancelled", challenged_message)
+        if challenged_team.player2_email and challenged_team.player2_email != challenged_team.player1_email:
+            send_email_notification(challenged_team.player2_email, "Challenge Cancelled", challenged_message)
+    
+    flash("Challenge cancelled successfully. Teams are now unlocked.", "success")
+    return redirect(request.referrer or url_for('admin.admin_ladder_challenges', ladder_type=challenge.ladder_type))
+
+
+@bp.route("/admin/ladder/challenge/reactivate/<int:challenge_id>", methods=["POST"])
+@require_admin_auth
+def admin_reactivate_challenge(challenge_id):
+    """Admin reactivates an expired challenge by extending its deadline."""
+    from datetime import datetime, timedelta
+    
+    challenge = LadderChallenge.query.get_or_404(challenge_id)
+    
+    # Reset status and give a fresh 48-hour window
+    challenge.status = 'pending_acceptance'
+    challenge.acceptance_deadline = datetime.now() + timedelta(hours=48)
+    
+    db.session.commit()
+    flash("Challenge reactivated successfully for 48 hours.", "success")
+    return redirect(request.referrer or url_for('admin.admin_ladder_challenges', ladder_type=challenge.ladder_type))
+
+
+@bp.route("/admin/ladder/matches/<ladder_type>")
+@require_admin_auth
+def admin_ladder_matches(ladder_type):
+    """Admin page to manage all ladder matches for a division"""
+    from datetime import datetime
+
+    if ladder_type not in ['men', 'women', 'mixed']:
+        flash("Invalid ladder type", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    if ladder_type == 'men':
+        division_title = "Men's Division"
+    elif ladder_type == 'women':
+        division_title = "Women's Division"
+    else:
+        division_title = "Mixed Division"
+
+    # Calculate display ranks using SAME logic as public ladder
+    all_teams_raw = LadderTeam.query.filter_by(
+        gender=ladder_type,
+        payment_received=True
+    ).all()
+    
+    teams_by_creation = sorted(all_teams_raw, key=lambda t: t.created_at)
+    initial_ranks = {t.id: idx for idx, t in enumerate(teams_by_creation, start=1)}
+    
+    all_teams_sorted = sorted(
+        all_teams_raw, 
+        key=lambda t: t.current_rank if t.current_rank is not None else initial_ranks.get(t.id, 999)
+    )
+    
+    # Create mapping from team_id to display_rank
+    team_display_ranks = {t.id: idx + 1 for idx, t in enumerate(all_teams_sorted)}
+
+    all_matches = LadderMatch.query.filter_by(ladder_type=ladder_type).options(
+        joinedload(LadderMatch.team_a),
+        joinedload(LadderMatch.team_b),
+    ).order_by(
+        LadderMatch.created_at.desc()
+    ).all()
+
+    pending_scores = []
+    disputed = []
+    no_shows = []
+    completed = []
+
+    for match in all_matches:
+        team_a = match.team_a
+        team_b = match.team_b
+        
+        # Add display_rank to team objects for template use
+        if team_a:
+            team_a.display_rank = team_display_ranks.get(team_a.id, team_a.current_rank)
+        if team_b:
+            team_b.display_rank = team_display_ranks.get(team_b.id, team_b.current_rank)
+
+        match_data = {
+            'match': match,
+            'team_a': team_a,
+            'team_b': team_b,
+        }
+
+        if match.disputed:
+            disputed.append(match_data)
+        elif match.reported_no_show_team_id and not match.no_show_verified:
+            no_shows.append(match_data)
+        elif match.verified or match.status == 'completed':
+            if len(completed) < 20:
+                completed.append(match_data)
+        elif match.status == 'pending':
+            pending_scores.append(match_data)
+
+    return render_template(
+        "admin_ladder_matches.html",
+        ladder_type=ladder_type,
+        division_title=division_title,
+        pending_scores=pending_scores,
+        disputed=disputed,
+        no_shows=no_shows,
+        completed=completed
+    )
+
+
+@bp.route("/admin/ladder/dispute/resolve/<int:match_id>", methods=["GET", "POST"])
+@require_admin_auth
+def admin_ladder_dispute_resolve(match_id):
+    """Admin page to resolve disputed ladder match scores"""
+    from datetime import datetime
+    from utils import swap_ladder_ranks, update_ladder_team_stats, send_email_notification
+
+    match = LadderMatch.query.get_or_404(match_id)
+    team_a = LadderTeam.query.get(match.team_a_id)
+    team_b = LadderTeam.query.get(match.team_b_id)
+
+    if request.method == "POST":
+        try:
+            set1_a = request.form.get("set1_a", type=int)
+            set1_b = request.form.get("set1_b", type=int)
+            set2_a = request.form.get("set2_a", type=int)
+            set2_b = request.form.get("set2_b", type=int)
+            set3_a = request.form.get("set3_a", type=int, default=0)
+            set3_b = request.form.get("set3_b", type=int, default=0)
+            winner_choice = request.form.get("winner")
+            admin_notes = request.form.get("admin_notes", "")
+
+            if not all([set1_a is not None, set1_b is not None, set2_a is not None, set2_b is not None, winner_choice]):
+                flash("Please fill in all required fields", "error")
+                return redirect(url_for('admin.admin_ladder_dispute_resolve', match_id=match_id))
+
+            sets_a = 0
+            sets_b = 0
+            games_a = set1_a + set2_a + (set3_a or 0)
+            games_b = set1_b + set2_b + (set3_b or 0)
+
+            if set1_a > set1_b:
+                sets_a += 1
+            else:
+                sets_b += 1
+
+            if set2_a > set2_b:
+                sets_a += 1
+            else:
+                sets_b += 1
+
+            if set3_a and set3_b:
+                if set3_a > set3_b:
+                    sets_a += 1
+                else:
+                    sets_b += 1
+
+            match.team_a_score_set1 = set1_a
+            match.team_a_score_set2 = set2_a
+            match.team_a_score_set3 = set3_a
+            match.team_b_score_set1 = set1_b
+            match.team_b_score_set2 = set2_b
+            match.team_b_score_set3 = set3_b
+
+            match.sets_a = sets_a
+            match.sets_b = sets_b
+            match.games_a = games_a
+            match.games_b = games_b
+
+            if winner_choice == "team_a":
+                match.winner_id = team_a.id
+                winner_team = team_a
+                loser_team = team_b
+            elif winner_choice == "team_b":
+                match.winner_id = team_b.id
+                winner_team = team_b
+                loser_team = team_a
+            else:
+                match.winner_id = None
+                winner_team = None
+                loser_team = None
+
+            match.status = 'completed'
+            match.disputed = False
+            match.verified = True
+            match.completed_at = datetime.now()
+
+            if winner_team and loser_team:
+                update_ladder_team_stats(match, winner_team, loser_team)
+                rank_changes = swap_ladder_ranks(winner_team, loser_team, match.ladder_type)
+
+                match.winner_old_rank = rank_changes['winner']['old']
+                match.winner_new_rank = rank_changes['winner']['new']
+                match.loser_old_rank = rank_changes['loser']['old']
+                match.loser_new_rank = rank_changes['loser']['new']
+
+            db.session.commit()
+
+            email_body_a = f"""Hi {team_a.player1_name},
+
+MATCH DISPUTE RESOLVED
+
+Your disputed match has been reviewed and resolved by admin.
+
+Match Details:
+- Opponent: {team_b.team_name}
+- Final Score: {set1_a}-{set1_b}, {set2_a}-{set2_b}{',' + str(set3_a) + '-' + str(set3_b) if set3_a else ''}
+- Winner: {winner_team.team_name if winner_team else 'Draw'}
+- Admin Notes: {admin_notes}
+
+Your new rank: #{team_a.current_rank}
+
+- BD Padel League
+"""
+
+            email_body_b = f"""Hi {team_b.player1_name},
+
+MATCH DISPUTE RESOLVED
+
+Your disputed match has been reviewed and resolved by admin.
+
+Match Details:
+- Opponent: {team_a.team_name}
+- Final Score: {set1_b}-{set1_a}, {set2_b}-{set2_a}{',' + str(set3_b) + '-' + str(set3_a) if set3_b else ''}
+- Winner: {winner_team.team_name if winner_team else 'Draw'}
+- Admin Notes: {admin_notes}
+
+Your new rank: #{team_b.current_rank}
+
+- BD Padel League
+"""
+
+            if team_a.player1_email:
+                send_email_notification(team_a.player1_email, "Match Dispute Resolved", email_body_a)
+            if team_a.player2_email:
+                send_email_notification(team_a.player2_email, "Match Dispute Resolved", email_body_a)
+            if team_b.player1_email:
+                send_email_notification(team_b.player1_email, "Match Dispute Resolved", email_body_b)
+            if team_b.player2_email:
+                send_email_notification(team_b.player2_email, "Match Dispute Resolved", email_body_b)
+
+            flash("Match dispute resolved successfully!", "success")
+            return redirect(url_for('admin.admin_ladder_matches', ladder_type=match.ladder_type))
+
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error resolving dispute: {str(e)}", "error")
+            return redirect(url_for('admin.admin_ladder_dispute_resolve', match_id=match_id))
+
+    return render_template(
+        "admin_ladder_dispute_resolve.html",
+        match=match,
+        team_a=team_a,
+        team_b=team_b
+    )
+
+
+@bp.route("/admin/ladder/no-show/process/<int:match_id>", methods=["POST"])
+@require_admin_auth
+def admin_ladder_no_show_process(match_id):
+    """Process admin decision on no-show report"""
+    from datetime import datetime
+    from utils import swap_ladder_ranks, apply_rank_penalty, update_ladder_team_stats, send_email_notification
+
+    match = LadderMatch.query.get_or_404(match_id)
+    team_a = LadderTeam.query.get(match.team_a_id)
+    team_b = LadderTeam.query.get(match.team_b_id)
+
+    action = request.form.get("action")
+    admin_notes = request.form.get("admin_notes", "")
+
+    if match.status == 'completed':
+        flash("Cannot process no-show - match already completed", "error")
+        return redirect(url_for('admin.admin_ladder_matches', ladder_type=match.ladder_type))
+
+    try:
+        if action == "approve":
+            no_show_team_id = match.reported_no_show_team_id
+            reporting_team_id = match.reported_by_team_id
+
+            if no_show_team_id == team_a.id:
+                opponent_team_name = team_b.team_name
+                no_show_team = team_a
+                winner_team = team_b
+            else:
+                opponent_team_name = team_a.team_name
+                no_show_team = team_b
+                winner_team = team_a
+
+            penalty_result = apply_rank_penalty(no_show_team, 1, f"No-show for match vs {winner_team.team_name}", match.ladder_type)
+
+            match.winner_id = winner_team.id
+            match.sets_a = 2 if winner_team.id == team_a.id else 0
+            match.sets_b = 2 if winner_team.id == team_b.id else 0
+            match.games_a = 12 if winner_team.id == team_a.id else 0
+            match.games_b = 12 if winner_team.id == team_b.id else 0
+            match.status = 'completed_no_show'
+            match.no_show_verified = True
+            match.verified = True
+            match.completed_at = datetime.now()
+
+            update_ladder_team_stats(match, winner_team, no_show_team)
+
+            db.session.commit()
+
+            email_winner = f"""Hi {winner_team.player1_name},
+
+NO-SHOW APPROVED - YOU WIN
+
+The admin has approved the no-show report for your match.
+
+Match Details:
+- Opponent: {no_show_team.team_name} (No-Show)
+- Result: Win by No-Show
+- Admin Notes: {admin_notes}
+
+Your new rank: #{winner_team.current_rank}
+
+- BD Padel League
+"""
+
+            email_no_show = f"""Hi {no_show_team.player1_name},
+
+NO-SHOW PENALTY APPLIED
+
+The admin has confirmed your no-show for the match vs {winner_team.team_name}.
+
+Penalties:
+- Match Result: Loss by No-Show
+- Rank Penalty: -1 rank
+- New Rank: #{no_show_team.current_rank}
+- Admin Notes: {admin_notes}
+
+Please ensure you attend all scheduled matches in the future.
+
+- BD Padel League
+"""
+
+            if winner_team.player1_email:
+                send_email_notification(winner_team.player1_email, "No-Show Approved - You Win", email_winner)
+            if winner_team.player2_email:
+                send_email_notification(winner_team.player2_email, "No-Show Approved - You Win", email_winner)
+            if no_show_team.player1_email:
+                send_email_notification(no_show_team.player1_email, "No-Show Penalty Applied", email_no_show)
+            if no_show_team.player2_email:
+                send_email_notification(no_show_team.player2_email, "No-Show Penalty Applied", email_no_show)
+
+            flash("No-show approved and penalties applied", "success")
+
+        elif action == "reject":
+            match.status = 'pending'
+            match.reported_no_show_team_id = None
+            match.reported_by_team_id = None
+            match.no_show_report_date = None
+            match.no_show_notes = None
+
+            db.session.commit()
+
+            email_body = f"""Hi,
+
+NO-SHOW REPORT REJECTED
+
+The admin has rejected the no-show report for your match.
+
+Match Details:
+- Teams: {team_a.team_name} vs {team_b.team_name}
+- Status: Match must be played
+- Admin Notes: {admin_notes}
+
+Please coordinate with your opponent to complete the match.
+
+- BD Padel League
+"""
+
+            if team_a.player1_email:
+                send_email_notification(team_a.player1_email, "No-Show Report Rejected", email_body)
+            if team_a.player2_email:
+                send_email_notification(team_a.player2_email, "No-Show Report Rejected", email_body)
+            if team_b.player1_email:
+                send_email_notification(team_b.player1_email, "No-Show Report Rejected", email_body)
+            if team_b.player2_email:
+                send_email_notification(team_b.player2_email, "No-Show Report Rejected", email_body)
+
+            flash("No-show report rejected - match reset to pending", "success")
+
+        return redirect(url_for('admin.admin_ladder_matches', ladder_type=match.ladder_type))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error processing no-show: {str(e)}", "error")
+        return redirect(url_for('admin.admin_ladder_matches', ladder_type=match.ladder_type))
+
+
+@bp.route("/admin/ladder/team/edit/<int:team_id>", methods=["GET", "POST"])
+@require_admin_auth
+def admin_ladder_edit_team(team_id):
+    """Edit ladder team details"""
+    from datetime import datetime
+    from utils import normalize_phone_number, normalize_team_name, send_email_notification
+
+    team = LadderTeam.query.get_or_404(team_id)
+    ladder_type = team.ladder_type
+
+    if request.method == "POST":
+        try:
+            team_name = request.form.get("team_name", "").strip()
+            player1_name = request.form.get("player1_name", "").strip()
+            player1_email = request.form.get("player1_email", "").strip()
+            player1_phone = request.form.get("player1_phone", "").strip()
+            player2_name = request.form.get("player2_name", "").strip()
+            player2_email = request.form.get("player2_email", "").strip()
+            player2_phone = request.form.get("player2_phone", "").strip()
+            # Handle contact preferences - default to email if neither is selected
+            contact_preference_email = "contact_preference_email" in request.form
+            contact_preference_whatsapp = "contact_preference_whatsapp" in request.form
+            
+            # If neither is selected, default to email
+            if not contact_preference_email and not contact_preference_whatsapp:
+                contact_preference_email = True
+
+            if not all([team_name, player1_name, player1_phone, player2_name, player2_phone]):
+                flash("All required fields must be filled", "error")
+                return redirect(url_for('admin.admin_ladder_edit_team', team_id=team_id))
+
+            canonical_name = normalize_team_name(team_name)
+            existing_team = LadderTeam.query.filter(
+                LadderTeam.team_name_canonical == canonical_name,
+                LadderTeam.id != team_id,
+                LadderTeam.ladder_type == ladder_type
+            ).first()
+
+            if existing_team:
+                flash(f"Team name '{team_name}' is already taken in this division", "error")
+                return redirect(url_for('admin.admin_ladder_edit_team', team_id=team_id))
+
+            old_team_name = team.team_name
+
+            team.team_name = team_name
+            team.team_name_canonical = canonical_name
+            team.player1_name = player1_name
+            team.player1_email = player1_email or None
+            team.player1_phone = normalize_phone_number(player1_phone)
+            team.player2_name = player2_name
+            team.player2_email = player2_email or None
+            team.player2_phone = normalize_phone_number(player2_phone)
+            team.contact_preference_email = contact_preference_email
+            team.contact_preference_whatsapp = contact_preference_whatsapp
+            team.updated_at = datetime.now()
+
+            db.session.commit()
+
+            email_body = f"""Hi {team.player1_name},
+
+TEAM DETAILS UPDATED
+
+Your ladder team details have been updated by an administrator.
+
+Updated Team: {team.team_name}
+Previous Name: {old_team_name}
+Division: {ladder_type.capitalize()} Ladder
+Current Rank: #{team.current_rank}
+
+Player 1: {team.player1_name} ({team.player1_email or team.player1_phone})
+Player 2: {team.player2_name} ({team.player2_email or team.player2_phone})
+
+If you have any questions about these changes, please contact the admin.
+
+- BD Padel League
+"""
+
+            if team.contact_preference_email:
+                if team.player1_email:
+                    send_email_notification(team.player1_email, "Team Details Updated", email_body)
+                if team.player2_email and team.player2_email != team.player1_email:
+                    send_email_notification(team.player2_email, "Team Details Updated", email_body)
+
+            flash(f"Team '{team.team_name}' updated successfully!", "success")
+            return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error updating team: {str(e)}", "error")
+            return redirect(url_for('admin.admin_ladder_edit_team', team_id=team_id))
+
+    return render_template("admin_edit_team.html", team=team, is_ladder=True)
+
+
+@bp.route("/admin/ladder/team/delete/<int:team_id>", methods=["POST"])
+@require_admin_auth
+def admin_ladder_delete_team(team_id):
+    """Delete ladder team and adjust rankings"""
+    from utils import send_email_notification
+
+    team = LadderTeam.query.get_or_404(team_id)
+    ladder_type = team.ladder_type
+    team_rank = team.current_rank
+    team_name = team.team_name
+
+    active_challenges = LadderChallenge.query.filter(
+        db.or_(
+            LadderChallenge.challenger_team_id == team_id,
+            LadderChallenge.challenged_team_id == team_id
+        ),
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).count()
+
+    if active_challenges > 0:
+        flash(f"Cannot delete team - they have {active_challenges} active challenge(s). Please resolve or cancel these first.", "error")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+    pending_matches = LadderMatch.query.filter(
+        db.or_(
+            LadderMatch.team_a_id == team_id,
+            LadderMatch.team_b_id == team_id
+        ),
+        LadderMatch.status == 'pending'
+    ).count()
+
+    if pending_matches > 0:
+        flash(f"Cannot delete team - they have {pending_matches} pending match(es). Please resolve these first.", "error")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+    try:
+        teams_to_move_up = LadderTeam.query.filter(
+            LadderTeam.gender == ladder_type,
+            LadderTeam.current_rank > team_rank
+        ).all()
+
+        for t in teams_to_move_up:
+            t.current_rank -= 1
+
+        player1_email = team.player1_email
+        player2_email = team.player2_email
+        contact_email = team.contact_preference_email
+
+        db.session.delete(team)
+        db.session.commit()
+
+        email_body = f"""Hi {team.player1_name},
+
+TEAM REMOVED FROM LADDER
+
+Your team "{team_name}" has been removed from the {ladder_type.capitalize()} Ladder by an administrator.
+
+Previous Rank: #{team_rank}
+Reason: Administrative decision
+
+If you believe this was done in error or have questions, please contact the admin immediately.
+
+- BD Padel League
+"""
+
+        if contact_email:
+            if player1_email:
+                send_email_notification(player1_email, "Team Removed from Ladder", email_body)
+            if player2_email and player2_email != player1_email:
+                send_email_notification(player2_email, "Team Removed from Ladder", email_body)
+
+        flash(f"Team '{team_name}' deleted successfully. {len(teams_to_move_up)} team(s) moved up in rankings.", "success")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error deleting team: {str(e)}", "error")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+
+@bp.route("/admin/ladder/team/adjust-rank", methods=["POST"])
+@require_admin_auth
+def admin_ladder_adjust_rank():
+    """Manually adjust a team's rank on the ladder"""
+    from utils import adjust_ladder_ranks, send_email_notification
+
+    team_id = request.form.get("team_id", type=int)
+    new_rank = request.form.get("new_rank", type=int)
+
+    if not team_id or not new_rank:
+        flash("Team ID and new rank are required", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    team = LadderTeam.query.get_or_404(team_id)
+    ladder_type = team.gender
+
+    try:
+        result = adjust_ladder_ranks(team, new_rank, ladder_type)
+
+        if not result.get('success'):
+            flash(result.get('message', 'Failed to adjust rank'), "error")
+            return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+        old_rank = result['old_rank']
+        new_rank = result['new_rank']
+        affected_teams = result['affected_teams']
+
+        email_body = f"""Hi {team.player1_name},
+
+RANK ADJUSTED BY ADMIN
+
+Your team's rank has been manually adjusted by an administrator.
+
+Team: {team.team_name}
+Old Rank: #{old_rank}
+New Rank: #{new_rank}
+Change: {"+" if new_rank > old_rank else ""}{new_rank - old_rank} positions
+
+If you have questions about this adjustment, please contact the admin.
+
+- BD Padel League
+"""
+
+        if team.contact_preference_email:
+            if team.player1_email:
+                send_email_notification(team.player1_email, f"Rank Adjusted: #{old_rank} → #{new_rank}", email_body)
+            if team.player2_email and team.player2_email != team.player1_email:
+                send_email_notification(team.player2_email, f"Rank Adjusted: #{old_rank} → #{new_rank}", email_body)
+
+        for affected in affected_teams:
+            affected_team = LadderTeam.query.get(affected['team_id'])
+            if affected_team and affected_team.contact_preference_email:
+                affected_email = f"""Hi {affected_team.player1_name},
+
+RANK ADJUSTMENT NOTIFICATION
+
+Due to an admin rank adjustment, your team's rank has been updated.
+
+Team: {affected_team.team_name}
+Old Rank: #{affected['old_rank']}
+New Rank: #{affected['new_rank']}
+
+This change was made to accommodate the adjustment of another team.
+
+- BD Padel League
+"""
+                if affected_team.player1_email:
+                    send_email_notification(affected_team.player1_email, "Rank Update", affected_email)
+                if affected_team.player2_email and affected_team.player2_email != affected_team.player1_email:
+                    send_email_notification(affected_team.player2_email, "Rank Update", affected_email)
+
+        flash(f"Rank adjusted successfully! {team.team_name}: #{old_rank} → #{new_rank}. {len(affected_teams)} other team(s) affected.", "success")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error adjusting rank: {str(e)}", "error")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+
+@bp.route("/admin/ladder/team/toggle-holiday", methods=["POST"])
+@require_admin_auth
+def admin_ladder_toggle_holiday():
+    """Toggle holiday mode for a ladder team"""
+    from datetime import datetime
+    from utils import send_email_notification
+
+    team_id = request.form.get("team_id", type=int)
+
+    if not team_id:
+        flash("Team ID is required", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+    team = LadderTeam.query.get_or_404(team_id)
+    ladder_type = team.gender
+
+    try:
+        if team.holiday_mode_active:
+            team.holiday_mode_active = False
+            team.holiday_mode_end = datetime.now()
+            action = "deactivated"
+
+            email_body = f"""Hi {team.player1_name},
+
+HOLIDAY MODE DEACTIVATED
+
+An administrator has deactivated holiday mode for your team.
+
+Team: {team.team_name}
+Division: {ladder_type.capitalize()} Ladder
+Current Rank: #{team.current_rank}
+Status: Now AVAILABLE for challenges
+
+You can now be challenged by other teams again.
+
+- BD Padel League
+"""
+
+        else:
+            active_challenges = LadderChallenge.query.filter(
+                db.or_(
+                    LadderChallenge.challenger_team_id == team_id,
+                    LadderChallenge.challenged_team_id == team_id
+                ),
+                LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+            ).count()
+
+            if active_challenges > 0:
+                flash(f"Cannot activate holiday mode - team has {active_challenges} active challenge(s)", "error")
+                return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+            team.holiday_mode_active = True
+            team.holiday_mode_start = datetime.now()
+            team.holiday_mode_end = None
+            action = "activated"
+
+            email_body = f"""Hi {team.player1_name},
+
+HOLIDAY MODE ACTIVATED
+
+An administrator has activated holiday mode for your team.
+
+Team: {team.team_name}
+Division: {ladder_type.capitalize()} Ladder
+Current Rank: #{team.current_rank}
+Status: Now ON HOLIDAY (cannot be challenged)
+
+While on holiday mode, you cannot be challenged by other teams and your rank is protected.
+
+- BD Padel League
+"""
+
+        db.session.commit()
+
+        if team.contact_preference_email:
+            if team.player1_email:
+                send_email_notification(team.player1_email, f"Holiday Mode {action.capitalize()}", email_body)
+            if team.player2_email and team.player2_email != team.player1_email:
+                send_email_notification(team.player2_email, f"Holiday Mode {action.capitalize()}", email_body)
+
+        flash(f"Holiday mode {action} for '{team.team_name}'", "success")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error toggling holiday mode: {str(e)}", "error")
+        return redirect(url_for('admin.admin_ladder_rankings', ladder_type=ladder_type))
+
+
+@bp.route("/admin/ladder/mark-paid/<int:team_id>", methods=["POST"])
+@require_admin_auth
+def admin_mark_ladder_team_paid(team_id):
+    team = LadderTeam.query.get_or_404(team_id)
+    if team.payment_received:
+        flash("Team is already marked as paid.", "info")
+        return redirect(url_for('admin.admin_panel', tab='ladder'))
+
+    try:
+        # Find max rank in the appropriate gender ladder and add team at bottom
+        max_rank_team = LadderTeam.query.filter_by(
+            gender=team.gender,
+            payment_received=True
+        ).order_by(LadderTeam.current_rank.desc()).first()
+
+        next_rank = (max_rank_team.current_rank + 1) if max_rank_team and max_rank_team.current_rank else 1
+
+        team.payment_received = True
+        team.current_rank = next_rank
+        team.updated_at = datetime.now()
+
+        db.session.commit()
+        flash(f"Team '{team.team_name}' marked as paid and entered ladder at rank #{next_rank}.", "success")
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error marking team as paid: {str(e)}")
+        flash(f"Error updating team: {str(e)}", "error")
+
+    return redirect(url_for('admin.admin_panel', tab='ladder'))
+
+
+@bp.route("/admin/ladder/pair-free-agents", methods=["POST"])
+@require_admin_auth
+def admin_pair_free_agents_ladder():
+    team_name = request.form.get('team_name')
+    p1_id = request.form.get('player1_id')
+    p2_id = request.form.get('player2_id')
+
+    if not all([team_name, p1_id, p2_id]):
+        flash("All fields are required.", "error")
+        return redirect(url_for('admin.admin_panel', tab='freeagents'))
+
+    if p1_id == p2_id:
+        flash("You cannot select the same player twice.", "error")
+        return redirect(url_for('admin.admin_panel', tab='freeagents'))
+
+    player1 = LadderFreeAgent.query.get(p1_id)
+    player2 = LadderFreeAgent.query.get(p2_id)
+
+    if not player1 or not player2:
+        flash("One or both players not found.", "error")
+        return redirect(url_for('admin.admin_panel', tab='freeagents'))
+
+    if player1.gender != player2.gender:
+        flash("Both players must be of the same gender.", "error")
+        return redirect(url_for('admin.admin_panel', tab='freeagents'))
+
+    try:
+        # Determine ladder type and gender
+        gender = player1.gender
+        ladder_type = 'men' if gender == 'men' else 'women'
+
+        # Generate unique access token
+        import secrets
+        access_token = secrets.token_urlsafe(32)
+
+        # Create new ladder team (pending payment)
+        from datetime import datetime
+        new_team = LadderTeam(
+            team_name=team_name,
+            team_name_canonical=normalize_team_name(team_name),
+            player1_name=player1.name,
+            player1_phone=player1.phone,
+            player1_email=player1.email,
+            player2_name=player2.name,
+            player2_phone=player2.phone,
+            player2_email=player2.email,
+            gender=gender,
+            ladder_type=ladder_type,
+            current_rank=None, # None indicates pending payment/not on ladder yet
+            payment_received=False,
+            is_verified=True,
+            access_token=access_token,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+
+        # Mark agents as paired
+        player1.paired = True
+        player2.paired = True
+
+        db.session.add(new_team)
+        db.session.commit()
+
+        # Generate access link
+        base_url = "https://goeclectic.xyz"
+        access_link = f"{base_url}/ladder/my-team/{access_token}"
+
+        # Send confirmation email to Player 1
+        from utils import send_email_notification
+        if gender == 'men':
+            whatsapp_link = "https://chat.whatsapp.com/Fw54Nxdk6jS9GTMOTnC0UD"
+        else: # women
+            whatsapp_link = "https://chat.whatsapp.com/GswFleVQhxF4gziShBhstd"
+
+        email_body = f"""Hi {player1.name},
+
+✅ Your team "{team_name}" has been successfully registered for the Ladder Tournament!
+
+📋 Registration Details:
+- Team Name: {team_name}
+- Gender Category: {gender.capitalize()}
+- Player 1: {player1.name} (You)
+- Player 2: {player2.name}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💳 PAYMENT REQUIRED - IMPORTANT
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+To complete your registration and be listed on the ladder rankings, please make a payment of BDT 500 PER TEAM (NOT per player).
+
+Payment Method: bKash
+Payment Number: 01313399918
+Amount: BDT 500 (TOTAL FOR THE ENTIRE TEAM)
+
+⚠️ IMPORTANT: 
+1. This is BDT 500 for the WHOLE TEAM
+2. When making the payment, you MUST put your team name in the reference/note field:
+
+Reference: {team_name}
+
+Once payment is confirmed by admin, your team will be visible on the ladder rankings and you can start challenging other teams.
+
+🔗 Your Team Access Link:
+{access_link}
+
+🔑 Access Token (for team login page):
+{access_token}
+
+💬 Join Your Division's WhatsApp Group:
+{whatsapp_link}
+
+Good luck climbing the ladder! 🚀
+
+- BD Padel League
+"""
+        send_email_notification(player1.email, f"Ladder Team Registered - {team_name}", email_body)
+
+        # Send confirmation email to Player 2
+        email_body_p2 = f"""Hi {player2.name},
+
+✅ You've been registered as part of team "{team_name}" for the Ladder Tournament!
+
+📋 Team Details:
+- Team Name: {team_name}
+- Gender Category: {gender.capitalize()}
+- Partner: {player1.name}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💳 PAYMENT REQUIRED - IMPORTANT
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+To complete your registration and be listed on the ladder rankings, a payment of BDT 500 per team is required.
+
+Payment Method: bKash
+Payment Number: 01313399918
+Amount: BDT 500 (TOTAL FOR THE ENTIRE TEAM)
+
+Reference: {team_name}
+
+Once payment is confirmed by admin, your team will be visible on the ladder rankings.
+
+- BD Padel League
+"""
+        send_email_notification(player2.email, f"Ladder Team Registered - {team_name}", email_body_p2)
+
+        flash(f"Successfully created team '{team_name}' (Pending Payment). Confirmation emails sent.", "success")
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error pairing free agents: {str(e)}")
+        flash(f"Error creating team: {str(e)}", "error")
+
+    return redirect(url_for('admin.admin_panel', tab='freeagents'))
+
+
+@bp.route("/admin/settings", methods=["GET", "POST"])
+@require_admin_auth
+def admin_settings():
+    """Admin settings page for league configuration"""
+    # Get or create settings
+    settings = LeagueSettings.query.first()
+    if not settings:
+        settings = LeagueSettings(swiss_rounds_count=5, playoff_teams_count=8, team_registration_open=True, freeagent_registration_open=True)
+        db.session.add(settings)
+        db.session.commit()
+
+    if request.method == "POST":
+        try:
+            # Update settings
+            swiss_rounds = request.form.get("swiss_rounds_count", type=int)
+            playoff_teams = request.form.get("playoff_teams_count", type=int)
+            team_reg_open = request.form.get("team_registration_open") == "on"
+            freeagent_reg_open = request.form.get("freeagent_registration_open") == "on"
+
+            # Validation
+            if swiss_rounds and swiss_rounds < 1:
+                flash("Swiss rounds must be at least 1", "error")
+                return redirect(url_for("admin.admin_settings"))
+
+            if playoff_teams and playoff_teams not in [4, 8, 16, 32]:
+                flash("Playoff teams must be 4, 8, 16 or 32", "error")
+                return redirect(url_for("admin.admin_settings"))
+
+            # Only allow changes if playoffs haven't started
+            if settings.current_phase != "swiss":
+                flash("Cannot change settings - playoffs have already started!", "error")
+                return redirect(url_for("admin.admin_settings"))
+
+            # Update settings
+            if swiss_rounds:
+                settings.swiss_rounds_count = swiss_rounds
+            if playoff_teams:
+                settings.playoff_teams_count = playoff_teams
+
+            # Update registration toggles (always update these)
+            settings.team_registration_open = team_reg_open
+            settings.freeagent_registration_open = freeagent_reg_open
+
+            db.session.commit()
+            flash("✅ League settings updated successfully!", "success")
+            return redirect(url_for("admin.admin_settings"))
+
+        except Exception as e:
+            flash(f"Error updating settings: {str(e)}", "error")
+            return redirect(url_for("admin.admin_settings"))
+
+    return render_template("admin_settings.html", settings=settings)
+
+
+@bp.route("/admin/ladder/settings", methods=["GET", "POST"])
+@require_admin_auth
+def admin_ladder_settings():
+    """Admin settings page for ladder configuration"""
+    settings = LadderSettings.query.first()
+    if not settings:
+        settings = LadderSettings(
+            challenge_acceptance_hours=48,
+            max_challenge_rank_difference=3,
+            acceptance_penalty_ranks=1,
+            match_completion_days=7,
+            completion_penalty_ranks=1,
+            holiday_mode_grace_weeks=2,
+            holiday_mode_weekly_penalty_ranks=1,
+            min_matches_per_month=2,
+            inactivity_penalty_ranks=3,
+            no_show_penalty_ranks=1,
+            men_registration_open=True,
+            women_registration_open=True
+        )
+        db.session.add(settings)
+        db.session.commit()
+
+    if request.method == "POST":
+        try:
+            challenge_acceptance_hours = request.form.get("challenge_acceptance_hours", type=int)
+            max_challenge_rank_difference = request.form.get("max_challenge_rank_difference", type=int)
+            acceptance_penalty_ranks = request.form.get("acceptance_penalty_ranks", type=int)
+            match_completion_days = request.form.get("match_completion_days", type=int)
+            completion_penalty_ranks = request.form.get("completion_penalty_ranks", type=int)
+            holiday_mode_grace_weeks = request.form.get("holiday_mode_grace_weeks", type=int)
+            holiday_mode_weekly_penalty_ranks = request.form.get("holiday_mode_weekly_penalty_ranks", type=int)
+            min_matches_per_month = request.form.get("min_matches_per_month", type=int)
+            inactivity_penalty_ranks = request.form.get("inactivity_penalty_ranks", type=int)
+            no_show_penalty_ranks = request.form.get("no_show_penalty_ranks", type=int)
+            men_registration_open = request.form.get("men_registration_open") == "on"
+            women_registration_open = request.form.get("women_registration_open") == "on"
+            penalties_active = request.form.get("penalties_active") == "on"
+
+            if challenge_acceptance_hours and challenge_acceptance_hours <= 0:
+                flash("Challenge acceptance hours must be greater than 0", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if max_challenge_rank_difference and max_challenge_rank_difference <= 0:
+                flash("Max challenge rank difference must be greater than 0", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if acceptance_penalty_ranks is not None and acceptance_penalty_ranks < 0:
+                flash("Acceptance penalty ranks cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if match_completion_days and match_completion_days <= 0:
+                flash("Match completion days must be greater than 0", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if completion_penalty_ranks is not None and completion_penalty_ranks < 0:
+                flash("Completion penalty ranks cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if holiday_mode_grace_weeks is not None and holiday_mode_grace_weeks < 0:
+                flash("Holiday mode grace weeks cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if holiday_mode_weekly_penalty_ranks is not None and holiday_mode_weekly_penalty_ranks < 0:
+                flash("Holiday mode weekly penalty cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if min_matches_per_month is not None and min_matches_per_month < 0:
+                flash("Minimum matches per month cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if inactivity_penalty_ranks is not None and inactivity_penalty_ranks < 0:
+                flash("Inactivity penalty ranks cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if no_show_penalty_ranks is not None and no_show_penalty_ranks < 0:
+                flash("No-show penalty ranks cannot be negative", "error")
+                return redirect(url_for("admin.admin_ladder_settings"))
+
+            if challenge_acceptance_hours:
+                settings.challenge_acceptance_hours = challenge_acceptance_hours
+            if max_challenge_rank_difference:
+                settings.max_challenge_rank_difference = max_challenge_rank_difference
+            if acceptance_penalty_ranks is not None:
+                settings.acceptance_penalty_ranks = acceptance_penalty_ranks
+            if match_completion_days:
+                settings.match_completion_days = match_completion_days
+            if completion_penalty_ranks is not None:
+                settings.completion_penalty_ranks = completion_penalty_ranks
+            if holiday_mode_grace_weeks is not None:
+                settings.holiday_mode_grace_weeks = holiday_mode_grace_weeks
+            if holiday_mode_weekly_penalty_ranks is not None:
+                settings.holiday_mode_weekly_penalty_ranks = holiday_mode_weekly_penalty_ranks
+            if min_matches_per_month is not None:
+                settings.min_matches_per_month = min_matches_per_month
+            if inactivity_penalty_ranks is not None:
+                settings.inactivity_penalty_ranks = inactivity_penalty_ranks
+            if no_show_penalty_ranks is not None:
+                settings.no_show_penalty_ranks = no_show_penalty_ranks
+
+            settings.men_registration_open = men_registration_open
+            settings.women_registration_open = women_registration_open
+            settings.penalties_active = penalties_active
+
+            db.session.commit()
+            flash("✅ Ladder settings updated successfully!", "success")
+            return redirect(url_for("admin.admin_ladder_settings"))
+
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error updating ladder settings: {str(e)}", "error")
+            return redirect(url_for("admin.admin_ladder_settings"))
+
+    return render_template("admin_ladder_settings.html", settings=settings)
+
+
+@bp.route("/admin/ladder/americano/tournaments")
+@require_admin_auth
+def admin_americano_tournaments():
+    """List all Americano tournaments"""
+    from datetime import datetime
+
+    try:
+        tournaments = AmericanoTournament.query.order_by(AmericanoTournament.tournament_date.desc()).all()
+
+        tournament_data = []
+        for tournament in tournaments:
+            participating_ids = []
+            if tournament.participating_free_agents:
+                import json
+                try:
+                    participating_ids = json.loads(tournament.participating_free_agents)
+                except:
+                    pass
+
+            participants_count = len(participating_ids)
+
+            matches = AmericanoMatch.query.filter_by(tournament_id=tournament.id).all()
+            matches_count = len(matches)
+            completed_matches = len([m for m in matches if m.status == 'completed'])
+
+            tournament_data.append({
+                'tournament': tournament,
+                'participants_count': participants_count,
+                'matches_count': matches_count,
+                'completed_matches': completed_matches
+            })
+
+        response = make_response(render_template("admin_americano_tournaments.html", tournament_data=tournament_data))
+        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+        response.headers['Pragma'] = 'no-cache'
+        response.headers['Expires'] = '0'
+        return response
+
+    except Exception as e:
+        current_app.logger.error(f"Error loading Americano tournaments: {str(e)}")
+        flash(f"Error loading tournaments: {str(e)}", "error")
+        return redirect(url_for('admin.admin_panel'))
+
+
+@bp.route("/admin/ladder/americano/create", methods=["GET", "POST"])
+@require_admin_auth
+def admin_americano_create():
+    """Create a new Americano tournament - Phase 1: Registration setup only"""
+    from datetime import datetime
+    import json
+
+    if request.method == "POST":
+        try:
+            gender = request.form.get("gender")
+            tournament_date_str = request.form.get("tournament_date")
+            location = request.form.get("location", "")
+
+            # Registration settings
+            registration_open = request.form.get("registration_open") == "on"
+            public_title = request.form.get("public_title", "").strip()
+            public_description = request.form.get("public_description", "").strip()
+            max_participants = request.form.get("max_participants", type=int, default=24)
+            num_courts = request.form.get("num_courts", type=int, default=2)
+            registration_deadline_str = request.form.get("registration_deadline", "").strip()
+
+            if not gender or not tournament_date_str:
+                flash("Division and tournament date are required", "error")
+                return redirect(url_for("admin.admin_americano_create"))
+
+            tournament_date = datetime.strptime(tournament_date_str, "%Y-%m-%d")
+
+            # Parse registration deadline if provided
+            registration_deadline = None
+            if registration_deadline_str:
+                try:
+                    registration_deadline = datetime.strptime(registration_deadline_str, "%Y-%m-%dT%H:%M")
+                except ValueError:
+                    try:
+                        registration_deadline = datetime.strptime(registration_deadline_str, "%Y-%m-%d")
+                    except ValueError:
+                        pass
+
+            # Create tournament with default match format settings (can be changed later)
+            tournament = AmericanoTournament(
+                tournament_date=tournament_date,
+                gender=gender,
+                location=location,
+                status="setup",
+                scoring_format="points",
+                points_per_match=24,  # Default, can be changed before generating matches
+                time_limit_minutes=20,  # Default
+                serves_before_rotation=2,  # Default
+                participating_free_agents="[]",
+                registration_open=registration_open,
+                registration_deadline=registration_deadline,
+                max_participants=max_participants,
+                public_title=public_title if public_title else None,
+                public_description=public_description if public_description else None,
+                num_courts=num_courts,
+                created_at=datetime.now()
+            )
+
+            db.session.add(tournament)
+            db.session.commit()
+
+            msg = f"Tournament created successfully!"
+            if registration_open:
+                msg += " Public registration is now open - tournament will appear on homepage."
+            flash(msg, "success")
+            return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament.id))
+
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error creating tournament: {str(e)}", "error")
+            return redirect(url_for("admin.admin_americano_create"))
+
+    return render_template("admin_americano_create.html")
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>")
+@require_admin_auth
+def admin_americano_detail(tournament_id):
+    """View tournament details"""
+    import json
+
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    # Get confirmed registrations
+    registrations = AmericanoRegistration.query.filter_by(
+        tournament_id=tournament_id,
+        status='confirmed'
+    ).order_by(AmericanoRegistration.created_at.asc()).all()
+
+    # Build participant list from registrations
+    participants = []
+    for reg in registrations:
+        # Create a simple object with name and email for display
+        participants.append({
+            'name': reg.player_name,
+            'email': reg.email
+        })
+
+    reg_count = len(registrations)
+
+    matches = AmericanoMatch.query.filter_by(tournament_id=tournament_id).order_by(
+        AmericanoMatch.round_number,
+        AmericanoMatch.id
+    ).all()
+
+    matches_by_round = {}
+    for match in matches:
+        if match.round_number not in matches_by_round:
+            matches_by_round[match.round_number] = []
+
+        p1 = LadderFreeAgent.query.get(match.player1_id)
+        p2 = LadderFreeAgent.query.get(match.player2_id)
+        p3 = LadderFreeAgent.query.get(match.player3_id)
+        p4 = LadderFreeAgent.query.get(match.player4_id)
+
+        matches_by_round[match.round_number].append({
+            'match': match,
+            'p1': p1,
+            'p2': p2,
+            'p3': p3,
+            'p4': p4
+        })
+
+    return render_template("admin_americano_detail.html",
+                         tournament=tournament,
+                         participants=participants,
+                         matches_by_round=matches_by_round,
+                         total_rounds=tournament.total_rounds,
+                         reg_count=reg_count)
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/registrations")
+@require_admin_auth
+def admin_americano_registrations(tournament_id):
+    """View tournament registrations"""
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    registrations = AmericanoRegistration.query.filter_by(
+        tournament_id=tournament_id
+    ).order_by(AmericanoRegistration.created_at.asc()).all()
+
+    return render_template("admin_americano_registrations.html",
+                         tournament=tournament,
+                         registrations=registrations)
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/toggle-registration", methods=["POST"])
+@require_admin_auth
+def admin_americano_toggle_registration(tournament_id):
+    """Toggle registration open/closed"""
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    tournament.registration_open = not tournament.registration_open
+    db.session.commit()
+
+    status = "opened" if tournament.registration_open else "closed"
+    flash(f"Registration {status} for this tournament.", "success")
+    return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/update-settings", methods=["POST"])
+@require_admin_auth
+def admin_americano_update_settings(tournament_id):
+    """Update match format settings before generating matches"""
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    # Check if matches already generated
+    existing_matches = AmericanoMatch.query.filter_by(tournament_id=tournament_id).first()
+    if existing_matches:
+        flash("Cannot change settings after matches have been generated.", "error")
+        return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+    try:
+        points_per_match = request.form.get("points_per_match", type=int)
+        time_limit_minutes = request.form.get("time_limit_minutes", type=int)
+        serves_before_rotation = request.form.get("serves_before_rotation", type=int)
+        num_courts = request.form.get("num_courts", type=int)
+
+        if points_per_match and points_per_match in [16, 24, 32]:
+            tournament.points_per_match = points_per_match
+
+        if time_limit_minutes and time_limit_minutes in [10, 20]:
+            tournament.time_limit_minutes = time_limit_minutes
+
+        if serves_before_rotation and serves_before_rotation in [2, 4]:
+            tournament.serves_before_rotation = serves_before_rotation
+
+        if num_courts and num_courts in [1, 2, 3, 4]:
+            tournament.num_courts = num_courts
+
+        db.session.commit()
+        flash("Match format settings updated successfully.", "success")
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error updating settings: {str(e)}", "error")
+
+    return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/court-schedule")
+@require_admin_auth
+def admin_americano_court_schedule(tournament_id):
+    """Court-based schedule view for score entry"""
+    import americano_schedule
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    schedule = americano_schedule.get_schedule_view(tournament)
+    if schedule is None:
+        flash("Match schedule has not been generated yet.", "error")
+        return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+    return render_template("admin_americano_court_schedule.html",
+                         tournament=tournament,
+                         matches_by_round=schedule['matches_by_round'],
+                         current_round=schedule['current_round'],
+                         total_rounds=tournament.total_rounds,
+                         num_courts=tournament.num_courts or 2,
+                         timetable=schedule['timetable'])
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/quick-score", methods=["POST"])
+@require_admin_auth
+def admin_americano_quick_score(tournament_id):
+    """Quick score entry from court schedule"""
+    import americano_standings
+    import live_updates
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    match_id = request.form.get("match_id", type=int)
+    team_a_score = request.form.get("team_a_score", type=int)
+    team_b_score = request.form.get("team_b_score", type=int)
+
+    if not match_id or team_a_score is None or team_b_score is None:
+        flash("Match ID and scores are required", "error")
+        return redirect(url_for("admin.admin_americano_court_schedule", tournament_id=tournament_id))
+
+    match = db.session.get(AmericanoMatch, match_id, with_for_update=True)
+    if not match or match.tournament_id != tournament_id:
+        flash("Invalid match", "error")
+        return redirect(url_for("admin.admin_americano_court_schedule", tournament_id=tournament_id))
+
+    if team_a_score < 0 or team_b_score < 0:
+        flash("Scores cannot be negative", "error")
+        return redirect(url_for("admin.admin_americano_court_schedule", tournament_id=tournament_id))
+
+    # Save scores and update the players' standings in one transaction
+    try:
+        americano_standings.record_score(match, team_a_score, team_b_score)
+    except ValueError as e:
+        db.session.rollback()
+        flash(str(e), "error")
+        return redirect(url_for("admin.admin_americano_court_schedule", tournament_id=tournament_id))
+    db.session.commit()
+    live_updates.publish_score(tournament, match, americano_standings.get_leaderboard(tournament))
+
+    flash(f"Score recorded: {team_a_score}-{team_b_score}", "success")
+    return redirect(url_for("admin.admin_americano_court_schedule", tournament_id=tournament_id))
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/generate-matches", methods=["POST"])
+@require_admin_auth
+def admin_americano_generate_matches(tournament_id):
+    """Generate Americano matches using the pairing algorithm"""
+    import americano_standings
+    from datetime import datetime
+    import json
+    from utils import generate_americano_pairings, send_email_notification, ensure_ladder_free_agent
+    from americano_scheduler import assign_courts, CHANGEOVER_MINUTES
+
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    existing_matches = AmericanoMatch.query.filter_by(tournament_id=tournament_id).all()
+    if existing_matches:
+        flash("Matches already generated for this tournament. Delete existing matches first if you want to regenerate.", "error")
+        return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+    # Get num_courts from form or use tournament default
+    num_courts = request.form.get("num_courts", type=int) or tournament.num_courts or 2
+    tournament.num_courts = num_courts
+
+    try:
+        # First, check for registrations and ensure they have LadderFreeAgent records
+        registrations = AmericanoRegistration.query.filter_by(
+            tournament_id=tournament_id,
+            status='confirmed'
+        ).all()
+
+        # Create/link LadderFreeAgent for each registration
+        for reg in registrations:
+            if not reg.ladder_free_agent_id:
+                ensure_ladder_free_agent(reg)
+
+        # Collect participant IDs from registrations
+        reg_participant_ids = [reg.ladder_free_agent_id for reg in registrations if reg.ladder_free_agent_id]
+
+        # Also include existing participants from pre-selection
+        existing_participant_ids = []
+        if tournament.participating_free_agents:
+            try:
+                existing_participant_ids = json.loads(tournament.participating_free_agents)
+            except:
+                pass
+
+        # Merge lists (avoid duplicates)
+        participant_ids = sorted(set(reg_participant_ids + existing_participant_ids))
+
+        # Update tournament with all participants
+        tournament.participating_free_agents = json.dumps(participant_ids)
+
+        if len(participant_ids) < 4:
+            flash("Need at least 4 participants to generate matches", "error")
+            return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+        rounds = generate_americano_pairings(participant_ids, seed=tournament_id)
+
+        if not rounds:
+            flash("Could not generate pairings", "error")
+            return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+        # Pack matches onto the available courts; each time slot is a played round
+        rounds = assign_courts(rounds, num_courts)
+
+        total_matches_created = 0
+        for round_num, round_matches in enumerate(rounds, start=1):
+            for court_num, match_tuple in enumerate(round_matches, start=1):
+                p1_id, p2_id, p3_id, p4_id = match_tuple
+
+                match = AmericanoMatch(
+                    tournament_id=tournament_id,
+                    round_number=round_num,
+                    court_number=court_num,
+                    player1_id=p1_id,
+                    player2_id=p2_id,
+                    player3_id=p3_id,
+                    player4_id=p4_id,
+                    status="pending",
+                    created_at=datetime.now()
+                )
+                db.session.add(match)
+                total_matches_created += 1
+
+        tournament.total_rounds = len(rounds)
+        tournament.status = "in_progress"
+        americano_standings.init_standings(tournament_id, participant_ids)
+        db.session.commit()
+
+        for participant_id in participant_ids:
+            free_agent = LadderFreeAgent.query.get(participant_id)
+            if free_agent and free_agent.email:
+                subject = f"🎾 Americano Tournament Schedule - {tournament.gender.title()}'s Division"
+                body = f"""Hi {free_agent.name},
+
+You've been invited to participate in an Americano Tournament!
+
+Tournament Details:
+📅 Date: {tournament.tournament_date.strftime('%B %d, %Y')}
+📍 Location: {tournament.location or 'TBD'}
+🏆 Division: {tournament.gender.title()}'s
+
+What is Americano Format?
+- Multiple rounds of doubles matches
+- Partners rotate each round
+- Everyone plays with everyone
+- Fun, social, and competitive!
+
+Match schedule will be sent soon. Get ready to play!
+
+- BD Padel League
+"""
+                send_email_notification(free_agent.email, subject, body)
+
+        duration = len(rounds) * ((tournament.time_limit_minutes or 20) + CHANGEOVER_MINUTES) - CHANGEOVER_MINUTES
+        flash(f"✅ Successfully generated {total_matches_created} matches across {len(rounds)} rounds on {num_courts} court(s) (about {duration} minutes)! Schedule emails sent to all participants.", "success")
+        return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error generating matches: {str(e)}", "error")
+        return redirect(url_for("admin.admin_americano_detail", tournament_id=tournament_id))
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/scores", methods=["GET", "POST"])
+@require_admin_auth
+def admin_americano_scores(tournament_id):
+    """Enter scores for Americano matches"""
+    import americano_schedule
+    import americano_standings
+    import live_updates
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    if request.method == "POST":
+        try:
+            match_id = request.form.get("match_id", type=int)
+            team_a_score = request.form.get("team_a_score", type=int)
+            team_b_score = request.form.get("team_b_score", type=int)
+
+            if not match_id or team_a_score is None or team_b_score is None:
+                flash("Match ID and scores are required", "error")
+                return redirect(url_for("admin.admin_americano_scores", tournament_id=tournament_id))
+
+            match = db.session.get(AmericanoMatch, match_id, with_for_update=True)
+            if not match or match.tournament_id != tournament_id:
+                flash("Invalid match", "error")
+                return redirect(url_for("admin.admin_americano_scores", tournament_id=tournament_id))
+
+            # Validate scores
+            if team_a_score < 0 or team_b_score < 0:
+                flash("Scores cannot be negative", "error")
+                return redirect(url_for("admin.admin_americano_scores", tournament_id=tournament_id))
+
+            # Maximum validation: points_per_match + 10% buffer
+            max_allowed = int(tournament.points_per_match * 1.1)
+            if team_a_score > max_allowed or team_b_score > max_allowed:
+                flash(f"Individual scores cannot exceed {max_allowed} (10% buffer over {tournament.points_per_match})", "error")
+                return redirect(url_for("admin.admin_americano_scores", tournament_id=tournament_id))
+
+            # Points-based scoring: each player gets their team's score,
+            # standings are updated in the same transaction
+            americano_standings.record_score(match, team_a_score, team_b_score)
+            db.session.commit()
+            live_updates.publish_score(tournament, match, americano_standings.get_leaderboard(tournament))
+
+            flash(f"✅ Points recorded: Team A ({team_a_score}) vs Team B ({team_b_score}). Each player receives their team's points.", "success")
+            return redirect(url_for("admin.admin_americano_scores", tournament_id=tournament_id))
+
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error recording score: {str(e)}", "error")
+            return redirect(url_for("admin.admin_americano_scores", tournament_id=tournament_id))
+
+    # Same read model as the court schedule (matches and players in two queries),
+    # built fresh rather than from the cache: scores are entered from this page
+    schedule = americano_schedule.build_schedule_view(tournament)
+    matches_by_round = {}
+    if schedule is not None:
+        matches_by_round = {
+            round_num: [m for court in sorted(courts) for m in courts[court]]
+            for round_num, courts in schedule['matches_by_round'].items()
+        }
+
+    return render_template("admin_americano_scores.html",
+                         tournament=tournament,
+                         matches_by_round=matches_by_round)
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/leaderboard")
+@require_admin_auth
+def admin_americano_leaderboard(tournament_id):
+    """View tournament leaderboard"""
+    import americano_standings
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    leaderboard = americano_standings.get_leaderboard(tournament)
+
+    total_players = len(leaderboard)
+    top_50_percent_count = max(1, total_players // 2)
+
+    for entry in leaderboard:
+        entry['is_eligible'] = (entry['rank'] <= top_50_percent_count)
+
+    all_matches_completed = AmericanoMatch.query.filter_by(
+        tournament_id=tournament_id, 
+        status='pending'
+    ).count() == 0
+
+    if all_matches_completed and tournament.status != 'completed':
+        tournament.status = 'completed'
+        tournament.completed_at = datetime.now()
+        db.session.commit()
+
+    return render_template("admin_americano_leaderboard.html",
+                         tournament=tournament,
+                         leaderboard=leaderboard,
+                         top_50_percent_count=top_50_percent_count)
+
+
+@bp.route("/admin/ladder/americano/<int:tournament_id>/pair-agents", methods=["GET", "POST"])
+@require_admin_auth
+def admin_americano_pair_agents(tournament_id):
+    """Pair tournament winners into ladder teams"""
+    from datetime import datetime
+    import json
+    import secrets
+    from utils import send_email_notification
+    from collections import defaultdict
+
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    if request.method == "POST":
+        try:
+            pairs = []
+            pair_index = 0
+            while True:
+                player1_id = request.form.get(f"player1_{pair_index}", type=int)
+                player2_id = request.form.get(f"player2_{pair_index}", type=int)
+                team_name = request.form.get(f"team_name_{pair_index}")
+
+                if not player1_id or not player2_id or not team_name:
+                    break
+
+                pairs.append({
+                    'player1_id': player1_id,
+                    'player2_id': player2_id,
+                    'team_name': team_name
+                })
+                pair_index += 1
+
+            if not pairs:
+                flash("No pairs selected", "error")
+                return redirect(url_for("admin.admin_americano_pair_agents", tournament_id=tournament_id))
+
+            max_rank = db.session.query(db.func.max(LadderTeam.current_rank)).filter_by(
+                gender=tournament.gender
+            ).scalar() or 0
+
+            for pair_data in pairs:
+                player1 = LadderFreeAgent.query.get(pair_data['player1_id'])
+                player2 = LadderFreeAgent.query.get(pair_data['player2_id'])
+
+                if not player1 or not player2:
+                    continue
+
+                max_rank += 1
+
+                team = LadderTeam(
+                    team_name=pair_data['team_name'],
+                    team_name_canonical=normalize_team_name(pair_data['team_name']),
+                    player1_name=player1.name,
+                    player1_phone=player1.phone,
+                    player1_email=player1.email,
+                    player2_name=player2.name,
+                    player2_phone=player2.phone,
+                    player2_email=player2.email,
+                    gender=tournament.gender,
+                    ladder_type=tournament.gender,
+                    current_rank=max_rank,
+                    access_token=secrets.token_urlsafe(32),
+                    created_at=datetime.now(),
+                    updated_at=datetime.now()
+                )
+
+                db.session.add(team)
+
+                db.session.delete(player1)
+                db.session.delete(player2)
+
+                for player, partner_name in [(player1, player2.name), (player2, player1.name)]:
+                    if player.email:
+                        subject = f"🎉 Congratulations! You've been paired into the {tournament.gender.title()}'s Ladder"
+                        body = f"""Hi {player.name},
+
+Congratulations on completing the Americano Tournament!
+
+🏆 You've been paired with {partner_name} to form the team: {pair_data['team_name']}
+
+Team Details:
+📊 Starting Rank: #{max_rank}
+🪜 Division: {tournament.gender.title()}'s Ladder
+🎾 Ready to challenge teams above you!
+
+Your team has been added to the bottom of the ladder. You can now:
+1. Challenge teams ranked above you (up to 3 positions)
+2. Accept challenges from teams below you
+3. Climb the ladder through victories!
+
+Welcome to the ladder! Let's see how high you can climb! 🚀
+
+- BD Padel League
+"""
+                        send_email_notification(player.email, subject, body)
+
+            db.session.commit()
+
+            flash(f"✅ Successfully created {len(pairs)} new teams from tournament participants! Congratulations emails sent.", "success")
+            return redirect(url_for("admin.admin_americano_leaderboard", tournament_id=tournament_id))
+
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error creating teams: {str(e)}", "error")
+            return redirect(url_for("admin.admin_americano_pair_agents", tournament_id=tournament_id))
+
+    participant_ids = []
+    if tournament.participating_free_agents:
+        participant_ids = json.loads(tournament.participating_free_agents)
+
+    player_stats = defaultdict(lambda: {
+        'player': None,
+        'total_points': 0,
+        'matches_played': 0,
+        'wins': 0
+    })
+
+    for pid in participant_ids:
+        agent = LadderFreeAgent.query.get(pid)
+        if agent:
+            player_stats[pid]['player'] = agent
+
+    matches = AmericanoMatch.query.filter_by(tournament_id=tournament_id, status='completed').all()
+
+    for match in matches:
+        for player_id in [match.player1_id, match.player2_id, match.player3_id, match.player4_id]:
+            if player_id in player_stats:
+                player_stats[player_id]['matches_played'] += 1
+
+                if player_id == match.player1_id:
+                    points = match.points_player1
+                elif player_id == match.player2_id:
+                    points = match.points_player2
+                elif player_id == match.player3_id:
+                    points = match.points_player3
+                else:
+                    points = match.points_player4
+
+                player_stats[player_id]['total_points'] += points
+                if points == 3:
+                    player_stats[player_id]['wins'] += 1
+
+    ranked_players = sorted(
+        [(pid, stats) for pid, stats in player_stats.items() if stats['player']],
+        key=lambda x: (x[1]['total_points'], x[1]['wins']),
+        reverse=True
+    )
+
+    total_players = len(ranked_players)
+    top_50_percent_count = max(1, total_players // 2)
+
+    eligible_players = []
+    all_players = []
+
+    for idx, (pid, stats) in enumerate(ranked_players, start=1):
+        entry = {
+            'rank': idx,
+            'player': stats['player'],
+            'total_points': stats['total_points'],
+            'is_eligible': (idx <= top_50_percent_count)
+        }
+        all_players.append(entry)
+        if entry['is_eligible']:
+            eligible_players.append(entry)
+
+    return render_template("admin_americano_pair_agents.html",
+                         tournament=tournament,
+                         eligible_players=eligible_players,
+                         all_players=all_players,
+                         top_50_percent_count=top_50_percent_count)
+
+
+@bp.route("/admin/send-mass-email", methods=["GET", "POST"])
+@require_admin_auth
+def send_mass_email():
+    """Mass email communication feature for admin"""
+    if request.method == "GET":
+        teams = Team.query.all()
+        free_agents = FreeAgent.query.all()
+
+        team_emails = []
+        for team in teams:
+            if team.player1_email:
+                team_emails.append(team.player1_email)
+            if team.player2_email:
+                team_emails.append(team.player2_email)
+
+        free_agent_emails = [fa.email for fa in free_agents if fa.email]
+
+        team_count = len([e for e in team_emails if e])
+        free_agent_count = len([e for e in free_agent_emails if e])
+        both_count = len(set([e for e in team_emails + free_agent_emails if e]))
+
+        return render_template(
+            "admin_mass_email.html",
+            team_count=team_count,
+            free_agent_count=free_agent_count,
+            both_count=both_count
+        )
+
+    try:
+        subject = request.form.get("subject", "").strip()
+        message = request.form.get("message", "").strip()
+        recipient_type = request.form.get("recipient_type", "")
+
+        if not subject or not message:
+            flash("Subject and message are required", "error")
+            return redirect(url_for("admin.send_mass_email"))
+
+        if recipient_type not in ["teams", "free_agents", "both"]:
+            flash("Invalid recipient selection", "error")
+            return redirect(url_for("admin.send_mass_email"))
+
+        from utils import send_email_notification
+
+        recipients = []
+
+        if recipient_type in ["teams", "both"]:
+            teams = Team.query.all()
+            for team in teams:
+                if team.player1_email:
+                    recipients.append(team.player1_email)
+                if team.player2_email and team.player2_email != team.player1_email:
+                    recipients.append(team.player2_email)
+
+        if recipient_type in ["free_agents", "both"]:
+            free_agents = FreeAgent.query.all()
+            for fa in free_agents:
+                if fa.email and fa.email not in recipients:
+                    recipients.append(fa.email)
+
+        recipients = list(set([r for r in recipients if r]))
+
+        if not recipients:
+            flash("No recipients found with email addresses", "error")
+            return redirect(url_for("admin.send_mass_email"))
+
+        sent_count = 0
+        failed_count = 0
+
+        for recipient in recipients:
+            if send_email_notification(recipient, subject, message):
+                sent_count += 1
+            else:
+                failed_count += 1
+
+        if sent_count > 0:
+            flash(f"✅ Successfully sent {sent_count} email(s)", "success")
+        if failed_count > 0:
+            flash(f"⚠️ Failed to send {failed_count} email(s)", "warning")
+
+        return redirect(url_for("admin.send_mass_email"))
+
+    except Exception as e:
+        flash(f"Error sending emails: {str(e)}", "error")
+        return redirect(url_for("admin.send_mass_email"))
+
+
+@bp.route("/admin/generate-playoff-preview", methods=["POST"])
+@require_admin_auth
+def generate_playoff_preview_route():
+    """Generate playoff preview and transition to playoff_preview phase"""
+    import json
+
+    # Check if Swiss is complete
+    swiss_complete, _, _ = check_swiss_completion()
+    if not swiss_complete:
+        flash("Cannot generate playoffs - Swiss rounds are not complete yet!", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Get or create settings
+    settings = LeagueSettings.query.first()
+    if not settings:
+        settings = LeagueSettings(swiss_rounds_count=5, playoff_teams_count=8)
+        db.session.add(settings)
+        db.session.commit()
+
+    # Check if playoffs already approved
+    if settings.playoffs_approved:
+        flash("Playoffs have already been approved!", "warning")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Generate preview
+    preview_data = generate_playoff_preview()
+    if not preview_data:
+        flash("Error generating playoff preview", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Save qualified team IDs to settings
+    qualified_ids = [team_data['team'].id for team_data in preview_data['qualified_teams']]
+    settings.qualified_team_ids = json.dumps(qualified_ids)
+    settings.current_phase = "playoff_preview"
+    db.session.commit()
+
+    flash(f"✅ Playoff preview generated! Top {len(qualified_ids)} teams have qualified. Please review and approve.", "success")
+    return redirect(url_for("admin.playoff_approval_page"))
+
+
+@bp.route("/admin/playoff-approval")
+@require_admin_auth
+def playoff_approval_page():
+    """Show playoff approval page with Top 8 teams and bracket preview"""
+    import json
+
+    settings = LeagueSettings.query.first()
+    if not settings or settings.current_phase != "playoff_preview":
+        flash("No playoff preview available", "warning")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Get qualified team IDs
+    if not settings.qualified_team_ids:
+        flash("No qualified teams found", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    team_ids = json.loads(settings.qualified_team_ids)
+
+    # Get team objects and build qualified teams list
+    qualified_teams = []
+    for idx, team_id in enumerate(team_ids, start=1):
+        team = Team.query.get(team_id)
+        if team:
+            qualified_teams.append({
+                'team': team,
+                'seed': idx,
+                'points': team.points,
+                'sets_diff': team.sets_diff,
+                'games_diff': team.games_diff
+            })
+
+    # Build bracket preview
+    bracket_preview = get_bracket_preview([team_data['team'] for team_data in qualified_teams])
+
+    return render_template(
+        "playoff_approval.html",
+        qualified_teams=qualified_teams,
+        bracket_preview=bracket_preview,
+        first_round_title=knockout_bracket.phase_title(knockout_bracket.phase_for_depth(
+            knockout_bracket.num_rounds(knockout_bracket.bracket_size(len(qualified_teams))) - 1
+        )),
+        settings=settings
+    )
+
+
+@bp.route("/admin/approve-playoffs", methods=["POST"])
+@require_admin_auth
+def approve_playoffs():
+    """Approve playoffs and generate quarterfinals"""
+    settings = LeagueSettings.query.first()
+    if not settings or settings.current_phase != "playoff_preview":
+        flash("Cannot approve playoffs at this time", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Mark playoffs as approved
+    settings.playoffs_approved = True
+    settings.current_phase = "playoffs"
+    db.session.commit()
+
+    flash("✅ Playoffs approved! You can now generate playoff rounds.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/reject-playoffs", methods=["POST"])
+@require_admin_auth
+def reject_playoffs():
+    """Reject playoff preview and return to Swiss phase"""
+    settings = LeagueSettings.query.first()
+    if not settings:
+        flash("Settings not found", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Reset to Swiss phase
+    settings.current_phase = "swiss"
+    settings.qualified_team_ids = None
+    settings.playoffs_approved = False
+    db.session.commit()
+
+    flash("Playoff preview rejected. You can regenerate it when ready.", "info")
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/generate-next-knockout-round", methods=["POST"])
+@require_admin_auth
+def generate_next_knockout_round():
+    """Generate the next knockout round (e.g. QF after Round of 16, SF after QF, Final after SF)"""
+    try:
+        phase = request.form.get("phase")  # "quarterfinal", "semifinal", "final", "round_of_16", ...
+        round_deadline_str = request.form.get("round_deadline")
+        
+        # Parse deadline string to datetime, normalized to end-of-day (23:59:59)
+        from datetime import datetime, time as dt_time
+        round_deadline = None
+        if round_deadline_str:
+            try:
+                deadline_date = datetime.strptime(round_deadline_str, "%Y-%m-%d").date()
+                round_deadline = datetime.combine(deadline_date, dt_time(23, 59, 59))
+            except ValueError:
+                flash("Invalid deadline date format", "error")
+                return redirect(url_for("admin.admin_panel"))
+        
+        if knockout_bracket.depth_for_phase(phase) is None:
+            flash("Invalid knockout phase", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        settings = LeagueSettings.query.first()
+        if not settings:
+            flash("Settings not found", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Determine round number from the phase's place in the bracket
+        round_number = get_knockout_round_number(settings, phase, len(get_playoff_team_ids(settings)))
+        if round_number is None:
+            flash(f"This bracket has no {knockout_bracket.phase_title(phase)} round", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Check if matches already exist for this phase
+        existing_matches = Match.query.filter_by(phase=phase).first()
+        if existing_matches:
+            flash(f"{knockout_bracket.phase_title(phase)} matches already exist!", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Generate the knockout round
+        from utils import generate_playoff_bracket
+        matches = generate_playoff_bracket(round_number, phase)
+        
+        if not matches:
+            flash(f"Could not generate {knockout_bracket.phase_title(phase)}: the previous round is not complete", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Set deadline on all generated matches
+        if round_deadline:
+            for match in matches:
+                match.round_deadline = round_deadline
+            db.session.commit()
+        
+        flash(f"✅ {knockout_bracket.phase_title(phase)} generated with {len(matches)} match(es)!", "success")
+        return redirect(url_for("admin.admin_panel"))
+        
+    except Exception as e:
+        logging.error(f"Error generating knockout round: {str(e)}")
+        flash(f"Error generating knockout round: {str(e)}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/generate-round", methods=["POST"])
+@require_admin_auth
+def generate_round():
+    """Generate Swiss-format round pairings as DRAFT for preview"""
+    try:
+        round_number = request.form.get("round_number", type=int)
+        round_deadline_str = request.form.get("round_deadline")
+        
+        # Parse deadline string to datetime, normalized to end-of-day (23:59:59)
+        from datetime import datetime, time as dt_time
+        round_deadline = None
+        if round_deadline_str:
+            try:
+                deadline_date = datetime.strptime(round_deadline_str, "%Y-%m-%d").date()
+                # Normalize to end-of-day (23:59:59)
+                round_deadline = datetime.combine(deadline_date, dt_time(23, 59, 59))
+            except ValueError:
+                flash("Invalid deadline date format", "error")
+                return redirect(url_for("admin.admin_panel"))
+        
+        if not round_number or round_number < 1:
+            flash("Invalid round number", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Check for existing live matches in this round (not drafts)
+        existing_live_matches = Match.query.filter_by(round=round_number, is_draft=False).first()
+        if existing_live_matches:
+            flash(f"Round {round_number} has already been generated and confirmed", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Check for existing draft matches - delete them to regenerate
+        existing_drafts = Match.query.filter_by(round=round_number, is_draft=True).all()
+        if existing_drafts:
+            for draft in existing_drafts:
+                db.session.delete(draft)
+            db.session.commit()
+        
+        # Check if settings allow generation
+        settings = LeagueSettings.query.first()
+        if settings and settings.current_phase == "playoff_preview":
+            flash("Cannot generate Swiss rounds while in playoff phase", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # TRANSITION TO PLAYOFFS LOGIC
+        if round_number > settings.swiss_rounds_count:
+            # Determine playoff phase based on round number relative to swiss rounds:
+            # swiss_rounds_count + 1 is the first knockout round (e.g. Quarterfinals
+            # for 8 teams), and so on up to the Final
+            team_ids = get_playoff_team_ids(settings)
+            size = knockout_bracket.bracket_size(len(team_ids))
+            depth = knockout_bracket.num_rounds(size) - (round_number - settings.swiss_rounds_count)
+            if depth < 0:
+                flash(f"Round {round_number} exceeds the scheduled league rounds.", "error")
+                return redirect(url_for("admin.admin_panel"))
+            phase_type = knockout_bracket.phase_for_depth(depth)
+
+            from utils import generate_playoff_bracket
+            matches = generate_playoff_bracket(round_number, phase_type)
+            
+            if not matches:
+                flash(f"Could not generate {phase_type} matches. Ensure playoffs are approved and teams are qualified.", "error")
+                return redirect(url_for("admin.admin_panel"))
+        else:
+            # Generate the Swiss pairings
+            from utils import generate_round_pairings
+            matches = generate_round_pairings(round_number)
+        
+        if not matches:
+            flash("No matches generated - check team count", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Mark all generated matches as DRAFT and set deadline
+        for match in matches:
+            match.is_draft = True
+            if round_deadline:
+                match.round_deadline = round_deadline
+        db.session.commit()
+        
+        # Redirect to preview page instead of sending emails
+        flash(f"📋 Round {round_number} preview generated with {len(matches)} match(es). Review and confirm below.", "info")
+        return redirect(url_for("admin.round_preview", round_number=round_number))
+        
+    except Exception as e:
+        logging.error(f"Error generating round: {str(e)}")
+        flash(f"Error generating round: {str(e)}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/extend-round-deadline", methods=["POST"])
+@require_admin_auth
+def extend_round_deadline():
+    """Extend the deadline for a round"""
+    try:
+        round_number = request.form.get("round_number", type=int)
+        new_deadline_str = request.form.get("new_deadline")
+        
+        if not round_number or not new_deadline_str:
+            flash("Round number and new deadline are required", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        from datetime import datetime, time as dt_time
+        try:
+            deadline_date = datetime.strptime(new_deadline_str, "%Y-%m-%d").date()
+            # Normalize to end-of-day (23:59:59)
+            new_deadline = datetime.combine(deadline_date, dt_time(23, 59, 59))
+        except ValueError:
+            flash("Invalid deadline date format", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Update ACTIVE matches in this round (not completed/walkover) and draft matches
+        matches = Match.query.filter(
+            Match.round == round_number,
+            db.or_(
+                Match.status.notin_(['completed', 'walkover']),
+                Match.is_draft == True,
+                Match.status == None  # Include drafts with no status
+            )
+        ).all()
+        if not matches:
+            flash(f"No active matches found for Round {round_number}. All matches may already be completed.", "info")
+            return redirect(url_for("admin.admin_panel"))
+        
+        for match in matches:
+            match.round_deadline = new_deadline
+        db.session.commit()
+        
+        flash(f"Round {round_number} deadline extended to {deadline_date.strftime('%B %d, %Y')} for {len(matches)} active match(es)", "success")
+        return redirect(url_for("admin.admin_panel"))
+        
+    except Exception as e:
+        logging.error(f"Error extending deadline: {str(e)}")
+        flash(f"Error extending deadline: {str(e)}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/round-preview/<int:round_number>")
+@require_admin_auth
+def round_preview(round_number):
+    """Show preview of generated round pairings before confirmation"""
+    # Get draft matches for this round
+    draft_matches = Match.query.filter_by(round=round_number, is_draft=True).all()
+    
+    if not draft_matches:
+        flash(f"No preview found for Round {round_number}. Generate the round first.", "error")
+        return redirect(url_for("admin.admin_panel"))
+    
+    # Get all teams involved and rank them
+    all_teams_set = set()
+    for match in draft_matches:
+        if match.team_a_id:
+            all_teams_set.add(match.team_a_id)
+        if match.team_b_id:
+            all_teams_set.add(match.team_b_id)
+    
+    all_teams = [Team.query.get(tid) for tid in all_teams_set if Team.query.get(tid)]
+    # Sort teams by ranking (same logic as leaderboard)
+    ranked_teams = sorted(all_teams, key=lambda t: (-t.points, -t.sets_diff, -t.games_diff, -t.wins, t.team_name))
+    team_rank_map = {team.id: idx + 1 for idx, team in enumerate(ranked_teams)}
+    
+    # Build preview data with team info and pairing reasons
+    preview_data = []
+    for match in draft_matches:
+        team_a = Team.query.get(match.team_a_id)
+        team_b = Team.query.get(match.team_b_id) if match.team_b_id else None
+        
+        # Create a simple, meaningful reason
+        if team_b is None:
+            pairing_reason = "Bye week (automatic win)"
+        else:
+            pairing_reason = "Matched by Swiss pairing algorithm"
+        
+        preview_data.append({
+            'match': match,
+            'team_a': team_a,
+            'team_b': team_b,
+            'team_a_rank': team_rank_map.get(match.team_a_id, 0) if team_a else 0,
+            'is_bye': team_b is None,
+            'reason': pairing_reason
+        })
+    
+    # Sort pairings by team_a rank (highest rank first)
+    preview_data.sort(key=lambda x: x['team_a_rank'])
+    
+    return render_template(
+        "round-preview.html",
+        round_number=round_number,
+        preview_data=preview_data,
+        match_count=len(draft_matches),
+        ranked_teams=ranked_teams
+    )
+
+
+@bp.route("/admin/confirm-round/<int:round_number>", methods=["POST"])
+@require_admin_auth
+def confirm_round(round_number):
+    """Confirm round preview - make matches live and send emails"""
+    try:
+        # Get draft matches for this round
+        draft_matches = Match.query.filter_by(round=round_number, is_draft=True).all()
+        
+        if not draft_matches:
+            flash(f"No preview found for Round {round_number}", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Promote drafts to live matches
+        for match in draft_matches:
+            match.is_draft = False
+        db.session.commit()
+        
+        # Send email notifications to teams
+        from utils import send_email_notification
+        teams_to_notify = set()
+        for match in draft_matches:
+            if match.team_a_id:
+                teams_to_notify.add(match.team_a_id)
+            if match.team_b_id:
+                teams_to_notify.add(match.team_b_id)
+        
+        for team_id in teams_to_notify:
+            team = Team.query.get(team_id)
+            if team and (team.player1_email or team.player2_email):
+                # Find the opponent in matches
+                team_matches = [m for m in draft_matches if m.team_a_id == team_id or m.team_b_id == team_id]
+                
+                match_details = ""
+                for match in team_matches:
+                    opponent_id = match.team_b_id if match.team_a_id == team_id else match.team_a_id
+                    if opponent_id:
+                        opponent = Team.query.get(opponent_id)
+                        match_details += f"vs {opponent.team_name}\n"
+                    else:
+                        match_details += "BYE (automatic win)\n"
+                
+                # Get base URL for link
+                base_url = os.environ.get('APP_BASE_URL', 'https://goeclectic.xyz')
+                matches_link = f"{base_url}/my-matches/{team.access_token}"
+                
+                # Get deadline from any match in this round (all matches share same deadline)
+                deadline_text = "Sunday 23:59"  # Default
+                if team_matches and team_matches[0].round_deadline:
+                    deadline_text = team_matches[0].round_deadline.strftime('%A, %B %d at %H:%M')
+                
+                email_body = f"""Hello {team.team_name},
+
+Round {round_number} has been generated! Here are your matchups:
+
+{match_details}
+Deadline: Submit your match result by {deadline_text}
+
+📍 View and manage your matches here: {matches_link}
+
+Best of luck!
+
+BD Padel League Admin"""
+                # Send to player 1
+                if team.player1_email:
+                    send_email_notification(
+                        team.player1_email,
+                        f"Round {round_number} Generated - Your Matchups",
+                        email_body
+                    )
+                
+                # Send to player 2 if different from player 1
+                if team.player2_email and team.player2_email != team.player1_email:
+                    send_email_notification(
+                        team.player2_email,
+                        f"Round {round_number} Generated - Your Matchups",
+                        email_body
+                    )
+        
+        flash(f"✅ Round {round_number} confirmed with {len(draft_matches)} match(es)! Emails sent to all teams.", "success")
+        return redirect(url_for("admin.admin_panel"))
+        
+    except Exception as e:
+        logging.error(f"Error confirming round: {str(e)}")
+        flash(f"Error confirming round: {str(e)}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/discard-round/<int:round_number>", methods=["POST"])
+@require_admin_auth
+def discard_round(round_number):
+    """Discard draft round preview - delete all draft matches"""
+    try:
+        # Get draft matches for this round
+        draft_matches = Match.query.filter_by(round=round_number, is_draft=True).all()
+        
+        if not draft_matches:
+            flash(f"No preview found for Round {round_number}", "error")
+            return redirect(url_for("admin.admin_panel"))
+        
+        # Delete all draft matches
+        for match in draft_matches:
+            db.session.delete(match)
+        db.session.commit()
+        
+        flash(f"🗑️ Round {round_number} preview discarded. You can regenerate when ready.", "info")
+        return redirect(url_for("admin.admin_panel"))
+        
+    except Exception as e:
+        logging.error(f"Error discarding round: {str(e)}")
+        flash(f"Error discarding round: {str(e)}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/reset-match-booking/<int:match_id>", methods=["POST"])
+@require_admin_auth
+def reset_match_booking(match_id):
+    """Reset a match's booking details so teams need to reschedule"""
+    match = Match.query.get_or_404(match_id)
+
+    # Clear booking details
+    match.booking_details = None
+    match.booking_confirmed = False
+    match.match_datetime = None
+    match.match_date = None
+    match.court = None
+
+    db.session.commit()
+
+    # Get team names for flash message
+    team_a = Team.query.get(match.team_a_id)
+    team_b = Team.query.get(match.team_b_id)
+    team_a_name = team_a.team_name if team_a else "Team A"
+    team_b_name = team_b.team_name if team_b else "Team B"
+
+    flash(f"✅ Match booking reset for {team_a_name} vs {team_b_name}. Teams will need to reschedule.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/reset-round-status/<int:round_number>", methods=["POST"])
+@require_admin_auth
+def reset_round_status(round_number):
+    """Reset all matches in a round back to scheduled status (useful for future rounds)"""
+    matches = Match.query.filter_by(round=round_number).all()
+
+    if not matches:
+        flash(f"No matches found for Round {round_number}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    reset_count = 0
+    for match in matches:
+        if match.status == "completed":
+            # Reverse stats if already calculated
+            if match.stats_calculated:
+                team_a = Team.query.get(match.team_a_id)
+                team_b = Team.query.get(match.team_b_id)
+
+                if team_a and team_b:
+                    # Reverse team stats
+                    team_a.sets_for -= match.sets_a
+                    team_a.sets_against -= match.sets_b
+                    team_a.games_for -= match.games_a
+                    team_a.games_against -= match.games_b
+
+                    team_b.sets_for -= match.sets_b
+                    team_b.sets_against -= match.sets_a
+                    team_b.games_for -= match.games_b
+                    team_b.games_against -= match.games_a
+
+                    # Reverse wins/losses/draws
+                    if match.winner_id == team_a.id:
+                        team_a.wins -= 1
+                        team_a.points -= 3
+                        team_b.losses -= 1
+                    elif match.winner_id == team_b.id:
+                        team_b.wins -= 1
+                        team_b.points -= 3
+                        team_a.losses -= 1
+                    elif match.winner_id is None:
+                        team_a.draws -= 1
+                        team_a.points -= 1
+                        team_b.draws -= 1
+                        team_b.points -= 1
+
+            # Reset match to scheduled
+            match.status = "scheduled"
+            match.score_a = None
+            match.score_b = None
+            match.sets_a = 0
+            match.sets_b = 0
+            match.games_a = 0
+            match.games_b = 0
+            match.winner_id = None
+            match.verified = False
+            match.stats_calculated = False
+            match.score_submission_a = None
+            match.score_submission_b = None
+            match.score_submitted_by_a = False
+            match.score_submitted_by_b = False
+
+            reset_count += 1
+
+    db.session.commit()
+    flash(f"✅ Reset {reset_count} match(es) in Round {round_number} back to scheduled status. All stats reversed.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/perf")
+@require_admin_auth
+def admin_perf():
+    """Per-endpoint query counts and the slowest statements (this worker, see query_profiler.py)"""
+    from datetime import datetime
+
+    store = query_profiler.get_store()
+    return render_template(
+        "admin_perf.html",
+        enabled=current_app.config["QUERY_PROFILER_ENABLED"],
+        since=datetime.fromtimestamp(store.since),
+        endpoints=store.endpoints(),
+        slowest=store.slowest(),
+        slow_ms=query_profiler.QUERY_PROFILER_SLOW_MS,
+    )
+
+
+@bp.route("/admin/perf/reset", methods=["POST"])
+@require_admin_auth
+def admin_perf_reset():
+    query_profiler.get_store().reset()
+    flash("Query profile reset for this worker", "success")
+    return redirect(url_for("admin.admin_perf"))
+
+
+@bp.route("/admin/reschedules")
+@require_admin_auth
+def reschedule_dashboard():
+    """Admin dashboard for managing reschedule requests"""
+    pending_reschedules = Reschedule.query.filter_by(status="pending").options(
+        joinedload(Reschedule.match).joinedload(Match.team_a),
+        joinedload(Reschedule.match).joinedload(Match.team_b),
+        joinedload(Reschedule.requester_team),
+    ).all()
+    max_allowed = get_max_reschedules_per_round()
+
+    # Get all reschedules with match and team details
+    reschedule_details = []
+    for reschedule in pending_reschedules:
+        match = reschedule.match
+        requester_team = reschedule.requester_team
+        opponent_team = None
+
+        if match and requester_team:
+            opponent_team = match.team_b if match.team_a_id == requester_team.id else match.team_a
+
+        reschedule_details.append({
+            'reschedule': reschedule,
+            'match': match,
+            'requester_team': requester_team,
+            'opponent_team': opponent_team
+        })
+
+    return render_template(
+        "reschedule_dashboard.html",
+        reschedule_details=reschedule_details,
+        max_allowed=max_allowed,
+        total_pending=len(reschedule_details)
+    )
+
+@bp.route("/admin/approve-reschedule/<int:reschedule_id>", methods=["POST"])
+@require_admin_auth
+def approve_reschedule(reschedule_id):
+    """Approve a reschedule request"""
+    reschedule = Reschedule.query.get_or_404(reschedule_id)
+
+    if reschedule.status != "pending":
+        flash("Reschedule request is not pending", "error")
+        return redirect(url_for("admin.reschedule_dashboard"))
+
+    try:
+        from datetime import datetime
+
+        # Update match with new date/time
+        match = Match.query.get(reschedule.match_id) if reschedule.match_id else None
+        if match:
+            # Parse the proposed time
+            proposed_time = reschedule.proposed_time
+            if " at " in proposed_time:
+                date_str, time_str = proposed_time.split(" at ")
+                
+                # Convert date format from "2025-11-25" to "Tuesday, November 25"
+                parsed_date = datetime.strptime(date_str, "%Y-%m-%d")
+                formatted_date = parsed_date.strftime("%A, %B %d")
+                
+                # Convert time format from "18:30" to "06:30 PM"
+                time_obj = datetime.strptime(time_str, "%H:%M")
+                formatted_time = time_obj.strftime("%I:%M %p")
+                
+                # Create fully formatted datetime string for booking details
+                booking_datetime_str = f"{formatted_date} at {formatted_time}"
+                
+                # Set all booking-related fields to match normal booking confirmation
+                # Keep match_date in original format (YYYY-MM-DD), only update match_datetime
+                if not match.match_date:
+                    match.match_date = date_str  # Set to YYYY-MM-DD format if empty
+                match.match_datetime = parsed_date.replace(hour=time_obj.hour, minute=time_obj.minute)
+                match.court = "Court assigned on arrival"
+                match.booking_details = f"{booking_datetime_str}\nCourt assigned on arrival\n✓ Confirmed by both teams"
+                match.booking_confirmed = True  # Admin approval counts as booking confirmation
+
+            # Update reschedule status
+            reschedule.status = "approved"
+            reschedule.approved_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            # Increment team's reschedule usage
+            requester_team = Team.query.get(reschedule.requester_team_id)
+            if requester_team:
+                requester_team.reschedules_used += 1
+
+            db.session.commit()
+
+            # Send approval notifications
+            from utils import send_email_notification
+            opponent_id = match.team_b_id if match.team_a_id == requester_team.id else match.team_a_id
+            opponent = Team.query.get(opponent_id)
+
+            approval_body = f"""Hi {requester_team.team_name},
+
+✅ Your reschedule request has been APPROVED by admin.
+
+Match Details:
+- Round: {match.round}
+- Opponent: {opponent.team_name if opponent else 'Unknown'}
+- New Time: {reschedule.proposed_time}
+- DEADLINE: Wednesday 23:59 (absolute deadline for makeup matches)
+
+⚠️ IMPORTANT: This is now a MAKEUP MATCH. You must complete it by Wednesday 23:59 or automatic walkover will be awarded to your opponent.
+
+Team Reschedules Used: {requester_team.reschedules_used}/2
+
+- BD Padel League
+"""
+            # Notify requester team
+            if requester_team.player1_email:
+                send_email_notification(requester_team.player1_email, f"Reschedule APPROVED - Round {match.round}", approval_body)
+            if requester_team.player2_email:
+                send_email_notification(requester_team.player2_email, f"Reschedule APPROVED - Round {match.round}", approval_body)
+
+            # Notify opponent team
+            if opponent:
+                opponent_approval_body = f"""Hi {opponent.team_name},
+
+The reschedule request from {requester_team.team_name} has been APPROVED by admin.
+
+Match Details:
+- Round: {match.round}
+- Opponent: {requester_team.team_name}
+- New Time: {reschedule.proposed_time}
+- DEADLINE: Wednesday 23:59 (absolute deadline for makeup matches)
+
+⚠️ IMPORTANT: This is now a MAKEUP MATCH. You must complete it by Wednesday 23:59 or automatic walkover will be awarded to {requester_team.team_name}.
+
+- BD Padel League
+"""
+                if opponent.player1_email:
+                    send_email_notification(opponent.player1_email, f"Reschedule APPROVED - Round {match.round}", opponent_approval_body)
+                if opponent.player2_email:
+                    send_email_notification(opponent.player2_email, f"Reschedule APPROVED - Round {match.round}", opponent_approval_body)
+
+            flash(f"Reschedule approved for {requester_team.team_name if requester_team else 'Unknown team'}", "success")
+        else:
+            flash("Associated match not found", "error")
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error approving reschedule: {str(e)}", "error")
+
+    return redirect(url_for("admin.reschedule_dashboard"))
+
+@bp.route("/admin/reject-reschedule/<int:reschedule_id>", methods=["POST"])
+@require_admin_auth
+def reject_reschedule(reschedule_id):
+    """Reject a reschedule request"""
+    reschedule = Reschedule.query.get_or_404(reschedule_id)
+
+    if reschedule.status != "pending":
+        flash("Reschedule request is not pending", "error")
+        return redirect(url_for("admin.reschedule_dashboard"))
+
+    try:
+        from datetime import datetime
+
+        # Update reschedule status
+        reschedule.status = "rejected"
+        reschedule.rejected_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        db.session.commit()
+
+        # Send rejection notifications
+        from utils import send_email_notification
+        requester_team = Team.query.get(reschedule.requester_team_id)
+        match = Match.query.get(reschedule.match_id) if reschedule.match_id else None
+
+        if requester_team and match:
+            opponent_id = match.team_b_id if match.team_a_id == requester_team.id else match.team_a_id
+            opponent = Team.query.get(opponent_id)
+
+            rejection_body = f"""Hi {requester_team.team_name},
+
+❌ Your reschedule request has been REJECTED by admin.
+
+Match Details:
+- Round: {match.round}
+- Opponent: {opponent.team_name if opponent else 'Unknown'}
+- Requested Time: {reschedule.proposed_time}
+
+Your match remains scheduled for the original round deadline (Sunday 23:59).
+
+If you need assistance, please contact the admin.
+
+Team Reschedules Used: {requester_team.reschedules_used}/2
+
+- BD Padel League
+"""
+            if requester_team.player1_email:
+                send_email_notification(requester_team.player1_email, f"Reschedule REJECTED - Round {match.round}", rejection_body)
+            if requester_team.player2_email:
+                send_email_notification(requester_team.player2_email, f"Reschedule REJECTED - Round {match.round}", rejection_body)
+
+            # Notify opponent team
+            if opponent:
+                opponent_rejection_body = f"""Hi {opponent.team_name},
+
+The reschedule request from {requester_team.team_name} has been REJECTED by admin.
+
+Match Details:
+- Round: {match.round}
+- Original Deadline: Sunday 23:59
+
+Your match remains scheduled for the original deadline.
+
+- BD Padel League
+"""
+                if opponent.player1_email:
+                    send_email_notification(opponent.player1_email, f"Reschedule REJECTED - Round {match.round}", opponent_rejection_body)
+                if opponent.player2_email:
+                    send_email_notification(opponent.player2_email, f"Reschedule REJECTED - Round {match.round}", opponent_rejection_body)
+
+        flash(f"Reschedule rejected for {requester_team.team_name if requester_team else 'Unknown team'}", "success")
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error rejecting reschedule: {str(e)}", "error")
+
+    return redirect(url_for("admin.reschedule_dashboard"))
+
+@bp.route("/admin/check-deadlines", methods=["POST"])
+@require_admin_auth
+def check_deadlines():
+    """Manually check for deadline violations and apply walkovers (or preview them with dry_run)"""
+    dry_run = request.form.get("dry_run") == "1"
+    walkovers = check_deadline_violations(dry_run=dry_run)
+
+    total_walkovers = len(walkovers['regular']) + len(walkovers['makeup'])
+    prefix = "[DRY RUN] " if dry_run else ""
+
+    if walkovers['regular']:
+        for walkover in walkovers['regular']:
+            flash(f"{prefix}⚠️ Regular Match Walkover: {walkover['team_a']} vs {walkover['team_b']} - Round {walkover['round']} (missed {walkover['deadline']} deadline)", "warning")
+
+    if walkovers['makeup']:
+        for walkover in walkovers['makeup']:
+            flash(f"{prefix}⚠️ Makeup Match Walkover: {walkover['opponent_team']} wins vs {walkover['requester_team']} (missed {walkover['deadline']} deadline)", "warning")
+
+    if total_walkovers > 0 and dry_run:
+        affected = ", ".join(
+            f"{delta['team_name']} ({delta['wins']}W/{delta['losses']}L, +{delta['points']} pts)"
+            for delta in walkovers['team_deltas'].values()
+        )
+        flash(f"🔍 Dry run: {total_walkovers} walkover(s) would be applied across {walkovers['candidates_checked']} open match(es). Team changes: {affected}", "info")
+    elif total_walkovers > 0:
+        flash(f"✅ Processed {total_walkovers} deadline violation(s) with automatic walkovers.", "success")
+    else:
+        flash("✅ No deadline violations found. All matches are within their deadlines.", "success")
+
+    return redirect(url_for("admin.reschedule_dashboard"))
+
+@bp.route("/admin/resend-round-emails/<int:round_number>", methods=["POST"])
+@require_admin_auth
+def resend_round_emails(round_number):
+    """Manually resend email notifications for a specific round"""
+    from utils import send_email_notification
+
+    # Get all matches for this round
+    matches = Match.query.filter_by(round=round_number).all()
+
+    if not matches:
+        flash(f"No matches found for Round {round_number}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    round_dates = get_round_date_range(round_number)
+    base_url = "https://goeclectic.xyz"
+
+    emails_sent = 0
+    emails_failed = 0
+
+    for match in matches:
+        try:
+            if match.status == "bye":
+                # Handle bye notification
+                bye_team = Team.query.get(match.team_a_id)
+                if bye_team:
+                    bye_body = f"""Hi {bye_team.team_name},
+
+Round {round_number} has been generated!
+
+🏖️ You have a BYE this round - no match to play.
+
+Round Dates: {round_dates}
+
+You'll automatically advance to the next round. Enjoy your break!
+
+- BD Padel League
+"""
+                    if bye_team.player1_email:
+                        if send_email_notification(bye_team.player1_email, f"Round {round_number} - BYE Week", bye_body):
+                            emails_sent += 1
+                        else:
+                            emails_failed += 1
+                    if bye_team.player2_email:
+                        if send_email_notification(bye_team.player2_email, f"Round {round_number} - BYE Week", bye_body):
+                            emails_sent += 1
+                        else:
+                            emails_failed += 1
+            else:
+                # Handle regular match notifications
+                team_a = Team.query.get(match.team_a_id)
+                team_b = Team.query.get(match.team_b_id)
+
+                if team_a and team_b:
+                    # Access link for each team
+                    base_url = "https://goeclectic.xyz"
+
+                    # Team A notification
+                    team_a_link = f"{base_url}/my-matches/{team_a.access_token}"
+                    team_a_body = f"""Hi {team_a.team_name},
+
+Round {round_number} has been generated!
+
+🎾 Your Match:
+- Opponent: {team_b.team_name}
+- Round Dates: {round_dates}
+- Deadline: Sunday 23:59
+
+📋 Next Steps:
+1. Coordinate with your opponent to book a court
+2. Play your match before Sunday 23:59
+3. Submit scores immediately after the match
+
+🔗 Your Match Page: {team_a_link}
+
+Opponent Contact:
+- {team_b.player1_name}: {team_b.player1_email or team_b.player1_phone}
+- {team_b.player2_name}: {team_b.player2_email or team_b.player2_phone}
+
+Good luck! 🎾
+
+- BD Padel League
+"""
+                    if team_a.player1_email:
+                        if send_email_notification(team_a.player1_email, f"Round {round_number} Pairing - vs {team_b.team_name}", team_a_body):
+                            emails_sent += 1
+                        else:
+                            emails_failed += 1
+                    if team_a.player2_email:
+                        if send_email_notification(team_a.player2_email, f"Round {round_number} Pairing - vs {team_b.team_name}", team_a_body):
+                            emails_sent += 1
+                        else:
+                            emails_failed += 1
+
+                    # Team B notification
+                    team_b_link = f"{base_url}/my-matches/{team_b.access_token}"
+                    team_b_body = f"""Hi {team_b.team_name},
+
+Round {round_number} has been generated!
+
+🎾 Your Match:
+- Opponent: {team_a.team_name}
+- Round Dates: {round_dates}
+- Deadline: Sunday 23:59
+
+📋 Next Steps:
+1. Coordinate with your opponent to book a court
+2. Play your match before Sunday 23:59
+3. Submit scores immediately after the match
+
+🔗 Your Match Page: {team_b_link}
+
+Opponent Contact:
+- {team_a.player1_name}: {team_a.player1_email or team_a.player1_phone}
+- {team_a.player2_name}: {team_a.player2_email or team_a.player2_phone}
+
+Good luck! 🎾
+
+- BD Padel League
+"""
+                    if team_b.player1_email:
+                        if send_email_notification(team_b.player1_email, f"Round {round_number} Pairing - vs {team_a.team_name}", team_b_body):
+                            emails_sent += 1
+                        else:
+                            emails_failed += 1
+                    if team_b.player2_email:
+                        if send_email_notification(team_b.player2_email, f"Round {round_number} Pairing - vs {team_a.team_name}", team_b_body):
+                            emails_sent += 1
+                        else:
+                            emails_failed += 1
+
+        except Exception as e:
+            print(f"[EMAIL ERROR] Failed to send emails for match {match.id}: {e}")
+            emails_failed += 1
+
+    if emails_sent > 0:
+        flash(f"✅ Successfully sent {emails_sent} email(s) for Round {round_number}", "success")
+    if emails_failed > 0:
+        flash(f"⚠️ Failed to send {emails_failed} email(s). Check SMTP configuration.", "warning")
+
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/update-match/<int:match_id>", methods=["POST"])
+@require_admin_auth
+def update_match(match_id):
+    match = Match.query.get(match_id)
+    if not match:
+        flash("Match not found", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Get form data
+    score_a_str = request.form.get("score_a", "").strip()
+    score_b_str = request.form.get("score_b", "").strip()
+    match_date = request.form.get("match_date", "").strip()
+    court = request.form.get("court", "").strip()
+
+    # If this is a bye round, don't process scores
+    if match.status == "bye":
+        flash("Cannot update bye round scores", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Check if we have scores to process
+    if not score_a_str or not score_b_str:
+        flash("Please enter scores for both teams", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # CRITICAL: If stats were already calculated, reverse them first
+    if match.stats_calculated:
+        team_a = Team.query.get(match.team_a_id)
+        team_b = Team.query.get(match.team_b_id)
+
+        if team_a and team_b:
+            # Reverse team stats
+            team_a.sets_for -= match.sets_a
+            team_a.sets_against -= match.sets_b
+            team_a.games_for -= match.games_a
+            team_a.games_against -= match.games_b
+
+            team_b.sets_for -= match.sets_b
+            team_b.sets_against -= match.sets_a
+            team_b.games_for -= match.games_b
+            team_b.games_against -= match.games_a
+
+            # Reverse wins/losses/draws
+            if match.winner_id == team_a.id:
+                team_a.wins -= 1
+                team_a.points -= 3
+                team_b.losses -= 1
+            elif match.winner_id == team_b.id:
+                team_b.wins -= 1
+                team_b.points -= 3
+                team_a.losses -= 1
+            elif match.winner_id is None and match.status == "completed":
+                team_a.draws -= 1
+                team_a.points -= 1
+                team_b.draws -= 1
+                team_b.points -= 1
+
+    # Calculate new match result
+    sets_a, sets_b, games_a, games_b, winner = calculate_match_result(score_a_str, score_b_str)
+
+    if winner is None:
+        flash("Invalid score format. Use format like '6-4, 6-3' or '6-4, 3-6, 10-8'", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Update match record
+    match.score_a = score_a_str
+    match.score_b = score_b_str
+    match.sets_a = sets_a
+    match.sets_b = sets_b
+    match.games_a = games_a
+    match.games_b = games_b
+    match.match_date = match_date
+    match.court = court
+    match.status = "completed"
+    match.stats_calculated = True
+
+    # Update team stats
+    team_a = Team.query.get(match.team_a_id)
+    team_b = Team.query.get(match.team_b_id)
+
+    if team_a and team_b:
+        # Add sets and games
+        team_a.sets_for += sets_a
+        team_a.sets_against += sets_b
+        team_a.games_for += games_a
+        team_a.games_against += games_b
+
+        team_b.sets_for += sets_b
+        team_b.sets_against += sets_a
+        team_b.games_for += games_b
+        team_b.games_against += games_a
+
+        # Update wins/losses/draws and points (3 for win, 1 for draw, 0 for loss)
+        if winner == 'a':
+            team_a.wins += 1
+            team_a.points += 3
+            team_b.losses += 1
+            match.winner_id = team_a.id
+        elif winner == 'b':
+            team_b.wins += 1
+            team_b.points += 3
+            team_a.losses += 1
+            match.winner_id = team_b.id
+        elif winner == 'draw':
+            team_a.draws += 1
+            team_a.points += 1
+            team_b.draws += 1
+            team_b.points += 1
+            match.winner_id = None
+
+    db.session.commit()
+    flash(f"Match scores updated successfully for {match.team_a.team_name} vs {match.team_b.team_name}", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/confirm-team/<int:team_id>", methods=["POST"])
+@require_admin_auth
+def confirm_team(team_id):
+    team = Team.query.get(team_id)
+    if team:
+        team.confirmed = not team.confirmed
+        # When admin confirms, also mark Player 2 as confirmed (admin override)
+        if team.confirmed:
+            team.player2_confirmed = True
+        else:
+            team.player2_confirmed = False
+        db.session.commit()
+        status = "confirmed" if team.confirmed else "unconfirmed"
+        flash(f"Team {team.team_name} {status}!", "success")
+    else:
+        flash("Team not found", "error")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/toggle-team-status/<int:team_id>", methods=["POST"])
+@require_admin_auth
+def toggle_team_status(team_id):
+    """Toggle team between active and inactive status for league"""
+    team = Team.query.get(team_id)
+    if team:
+        new_status = 'inactive' if team.status == 'active' else 'active'
+        team.status = new_status
+        db.session.commit()
+        flash(f"Team {team.team_name} is now {new_status}!", "success")
+    else:
+        flash("Team not found", "error")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/edit-team/<int:team_id>", methods=["GET", "POST"])
+@require_admin_auth
+def edit_team(team_id):
+    team = Team.query.get(team_id)
+    if not team:
+        flash("Team not found", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    # Store original phone numbers to check for changes
+    old_player1_phone = team.player1_phone
+    old_player2_phone = team.player2_phone
+
+    if request.method == "POST":
+        team_name = request.form.get("team_name", "").strip()
+        player1_name = request.form.get("player1_name", "").strip()
+        player1_email = request.form.get("player1_email", "").strip()
+        player1_phone = request.form.get("player1_phone", "").strip()
+        player2_name = request.form.get("player2_name", "").strip()
+        player2_email = request.form.get("player2_email", "").strip()
+        player2_phone = request.form.get("player2_phone", "").strip()
+
+        errors = []
+
+        if not team_name:
+            errors.append("Team name is required")
+
+        if not player1_name:
+            errors.append("Player 1 name is required")
+
+        if not player2_name:
+            errors.append("Player 2 name is required")
+
+        if not player1_phone:
+            errors.append("Player 1 phone is required")
+
+        if not player2_phone:
+            errors.append("Player 2 phone is required")
+
+        normalized_phone1 = normalize_phone_number(player1_phone) if player1_phone else None
+        normalized_phone2 = normalize_phone_number(player2_phone) if player2_phone else None
+
+        if player1_phone and not normalized_phone1:
+            errors.append("Player 1 phone number is invalid")
+
+        if player2_phone and not normalized_phone2:
+            errors.append("Player 2 phone number is invalid")
+
+        if player1_email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', player1_email):
+            errors.append("Player 1 email format is invalid")
+
+        if player2_email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', player2_email):
+            errors.append("Player 2 email format is invalid")
+
+        if errors:
+            for error in errors:
+                flash(error, "error")
+            return render_template("admin_edit_team.html", team=team)
+
+        team.team_name = team_name
+        team.team_name_canonical = normalize_team_name(team_name)
+        team.player1_name = player1_name
+        team.player1_email = player1_email if player1_email else None
+        team.player1_phone = normalized_phone1
+        team.player2_name = player2_name
+        team.player2_email = player2_email if player2_email else None
+        team.player2_phone = normalized_phone2
+
+        # Update associated Player records if phone number changed
+        if old_player1_phone != normalized_phone1:
+            player1 = Player.query.filter_by(phone=old_player1_phone).first()
+            if player1:
+                player1.phone = normalized_phone1
+                player1.name = player1_name
+                player1.email = player1_email if player1_email else None
+
+        if old_player2_phone != normalized_phone2:
+            player2 = Player.query.filter_by(phone=old_player2_phone).first()
+            if player2:
+                player2.phone = normalized_phone2
+                player2.name = player2_name
+                player2.email = player2_email if player2_email else None
+
+        try:
+            db.session.commit()
+            flash(f"Team {team_name} updated successfully!", "success")
+            return redirect(url_for("admin.admin_panel"))
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error updating team: {str(e)}", "error")
+            return render_template("admin_edit_team.html", team=team)
+
+    return render_template("admin_edit_team.html", team=team)
+
+@bp.route("/admin/delete-team/<int:team_id>", methods=["POST"])
+@require_admin_auth
+def delete_team(team_id):
+    team = Team.query.get(team_id)
+    if not team:
+        flash("Team not found", "error")
+        return redirect(url_for("admin.admin_panel"))
+    # Optionally: delete that team's matches as well
+    # For safety, only allow delete if team has no completed matches
+    has_matches = Match.query.filter(
+        (Match.team_a_id == team_id) | (Match.team_b_id == team_id)
+    ).count() > 0
+    if has_matches:
+        flash("Cannot delete team with scheduled or recorded matches. Remove matches first.", "error")
+        return redirect(url_for("admin.admin_panel"))
+    db.session.delete(team)
+    db.session.commit()
+    flash("Team deleted.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/deny-reschedule/<int:reschedule_id>", methods=["POST"])
+@require_admin_auth
+def deny_reschedule(reschedule_id):
+    reschedule = Reschedule.query.get_or_404(reschedule_id)
+    reschedule.status = "denied"
+    db.session.commit()
+    flash(f"Reschedule request denied for Match {reschedule.match_id}")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/approve-substitute/<int:substitute_id>", methods=["POST"])
+@require_admin_auth
+def approve_substitute(substitute_id):
+    substitute = Substitute.query.get_or_404(substitute_id)
+    substitute.status = "approved"
+
+    # Increment substitute counter for the team
+    team = Team.query.get(substitute.team_id)
+    match = Match.query.get(substitute.match_id)
+
+    if team:
+        team.subs_used += 1
+
+    # Create a Player record for the substitute so they can accumulate stats
+    from datetime import datetime
+    if substitute.phone:
+        substitute_player = Player.query.filter_by(phone=substitute.phone).first()
+        if not substitute_player:
+            substitute_player = Player(
+                name=substitute.name,
+                phone=substitute.phone,
+                email=substitute.email,
+                current_team_id=team.id if team else None,
+                created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
+            db.session.add(substitute_player)
+            db.session.flush()
+        
+        # Link the player to the substitute record
+        substitute.player_id = substitute_player.id
+
+    db.session.commit()
+
+    # Send confirmation emails to all parties
+    from utils import send_email_notification
+
+    if match and team:
+        # Get replaced player's name
+        replaced_player_name = team.player1_name if substitute.replaces_player_number == 1 else team.player2_name
+
+        # Get opponent team
+        opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+        opponent_team = Team.query.get(opponent_id)
+
+        subject = f"Substitute Request APPROVED - Round {match.round}"
+
+        # Email to Player 1
+        if team.player1_email:
+            body1 = f"""Hello {team.player1_name},
+
+✅ GOOD NEWS! Your substitute request has been APPROVED by the admin.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Substitute: {substitute.name} ({substitute.email})
+- Replacing: {replaced_player_name}
+- Match ID: {match.id}
+
+Your substitute is now officially approved for this match. Please coordinate with {substitute.name} for the match schedule.
+
+Team Substitute Usage: {team.subs_used}/2
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(team.player1_email, subject, body1)
+
+        # Email to Player 2
+        if team.player2_email:
+            body2 = f"""Hello {team.player2_name},
+
+✅ GOOD NEWS! Your team's substitute request has been APPROVED by the admin.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Substitute: {substitute.name} ({substitute.email})
+- Replacing: {replaced_player_name}
+- Match ID: {match.id}
+
+Your substitute is now officially approved for this match. Please coordinate with {substitute.name} for the match schedule.
+
+Team Substitute Usage: {team.subs_used}/2
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(team.player2_email, subject, body2)
+
+        # Email to Substitute
+        if substitute.email:
+            sub_body = f"""Hello {substitute.name},
+
+✅ CONGRATULATIONS! Your substitute request has been APPROVED by the admin.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Team Players: {team.player1_name} & {team.player2_name}
+- You will replace: {replaced_player_name}
+- Match ID: {match.id}
+
+You are now officially approved to play as a substitute for this match. Please coordinate with the team for the match schedule and details.
+
+Thank you for participating!
+Padel League Hub"""
+            send_email_notification(substitute.email, subject, sub_body)
+
+        # Email to OPPONENT TEAM
+        if opponent_team:
+            opponent_subject = f"Opponent Using Substitute - Round {match.round}"
+            opponent_body = f"""Hello {opponent_team.team_name},
+
+📢 FYI: Your opponent will be using a substitute player for your upcoming match.
+
+Match Details:
+- Round: {match.round}
+- Opponent Team: {team.team_name}
+- Substitute Player: {substitute.name}
+- Replacing: {replaced_player_name}
+
+The substitute has been approved by the admin. Please proceed with the match as scheduled.
+
+Good luck!
+Padel League Hub"""
+
+            if opponent_team.player1_email:
+                send_email_notification(opponent_team.player1_email, opponent_subject, opponent_body)
+            if opponent_team.player2_email:
+                send_email_notification(opponent_team.player2_email, opponent_subject, opponent_body)
+
+    flash(f"Substitute request approved for Match {substitute.match_id}. Team now has {team.subs_used}/2 substitutes used. Confirmation emails sent to all parties.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/deny-substitute/<int:substitute_id>", methods=["POST"])
+@require_admin_auth
+def deny_substitute(substitute_id):
+    substitute = Substitute.query.get_or_404(substitute_id)
+    substitute.status = "denied"
+
+    team = Team.query.get(substitute.team_id)
+    match = Match.query.get(substitute.match_id)
+
+    db.session.commit()
+
+    # Send notification emails
+    from utils import send_email_notification
+
+    if match and team:
+        subject = f"Substitute Request DENIED - Round {match.round}"
+
+        # Email to Player 1
+        if team.player1_email:
+            body1 = f"""Hello {team.player1_name},
+
+Your substitute request has been DENIED by the admin.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Substitute: {substitute.name} ({substitute.email})
+- Match ID: {match.id}
+
+Please contact the admin if you have questions or to submit a different substitute request.
+
+Team Substitute Usage: {team.subs_used}/2
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(team.player1_email, subject, body1)
+
+        # Email to Player 2
+        if team.player2_email:
+            body2 = f"""Hello {team.player2_name},
+
+Your team's substitute request has been DENIED by the admin.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Substitute: {substitute.name} ({substitute.email})
+- Match ID: {match.id}
+
+Please contact the admin if you have questions or your teammate needs to submit a different substitute request.
+
+Team Substitute Usage: {team.subs_used}/2
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(team.player2_email, subject, body2)
+
+        # Email to Substitute
+        if substitute.email:
+            sub_body = f"""Hello {substitute.name},
+
+Unfortunately, your substitute request has been DENIED by the admin.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Team Players: {team.player1_name} & {team.player2_name}
+- Match ID: {match.id}
+
+You will not be playing as a substitute for this match. Please contact the team or admin if you have questions.
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(substitute.email, subject, sub_body)
+
+    flash(f"Substitute request denied for Match {substitute.match_id}. Notification emails sent to all parties.")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/set-booking-date/<int:match_id>", methods=["POST"])
+@require_admin_auth
+def set_booking_date(match_id):
+    """Admin sets match booking date (no restrictions). Notifies both teams via email."""
+    from utils import send_email_notification
+    
+    match = Match.query.get_or_404(match_id)
+    booking_date = request.form.get("booking_date", "").strip()
+    booking_time = request.form.get("booking_time", "").strip()
+    
+    if not booking_date or not booking_time:
+        flash("Both date and time are required.", "error")
+        return redirect(url_for("admin.admin_panel"))
+    
+    # Format as "YYYY-MM-DD at HH:MM"
+    booking_date_formatted = f"{booking_date} at {booking_time}"
+    
+    # Get both teams
+    team_a = Team.query.get(match.team_a_id)
+    team_b = Team.query.get(match.team_b_id)
+    
+    if not team_a or not team_b:
+        flash("Teams not found.", "error")
+        return redirect(url_for("admin.admin_panel"))
+    
+    # Store the admin-set booking date
+    match.booking_date_admin = booking_date_formatted
+    db.session.commit()
+    
+    # Send email notification to both teams
+    subject = f"Match Booking Date Set - {team_a.team_name} vs {team_b.team_name}"
+    
+    # Email to Team A
+    body_a = f"""Hello {team_a.player1_name},
+
+Your match booking date has been set by the admin!
+
+Match Details:
+- Team A: {team_a.team_name}
+- Team B: {team_b.team_name}
+- Round: {match.round}
+- Booking Date: {booking_date_formatted}
+
+Please confirm your availability and prepare for the match.
+
+Thank you!
+Padel League Hub"""
+    
+    if team_a.player1_email:
+        send_email_notification(team_a.player1_email, subject, body_a)
+    if team_a.player2_email and team_a.player2_email != team_a.player1_email:
+        send_email_notification(team_a.player2_email, subject, body_a)
+    
+    # Email to Team B
+    body_b = f"""Hello {team_b.player1_name},
+
+Your match booking date has been set by the admin!
+
+Match Details:
+- Team A: {team_a.team_name}
+- Team B: {team_b.team_name}
+- Round: {match.round}
+- Booking Date: {booking_date_formatted}
+
+Please confirm your availability and prepare for the match.
+
+Thank you!
+Padel League Hub"""
+    
+    if team_b.player1_email:
+        send_email_notification(team_b.player1_email, subject, body_b)
+    if team_b.player2_email and team_b.player2_email != team_b.player1_email:
+        send_email_notification(team_b.player2_email, subject, body_b)
+    
+    flash(f"Booking date set to '{booking_date_formatted}'. Notification emails sent to both teams.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+@bp.route("/admin/override-match/<int:match_id>", methods=["POST"])
+@require_admin_auth
+def override_match(match_id):
+    match = Match.query.get_or_404(match_id)
+    action = request.form.get("override_action")  # completed | walkover_a | walkover_b | void
+    score_a_str = request.form.get("override_score_a", "").strip()
+    score_b_str = request.form.get("override_score_b", "").strip()
+    note = request.form.get("override_note", "").strip()
+
+    # Reverse prior stats if needed
+    try:
+        if match.stats_calculated:
+            team_a = Team.query.get(match.team_a_id)
+            team_b = Team.query.get(match.team_b_id)
+            if team_a and team_b:
+                team_a.sets_for -= match.sets_a
+                team_a.sets_against -= match.sets_b
+                team_a.games_for -= match.games_a
+                team_a.games_against -= match.games_b
+                team_b.sets_for -= match.sets_b
+                team_b.sets_against -= match.sets_a
+                team_b.games_for -= match.games_b
+                team_b.games_against -= match.games_a
+                if match.winner_id == team_a.id:
+                    team_a.wins -= 1
+                    team_a.points -= 3
+                    team_b.losses -= 1
+                elif match.winner_id == team_b.id:
+                    team_b.wins -= 1
+                    team_b.points -= 3
+                    team_a.losses -= 1
+                elif match.winner_id is None and match.status == "completed":
+                    team_a.draws -= 1
+                    team_a.points -= 1
+                    team_b.draws -= 1
+                    team_b.points -= 1
+
+        # Apply override
+        if action == "completed":
+            sets_a, sets_b, games_a, games_b, winner = calculate_match_result(score_a_str, score_b_str)
+            if winner is None:
+                flash("Invalid score format for override.", "error")
+                return redirect(url_for("admin.admin_panel"))
+            match.score_a = score_a_str
+            match.score_b = score_b_str
+            match.sets_a = sets_a
+            match.sets_b = sets_b
+            match.games_a = games_a
+            match.games_b = games_b
+            match.status = "completed"
+            match.stats_calculated = True
+            team_a = Team.query.get(match.team_a_id)
+            team_b = Team.query.get(match.team_b_id)
+            if team_a and team_b:
+                team_a.sets_for += sets_a
+                team_a.sets_against += sets_b
+                team_a.games_for += games_a
+                team_a.games_against += games_b
+                team_b.sets_for += sets_b
+                team_b.sets_against += sets_a
+                team_b.games_for += games_b
+                team_b.games_against += games_a
+                if winner == 'a':
+                    match.winner_id = team_a.id
+                    team_a.wins += 1
+                    team_a.points += 3
+                    team_b.losses += 1
+                elif winner == 'b':
+                    match.winner_id = team_b.id
+                    team_b.wins += 1
+                    team_b.points += 3
+                    team_a.losses += 1
+                else:
+                    match.winner_id = None
+                    team_a.draws += 1
+                    team_b.draws += 1
+                    team_a.points += 1
+                    team_b.points += 1
+        elif action in ("walkover_a", "walkover_b"):
+            match.score_a = None
+            match.score_b = None
+            match.sets_a = 0
+            match.sets_b = 0
+            match.games_a = 0
+            match.games_b = 0
+            match.status = "walkover"
+            match.stats_calculated = True
+            team_a = Team.query.get(match.team_a_id)
+            team_b = Team.query.get(match.team_b_id)
+            if team_a and team_b:
+                if action == "walkover_a":
+                    match.winner_id = team_a.id
+                    team_a.wins += 1
+                    team_a.points += 3
+                    team_b.losses += 1
+                else:
+                    match.winner_id = team_b.id
+                    team_b.wins += 1
+                    team_b.points += 3
+                    team_a.losses += 1
+        elif action == "void":
+            match.score_a = None
+            match.score_b = None
+            match.sets_a = 0
+            match.sets_b = 0
+            match.games_a = 0
+            match.games_b = 0
+            match.status = "scheduled"
+            match.stats_calculated = False
+            match.winner_id = None
+
+        if note:
+            match.notes = note
+
+        db.session.commit()
+        flash(f"Match {match_id} override applied: {action}", "success")
+        return redirect(url_for("admin.admin_panel"))
+
+    except Exception as e:
+        db.session.rollback()
+        flash(f"Error applying override: {str(e)}", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/remove-freeagent/<int:freeagent_id>", methods=["POST"])
+@require_admin_auth
+def remove_freeagent(freeagent_id):
+    """Remove a single free agent from the list"""
+    free_agent = FreeAgent.query.get_or_404(freeagent_id)
+
+    # Check if this free agent was admin-paired (has partner_id)
+    if free_agent.partner_id:
+        # Keep history by marking as paired
+        free_agent.paired = True
+        flash(f"Free agent {free_agent.name} marked as paired (history preserved).", "success")
+    else:
+        # No partner, safe to delete
+        name = free_agent.name
+        db.session.delete(free_agent)
+        flash(f"Free agent {name} removed from the list.", "success")
+
+    db.session.commit()
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/remove-ladder-freeagent/<int:freeagent_id>", methods=["POST"])
+@require_admin_auth
+def remove_ladder_freeagent(freeagent_id):
+    """Remove a ladder free agent from the list"""
+    free_agent = LadderFreeAgent.query.get_or_404(freeagent_id)
+    name = free_agent.name
+    
+    db.session.delete(free_agent)
+    db.session.commit()
+    
+    flash(f"Free agent {name} removed successfully.", "success")
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/edit-free-agent/<int:free_agent_id>", methods=["GET", "POST"])
+@require_admin_auth
+def edit_free_agent(free_agent_id):
+    """Edit free agent registration details"""
+    free_agent = FreeAgent.query.get(free_agent_id)
+    if not free_agent:
+        flash("Free agent not found", "error")
+        return redirect(url_for("admin.admin_panel"))
+
+    if request.method == "POST":
+        name = request.form.get("name", "").strip()
+        email = request.form.get("email", "").strip()
+        phone = request.form.get("phone", "").strip()
+        skill_level = request.form.get("skill_level", "").strip()
+        playstyle = request.form.get("playstyle", "").strip()
+        availability = request.form.get("availability", "").strip()
+
+        errors = []
+
+        if not name:
+            errors.append("Name is required")
+
+        if not email:
+            errors.append("Email is required")
+
+        if not phone:
+            errors.append("Phone number is required")
+
+        if not skill_level:
+            errors.append("Skill level is required")
+
+        if not playstyle:
+            errors.append("Playstyle is required")
+
+        if not availability:
+            errors.append("Availability is required")
+
+        normalized_phone = normalize_phone_number(phone) if phone else None
+
+        if phone and not normalized_phone:
+            errors.append("Phone number is invalid")
+
+        if email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+            errors.append("Email format is invalid")
+
+        if normalized_phone and normalized_phone != free_agent.phone:
+            existing_fa_phone = FreeAgent.query.filter_by(phone=normalized_phone).first()
+            if existing_fa_phone and existing_fa_phone.id != free_agent_id:
+                errors.append("This phone number is already registered")
+
+        if email and email != free_agent.email:
+            existing_fa_email = FreeAgent.query.filter_by(email=email).first()
+            if existing_fa_email and existing_fa_email.id != free_agent_id:
+                errors.append("This email is already registered")
+
+        if errors:
+            for error in errors:
+                flash(error, "error")
+            return render_template("admin_edit_free_agent.html", free_agent=free_agent)
+
+        free_agent.name = name
+        free_agent.email = email
+        free_agent.phone = normalized_phone
+        free_agent.skill_level = skill_level
+        free_agent.playstyle = playstyle
+        free_agent.availability = availability
+
+        try:
+            db.session.commit()
+            flash(f"Free agent {name} updated successfully!", "success")
+            return redirect(url_for("admin.admin_panel"))
+        except Exception as e:
+            db.session.rollback()
+            flash(f"Error updating free agent: {str(e)}", "error")
+            return render_template("admin_edit_free_agent.html", free_agent=free_agent)
+
+    return render_template("admin_edit_free_agent.html", free_agent=free_agent)
+
+
+@bp.route("/admin/cleanup-duplicate-freeagents", methods=["POST"])
+@require_admin_auth
+def cleanup_duplicate_freeagents():
+    """Bulk remove all free agents who are already in teams"""
+    free_agents = FreeAgent.query.filter_by(paired=False).all()
+    removed_count = 0
+    preserved_count = 0
+
+    # Free agents who already exist in a team, found in one query
+    duplicates = contact_index.group_free_agent_duplicates(free_agents, "free_agent")["duplicate"]
+
+    for item in duplicates:
+        fa = item["agent"]
+        # Check if admin-paired (has partner_id)
+        if fa.partner_id:
+            # Keep history
+            fa.paired = True
+            preserved_count += 1
+        else:
+            # Remove from list
+            db.session.delete(fa)
+            removed_count += 1
+
+    db.session.commit()
+
+    if removed_count > 0 or preserved_count > 0:
+        flash(f"Cleanup complete: {removed_count} free agent(s) removed, {preserved_count} marked as paired (history preserved).", "success")
+    else:
+        flash("No duplicate free agents found.", "info")
+
+    return redirect(url_for("admin.admin_panel"))
+
+
+@bp.route("/admin/recalculate-player-stats", methods=["POST"])
+@require_admin_auth
+def admin_recalculate_player_stats():
+    """Admin route to recalculate all player stats from completed matches"""
+    try:
+        matches_count = recalculate_all_player_stats()
+        flash(f"Player stats recalculated for {matches_count} completed league matches!", "success")
+    except Exception as e:
+        flash(f"Error recalculating player stats: {str(e)}", "error")
+    
+    return redirect(url_for("admin.admin_panel"))
@@ -0,0 +1,319 @@
+"""
+Americano Blueprint for BD Padel League
+Public Americano tournament pages: listing, registration, schedule, live
+view and leaderboard, and the player lookup API used by the sign-up forms.
+"""
+
+from flask import Blueprint, render_template, redirect, url_for, request, flash, abort
+from models import db, AmericanoTournament, AmericanoMatch, AmericanoRegistration
+import contact_index
+from registration_validator import validate_tournament_registration
+
+bp = Blueprint("americano", __name__)
+
+
+# ============================================================================
+# PUBLIC AMERICANO TOURNAMENT ROUTES
+# ============================================================================
+
+@bp.route("/tournaments")
+def tournaments_list():
+    """List all open tournaments"""
+    from datetime import datetime
+
+    now = datetime.now()
+
+    # Get tournaments with registration open or recently completed
+    tournaments = AmericanoTournament.query.filter(
+        db.or_(
+            AmericanoTournament.registration_open == True,
+            AmericanoTournament.status.in_(['in_progress', 'completed'])
+        )
+    ).order_by(AmericanoTournament.tournament_date.desc()).all()
+
+    tournament_data = []
+    for tournament in tournaments:
+        reg_count = AmericanoRegistration.query.filter_by(
+            tournament_id=tournament.id,
+            status='confirmed'
+        ).count()
+
+        # Determine state
+        is_registration_open = (
+            tournament.registration_open and
+            (tournament.registration_deadline is None or tournament.registration_deadline >= now)
+        )
+
+        has_matches = AmericanoMatch.query.filter_by(tournament_id=tournament.id).count() > 0
+
+        tournament_data.append({
+            'tournament': tournament,
+            'reg_count': reg_count,
+            'is_registration_open': is_registration_open,
+            'has_matches': has_matches
+        })
+
+    return render_template("americano/tournament_list.html", tournament_data=tournament_data)
+
+
+@bp.route("/tournaments/<int:tournament_id>")
+def tournament_detail(tournament_id):
+    """Tournament details + participant list"""
+    from datetime import datetime
+    import json
+
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+    now = datetime.now()
+
+    # Get registrations
+    registrations = AmericanoRegistration.query.filter_by(
+        tournament_id=tournament_id,
+        status='confirmed'
+    ).order_by(AmericanoRegistration.created_at.asc()).all()
+
+    # Check if registration is open
+    is_registration_open = (
+        tournament.registration_open and
+        (tournament.registration_deadline is None or tournament.registration_deadline >= now)
+    )
+
+    # Check if matches have been generated
+    has_matches = AmericanoMatch.query.filter_by(tournament_id=tournament_id).count() > 0
+
+    # Check if full
+    is_full = len(registrations) >= (tournament.max_participants or 24)
+
+    return render_template("americano/tournament_detail.html",
+                         tournament=tournament,
+                         registrations=registrations,
+                         is_registration_open=is_registration_open,
+                         has_matches=has_matches,
+                         is_full=is_full)
+
+
+@bp.route("/tournaments/<int:tournament_id>/register", methods=["GET", "POST"])
+def tournament_register(tournament_id):
+    """Registration form with smart player detection"""
+    from datetime import datetime
+    from utils import find_existing_player_by_email, find_existing_player_by_phone, normalize_phone_number
+
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+    now = datetime.now()
+
+    # Check if registration is open
+    if not tournament.registration_open:
+        flash("Registration is not open for this tournament.", "error")
+        return redirect(url_for('americano.tournament_detail', tournament_id=tournament_id))
+
+    if tournament.registration_deadline and tournament.registration_deadline < now:
+        flash("Registration deadline has passed.", "error")
+        return redirect(url_for('americano.tournament_detail', tournament_id=tournament_id))
+
+    # Check if full
+    reg_count = AmericanoRegistration.query.filter_by(
+        tournament_id=tournament_id,
+        status='confirmed'
+    ).count()
+    if reg_count >= (tournament.max_participants or 24):
+        flash("This tournament is full.", "error")
+        return redirect(url_for('americano.tournament_detail', tournament_id=tournament_id))
+
+    if request.method == "POST":
+        name = request.form.get("name", "").strip()
+        email = request.form.get("email", "").strip().lower()
+        phone = request.form.get("phone", "").strip()
+        gender = request.form.get("gender", "").strip()
+        skill_level = request.form.get("skill_level", "").strip()
+        source_type = request.form.get("source_type", "new")
+        source_id = request.form.get("source_id", type=int)
+
+        # Validation
+        if not name or not email or not phone or not gender:
+            flash("All fields are required.", "error")
+            return render_template("americano/register.html",
+                                 tournament=tournament,
+                                 form_data=request.form)
+
+        # Validate gender matches tournament
+        if gender != tournament.gender:
+            flash(f"This tournament is for {tournament.gender}'s division only.", "error")
+            return render_template("americano/register.html",
+                                 tournament=tournament,
+                                 form_data=request.form)
+
+        # Normalize phone
+        normalized_phone = normalize_phone_number(phone)
+
+        # Check for duplicate registration
+        error = validate_tournament_registration(tournament_id, email, normalized_phone)
+        if error:
+            flash(error, "error")
+            return redirect(url_for('americano.tournament_detail', tournament_id=tournament_id))
+
+        # Create registration
+        registration = AmericanoRegistration(
+            tournament_id=tournament_id,
+            name=name,
+            phone=normalized_phone,
+            email=email,
+            gender=gender,
+            source_type=source_type,
+            source_id=source_id,
+            skill_level=skill_level if skill_level else None,
+            status='confirmed',
+            created_at=datetime.now()
+        )
+
+        db.session.add(registration)
+        db.session.commit()
+
+        flash(f"Registration successful! Welcome to the tournament, {name}.", "success")
+        return redirect(url_for('americano.tournament_detail', tournament_id=tournament_id))
+
+    return render_template("americano/register.html", tournament=tournament)
+
+
+@bp.route("/api/check-player", methods=["GET"])
+def api_check_player():
+    """AJAX endpoint to check if player exists"""
+    from flask import jsonify
+
+    email = request.args.get("email", "").strip()
+    phone = request.args.get("phone", "").strip()
+
+    # One cached directory probe answers both (email matches take priority over phone)
+    source_type, source_id, player_data = contact_index.cached_find_existing_player(email=email, phone=phone)
+    return jsonify(_check_player_payload(source_type, source_id, player_data))
+
+
+def _check_player_payload(source_type, source_id, player_data):
+    """JSON body for a player identity lookup result"""
+    if not player_data:
+        return {'found': False}
+    return {
+        'found': True,
+        'source_type': source_type,
+        'source_id': source_id,
+        'name': player_data.get('name'),
+        'phone': player_data.get('phone'),
+        'email': player_data.get('email'),
+        'gender': player_data.get('gender')
+    }
+
+
+MAX_BATCH_PLAYER_CHECKS = 20
+
+
+@bp.route("/api/check-players", methods=["GET", "POST"])
+def api_check_players():
+    """
+    Batched player lookup: several emails and/or phones in one request.
+    GET ?email=..&email=..&phone=.. or POST JSON {"emails": [...], "phones": [...]}
+    Returns {"emails": {input: result}, "phones": {input: result}}, where a result
+    is only {"found", "source_type"}: the endpoint is public, so it must not hand
+    out contact details 20 identifiers at a time (/api/check-player does that
+    for the one player filling in a form).
+    """
+    from flask import jsonify
+
+    if request.method == "POST":
+        payload = request.get_json(silent=True) or {}
+        emails = payload.get("emails") or []
+        phones = payload.get("phones") or []
+    else:
+        emails = request.args.getlist("email")
+        phones = request.args.getlist("phone")
+
+    emails = [e.strip() for e in emails if isinstance(e, str) and e.strip()]
+    phones = [p.strip() for p in phones if isinstance(p, str) and p.strip()]
+    if len(emails) + len(phones) > MAX_BATCH_PLAYER_CHECKS:
+        return jsonify({'error': f'At most {MAX_BATCH_PLAYER_CHECKS} identifiers per request'}), 400
+
+    results = contact_index.cached_find_existing_players(emails=emails, phones=phones)
+
+    def presence(key):
+        source_type, _source_id, player_data = results.get(key, (None, None, None))
+        return {'found': True, 'source_type': source_type} if player_data else {'found': False}
+
+    return jsonify({
+        'emails': {email: presence(("email", contact_index.email_key(email))) for email in emails},
+        'phones': {phone: presence(("phone", contact_index.phone_key(phone))) for phone in phones},
+    })
+
+
+@bp.route("/tournaments/<int:tournament_id>/schedule")
+def tournament_schedule(tournament_id):
+    """Public schedule view - players check their matches, courts, partners"""
+    import americano_schedule
+    import live_updates
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    schedule = americano_schedule.get_schedule_view(tournament)
+    if schedule is None:
+        flash("Match schedule has not been generated yet.", "info")
+        return redirect(url_for('americano.tournament_detail', tournament_id=tournament_id))
+
+    return render_template("americano/public_schedule.html",
+                         tournament=tournament,
+                         matches_by_round=schedule['matches_by_round'],
+                         current_round=schedule['current_round'],
+                         total_rounds=tournament.total_rounds,
+                         participants=schedule['participants'],
+                         num_courts=tournament.num_courts or 2,
+                         timetable=schedule['timetable'],
+                         live_stream=live_updates.LIVE_SSE_ENABLED)
+
+
+@bp.route("/tournaments/<int:tournament_id>/schedule.json")
+def tournament_schedule_json(tournament_id):
+    """
+    Compact schedule for polling clients. Sends an ETag; a request with a
+    matching If-None-Match gets 304 Not Modified until a score changes.
+    """
+    import americano_schedule
+    from flask import jsonify
+
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    schedule = americano_schedule.get_schedule_view(tournament)
+    if schedule is None:
+        return jsonify({'error': 'Match schedule has not been generated yet.'}), 404
+
+    response = jsonify(schedule['compact'])
+    response.set_etag(schedule['version'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+@bp.route("/tournaments/<int:tournament_id>/live")
+def tournament_live(tournament_id):
+    """Server-Sent Events stream of score updates for the public schedule and leaderboard"""
+    import live_updates
+    from flask import Response
+
+    if not live_updates.LIVE_SSE_ENABLED:
+        abort(404)  # pages poll schedule.json instead
+    AmericanoTournament.query.get_or_404(tournament_id)
+
+    stream = live_updates.open_stream(tournament_id)
+    if stream is None:
+        return Response("Too many live viewers, falling back to polling", status=503,
+                        headers={'Retry-After': '30'})
+
+    return Response(stream, mimetype="text/event-stream", headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',  # don't let a proxy buffer the stream
+    })
+
+
+@bp.route("/tournaments/<int:tournament_id>/leaderboard")
+def tournament_leaderboard(tournament_id):
+    """Public leaderboard view"""
+    import americano_standings
+    import live_updates
+    tournament = AmericanoTournament.query.get_or_404(tournament_id)
+
+    return render_template("americano/public_leaderboard.html",
+                         tournament=tournament,
+                         leaderboard=americano_standings.get_leaderboard(tournament),
+                         live_stream=live_updates.LIVE_SSE_ENABLED)
@@ -0,0 +1,2156 @@
+"""
+Ladder Blueprint for BD Padel League
+Ladder registration, the men/women/mixed ladders, the team dashboard,
+challenges and score confirmation.
+"""
+
+from flask import Blueprint, render_template, redirect, url_for, request, flash, session
+import os
+import secrets
+from models import db, LadderTeam, LadderFreeAgent, LadderChallenge, LadderMatch, LadderSettings
+from utils import normalize_phone_number, normalize_team_name
+from registration_validator import validate_ladder_team
+from ladder_rules import (
+    apply_rank_penalty, calculate_holiday_status, swap_ladder_ranks, update_ladder_team_stats_from_match,
+)
+
+bp = Blueprint("ladder", __name__)
+
+
+@bp.route("/ladder/register-team", methods=["GET", "POST"])
+def ladder_register_team():
+    """Ladder team registration with gender and contact preferences"""
+    if request.method == "POST":
+        team_name = request.form["team_name"]
+        p1_name = request.form["player1_name"]
+        p1_phone = request.form["player1_phone"]
+        p1_email = request.form.get("player1_email", "").strip()
+        p2_name = request.form["player2_name"]
+        p2_phone = request.form["player2_phone"]
+        p2_email = request.form.get("player2_email", "").strip()
+        gender = request.form.get("gender", "").strip()
+
+        # Get contact preferences
+        contact_email = request.form.get("contact_email") == "on"
+        contact_whatsapp = request.form.get("contact_whatsapp") == "on"
+
+        # Validate required fields
+        if not p1_email or not p2_email:
+            flash("Email is required for both players.", "error")
+            return render_template("ladder/register_team.html", form_data=request.form)
+
+        if not gender or gender not in ["men", "women", "mixed"]:
+            flash("Please select a division (Men, Women, or Mixed).", "error")
+            return render_template("ladder/register_team.html", form_data=request.form)
+        
+        # For Mixed teams, validate gender selections
+        player1_gender = None
+        player2_gender = None
+        if gender == "mixed":
+            player1_gender = request.form.get("player1_gender", "").strip()
+            player2_gender = request.form.get("player2_gender", "").strip()
+            
+            if not player1_gender or not player2_gender:
+                flash("Please select gender for both players in Mixed teams.", "error")
+                return render_template("ladder/register_team.html", form_data=request.form)
+            
+            if player1_gender not in ["male", "female"] or player2_gender not in ["male", "female"]:
+                flash("Invalid gender selection.", "error")
+                return render_template("ladder/register_team.html", form_data=request.form)
+            
+            # Validate exactly one male and one female
+            if player1_gender == player2_gender:
+                flash("Mixed teams must have exactly one male and one female player.", "error")
+                return render_template("ladder/register_team.html", form_data=request.form)
+
+        # Validate at least one contact preference
+        if not contact_email and not contact_whatsapp:
+            flash("Please select at least one contact preference (Email or WhatsApp).", "error")
+            return render_template("ladder/register_team.html", form_data=request.form)
+
+        # Check if Player 1 and Player 2 have the same email or phone number
+        if p1_email.lower() == p2_email.lower():
+            flash("Player 1 and Player 2 cannot have the same email address.", "error")
+            return render_template("ladder/register_team.html", form_data=request.form)
+
+        if normalize_phone_number(p1_phone) == normalize_phone_number(p2_phone):
+            flash("Player 1 and Player 2 cannot have the same WhatsApp number.", "error")
+            return render_template("ladder/register_team.html", form_data=request.form)
+
+        # Normalize phone numbers
+        p1_phone_normalized = normalize_phone_number(p1_phone)
+        p2_phone_normalized = normalize_phone_number(p2_phone)
+
+        # Team name must be unique across league and ladder; players only within the ladder
+        # (Mixed registrations are checked against Mixed teams only). One query for all checks.
+        error = validate_ladder_team(team_name, [(p1_email, p1_phone), (p2_email, p2_phone)], gender)
+        if error:
+            flash(error, "error")
+            return render_template("ladder/register_team.html", form_data=request.form)
+
+        canonical = normalize_team_name(team_name)
+
+        # Generate unique access token
+        access_token = secrets.token_urlsafe(32)
+
+        # Find max rank in the appropriate gender ladder and add team at bottom
+        from datetime import datetime
+        max_rank_team = LadderTeam.query.filter_by(
+            gender=gender
+        ).order_by(LadderTeam.current_rank.desc()).first()
+
+        current_rank = max_rank_team.current_rank + 1 if max_rank_team else 1
+
+        # Create new ladder team
+        new_team = LadderTeam(
+            team_name=team_name,
+            team_name_canonical=canonical,
+            player1_name=p1_name,
+            player1_phone=p1_phone_normalized,
+            player1_email=p1_email,
+            player2_name=p2_name,
+            player2_phone=p2_phone_normalized,
+            player2_email=p2_email,
+            gender=gender,
+            ladder_type=gender,
+            current_rank=current_rank,
+            contact_preference_email=contact_email,
+            contact_preference_whatsapp=contact_whatsapp,
+            access_token=access_token,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            player1_gender=player1_gender if gender == "mixed" else None,
+            player2_gender=player2_gender if gender == "mixed" else None
+        )
+        db.session.add(new_team)
+        db.session.commit()
+
+        # Generate access link
+        base_url = "https://goeclectic.xyz"
+        access_link = f"{base_url}/ladder/my-team/{access_token}"
+
+        # Send confirmation email to Player 1
+        if p1_email:
+            from utils import send_email_notification
+            # Determine WhatsApp group link based on gender
+            if gender == 'men':
+                whatsapp_link = "https://chat.whatsapp.com/Fw54Nxdk6jS9GTMOTnC0UD"
+            elif gender == 'women':
+                whatsapp_link = "https://chat.whatsapp.com/GswFleVQhxF4gziShBhstd"
+            else:  # mixed
+                whatsapp_link = "https://chat.whatsapp.com/LMHJyJ68MeCEhZaewOA8jx"
+
+            email_body = f"""Hi {p1_name},
+
+✅ Your team "{team_name}" has been successfully registered for the Ladder Tournament!
+
+📋 Registration Details:
+- Team Name: {team_name}
+- Gender Category: {gender.capitalize()}
+- Player 1: {p1_name} (You)
+- Player 2: {p2_name}
+- Starting Rank: #{current_rank}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💳 PAYMENT REQUIRED - IMPORTANT
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+To complete your registration and be listed on the ladder rankings, please make a payment of BDT 500 PER TEAM (NOT per player).
+
+Payment Method: bKash
+Payment Number: 01313399918
+Amount: BDT 500 (TOTAL FOR THE ENTIRE TEAM - split between both players if you wish)
+
+⚠️ IMPORTANT: 
+1. This is BDT 500 for the WHOLE TEAM (both players together)
+2. You can split the cost between players or one player can pay the full amount
+3. When making the payment, you MUST put your team name in the reference/note field:
+
+Reference: {team_name}
+
+Failure to include your team name in the reference may cause delays in listing your team on the ladder rankings.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Once payment is confirmed by admin, your team will be visible on the ladder rankings and you can start challenging other teams.
+
+🔗 Your Team Access Link:
+{access_link}
+
+🔑 Access Token (for team login page):
+{access_token}
+
+You can either:
+1. Click the access link above to go directly to your team page, OR
+2. Visit the ladder login page and paste your access token
+
+💬 Join Your Division's WhatsApp Group:
+{whatsapp_link}
+
+Stay connected with other teams, coordinate matches, and get updates!
+
+🎾 How the Ladder Works:
+- Challenge teams up to 3 positions above you
+- Win to swap positions and climb the ladder
+- Play at your convenience
+- Monthly Americano tournaments for additional fun!
+
+Good luck climbing the ladder! 🚀
+
+- BD Padel League
+"""
+            send_email_notification(p1_email, f"Ladder Team Registered - {team_name}", email_body)
+
+        # Send confirmation email to Player 2
+        if p2_email:
+            from utils import send_email_notification
+            email_body = f"""Hi {p2_name},
+
+✅ You've been registered as part of team "{team_name}" for the Ladder Tournament!
+
+📋 Team Details:
+- Team Name: {team_name}
+- Gender Category: {gender.capitalize()}
+- Partner: {p1_name}
+- Starting Rank: #{current_rank}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💳 PAYMENT REQUIRED - IMPORTANT
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+To complete your registration and be listed on the ladder rankings, please make a payment of BDT 500 PER TEAM (NOT per player).
+
+Payment Method: bKash
+Payment Number: 01313399918
+Amount: BDT 500 (TOTAL FOR THE ENTIRE TEAM - split between both players if you wish)
+
+⚠️ IMPORTANT: 
+1. This is BDT 500 for the WHOLE TEAM (both players together)
+2. You can coordinate with {p1_name} to split the cost or one of you can pay the full amount
+3. When making the payment, you MUST put your team name in the reference/note field:
+
+Reference: {team_name}
+
+Failure to include your team name in the reference may cause delays in listing your team on the ladder rankings.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Once payment is confirmed by admin, your team will be visible on the ladder rankings and you can start challenging other teams.
+
+🔗 Your Team Access Link:
+{access_link}
+
+🔑 Access Token (for team login page):
+{access_token}
+
+You can either:
+1. Click the access link above to go directly to your team page, OR
+2. Visit the ladder login page and paste your access token
+
+💬 Join Your Division's WhatsApp Group:
+{whatsapp_link}
+
+Stay connected with other teams, coordinate matches, and get updates!
+
+🎾 How the Ladder Works:
+- Challenge teams up to 3 positions above you
+- Win to swap positions and climb the ladder
+- Play at your convenience
+- Monthly Americano tournaments for additional fun!
+
+Good luck climbing the ladder! 🚀
+
+- BD Padel League
+"""
+            send_email_notification(p2_email, f"Ladder Team Registered - {team_name}", email_body)
+
+        # Send admin notification
+        admin_email = os.environ.get("ADMIN_EMAIL")
+        if admin_email:
+            from utils import send_email_notification
+            admin_body = f"""🆕 NEW LADDER TEAM REGISTRATION
+
+Team Name: {team_name}
+Gender: {gender.capitalize()}
+Ladder Type: Ladder
+Starting Rank: #{current_rank}
+
+Player 1:
+- Name: {p1_name}
+- Email: {p1_email}
+- Phone: {p1_phone}
+
+Player 2:
+- Name: {p2_name}
+- Email: {p2_email}
+- Phone: {p2_phone}
+
+Contact Preferences:
+- Email: {"Yes" if contact_email else "No"}
+- WhatsApp: {"Yes" if contact_whatsapp else "No"}
+
+Access Link: {access_link}
+"""
+            send_email_notification(admin_email, f"New Ladder Team: {team_name}", admin_body)
+
+        return render_template("ladder/registration_success_team.html", 
+                             team_name=team_name, 
+                             access_link=access_link,
+                             rank=current_rank,
+                             gender=gender)
+
+    return render_template("ladder/register_team.html")
+
+@bp.route("/ladder/register-freeagent", methods=["GET", "POST"])
+def ladder_register_freeagent():
+    """Ladder free agent registration for monthly Americano tournaments"""
+    if request.method == "POST":
+        name = request.form["name"]
+        phone = request.form["phone"]
+        email = request.form.get("email", "").strip()
+        gender = request.form.get("gender", "").strip()
+        skill_level = request.form.get("skill_level", "").strip()
+        playstyle = request.form.get("playstyle", "").strip()
+        availability = request.form.get("availability", "").strip()
+
+        # Get contact preferences
+        contact_email = request.form.get("contact_email") == "on"
+        contact_whatsapp = request.form.get("contact_whatsapp") == "on"
+
+        # Validate required fields
+        if not email:
+            flash("Email is required for free agent registration.", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        if not gender or gender not in ["men", "women"]:
+            flash("Please select a gender (Men or Women).", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        # Validate at least one contact preference
+        if not contact_email and not contact_whatsapp:
+            flash("Please select at least one contact preference (Email or WhatsApp).", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        # Normalize phone number
+        phone_normalized = normalize_phone_number(phone)
+
+        # Check if email is already registered in LadderTeam only (allow league players)
+        existing_ladder_email = LadderTeam.query.filter(
+            db.or_(
+                LadderTeam.player1_email == email,
+                LadderTeam.player2_email == email
+            )
+        ).first()
+
+        if existing_ladder_email:
+            flash(f"This email ({email}) is already registered in ladder team '{existing_ladder_email.team_name}'. Please use a different email.", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        # Check if phone is already registered in LadderTeam only (allow league players)
+        existing_ladder_phone = LadderTeam.query.filter(
+            db.or_(
+                LadderTeam.player1_phone == phone_normalized,
+                LadderTeam.player2_phone == phone_normalized
+            )
+        ).first()
+
+        if existing_ladder_phone:
+            flash(f"This WhatsApp number is already registered in ladder team '{existing_ladder_phone.team_name}'. Please use a different number.", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        # Check ladder free agents (duplicate within ladder free agents only)
+        existing_ladder_fa_email = LadderFreeAgent.query.filter_by(email=email).first()
+        if existing_ladder_fa_email:
+            flash(f"This email is already registered as a ladder free agent. Please use a different email.", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        existing_ladder_fa_phone = LadderFreeAgent.query.filter_by(phone=phone_normalized).first()
+        if existing_ladder_fa_phone:
+            flash(f"This WhatsApp number is already registered as a ladder free agent. Please use a different number.", "error")
+            return render_template("ladder/register_freeagent.html", form_data=request.form)
+
+        # Generate unique access token
+        access_token = secrets.token_urlsafe(32)
+
+        # Create new ladder free agent
+        from datetime import datetime
+        new_fa = LadderFreeAgent(
+            name=name,
+            phone=phone_normalized,
+            email=email,
+            gender=gender,
+            contact_preference_email=contact_email,
+            contact_preference_whatsapp=contact_whatsapp,
+            access_token=access_token,
+            skill_level=skill_level,
+            playstyle=playstyle,
+            availability=availability,
+            created_at=datetime.now()
+        )
+        db.session.add(new_fa)
+        db.session.commit()
+
+        # Generate access link
+        base_url = "https://goeclectic.xyz"
+        access_link = f"{base_url}/ladder/my-team/{access_token}"
+
+        # Send confirmation email
+        if email:
+            from utils import send_email_notification
+            # Determine WhatsApp group link based on gender
+            if gender == 'men':
+                whatsapp_link = "https://chat.whatsapp.com/BMqHxbPhKg67tmXIyuZwNJ"
+            else:
+                whatsapp_link = "https://chat.whatsapp.com/JdjNaMf3QhnD7yw1saq9lk"
+
+            email_body = f"""Hi {name},
+
+✅ Welcome to the Ladder Tournament! Your free agent registration has been confirmed.
+
+📋 Your Profile:
+- Name: {name}
+- Gender: {gender.capitalize()}
+- Skill Level: {skill_level}
+- Playstyle: {playstyle}
+- Availability: {availability}
+
+🎾 Monthly Americano Tournaments:
+As a ladder free agent, you'll be invited to participate in our monthly Americano tournaments! These are fun, social tournaments where you'll:
+- Play with different partners each round
+- Meet other players in your gender category
+- Compete for prizes and bragging rights
+- Enjoy a friendly, competitive atmosphere
+
+💬 Join Your Free Agents WhatsApp Group:
+{whatsapp_link}
+
+Connect with other free agents, get tournament updates, and find potential partners!
+
+📅 What's Next?
+You'll receive an email notification before each monthly tournament with:
+- Tournament date and time
+- Registration confirmation
+- Tournament format details
+- Venue information
+
+Contact Preferences: {"Email" if contact_email else ""}{"" if not (contact_email and contact_whatsapp) else " and "}{"WhatsApp" if contact_whatsapp else ""}
+
+If you have any questions, please contact the admin.
+
+Thank you for joining! 🚀
+
+- BD Padel League
+"""
+            send_email_notification(email, f"Ladder Free Agent Registration Confirmed", email_body)
+
+        # Send admin notification
+        admin_email = os.environ.get("ADMIN_EMAIL")
+        if admin_email:
+            from utils import send_email_notification
+            admin_body = f"""🆕 NEW LADDER FREE AGENT REGISTRATION
+
+Name: {name}
+Email: {email}
+Phone: {phone}
+Gender: {gender.capitalize()}
+Skill Level: {skill_level}
+Playstyle: {playstyle}
+Availability: {availability}
+
+Contact Preferences:
+- Email: {"Yes" if contact_email else "No"}
+- WhatsApp: {"Yes" if contact_whatsapp else "No"}
+
+Access Link: {access_link}
+"""
+            send_email_notification(admin_email, f"New Ladder Free Agent: {name}", admin_body)
+
+        return render_template("ladder/registration_success_freeagent.html", 
+                             name=name, 
+                             access_link=access_link,
+                             gender=gender)
+
+    return render_template("ladder/register_freeagent.html")
+
+@bp.route("/ladder/men/")
+def ladder_men():
+    """Public Men's Ladder Rankings Page - View Only"""
+    ladder_type = 'men'
+
+    # Query by gender='men' and only show paid teams
+    teams = LadderTeam.query.filter_by(
+        gender='men',
+        payment_received=True
+    ).all()
+
+    # Calculate initial rank based on registration order (when they joined)
+    teams_by_creation = sorted(teams, key=lambda t: t.created_at)
+    initial_ranks = {team.id: idx for idx, team in enumerate(teams_by_creation, start=1)}
+    
+    # Sort by current_rank (which preserves rank swaps from matches)
+    # If current_rank is None, assign based on registration order
+    teams_sorted = sorted(teams, key=lambda t: t.current_rank if t.current_rank is not None else initial_ranks.get(t.id, 999))
+    
+    # Assign display ranks (sequential 1..N for consistent display)
+    for idx, team in enumerate(teams_sorted, start=1):
+        team.display_rank = idx
+    
+    # Calculate movement: initial rank - current rank (positive = moved up)
+    for team in teams:
+        team.initial_rank = initial_ranks.get(team.id, 999)
+        team.rank_movement = team.initial_rank - team.display_rank
+
+    active_challenges = LadderChallenge.query.filter(
+        LadderChallenge.ladder_type == ladder_type,
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).all()
+
+    locked_team_ids = set()
+    for challenge in active_challenges:
+        locked_team_ids.add(challenge.challenger_team_id)
+        locked_team_ids.add(challenge.challenged_team_id)
+
+    recent_matches = LadderMatch.query.filter(
+        LadderMatch.ladder_type == ladder_type,
+        LadderMatch.verified == True
+    ).order_by(LadderMatch.completed_at.desc()).limit(10).all()
+
+    top_performers = []
+    if teams_sorted:
+        teams_with_matches = [t for t in teams_sorted if t.matches_played > 0]
+        if teams_with_matches:
+            sorted_by_wins = sorted(teams_with_matches, key=lambda t: (t.wins / t.matches_played if t.matches_played > 0 else 0, t.wins), reverse=True)
+            top_performers = sorted_by_wins[:3]
+
+    team_map = {t.id: t for t in teams_sorted}
+
+    settings = LadderSettings.query.first()
+
+    return render_template("ladder/ladder_rankings.html",
+                         teams=teams_sorted,
+                         ladder_type=ladder_type,
+                         locked_team_ids=locked_team_ids,
+                         recent_matches=recent_matches,
+                         top_performers=top_performers,
+                         team_map=team_map,
+                         settings=settings,
+                         is_public=True)
+
+@bp.route("/ladder/women/")
+def ladder_women():
+    """Public Women's Ladder Rankings Page - View Only"""
+    ladder_type = 'women'
+
+    # Query by gender='women' and only show paid teams
+    teams = LadderTeam.query.filter_by(
+        gender='women',
+        payment_received=True
+    ).all()
+
+    # Calculate initial rank based on registration order (when they joined)
+    teams_by_creation = sorted(teams, key=lambda t: t.created_at)
+    initial_ranks = {team.id: idx for idx, team in enumerate(teams_by_creation, start=1)}
+    
+    # Sort by current_rank (which preserves rank swaps from matches)
+    # If current_rank is None, assign based on registration order
+    teams_sorted = sorted(teams, key=lambda t: t.current_rank if t.current_rank is not None else initial_ranks.get(t.id, 999))
+    
+    # Assign display ranks (sequential 1..N for consistent display)
+    for idx, team in enumerate(teams_sorted, start=1):
+        team.display_rank = idx
+    
+    # Calculate movement: initial rank - current rank (positive = moved up)
+    for team in teams:
+        team.initial_rank = initial_ranks.get(team.id, 999)
+        team.rank_movement = team.initial_rank - team.display_rank
+
+    active_challenges = LadderChallenge.query.filter(
+        LadderChallenge.ladder_type == ladder_type,
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).all()
+
+    locked_team_ids = set()
+    for challenge in active_challenges:
+        locked_team_ids.add(challenge.challenger_team_id)
+        locked_team_ids.add(challenge.challenged_team_id)
+
+    recent_matches = LadderMatch.query.filter(
+        LadderMatch.ladder_type == ladder_type,
+        LadderMatch.verified == True
+    ).order_by(LadderMatch.completed_at.desc()).limit(10).all()
+
+    top_performers = []
+    if teams_sorted:
+        teams_with_matches = [t for t in teams_sorted if t.matches_played > 0]
+        if teams_with_matches:
+            sorted_by_wins = sorted(teams_with_matches, key=lambda t: (t.wins / t.matches_played if t.matches_played > 0 else 0, t.wins), reverse=True)
+            top_performers = sorted_by_wins[:3]
+
+    team_map = {t.id: t for t in teams_sorted}
+
+    settings = LadderSettings.query.first()
+
+    return render_template("ladder/ladder_rankings.html",
+                         teams=teams_sorted,
+                         ladder_type=ladder_type,
+                         locked_team_ids=locked_team_ids,
+                         recent_matches=recent_matches,
+                         top_performers=top_performers,
+                         team_map=team_map,
+                         settings=settings,
+                         is_public=True)
+
+@bp.route("/ladder/mixed/")
+def ladder_mixed():
+    """Public Mixed Ladder Rankings Page - View Only"""
+    ladder_type = 'mixed'
+
+    # Query by gender='mixed' and only show paid teams
+    teams = LadderTeam.query.filter_by(
+        gender='mixed',
+        payment_received=True
+    ).all()
+    
+    # Calculate initial rank based on registration order (when they joined)
+    teams_by_creation = sorted(teams, key=lambda t: t.created_at)
+    initial_ranks = {team.id: idx for idx, team in enumerate(teams_by_creation, start=1)}
+    
+    # Sort by current_rank (which preserves rank swaps from matches)
+    # If current_rank is None, assign based on registration order
+    teams_sorted = sorted(teams, key=lambda t: t.current_rank if t.current_rank is not None else initial_ranks.get(t.id, 999))
+    
+    # Assign display ranks (sequential 1..N for consistent display)
+    for idx, team in enumerate(teams_sorted, start=1):
+        team.display_rank = idx
+    
+    # Calculate movement: initial rank - current rank (positive = moved up)
+    for team in teams:
+        team.initial_rank = initial_ranks.get(team.id, 999)
+        team.rank_movement = team.initial_rank - team.display_rank
+
+    active_challenges = LadderChallenge.query.filter(
+        LadderChallenge.ladder_type == ladder_type,
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).all()
+
+    locked_team_ids = set()
+    for challenge in active_challenges:
+        locked_team_ids.add(challenge.challenger_team_id)
+        locked_team_ids.add(challenge.challenged_team_id)
+
+    recent_matches = LadderMatch.query.filter(
+        LadderMatch.ladder_type == ladder_type,
+        LadderMatch.verified == True
+    ).order_by(LadderMatch.completed_at.desc()).limit(10).all()
+
+    top_performers = []
+    if teams_sorted:
+        teams_with_matches = [t for t in teams_sorted if t.matches_played > 0]
+        if teams_with_matches:
+            sorted_by_wins = sorted(teams_with_matches, key=lambda t: (t.wins / t.matches_played if t.matches_played > 0 else 0, t.wins), reverse=True)
+            top_performers = sorted_by_wins[:3]
+
+    team_map = {t.id: t for t in teams_sorted}
+
+    settings = LadderSettings.query.first()
+
+    # Check if user is logged in as a team
+    logged_in_team = None
+    if 'ladder_team_id' in session:
+        logged_in_team = LadderTeam.query.get(session['ladder_team_id'])
+        # Verify the team is in the mixed ladder
+        if logged_in_team and logged_in_team.gender != 'mixed':
+            logged_in_team = None
+
+    return render_template("ladder/ladder_rankings.html",
+                         teams=teams_sorted,
+                         ladder_type=ladder_type,
+                         locked_team_ids=locked_team_ids,
+                         recent_matches=recent_matches,
+                         top_performers=top_performers,
+                         team_map=team_map,
+                         settings=settings,
+                         is_public=True,
+                         logged_in_team=logged_in_team)
+
+
+def verify_match_scores(match):
+    """
+    Verify that both teams submitted scores for the same match.
+    Since scores are stored consistently (team_a_score_set1 is always Team A's games,
+    team_b_score_set1 is always Team B's games), if both teams submitted, scores are verified.
+    Returns True if scores exist and are valid, False if there's a dispute.
+    """
+    from datetime import datetime
+    from utils import send_email_notification
+
+    team_a = LadderTeam.query.get(match.team_a_id)
+    team_b = LadderTeam.query.get(match.team_b_id)
+
+    if not match.team_a_submitted or not match.team_b_submitted:
+        return False
+
+    # Both teams submitted scores - they are automatically consistent
+    # because they're stored in the same fields regardless of submission order
+    set1_valid = (match.team_a_score_set1 is not None and match.team_b_score_set1 is not None)
+    set2_valid = (match.team_a_score_set2 is not None and match.team_b_score_set2 is not None)
+    set3_valid = True
+    
+    if match.team_a_score_set3 is not None or match.team_b_score_set3 is not None:
+        # Both teams must agree on whether set 3 exists
+        set3_valid = (match.team_a_score_set3 is not None and match.team_b_score_set3 is not None)
+
+    scores_match = set1_valid and set2_valid and set3_valid
+
+    if scores_match:
+        match.status = 'completed'
+        match.completed_at = datetime.now()
+        match.verified = True
+        match.disputed = False
+        
+        # Mark the associated challenge as completed if it exists
+        if match.challenge_id:
+            challenge = LadderChallenge.query.get(match.challenge_id)
+            if challenge:
+                challenge.status = 'completed'
+
+        team_a_sets_won = 0
+        team_b_sets_won = 0
+        team_a_games_total = 0
+        team_b_games_total = 0
+
+        sets = [
+            (match.team_a_score_set1, match.team_b_score_set1),
+            (match.team_a_score_set2, match.team_b_score_set2),
+        ]
+        if match.team_a_score_set3 is not None:
+            sets.append((match.team_a_score_set3, match.team_b_score_set3))
+
+        for team_a_games, team_b_games in sets:
+            team_a_games_total += team_a_games
+            team_b_games_total += team_b_games
+            if team_a_games > team_b_games:
+                team_a_sets_won += 1
+            elif team_b_games > team_a_games:
+                team_b_sets_won += 1
+
+        match.sets_a = team_a_sets_won
+        match.sets_b = team_b_sets_won
+        match.games_a = team_a_games_total
+        match.games_b = team_b_games_total
+
+        if team_a_sets_won > team_b_sets_won:
+            match.winner_id = team_a.id
+        elif team_b_sets_won > team_a_sets_won:
+            match.winner_id = team_b.id
+        else:
+            match.winner_id = None
+
+        match.score_a = f"{match.team_a_score_set1}-{match.team_b_score_set1}"
+        if match.team_a_score_set2 is not None:
+            match.score_a += f", {match.team_a_score_set2}-{match.team_b_score_set2}"
+        if match.team_a_score_set3 is not None:
+            match.score_a += f", {match.team_a_score_set3}-{match.team_b_score_set3}"
+
+        match.score_b = f"{match.team_b_score_set1}-{match.team_a_score_set1}"
+        if match.team_b_score_set2 is not None:
+            match.score_b += f", {match.team_b_score_set2}-{match.team_a_score_set2}"
+        if match.team_b_score_set3 is not None:
+            match.score_b += f", {match.team_b_score_set3}-{match.team_a_score_set3}"
+
+        update_ladder_team_stats_from_match(match)
+
+        rank_changes = None
+        if match.winner_id:
+            winner_team = team_a if match.winner_id == team_a.id else team_b
+            loser_team = team_b if match.winner_id == team_a.id else team_a
+
+            rank_changes = swap_ladder_ranks(winner_team, loser_team, match)
+
+            match.winner_old_rank = rank_changes['winner']['old']
+            match.winner_new_rank = rank_changes['winner']['new']
+            match.loser_old_rank = rank_changes['loser']['old']
+            match.loser_new_rank = rank_changes['loser']['new']
+
+        db.session.commit()
+
+        winner_name = team_a.team_name if match.winner_id == team_a.id else (team_b.team_name if match.winner_id == team_b.id else "Draw")
+
+        rank_info_a = ""
+        rank_info_b = ""
+
+        if rank_changes:
+            if match.winner_id == team_a.id:
+                old_rank = rank_changes['winner']['old']
+                new_rank = rank_changes['winner']['new']
+                opponent_old = rank_changes['loser']['old']
+                opponent_new = rank_changes['loser']['new']
+
+                if new_rank < old_rank:
+                    rank_info_a = f"\n🎯 RANK UPDATE: You moved UP from #{old_rank} to #{new_rank}! ⬆️\n   {team_b.team_name} dropped from #{opponent_old} to #{opponent_new}\n"
+                elif new_rank > old_rank:
+                    rank_info_a = f"\n📊 RANK UPDATE: Your rank changed from #{old_rank} to #{new_rank}\n"
+                else:
+                    rank_info_a = f"\n📊 RANK UPDATE: You remain at rank #{old_rank}\n"
+
+                rank_info_b = f"\n📉 RANK UPDATE: You dropped from #{opponent_old} to #{opponent_new} ⬇️\n   {team_a.team_name} moved from #{old_rank} to #{new_rank}\n"
+            else:
+                old_rank = rank_changes['loser']['old']
+                new_rank = rank_changes['loser']['new']
+                opponent_old = rank_changes['winner']['old']
+                opponent_new = rank_changes['winner']['new']
+
+                rank_info_a = f"\n📉 RANK UPDATE: You dropped from #{old_rank} to #{new_rank} ⬇️\n   {team_b.team_name} moved from #{opponent_old} to #{opponent_new}\n"
+
+                if opponent_new < opponent_old:
+                    rank_info_b = f"\n🎯 RANK UPDATE: You moved UP from #{opponent_old} to #{opponent_new}! ⬆️\n   {team_a.team_name} dropped from #{old_rank} to #{new_rank}\n"
+                elif opponent_new > opponent_old:
+                    rank_info_b = f"\n📊 RANK UPDATE: Your rank changed from #{opponent_old} to #{opponent_new}\n"
+                else:
+                    rank_info_b = f"\n📊 RANK UPDATE: You remain at rank #{opponent_old}\n"
+
+        team_a_message = f"""
+Match Scores Verified!
+
+Your match against {team_b.team_name} has been verified and recorded.
+
+Final Score: {match.score_a}
+Result: {"You Won! 🎉" if match.winner_id == team_a.id else ("You Lost" if match.winner_id == team_b.id else "Draw")}
+{rank_info_a}
+Both teams submitted matching scores. Your stats have been updated.
+
+Manage your team: {request.url_root}ladder/my-team/{team_a.access_token}
+
+Good game!
+BD Padel Ladder Team
+"""
+
+        team_b_message = f"""
+Match Scores Verified!
+
+Your match against {team_a.team_name} has been verified and recorded.
+
+Final Score: {match.score_b}
+Result: {"You Won! 🎉" if match.winner_id == team_b.id else ("You Lost" if match.winner_id == team_a.id else "Draw")}
+{rank_info_b}
+Both teams submitted matching scores. Your stats have been updated.
+
+Manage your team: {request.url_root}ladder/my-team/{team_b.access_token}
+
+Good game!
+BD Padel Ladder Team
+"""
+
+        if team_a.contact_preference_email:
+            if team_a.player1_email:
+                send_email_notification(team_a.player1_email, f"Match Verified - {team_a.team_name}", team_a_message)
+            if team_a.player2_email and team_a.player2_email != team_a.player1_email:
+                send_email_notification(team_a.player2_email, f"Match Verified - {team_a.team_name}", team_a_message)
+
+        if team_b.contact_preference_email:
+            if team_b.player1_email:
+                send_email_notification(team_b.player1_email, f"Match Verified - {team_b.team_name}", team_b_message)
+            if team_b.player2_email and team_b.player2_email != team_b.player1_email:
+                send_email_notification(team_b.player2_email, f"Match Verified - {team_b.team_name}", team_b_message)
+
+        return True
+    else:
+        match.status = 'disputed'
+        match.disputed = True
+        match.verified = False
+        db.session.commit()
+
+        dispute_message_a = f"""
+Score Dispute Detected
+
+There is a mismatch between the scores submitted by you and {team_b.team_name}.
+
+Your submission:
+- Set 1: {match.team_a_score_set1}-{match.team_b_score_set1}
+- Set 2: {match.team_a_score_set2}-{match.team_b_score_set2}
+{f"- Set 3: {match.team_a_score_set3}-{match.team_b_score_set3}" if match.team_a_score_set3 else ""}
+
+{team_b.team_name}'s submission:
+- Set 1: {match.team_b_score_set1}-{match.team_a_score_set1}
+- Set 2: {match.team_b_score_set2}-{match.team_a_score_set2}
+{f"- Set 3: {match.team_b_score_set3}-{match.team_a_score_set3}" if match.team_b_score_set3 else ""}
+
+An administrator will review and resolve this dispute. You will be notified once it's resolved.
+
+Manage your team: {request.url_root}ladder/my-team/{team_a.access_token}
+
+BD Padel Ladder Team
+"""
+
+        dispute_message_b = f"""
+Score Dispute Detected
+
+There is a mismatch between the scores submitted by you and {team_a.team_name}.
+
+Your submission:
+- Set 1: {match.team_b_score_set1}-{match.team_a_score_set1}
+- Set 2: {match.team_b_score_set2}-{match.team_a_score_set2}
+{f"- Set 3: {match.team_b_score_set3}-{match.team_a_score_set3}" if match.team_b_score_set3 else ""}
+
+{team_a.team_name}'s submission:
+- Set 1: {match.team_a_score_set1}-{match.team_b_score_set1}
+- Set 2: {match.team_a_score_set2}-{match.team_b_score_set2}
+{f"- Set 3: {match.team_a_score_set3}-{match.team_b_score_set3}" if match.team_a_score_set3 else ""}
+
+An administrator will review and resolve this dispute. You will be notified once it's resolved.
+
+Manage your team: {request.url_root}ladder/my-team/{team_b.access_token}
+
+BD Padel Ladder Team
+"""
+
+        if team_a.contact_preference_email:
+            if team_a.player1_email:
+                send_email_notification(team_a.player1_email, f"Score Dispute - {team_a.team_name}", dispute_message_a)
+            if team_a.player2_email and team_a.player2_email != team_a.player1_email:
+                send_email_notification(team_a.player2_email, f"Score Dispute - {team_a.team_name}", dispute_message_a)
+
+        if team_b.contact_preference_email:
+            if team_b.player1_email:
+                send_email_notification(team_b.player1_email, f"Score Dispute - {team_b.team_name}", dispute_message_b)
+            if team_b.player2_email and team_b.player2_email != team_b.player1_email:
+                send_email_notification(team_b.player2_email, f"Score Dispute - {team_b.team_name}", dispute_message_b)
+
+        return False
+
+
+@bp.route("/ladder/my-team/<token>", methods=["GET", "POST"])
+def ladder_my_team(token):
+    """Team-specific dashboard for ladder teams to manage matches, challenges, and holiday mode"""
+    from datetime import datetime, timedelta
+
+    # Verify access token and get team
+    team = LadderTeam.query.filter_by(access_token=token).first_or_404()
+
+    # Get ladder settings for grace period calculations
+    settings = LadderSettings.query.first()
+    if not settings:
+        # Create default settings if none exist
+        settings = LadderSettings(
+            challenge_acceptance_hours=48,
+            challenge_completion_days=7,
+            max_challenge_rank_difference=3,
+            acceptance_penalty_ranks=1,
+            no_show_penalty_ranks=1,
+            min_matches_per_month=2,
+            inactivity_penalty_ranks=3,
+            holiday_mode_grace_weeks=2,
+            holiday_mode_weekly_penalty_ranks=1,
+            free_agent_partner_selection_days=3
+        )
+        db.session.add(settings)
+        db.session.commit()
+
+    # Handle POST requests (placeholders for later implementation)
+    if request.method == "POST":
+        action = request.form.get("action")
+
+        if action == "toggle_holiday":
+            from utils import send_email_notification
+            from datetime import datetime, timedelta
+
+            now = datetime.now()
+
+            if team.holiday_mode_active:
+                team.holiday_mode_active = False
+                team.holiday_mode_end = now
+
+                db.session.commit()
+
+                deactivation_message = f"""
+Holiday Mode Deactivated
+
+Welcome back to the ladder, {team.team_name}!
+
+Your holiday mode has been deactivated and you can now participate in challenges again.
+
+Team Dashboard: {request.url_root}ladder/my-team/{team.access_token}
+
+Regards,
+BD Padel Ladder Team
+"""
+
+                if team.contact_preference_email:
+                    if team.player1_email:
+                        send_email_notification(team.player1_email, f"Holiday Mode Deactivated - {team.team_name}", deactivation_message)
+                    if team.player2_email and team.player2_email != team.player1_email:
+                        send_email_notification(team.player2_email, f"Holiday Mode Deactivated - {team.team_name}", deactivation_message)
+
+                flash("Holiday mode deactivated! Welcome back to the ladder.", "success")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+            else:
+                active_challenges_sent = LadderChallenge.query.filter(
+                    LadderChallenge.challenger_team_id == team.id,
+                    LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+                ).count()
+
+                active_challenges_received = LadderChallenge.query.filter(
+                    LadderChallenge.challenged_team_id == team.id,
+                    LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+                ).count()
+
+                pending_matches = LadderMatch.query.filter(
+                    db.or_(
+                        LadderMatch.team_a_id == team.id,
+                        LadderMatch.team_b_id == team.id
+                    ),
+                    LadderMatch.verified == False,
+                    LadderMatch.status.in_(['pending', 'pending_opponent_score'])
+                ).count()
+
+                if active_challenges_sent > 0 or active_challenges_received > 0 or pending_matches > 0:
+                    flash("Cannot activate holiday mode while you have active challenges or pending matches. Please complete or cancel them first.", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                team.holiday_mode_active = True
+                team.holiday_mode_start = now
+
+                db.session.commit()
+
+                grace_period_days = settings.holiday_mode_grace_weeks * 7
+
+                activation_message = f"""
+Holiday Mode Activated
+
+{team.team_name}, your holiday mode has been successfully activated!
+
+What this means:
+- You have {grace_period_days} days ({settings.holiday_mode_grace_weeks} weeks) of grace period with no rank penalties
+- You cannot be challenged by other teams during this time
+- You cannot challenge other teams during this time
+- After the grace period, you will be penalized {settings.holiday_mode_weekly_penalty_ranks} rank(s) per week
+- You can deactivate holiday mode anytime through your team dashboard
+
+Grace Period: {grace_period_days} days (until {(now + timedelta(days=grace_period_days)).strftime('%B %d, %Y')})
+
+Team Dashboard: {request.url_root}ladder/my-team/{team.access_token}
+
+Enjoy your break!
+
+Regards,
+BD Padel Ladder Team
+"""
+
+                if team.contact_preference_email:
+                    if team.player1_email:
+                        send_email_notification(team.player1_email, f"Holiday Mode Activated - {team.team_name}", activation_message)
+                    if team.player2_email and team.player2_email != team.player1_email:
+                        send_email_notification(team.player2_email, f"Holiday Mode Activated - {team.team_name}", activation_message)
+
+                flash(f"Holiday mode activated! You have {grace_period_days} days of grace period before any penalties apply.", "success")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+        elif action == "submit_score":
+            from utils import send_email_notification
+
+            match_id = request.form.get("match_id")
+            if not match_id:
+                flash("Match ID is required", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            match = LadderMatch.query.get(match_id)
+            if not match:
+                flash("Match not found", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if match.team_a_id != team.id and match.team_b_id != team.id:
+                flash("You are not authorized to submit scores for this match", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            challenge = LadderChallenge.query.get(match.challenge_id)
+            now = datetime.now()
+
+            if challenge and challenge.completion_deadline:
+                if now > challenge.completion_deadline:
+                    team_a = LadderTeam.query.get(match.team_a_id)
+                    team_b = LadderTeam.query.get(match.team_b_id)
+
+                    if not match.team_a_submitted and not match.team_b_submitted:
+                        apply_rank_penalty(team_a, 1, f"Failed to complete match against {team_b.team_name} before deadline")
+                        apply_rank_penalty(team_b, 1, f"Failed to complete match against {team_a.team_name} before deadline")
+                        flash(f"Match deadline has passed. Both teams have been penalized 1 rank.", "warning")
+
+            try:
+                set1_team = int(request.form.get("set1_team_score", 0))
+                set1_opp = int(request.form.get("set1_opponent_score", 0))
+                set2_team = int(request.form.get("set2_team_score", 0))
+                set2_opp = int(request.form.get("set2_opponent_score", 0))
+
+                set3_team_str = request.form.get("set3_team_score", "").strip()
+                set3_opp_str = request.form.get("set3_opponent_score", "").strip()
+
+                set3_team = int(set3_team_str) if set3_team_str else None
+                set3_opp = int(set3_opp_str) if set3_opp_str else None
+
+                if set1_team < 0 or set1_opp < 0 or set2_team < 0 or set2_opp < 0:
+                    flash("Scores cannot be negative", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                if (set3_team is not None and set3_team < 0) or (set3_opp is not None and set3_opp < 0):
+                    flash("Scores cannot be negative", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                if set1_team > 7 or set1_opp > 7 or set2_team > 7 or set2_opp > 7:
+                    flash("Invalid score: Games in a set cannot exceed 7 in padel", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                if (set3_team is not None and set3_team > 7) or (set3_opp is not None and set3_opp > 7):
+                    flash("Invalid score: Games in a set cannot exceed 7 in padel", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            except (ValueError, TypeError):
+                flash("Invalid score format. Please enter valid numbers.", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            is_team_a = (match.team_a_id == team.id)
+
+            if is_team_a:
+                match.team_a_score_set1 = set1_team
+                match.team_b_score_set1 = set1_opp
+                match.team_a_score_set2 = set2_team
+                match.team_b_score_set2 = set2_opp
+                match.team_a_score_set3 = set3_team
+                match.team_b_score_set3 = set3_opp
+                match.team_a_submitted = True
+                match.score_submitted_by_a = True
+                if not match.first_submitter_id:
+                    match.first_submitter_id = team.id
+            else:
+                match.team_b_score_set1 = set1_team
+                match.team_a_score_set1 = set1_opp
+                match.team_b_score_set2 = set2_team
+                match.team_a_score_set2 = set2_opp
+                match.team_b_score_set3 = set3_team
+                match.team_a_score_set3 = set3_opp
+                match.team_b_submitted = True
+                match.score_submitted_by_b = True
+                if not match.first_submitter_id:
+                    match.first_submitter_id = team.id
+
+            db.session.commit()
+
+            opponent_team = LadderTeam.query.get(match.team_b_id if is_team_a else match.team_a_id)
+
+            if match.team_a_submitted and match.team_b_submitted:
+                # Both teams submitted - auto-verify the match
+                verify_match_scores(match)
+                flash("Your score has been submitted and the match is now complete!", "success")
+            else:
+                match.status = 'pending_opponent_score'
+                db.session.commit()
+
+                submission_message = f"""
+Score Submitted
+
+{team.team_name} has submitted their score for your match.
+
+Match: {team.team_name} vs {opponent_team.team_name}
+
+Please submit your score through your team dashboard as soon as possible.
+
+Manage your team: {request.url_root}ladder/my-team/{opponent_team.access_token}
+
+BD Padel Ladder Team
+"""
+
+                if opponent_team.contact_preference_email:
+                    if opponent_team.player1_email:
+                        send_email_notification(opponent_team.player1_email, f"Score Submission Waiting - {opponent_team.team_name}", submission_message)
+                    if opponent_team.player2_email and opponent_team.player2_email != opponent_team.player1_email:
+                        send_email_notification(opponent_team.player2_email, f"Score Submission Waiting - {opponent_team.team_name}", submission_message)
+
+                flash("Your score has been submitted. Waiting for opponent to submit their score.", "success")
+
+            return redirect(url_for('ladder.ladder_my_team', token=token))
+
+        elif action == "accept_challenge":
+            try:
+                challenge_id = request.form.get("challenge_id")
+                if not challenge_id:
+                    flash("Challenge ID is required", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                challenge = LadderChallenge.query.get(challenge_id)
+                if not challenge:
+                    flash("Challenge not found", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                if challenge.challenged_team_id != team.id:
+                    flash("You are not authorized to accept this challenge", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                now = datetime.now()
+
+                if now > challenge.acceptance_deadline:
+                    apply_rank_penalty(team, settings.acceptance_penalty_ranks, 
+                                     f"Failed to accept challenge from rank #{LadderTeam.query.get(challenge.challenger_team_id).current_rank} before deadline")
+                    challenge.status = 'expired'
+                    db.session.commit()
+                    flash(f"Challenge acceptance deadline has passed. You have been penalized {settings.acceptance_penalty_ranks} rank(s).", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+                challenge.status = 'accepted'
+                challenge.accepted_at = now
+                challenge.completion_deadline = now + timedelta(days=settings.match_completion_days)
+
+                match = LadderMatch(
+                    team_a_id=challenge.challenger_team_id,
+                    team_b_id=challenge.challenged_team_id,
+                    challenge_id=challenge.id,
+                    ladder_type=team.ladder_type,
+                    created_at=now
+                )
+                db.session.add(match)
+                db.session.add(challenge)  # Explicitly add challenge to ensure it's tracked
+                db.session.commit()
+                print(f"[DEBUG] Challenge {challenge_id} accepted. Status updated to: {challenge.status}")
+
+                challenger_team = LadderTeam.query.get(challenge.challenger_team_id)
+                challenged_team = team
+
+                challenger_message = f"""Hello {challenger_team.team_name},
+
+Challenge Accepted!
+
+Great news! {challenged_team.team_name} has accepted your challenge!
+
+Match Details:
+- Opponent: {challenged_team.team_name} ({challenged_team.player1_name} & {challenged_team.player2_name})
+- Their Rank: #{challenged_team.current_rank}
+- Match Deadline: {challenge.completion_deadline.strftime('%B %d, %Y')}
+
+You have {settings.match_completion_days} days to complete this match and submit scores.
+
+Please coordinate with your opponent to schedule a time to play. You can contact them via:
+- {challenged_team.player1_name}: {challenged_team.player1_phone}
+- {challenged_team.player2_name}: {challenged_team.player2_phone}
+
+After playing, both teams must submit scores through your team dashboard.
+
+Good luck!
+
+Regards,
+BD Padel Ladder Team
+"""
+
+                challenged_message = f"""Hello {challenged_team.team_name},
+
+Challenge Accepted!
+
+You have successfully accepted the challenge from {challenger_team.team_name}!
+
+Match Details:
+- Opponent: {challenger_team.team_name} ({challenger_team.player1_name} & {challenger_team.player2_name})
+- Their Rank: #{challenger_team.current_rank}
+- Match Deadline: {challenge.completion_deadline.strftime('%B %d, %Y')}
+
+You have {settings.match_completion_days} days to complete this match and submit scores.
+
+Please coordinate with your opponent to schedule a time to play. You can contact them via:
+- {challenger_team.player1_name}: {challenger_team.player1_phone}
+- {challenger_team.player2_name}: {challenger_team.player2_phone}
+
+After playing, both teams must submit scores through your team dashboard.
+
+Good luck!
+
+Regards,
+BD Padel Ladder Team
+"""
+
+                from utils import send_email_notification
+
+                if challenger_team.contact_preference_email:
+                    if challenger_team.player1_email:
+                        send_email_notification(challenger_team.player1_email, 
+                                              f"Challenge Accepted - {challenger_team.team_name}", 
+                                              challenger_message)
+                    if challenger_team.player2_email and challenger_team.player2_email != challenger_team.player1_email:
+                        send_email_notification(challenger_team.player2_email, 
+                                              f"Challenge Accepted - {challenger_team.team_name}", 
+                                              challenger_message)
+
+                if challenged_team.contact_preference_email:
+                    if challenged_team.player1_email:
+                        send_email_notification(challenged_team.player1_email, 
+                                              f"Challenge Accepted - {challenged_team.team_name}", 
+                                              challenged_message)
+                    if challenged_team.player2_email and challenged_team.player2_email != challenged_team.player1_email:
+                        send_email_notification(challenged_team.player2_email, 
+                                              f"Challenge Accepted - {challenged_team.team_name}", 
+                                              challenged_message)
+
+                flash(f"Challenge accepted! You have until {challenge.completion_deadline.strftime('%B %d, %Y')} to complete the match.", "success")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+            
+            except Exception as e:
+                db.session.rollback()
+                print(f"[ERROR] Failed to accept challenge: {str(e)}")
+                flash(f"Error accepting challenge: {str(e)}", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+        elif action == "reject_challenge":
+            challenge_id = request.form.get("challenge_id")
+            if not challenge_id:
+                flash("Challenge ID is required", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            challenge = LadderChallenge.query.get(challenge_id)
+            if not challenge:
+                flash("Challenge not found", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if challenge.challenged_team_id != team.id:
+                flash("You are not authorized to reject this challenge", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            now = datetime.now()
+
+            if now > challenge.acceptance_deadline:
+                apply_rank_penalty(team, settings.acceptance_penalty_ranks, 
+                                 f"Failed to respond to challenge from rank #{LadderTeam.query.get(challenge.challenger_team_id).current_rank} before deadline")
+                challenge.status = 'expired'
+                db.session.commit()
+                flash(f"Challenge acceptance deadline has passed. You have been penalized {settings.acceptance_penalty_ranks} rank(s) for late rejection.", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            challenge.status = 'rejected'
+            db.session.commit()
+
+            challenger_team = LadderTeam.query.get(challenge.challenger_team_id)
+            challenged_team = team
+
+            challenger_message = f"""Challenge Rejected
+
+{challenged_team.team_name} has declined your challenge.
+
+Challenge Details:
+- Challenged Team: {challenged_team.team_name} ({challenged_team.player1_name} & {challenged_team.player2_name})
+- Their Rank: #{challenged_team.current_rank}
+- Status: Rejected
+
+Both teams are now unlocked and available to send or receive new challenges.
+
+You can challenge other teams by visiting the ladder rankings page.
+
+Regards,
+BD Padel Ladder Team
+"""
+
+            challenged_message = f"""Challenge Rejected
+
+You have successfully rejected the challenge from {challenger_team.team_name}.
+
+Challenge Details:
+- Challenger Team: {challenger_team.team_name} ({challenger_team.player1_name} & {challenger_team.player2_name})
+- Their Rank: #{challenger_team.current_rank}
+- Status: Rejected
+
+Both teams are now unlocked and available to send or receive new challenges.
+
+Regards,
+BD Padel Ladder Team
+"""
+
+            from utils import send_email_notification
+
+            if challenger_team.contact_preference_email:
+                if challenger_team.player1_email:
+                    send_email_notification(challenger_team.player1_email, 
+                                          f"Challenge Rejected - {challenger_team.team_name}", 
+                                          challenger_message)
+                if challenger_team.player2_email and challenger_team.player2_email != challenger_team.player1_email:
+                    send_email_notification(challenger_team.player2_email, 
+                                          f"Challenge Rejected - {challenger_team.team_name}", 
+                                          challenger_message)
+
+            if challenged_team.contact_preference_email:
+                if challenged_team.player1_email:
+                    send_email_notification(challenged_team.player1_email, 
+                                          f"Challenge Rejected - {challenged_team.team_name}", 
+                                          challenged_message)
+                if challenged_team.player2_email and challenged_team.player2_email != challenged_team.player1_email:
+                    send_email_notification(challenged_team.player2_email, 
+                                          f"Challenge Rejected - {challenged_team.team_name}", 
+                                          challenged_message)
+
+            flash("Challenge rejected successfully. Both teams are now unlocked.", "success")
+            return redirect(url_for('ladder.ladder_my_team', token=token))
+
+        elif action == "cancel_challenge":
+            from utils import send_email_notification
+            
+            challenge_id = request.form.get("challenge_id")
+            if not challenge_id:
+                flash("Challenge ID is required", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            challenge = LadderChallenge.query.get(challenge_id)
+            if not challenge:
+                flash("Challenge not found", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if challenge.status not in ['accepted', 'pending_acceptance']:
+                flash("Only pending or accepted challenges can be cancelled", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            # Verify the requesting team is either the challenger or challenged team
+            is_challenger = challenge.challenger_team_id == team.id
+            is_challenged = challenge.challenged_team_id == team.id
+            
+            if not is_challenger and not is_challenged:
+                flash("You are not authorized to cancel this challenge", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            challenger_team = team
+            challenged_team = LadderTeam.query.get(challenge.challenged_team_id)
+            match = LadderMatch.query.filter_by(challenge_id=challenge.id).first()
+
+            # Cancel the challenge
+            challenge.status = 'cancelled'
+            db.session.commit()
+
+            # Delete the associated match if it exists and no scores have been submitted
+            if match and not match.team_a_submitted and not match.team_b_submitted:
+                db.session.delete(match)
+                db.session.commit()
+
+            challenger_message = f"""Challenge Cancelled
+
+You have cancelled your challenge against {challenged_team.team_name}.
+
+Challenge Details:
+- Challenged Team: {challenged_team.team_name} ({challenged_team.player1_name} & {challenged_team.player2_name})
+- Their Rank: #{challenged_team.current_rank}
+- Status: Cancelled
+
+Both teams are now unlocked and available to send or receive new challenges.
+
+You can challenge other teams by visiting the ladder rankings page.
+
+Regards,
+BD Padel Ladder Team
+"""
+
+            challenged_message = f"""Challenge Cancelled
+
+{challenger_team.team_name} has cancelled their challenge against you.
+
+Challenge Details:
+- Challenger Team: {challenger_team.team_name} ({challenger_team.player1_name} & {challenger_team.player2_name})
+- Their Rank: #{challenger_team.current_rank}
+- Status: Cancelled
+
+Both teams are now unlocked and available to send or receive new challenges.
+
+Regards,
+BD Padel Ladder Team
+"""
+
+            if challenger_team.contact_preference_email:
+                if challenger_team.player1_email:
+                    send_email_notification(challenger_team.player1_email, 
+                                          f"Challenge Cancelled - {challenger_team.team_name}", 
+                                          challenger_message)
+                if challenger_team.player2_email and challenger_team.player2_email != challenger_team.player1_email:
+                    send_email_notification(challenger_team.player2_email, 
+                                          f"Challenge Cancelled - {challenger_team.team_name}", 
+                                          challenger_message)
+
+            if challenged_team.contact_preference_email:
+                if challenged_team.player1_email:
+                    send_email_notification(challenged_team.player1_email, 
+                                          f"Challenge Cancelled - {challenged_team.team_name}", 
+                                          challenged_message)
+                if challenged_team.player2_email and challenged_team.player2_email != challenged_team.player1_email:
+                    send_email_notification(challenged_team.player2_email, 
+                                          f"Challenge Cancelled - {challenged_team.team_name}", 
+                                          challenged_message)
+
+            flash("Challenge cancelled successfully. Both teams are now unlocked.", "success")
+            return redirect(url_for('ladder.ladder_my_team', token=token))
+
+        elif action == "report_no_show":
+            from utils import send_email_notification
+
+            match_id = request.form.get("match_id")
+            if not match_id:
+                flash("Match ID is required", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            match = LadderMatch.query.get(match_id)
+            if not match:
+                flash("Match not found", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if match.team_a_id != team.id and match.team_b_id != team.id:
+                flash("You are not authorized to report no-show for this match", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if match.verified or match.status in ['completed', 'completed_no_show']:
+                flash("Cannot report no-show for a completed match", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if match.team_a_submitted and match.team_b_submitted:
+                flash("Cannot report no-show when both teams have submitted scores", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            if match.reported_no_show_team_id:
+                flash("A no-show report has already been filed for this match", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            challenge = LadderChallenge.query.get(match.challenge_id)
+            now = datetime.now()
+
+            if challenge and challenge.completion_deadline:
+                if now <= challenge.completion_deadline:
+                    deadline_str = challenge.completion_deadline.strftime('%B %d, %Y at %I:%M %p')
+                    flash(f"Cannot report no-show before match completion deadline ({deadline_str})", "error")
+                    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+            opponent_team = LadderTeam.query.get(opponent_id)
+
+            if not opponent_team:
+                flash("Opponent team not found", "error")
+                return redirect(url_for('ladder.ladder_my_team', token=token))
+
+            match.reported_no_show_team_id = opponent_id
+            match.reported_by_team_id = team.id
+            match.no_show_report_date = now
+            match.status = 'no_show_reported'
+
+            db.session.commit()
+
+            reporter_message = f"""
+No-Show Report Submitted
+
+{team.team_name}, your no-show report has been successfully submitted.
+
+Match Details:
+- Your Team: {team.team_name}
+- Opponent Team: {opponent_team.team_name}
+- Reported No-Show Team: {opponent_team.team_name}
+- Report Date: {now.strftime('%B %d, %Y at %I:%M %p')}
+
+An administrator will review your report shortly and take appropriate action. You will be notified once the review is complete.
+
+If the no-show is verified:
+- You will be awarded the match win
+- Your opponent will receive a {settings.no_show_penalty_ranks} rank penalty
+
+Team Dashboard: {request.url_root}ladder/my-team/{team.access_token}
+
+Regards,
+BD Padel Ladder Team
+"""
+
+            reported_team_message = f"""
+No-Show Report - Immediate Action Required
+
+{opponent_team.team_name}, you have been reported as a no-show for your match.
+
+Match Details:
+- Your Team: {opponent_team.team_name}
+- Opponent Team: {team.team_name}
+- Report Date: {now.strftime('%B %d, %Y at %I:%M %p')}
+
+If this report is incorrect, please contact the administrator IMMEDIATELY by replying to this email with evidence that you:
+1. Attempted to schedule the match
+2. Were present at the agreed time and location
+3. Have communication records with your opponent
+
+If the no-show is verified by admin:
+- Match will be awarded to {team.team_name}
+- Your team will be penalized {settings.no_show_penalty_ranks} rank(s)
+- Match will be marked as completed with no-show status
+
+Team Dashboard: {request.url_root}ladder/my-team/{opponent_team.access_token}
+
+IMPORTANT: Respond within 24 hours to dispute this report.
+
+Regards,
+BD Padel Ladder Team
+"""
+
+            admin_email = os.environ.get("ADMIN_EMAIL")
+            admin_message = f"""
+No-Show Report Requires Review
+
+A no-show report has been submitted and requires admin review.
+
+Report Details:
+- Match ID: {match.id}
+- Reporter Team: {team.team_name} (Rank #{team.current_rank})
+  - Players: {team.player1_name} & {team.player2_name}
+  - Contact: {team.player1_phone}
+- Reported Team: {opponent_team.team_name} (Rank #{opponent_team.current_rank})
+  - Players: {opponent_team.player1_name} & {opponent_team.player2_name}
+  - Contact: {opponent_team.player1_phone}
+- Report Date: {now.strftime('%B %d, %Y at %I:%M %p')}
+- Match Completion Deadline: {challenge.completion_deadline.strftime('%B %d, %Y at %I:%M %p') if challenge and challenge.completion_deadline else 'N/A'}
+
+Action Required:
+1. Review communication between both teams
+2. Verify if reported team was genuinely absent
+3. Check if there were legitimate reasons for absence
+4. Approve or reject the no-show report in admin panel
+
+If Approved:
+- {team.team_name} will be awarded the match win
+- {opponent_team.team_name} will receive -{settings.no_show_penalty_ranks} rank penalty
+- Match status will be updated to 'completed_no_show'
+
+If Rejected:
+- Both teams will be notified
+- Match remains pending for score submission
+
+Admin Panel: {request.url_root}admin
+
+Regards,
+BD Padel Ladder System
+"""
+
+            if team.contact_preference_email:
+                if team.player1_email:
+                    send_email_notification(team.player1_email, 
+                                          f"No-Show Report Submitted - {team.team_name}", 
+                                          reporter_message)
+                if team.player2_email and team.player2_email != team.player1_email:
+                    send_email_notification(team.player2_email, 
+                                          f"No-Show Report Submitted - {team.team_name}", 
+                                          reporter_message)
+
+            if opponent_team.contact_preference_email:
+                if opponent_team.player1_email:
+                    send_email_notification(opponent_team.player1_email, 
+                                          f"URGENT: No-Show Report Filed Against {opponent_team.team_name}", 
+                                          reported_team_message)
+                if opponent_team.player2_email and opponent_team.player2_email != opponent_team.player1_email:
+                    send_email_notification(opponent_team.player2_email, 
+                                          f"URGENT: No-Show Report Filed Against {opponent_team.team_name}", 
+                                          reported_team_message)
+
+            if admin_email:
+                send_email_notification(admin_email, 
+                                      f"No-Show Report Review Required - Match #{match.id}", 
+                                      admin_message)
+
+            flash(f"No-show report submitted for {opponent_team.team_name}. An administrator will review your report shortly.", "success")
+            return redirect(url_for('ladder.ladder_my_team', token=token))
+
+    # Query active challenges (sent and received)
+    # Exclude challenges with matches that have scores submitted (matches in progress)
+    challenges_sent = LadderChallenge.query.filter(
+        LadderChallenge.challenger_team_id == team.id,
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).order_by(LadderChallenge.created_at.desc()).all()
+
+    challenges_received = LadderChallenge.query.filter(
+        LadderChallenge.challenged_team_id == team.id,
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).order_by(LadderChallenge.created_at.desc()).all()
+
+    # Get opponent team info for challenges
+    challenge_details_sent = []
+    for challenge in challenges_sent:
+        # Skip if the match for this challenge is in progress (scores have been submitted)
+        match = LadderMatch.query.filter_by(challenge_id=challenge.id).first()
+        if match and (match.team_a_submitted or match.team_b_submitted):
+            continue  # Match is in progress, don't show challenge as active
+        
+        opponent = LadderTeam.query.get(challenge.challenged_team_id)
+        if opponent:
+            challenge_details_sent.append({
+                'challenge': challenge,
+                'opponent': opponent,
+                'is_challenger': True
+            })
+
+    challenge_details_received = []
+    now = datetime.now()
+    for challenge in challenges_received:
+        # Skip if the match for this challenge is in progress (scores have been submitted)
+        match = LadderMatch.query.filter_by(challenge_id=challenge.id).first()
+        if match and (match.team_a_submitted or match.team_b_submitted):
+            continue  # Match is in progress, don't show challenge as active
+        
+        opponent = LadderTeam.query.get(challenge.challenger_team_id)
+        if opponent:
+            # Only calculate deadline info for pending_acceptance challenges
+            # Accepted challenges don't have an acceptance deadline to worry about
+            hours_until_deadline = 0
+            is_deadline_approaching = False
+            is_past_deadline = False
+            
+            if challenge.status == 'pending_acceptance':
+                hours_until_deadline = (challenge.acceptance_deadline - now).total_seconds() / 3600
+                is_deadline_approaching = hours_until_deadline < 24 and hours_until_deadline > 0
+                is_past_deadline = hours_until_deadline <= 0
+
+            challenge_details_received.append({
+                'challenge': challenge,
+                'opponent': opponent,
+                'is_challenger': False,
+                'hours_until_deadline': max(0, hours_until_deadline),
+                'is_deadline_approaching': is_deadline_approaching,
+                'is_past_deadline': is_past_deadline
+            })
+
+    # Query ladder matches for this team
+    matches = LadderMatch.query.filter(
+        db.or_(
+            LadderMatch.team_a_id == team.id,
+            LadderMatch.team_b_id == team.id
+        )
+    ).order_by(LadderMatch.created_at.desc()).all()
+
+    # Separate pending and completed matches
+    pending_matches = []
+    completed_matches = []
+    seen_opponents = {}  # Track opponent pairs to avoid duplicates
+
+    for match in matches:
+        opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+        opponent = LadderTeam.query.get(opponent_id)
+        challenge = LadderChallenge.query.get(match.challenge_id)
+
+        is_team_a = match.team_a_id == team.id
+
+        is_past_deadline = False
+        if challenge and challenge.completion_deadline:
+            is_past_deadline = now > challenge.completion_deadline
+
+        match_detail = {
+            'match': match,
+            'opponent': opponent,
+            'challenge': challenge,
+            'is_team_a': is_team_a,
+            'team_score': match.score_a if is_team_a else match.score_b,
+            'opponent_score': match.score_b if is_team_a else match.score_a,
+            'team_submitted': match.score_submitted_by_a if is_team_a else match.score_submitted_by_b,
+            'opponent_submitted': match.score_submitted_by_b if is_team_a else match.score_submitted_by_a,
+            'is_past_deadline': is_past_deadline,
+        }
+
+        if match.verified:
+            completed_matches.append(match_detail)
+        else:
+            # Skip matches from completed challenges (duplicate/stale matches)
+            if challenge and challenge.status == 'completed':
+                continue
+            
+            # Deduplicate: only add the most recent match for each opponent pair
+            opponent_key = opponent_id
+            if opponent_key not in seen_opponents:
+                seen_opponents[opponent_key] = True
+                # Check if no-show report is pending admin review
+                if match.status == 'no_show_reported':
+                    match_detail['no_show_pending_review'] = True
+                pending_matches.append(match_detail)
+
+    # Calculate holiday mode grace period info using helper function
+    holiday_info = calculate_holiday_status(team, settings)
+
+    # Check if team is locked (in active challenge)
+    is_locked = any(c['challenge'].status in ['pending_acceptance', 'accepted'] 
+                    for c in challenge_details_sent + challenge_details_received)
+
+    # Determine team status
+    if is_locked:
+        team_status = 'locked'
+        status_color = 'orange'
+        status_message = 'In Active Challenge'
+    elif team.holiday_mode_active:
+        team_status = 'holiday'
+        status_color = 'blue'
+        status_message = 'Holiday Mode'
+    else:
+        team_status = 'available'
+        status_color = 'green'
+        status_message = 'Available'
+
+    # Calculate display rank using EXACT same logic as public ladder page
+    # CRITICAL: Must match ladder_men/ladder_women routes for consistent ranking
+    # Public ladder uses: gender + payment_received (no ladder_type filter)
+    all_teams_raw = LadderTeam.query.filter_by(
+        gender=team.gender,
+        payment_received=True
+    ).all()
+    
+    # Calculate initial rank based on registration order (same as public ladder)
+    teams_by_creation = sorted(all_teams_raw, key=lambda t: t.created_at)
+    initial_ranks = {t.id: idx for idx, t in enumerate(teams_by_creation, start=1)}
+    
+    # Sort by current_rank with creation order as tiebreaker (same as public ladder)
+    all_teams_in_ladder = sorted(
+        all_teams_raw, 
+        key=lambda t: t.current_rank if t.current_rank is not None else initial_ranks.get(t.id, 999)
+    )
+    
+    # Map team IDs to their actual sequential rank (1..N) based on sorted order
+    team_id_to_seq_rank = {t.id: idx + 1 for idx, t in enumerate(all_teams_in_ladder)}
+    team_display_rank = team_id_to_seq_rank.get(team.id)
+
+    # Get teams that can be challenged (3 ranks above, expandable if teams are on holiday)
+    challengeable_teams = []
+    if not is_locked and not team.holiday_mode_active:
+        max_rank_diff = settings.max_challenge_rank_difference if settings else 3
+        
+        if team_display_rank:
+            # Find up to 3 available slots above me
+            target_teams_data = []
+            curr_target_idx = team_display_rank - 2  # -1 for 0-indexed, then -1 for team above
+            
+            # We'll look further up if we hit holiday teams
+            while len(target_teams_data) < max_rank_diff and curr_target_idx >= 0:
+                potential_t = all_teams_in_ladder[curr_target_idx]
+                
+                is_t_locked = LadderChallenge.query.filter(
+                    db.or_(
+                        LadderChallenge.challenger_team_id == potential_t.id,
+                        LadderChallenge.challenged_team_id == potential_t.id
+                    ),
+                    LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+                ).first() is not None
+                
+                if potential_t.holiday_mode_active and not is_t_locked:
+                    # Skip this rank, look one higher
+                    curr_target_idx -= 1
+                    continue
+                
+                # This rank is valid (either available or locked but visible)
+                target_teams_data.append({
+                    'team': potential_t,
+                    'is_locked': is_t_locked,
+                    'is_holiday': potential_t.holiday_mode_active,
+                    'display_rank': curr_target_idx + 1
+                })
+                curr_target_idx -= 1
+
+            challengeable_teams = target_teams_data
+
+    return render_template("ladder/my_team.html",
+                         team=team,
+                         team_display_rank=team_display_rank,
+                         challenges_sent=challenge_details_sent,
+                         challenges_received=challenge_details_received,
+                         pending_matches=pending_matches,
+                         completed_matches=completed_matches,
+                         holiday_info=holiday_info,
+                         settings=settings,
+                         is_locked=is_locked,
+                         team_status=team_status,
+                         status_color=status_color,
+                         status_message=status_message,
+                         challengeable_teams=challengeable_teams)
+
+@bp.route("/ladder/login", methods=["GET", "POST"])
+def ladder_login():
+    """Team login for ladder system - allows teams to challenge others"""
+    if request.method == "POST":
+        access_token = request.form.get("access_token", "").strip()
+
+        if not access_token:
+            flash("Please enter your access token", "error")
+            return redirect(url_for('ladder.ladder_login'))
+
+        team = LadderTeam.query.filter_by(access_token=access_token).first()
+
+        if not team:
+            flash("Invalid access token. Please check your registration email for the correct token.", "error")
+            return redirect(url_for('ladder.ladder_login'))
+
+        session['ladder_team_id'] = team.id
+        session['ladder_team_token'] = access_token
+        flash(f"Welcome back, {team.team_name}!", "success")
+
+        # Redirect based on the team's actual gender/ladder_type
+        if team.gender == 'men' or team.ladder_type == 'men':
+            return redirect(url_for('ladder.ladder_men'))
+        else:
+            return redirect(url_for('ladder.ladder_women'))
+
+    return render_template("ladder/login.html")
+
+@bp.route("/ladder/logout")
+def ladder_logout():
+    """Logout from ladder team session"""
+    team_id = session.get('ladder_team_id')
+    if team_id:
+        team = LadderTeam.query.get(team_id)
+        if team:
+            flash(f"Goodbye, {team.team_name}!", "info")
+
+    session.pop('ladder_team_id', None)
+    session.pop('ladder_team_token', None)
+    return redirect(url_for('public.index'))
+
+@bp.route("/ladder/challenge/create", methods=["POST"])
+def ladder_challenge_create():
+    """Create a new ladder challenge from one team to another"""
+    from datetime import datetime, timedelta
+    from utils import send_email_notification
+
+    # Try to get challenger from session first, then from token parameter
+    challenger_id = session.get('ladder_team_id')
+    challenger_token = request.form.get('token')
+    
+    if not challenger_id and not challenger_token:
+        flash("Please log in to challenge other teams", "error")
+        return redirect(url_for('ladder.ladder_login'))
+    
+    # If token is provided, get challenger from token
+    if challenger_token and not challenger_id:
+        challenger = LadderTeam.query.filter_by(access_token=challenger_token).first()
+        if not challenger:
+            flash("Invalid team token", "error")
+            return redirect(url_for('ladder.ladder_login'))
+        challenger_id = challenger.id
+    elif challenger_id:
+        challenger = LadderTeam.query.get(challenger_id)
+        if not challenger:
+            flash("Challenger team not found", "error")
+            return redirect(url_for('ladder.ladder_login'))
+
+    challenged_id = request.form.get('challenged_team_id', type=int)
+
+    if not challenged_id:
+        flash("Invalid challenge request", "error")
+        return redirect(url_for('public.index'))
+
+    challenged = LadderTeam.query.get(challenged_id)
+
+    if not challenger or not challenged:
+        flash("One or both teams not found", "error")
+        return redirect(url_for('public.index'))
+
+    settings = LadderSettings.query.first()
+    if not settings:
+        settings = LadderSettings(
+            challenge_acceptance_hours=48,
+            challenge_completion_days=7,
+            max_challenge_rank_difference=3
+        )
+        db.session.add(settings)
+        db.session.commit()
+
+    # Prevent cross-gender challenges
+    if challenger.ladder_type != challenged.ladder_type:
+        flash("You can only challenge teams in your own ladder", "error")
+        redirect_token = challenger_token or session.get('ladder_team_token')
+        return redirect(url_for('ladder.ladder_my_team', token=redirect_token))
+
+    if challenger.gender != challenged.gender:
+        flash(f"You cannot challenge teams from a different gender category. You are in the {challenger.gender.title()}'s division.", "error")
+        redirect_token = challenger_token or session.get('ladder_team_token')
+        return redirect(url_for('ladder.ladder_my_team', token=redirect_token))
+
+    if challenger.holiday_mode_active:
+        flash("You cannot challenge while in holiday mode", "error")
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+    if challenged.holiday_mode_active:
+        flash("You cannot challenge a team that is in holiday mode", "error")
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+    active_challenge_challenger = LadderChallenge.query.filter(
+        db.or_(
+            LadderChallenge.challenger_team_id == challenger_id,
+            LadderChallenge.challenged_team_id == challenger_id
+        ),
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).first()
+
+    if active_challenge_challenger:
+        flash("You already have an active challenge. Complete it before creating a new one.", "error")
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+    active_challenge_challenged = LadderChallenge.query.filter(
+        db.or_(
+            LadderChallenge.challenger_team_id == challenged_id,
+            LadderChallenge.challenged_team_id == challenged_id
+        ),
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).first()
+
+    if active_challenge_challenged:
+        flash(f"{challenged.team_name} is already in an active challenge", "error")
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+    rank_diff = challenger.current_rank - challenged.current_rank
+    if rank_diff <= 0:
+        flash("You can only challenge teams ranked above you", "error")
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+    if rank_diff > settings.max_challenge_rank_difference:
+        flash(f"You can only challenge teams within {settings.max_challenge_rank_difference} ranks above you", "error")
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+    acceptance_deadline = datetime.utcnow() + timedelta(hours=settings.challenge_acceptance_hours)
+
+    new_challenge = LadderChallenge(
+        challenger_team_id=challenger_id,
+        challenged_team_id=challenged_id,
+        ladder_type=challenger.ladder_type,
+        status='pending_acceptance',
+        acceptance_deadline=acceptance_deadline,
+        created_at=datetime.utcnow()
+    )
+
+    db.session.add(new_challenge)
+    db.session.commit()
+
+    challenger_email_body = f"""Hello {challenger.team_name},
+
+Your challenge to {challenged.team_name} has been sent successfully!
+
+They have {settings.challenge_acceptance_hours} hours ({settings.challenge_acceptance_hours // 24} days) to accept your challenge.
+
+If they don't accept within the deadline, they will receive a -{settings.acceptance_penalty_ranks} rank penalty.
+
+You'll receive an email notification once they accept. Good luck!
+
+---
+Padel Ladder League
+"""
+
+    challenged_email_body = f"""Hello {challenged.team_name},
+
+You have been challenged by {challenger.team_name} (Rank #{challenger.current_rank})!
+
+⚠️ IMPORTANT: You have {settings.challenge_acceptance_hours} hours ({settings.challenge_acceptance_hours // 24} days) to accept this challenge.
+
+If you don't accept by {acceptance_deadline.strftime('%B %d, %Y at %I:%M %p UTC')}, you will receive a -{settings.acceptance_penalty_ranks} rank penalty.
+
+Accept the challenge here:
+{request.url_root}ladder/my-team/{challenged.access_token}
+
+Good luck!
+
+---
+Padel Ladder League
+"""
+
+    if challenger.contact_preference_email and challenger.player1_email:
+        send_email_notification(
+            challenger.player1_email,
+            f"Challenge Sent to {challenged.team_name}",
+            challenger_email_body
+        )
+
+    if challenged.contact_preference_email and challenged.player1_email:
+        send_email_notification(
+            challenged.player1_email,
+            f"⚠️ Challenge from {challenger.team_name} - Action Required!",
+            challenged_email_body
+        )
+
+    flash(f"Challenge sent to {challenged.team_name}! They have {settings.challenge_acceptance_hours // 24} days to accept.", "success")
+    redirect_token = challenger_token or session.get('ladder_team_token')
+    if redirect_token:
+        return redirect(url_for('ladder.ladder_my_team', token=redirect_token))
+    else:
+        return redirect(url_for('ladder.ladder_men' if challenger.ladder_type == 'men' else 'ladder_women'))
+
+
+@bp.route("/ladder/score/confirm/<int:match_id>", methods=["POST"])
+def ladder_score_confirm(match_id):
+    """Confirm opponent's submitted score"""
+    from utils import send_email_notification
+    
+    token = request.form.get("token")
+    team = LadderTeam.query.filter_by(access_token=token).first_or_404()
+    match = LadderMatch.query.get_or_404(match_id)
+    
+    if match.team_a_id != team.id and match.team_b_id != team.id:
+        flash("Unauthorized", "error")
+        return redirect(url_for('ladder.ladder_my_team', token=token))
+    
+    is_team_a = (match.team_a_id == team.id)
+    
+    if is_team_a:
+        match.score_confirmed_by_a = True
+        match.team_a_submitted = True  # Confirm counts as submission
+    else:
+        match.score_confirmed_by_b = True
+        match.team_b_submitted = True  # Confirm counts as submission
+    
+    db.session.commit()
+    
+    # Check if both teams have submitted (submission counts as confirmation)
+    if match.team_a_submitted and match.team_b_submitted:
+        # Both teams submitted - verify and complete
+        if verify_match_scores(match):
+            flash("Both teams confirmed! Match completed.", "success")
+        else:
+            flash("Scores need admin review due to mismatch.", "warning")
+    else:
+        match.status = 'score_confirmed'
+        db.session.commit()
+        flash("Score confirmed. Waiting for opponent.", "success")
+    
+    return redirect(url_for('ladder.ladder_my_team', token=token))
+
+
+@bp.route("/ladder/score/reject/<int:match_id>", methods=["POST"])
+def ladder_score_reject(match_id):
+    """Reject opponent's score and allow resubmission"""
+    from utils import send_email_notification
+    
+    token = request.form.get("token")
+    team = LadderTeam.query.filter_by(access_token=token).first_or_404()
+    match = LadderMatch.query.get_or_404(match_id)
+    
+    if match.team_a_id != team.id and match.team_b_id != team.id:
+        flash("Unauthorized", "error")
+        return redirect(url_for('ladder.ladder_my_team', token=token))
+    
+    match.rejection_count = (match.rejection_count or 0) + 1
+    
+    if match.rejection_count >= 2:
+        match.status = 'disputed'
+        match.disputed = True
+        db.session.commit()
+        flash("Both teams rejected scores - escalated to admin.", "warning")
+    else:
+        is_team_a = (match.team_a_id == team.id)
+        
+        if is_team_a:
+            match.team_b_submitted = False
+            match.score_confirmed_by_b = False
+        else:
+            match.team_a_submitted = False
+            match.score_confirmed_by_a = False
+        
+        match.status = 'pending_opponent_score'
+        db.session.commit()
+        
+        opponent_team = LadderTeam.query.get(match.team_b_id if is_team_a else match.team_a_id)
+        
+        rejection_message = f"""
+Score Rejected
+
+{team.team_name} rejected your submitted score. Please resubmit your score.
+
+If you reject again, match will go to admin review.
+
+Manage your team: {request.url_root}ladder/my-team/{opponent_team.access_token}
+
+BD Padel Ladder Team
+"""
+        
+        if opponent_team.contact_preference_email:
+            if opponent_team.player1_email:
+                send_email_notification(opponent_team.player1_email, "Score Rejected - Resubmit", rejection_message)
+            if opponent_team.player2_email and opponent_team.player2_email != opponent_team.player1_email:
+                send_email_notification(opponent_team.player2_email, "Score Rejected - Resubmit", rejection_message)
+        
+        flash("Score rejected. Opponent will resubmit.", "info")
+    
+    return redirect(url_for('ladder.ladder_my_team', token=token))
@@ -0,0 +1,1290 @@
+"""
+League Blueprint for BD Padel League
+League registration (teams and free agents) and the token-based team pages:
+matches, bookings, scores, reschedules and substitutes.
+"""
+
+from flask import Blueprint, render_template, redirect, url_for, request, flash
+import os
+import secrets
+from sqlalchemy.orm import joinedload, selectinload
+from models import db, Team, Match, Reschedule, Substitute, Player, LeagueSettings
+from utils import (
+    invert_score_string,
+    normalize_phone_number,
+    normalize_team_name,
+    get_round_start_date,
+    get_max_reschedules_per_round,
+    get_round_date_range,
+)
+import knockout_bracket
+from registration_validator import validate_league_team
+from league_results import update_bracket_winners, update_team_stats_from_match
+
+bp = Blueprint("league", __name__)
+
+
+def get_pending_reschedules():
+    """Get all pending reschedule requests"""
+    return Reschedule.query.filter_by(status="pending").all()
+
+
+@bp.route("/register-team", methods=["GET", "POST"])
+def register_team():
+    # Check if team registration is open
+    settings = LeagueSettings.query.first()
+    if settings and not settings.team_registration_open:
+        return render_template("registration_closed.html", registration_type="Team")
+
+    if request.method == "POST":
+        team_name = request.form["team_name"]
+        p1_name = request.form["player1_name"]
+        p1_phone = request.form["player1_phone"]
+        p1_email = request.form.get("player1_email", "").strip()
+        p2_name = request.form["player2_name"]
+        p2_phone = request.form["player2_phone"]
+        p2_email = request.form.get("player2_email", "").strip()
+
+        # Require emails for both players
+        if not p1_email or not p2_email:
+            flash("Email is required for both players.", "error")
+            return render_template("register_team.html", form_data=request.form)
+
+        # Check if Player 1 and Player 2 have the same email or phone number
+        if p1_email.lower() == p2_email.lower():
+            flash("Player 1 and Player 2 cannot have the same email address.", "error")
+            return render_template("register_team.html", form_data=request.form)
+
+        if normalize_phone_number(p1_phone) == normalize_phone_number(p2_phone):
+            flash("Player 1 and Player 2 cannot have the same WhatsApp number.", "error")
+            return render_template("register_team.html", form_data=request.form)
+
+        # All duplicate checks (both players' emails and phones, team name) in one query
+        error = validate_league_team(team_name, [(p1_email, p1_phone), (p2_email, p2_phone)])
+        if error:
+            flash(error, "error")
+            return render_template("register_team.html", form_data=request.form)
+
+        canonical = normalize_team_name(team_name)
+
+        # Generate unique access token for this team
+        access_token = secrets.token_urlsafe(32)
+        # Generate confirmation token for Player 2
+        player2_confirmation_token = secrets.token_urlsafe(32)
+
+        # Normalize phone numbers before storing
+        p1_phone_normalized = normalize_phone_number(p1_phone)
+        p2_phone_normalized = normalize_phone_number(p2_phone)
+
+        new_team = Team(team_name=team_name, team_name_canonical=canonical,
+                        player1_name=p1_name, player1_phone=p1_phone_normalized, player1_email=p1_email,
+                        player2_name=p2_name, player2_phone=p2_phone_normalized, player2_email=p2_email,
+                        access_token=access_token,
+                        player2_confirmation_token=player2_confirmation_token,
+                        player2_confirmed=False)  # Player 2 needs to confirm
+        db.session.add(new_team)
+        db.session.commit()
+
+        # Create or update Player records for both players
+        from datetime import datetime
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Player 1
+        player1 = Player.query.filter_by(phone=p1_phone).first()
+        if not player1:
+            player1 = Player(
+                name=p1_name,
+                phone=p1_phone,
+                email=p1_email,
+                current_team_id=new_team.id,
+                created_at=now
+            )
+            db.session.add(player1)
+        else:
+            player1.name = p1_name  # Update name in case it changed
+            player1.current_team_id = new_team.id
+            if p1_email:
+                player1.email = p1_email
+
+        # Player 2
+        player2 = Player.query.filter_by(phone=p2_phone).first()
+        if not player2:
+            player2 = Player(
+                name=p2_name,
+                phone=p2_phone,
+                email=p2_email,
+                current_team_id=new_team.id,
+                created_at=now
+            )
+            db.session.add(player2)
+        else:
+            player2.name = p2_name
+            player2.current_team_id = new_team.id
+            if p2_email:
+                player2.email = p2_email
+
+        db.session.commit()
+
+        # Generate secure access link using custom domain
+        base_url = "https://goeclectic.xyz"
+        access_link = f"{base_url}/my-matches/{access_token}"
+        confirmation_link = f"{base_url}/confirm-team/{new_team.id}/{player2_confirmation_token}"
+
+        # Send admin notification about new team registration
+        admin_email = os.environ.get("ADMIN_EMAIL")
+        if admin_email:
+            from utils import send_email_notification
+            admin_body = f"""🆕 NEW TEAM REGISTRATION
+
+Team Name: {team_name}
+
+Player 1:
+- Name: {p1_name}
+- Email: {p1_email}
+- Phone: {p1_phone}
+
+Player 2:
+- Name: {p2_name}
+- Email: {p2_email}
+- Phone: {p2_phone}
+
+Access Link: {access_link}
+Confirmation Link for Player 2: {confirmation_link}
+
+Please review and confirm this team in the admin panel.
+"""
+            send_email_notification(admin_email, f"New Team Registration: {team_name}", admin_body)
+
+        # Send confirmation email to Player 1 (registrant)
+        if p1_email:
+            from utils import send_email_notification
+            email_body = f"""Hi {p1_name},
+
+✅ Your team "{team_name}" has been successfully registered!
+
+📋 Registration Details:
+- Team Name: {team_name}
+- Player 1: {p1_name} (You)
+- Player 2: {p2_name}
+
+⏳ Next Step: Waiting for {p2_name} to confirm the partnership
+We've sent a confirmation link to {p2_name}'s email ({p2_email}). Once they confirm, your team will be active and ready to compete!
+
+🔗 Your Team Access Link:
+{access_link}
+
+Bookmark this link to:
+- View your match schedule
+- See opponent contact information
+- Submit match scores
+- Request reschedules or substitutes
+
+💬 Join Our WhatsApp Community:
+https://chat.whatsapp.com/FGOQG62XwWfDazc6ZmMagT
+
+Stay connected with other teams, get updates, and coordinate matches!
+
+Good luck in the league! 🎾
+
+- BD Padel League
+"""
+            send_email_notification(p1_email, f"Team Registered - Awaiting Partner Confirmation", email_body)
+
+        # Send confirmation email to Player 2 if email provided
+        if p2_email:
+            from utils import send_email_notification
+            email_body = f"""Hi {p2_name},
+
+You've been invited to join the BD Padel League team "{team_name}" by {p1_name}.
+
+Please confirm your partnership by clicking the link below:
+{confirmation_link}
+
+Or visit your team page:
+{access_link}
+
+Once confirmed, you'll be able to participate in matches!
+
+💬 Join Our WhatsApp Community:
+https://chat.whatsapp.com/FGOQG62XwWfDazc6ZmMagT
+
+Stay connected with other teams, get updates, and coordinate matches!
+
+- BD Padel League
+"""
+            send_email_notification(p2_email, f"Confirm Your Partnership - Team {team_name}", email_body)
+
+        flash(f"Team registered successfully! {p2_name} will receive a confirmation link.", "success")
+        return redirect(url_for("public.index"))
+    return render_template("register_team.html")
+
+@bp.route("/confirm-team/<int:team_id>/<token>", methods=["GET", "POST"])
+def confirm_team_partnership(team_id: int, token: str):
+    """Player 2 confirms their partnership via secure link"""
+    team = Team.query.get_or_404(team_id)
+
+    # Verify token matches
+    if team.player2_confirmation_token != token:
+        flash("Invalid confirmation link. Please check your link or contact admin.", "error")
+        return redirect(url_for("public.index"))
+
+    # Check if already confirmed
+    if team.player2_confirmed:
+        return render_template("confirm_team.html", team=team, already_confirmed=True)
+
+    if request.method == "POST":
+        # Player 2 confirms
+        team.player2_confirmed = True
+        team.confirmed = True  # Team is now fully confirmed
+        db.session.commit()
+
+        # Notify Player 1
+        from utils import send_email_notification
+
+        base_url = "https://goeclectic.xyz"
+        access_link = f"{base_url}/my-matches/{team.access_token}"
+
+        if team.player1_email:
+            email_body = f"""Hi {team.player1_name},
+
+Great news! {team.player2_name} has confirmed your partnership.
+
+Team "{team.team_name}" is now active and ready to participate in matches!
+
+Visit your team page: {access_link}
+
+Good luck!
+
+- BD Padel League
+"""
+            send_email_notification(team.player1_email, f"Partnership Confirmed - Team {team.team_name}", email_body)
+
+        flash(f"✅ Partnership confirmed! Team {team.team_name} is now active.", "success")
+        return redirect(f"/my-matches/{team.access_token}")
+
+    return render_template("confirm_team.html", team=team, already_confirmed=False)
+
+@bp.route("/register-freeagent", methods=["GET", "POST"])
+def register_freeagent():
+    """
+    DEPRECATED: League free agent registration has been moved to the Ladder system.
+    This route now redirects to the ladder free agent registration.
+    """
+    flash("ℹ️ Free agent registration has moved to our Ladder system for better matching and ongoing play opportunities!", "info")
+    return redirect(url_for("ladder.ladder_register_freeagent"))
+
+@bp.route("/my-matches/<token>")
+def my_matches(token):
+    """Secure token-based access to team's matches and opponent contact info"""
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    # Get all matches for this team
+    matches = Match.query.filter(
+        (Match.team_a_id == team.id) | (Match.team_b_id == team.id)
+    ).options(
+        joinedload(Match.team_a),
+        joinedload(Match.team_b),
+        selectinload(Match.reschedules),
+    ).order_by(Match.round.desc(), Match.id.desc()).all()
+
+    # Enrich matches with opponent info and round dates
+    match_details = []
+    for match in matches:
+        opponent = match.team_b if match.team_a_id == team.id else match.team_a
+
+        # Add round date range
+        match.round_dates = get_round_date_range(match)
+        
+        # Check if match has been rescheduled
+        is_rescheduled = bool(match.reschedules)
+
+        match_details.append({
+            'match': match,
+            'opponent': opponent,
+            'is_team_a': match.team_a_id == team.id,
+            'is_rescheduled': is_rescheduled
+        })
+
+    # Sort matches: Active/scheduled first (by round descending), then completed by round
+    # This ensures current round appears at top, followed by completed matches
+    scheduled = [m for m in match_details if m['match'].status != 'completed']
+    completed = [m for m in match_details if m['match'].status == 'completed']
+    
+    # Sort scheduled by round descending (current round first)
+    scheduled.sort(key=lambda x: x['match'].round if x['match'].round else 0, reverse=True)
+    
+    # Sort completed by round descending (newest completed first)
+    completed.sort(key=lambda x: x['match'].round if x['match'].round else 0, reverse=True)
+    
+    # Combine: Scheduled first, then completed
+    sorted_match_details = scheduled + completed
+
+    return render_template(
+        "my_matches.html",
+        team=team,
+        match_details=sorted_match_details
+    )
+
+@bp.route("/submit-booking/<token>", methods=["POST"])
+def submit_booking(token):
+    """Handle booking submission from team's secure page"""
+    from datetime import datetime
+    from utils import send_email_notification
+
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    try:
+        data = request.get_json()
+        match_id = int(data.get("match_id"))
+        booking_date = data.get("date")  # YYYY-MM-DD
+        booking_time = data.get("time")  # HH:MM
+
+        if not all([match_id, booking_date, booking_time]):
+            return {"success": False, "message": "Missing required fields"}, 400
+
+        # Find the match
+        match = Match.query.get(match_id)
+        if not match:
+            return {"success": False, "message": "Match not found"}, 404
+
+        # Verify team is part of this match
+        if match.team_a_id != team.id and match.team_b_id != team.id:
+            return {"success": False, "message": "Unauthorized"}, 403
+
+        # Parse datetime
+        datetime_str = f"{booking_date} {booking_time}"
+        match_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
+
+        # Check if it's in the past
+        if match_datetime < datetime.now():
+            return {"success": False, "message": "Booking time cannot be in the past"}, 400
+
+        # CRITICAL: Validate booking date is within round date range
+        if match.round:
+            if match.round_deadline:
+                # Range is (deadline - 6 days) to deadline
+                round_end_date = match.round_deadline.date()
+                from datetime import timedelta
+                round_start_date = round_end_date - timedelta(days=6)
+            else:
+                round_start_date = get_round_start_date(match.round)
+                if round_start_date:
+                    from datetime import timedelta, date
+                    # Special handling for Round 5: extend end date to Dec 27
+                    if match.round == 5:
+                        round_end_date = date(2025, 12, 27)
+                    else:
+                        round_end_date = round_start_date + timedelta(days=6)  # Sunday
+                else:
+                    round_end_date = None
+            
+            if round_start_date and round_end_date:
+                booking_date_obj = datetime.strptime(booking_date, "%Y-%m-%d").date()
+
+                if booking_date_obj < round_start_date or booking_date_obj > round_end_date:
+                    round_dates = get_round_date_range(match)
+                    return {
+                        "success": False,
+                        "message": f"Booking date must be within round dates ({round_dates}). For dates outside this range, please use the Reschedule Request feature."
+                    }, 400
+
+        # Get opponent
+        opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+        opponent = Team.query.get(opponent_id)
+
+        # Check if there's an existing booking or if this is a change to confirmed booking
+        if match.booking_details:
+            # Parse existing booking
+            try:
+                existing_datetime_str = match.booking_details.split("Court assigned on arrival")[0].strip()
+
+                # If booking was already confirmed and someone is proposing a new time
+                if match.booking_confirmed:
+                    # Reset confirmation and store new proposal
+                    match.booking_confirmed = False
+                    match.booking_requested_by = team.id
+                    formatted_datetime = match_datetime.strftime("%A, %B %d at %I:%M %p")
+                    match.booking_details = f"{formatted_datetime}\nCourt assigned on arrival\nWaiting for {opponent.team_name} to confirm..."
+                    match.match_datetime = match_datetime
+                    db.session.commit()
+
+                    # Notify opponent about the change
+                    base_url = "https://goeclectic.xyz"
+                    notification_body = f"""Hi!
+
+{team.team_name} has proposed a CHANGE to your confirmed match booking:
+
+NEW Proposed Time: {formatted_datetime}
+Court: Assigned on arrival
+
+Please log in to confirm or propose a different time:
+{base_url}/my-matches/{opponent.access_token}
+
+- BD Padel League
+"""
+                    if opponent.player1_email:
+                        send_email_notification(opponent.player1_email, "Match Booking Change Proposed", notification_body)
+                    if opponent.player2_email:
+                        send_email_notification(opponent.player2_email, "Match Booking Change Proposed", notification_body)
+
+                    return {
+                        "success": True,
+                        "message": f"Booking change submitted! Waiting for {opponent.team_name} to confirm the new time.",
+                        "confirmed": False,
+                        "booking_details": match.booking_details
+                    }
+            except:
+                pass
+
+        # Store this team's booking (waiting for opponent confirmation)
+        formatted_datetime = match_datetime.strftime("%A, %B %d at %I:%M %p")
+        match.booking_details = f"{formatted_datetime}\nCourt assigned on arrival\nWaiting for {opponent.team_name} to confirm..."
+        match.booking_requested_by = team.id
+        match.match_datetime = match_datetime  # Store for potential confirmation
+        db.session.commit()
+
+        # Notify opponent
+        base_url = "https://goeclectic.xyz"
+        notification_body = f"""Hi!
+
+{team.team_name} has proposed a match booking:
+
+Date & Time: {formatted_datetime}
+Court: Assigned on arrival
+
+Please log in to confirm or propose a different time:
+{base_url}/my-matches/{opponent.access_token}
+
+- BD Padel League
+"""
+        if opponent.player1_email:
+            send_email_notification(opponent.player1_email, "Match Booking Proposed", notification_body)
+        if opponent.player2_email:
+            send_email_notification(opponent.player2_email, "Match Booking Proposed", notification_body)
+
+        return {
+            "success": True,
+            "message": f"Booking submitted! Waiting for {opponent.team_name} to confirm.",
+            "confirmed": False,
+            "booking_details": match.booking_details
+        }
+
+    except Exception as e:
+        print(f"[ERROR] Booking submission failed: {e}")
+        return {"success": False, "message": str(e)}, 500
+
+@bp.route("/confirm-booking/<token>", methods=["POST"])
+def confirm_booking(token):
+    """Handle booking confirmation from team's secure page (no re-entry needed)"""
+    from datetime import datetime
+    from utils import send_email_notification
+
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    try:
+        data = request.get_json()
+        match_id = int(data.get("match_id"))
+
+        if not match_id:
+            return {"success": False, "message": "Match ID required"}, 400
+
+        # Find the match
+        match = Match.query.get(match_id)
+        if not match:
+            return {"success": False, "message": "Match not found"}, 404
+
+        # Verify team is part of this match
+        if match.team_a_id != team.id and match.team_b_id != team.id:
+            return {"success": False, "message": "Unauthorized"}, 403
+
+        # Check if there's already a booking proposal
+        if not match.booking_details or match.booking_confirmed:
+            return {"success": False, "message": "No booking proposal to confirm"}, 400
+
+        # Parse the existing booking to extract datetime
+        try:
+            # Extract the datetime from the booking details
+            # Format: "Wednesday, October 22 at 06:30 PM\nCourt assigned on arrival\nWaiting for DUMMY_Lightning Bolts to confirm..."
+            booking_lines = match.booking_details.split('\n')
+            datetime_str = booking_lines[0].strip()  # "Wednesday, October 22 at 06:30 PM"
+
+            # Convert to datetime object - parse without year, then replace with current year
+            parsed_datetime = datetime.strptime(datetime_str, "%A, %B %d at %I:%M %p")
+            match_datetime = parsed_datetime.replace(year=datetime.now().year)
+
+            # Get opponent
+            opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+            opponent = Team.query.get(opponent_id)
+
+            # Confirm the booking
+            match.match_datetime = match_datetime
+            match.match_date = datetime_str
+            match.court = "Court assigned on arrival"
+            match.booking_confirmed = True
+            match.booking_details = f"{datetime_str}\nCourt assigned on arrival\n✓ Confirmed by both teams"
+            db.session.commit()
+
+            # Send confirmation emails to both teams
+            confirmation_body = f"""Hi!
+
+Your match booking has been confirmed by both teams:
+
+Match: {team.team_name} vs {opponent.team_name}
+Date & Time: {match.match_date}
+Court: Assigned on arrival
+
+See you on the court! 🎾
+
+- BD Padel League
+"""
+            # Send to confirming team
+            if team.player1_email:
+                send_email_notification(team.player1_email, "Match Booking Confirmed", confirmation_body)
+            if team.player2_email:
+                send_email_notification(team.player2_email, "Match Booking Confirmed", confirmation_body)
+
+            # Send to proposing team
+            if opponent.player1_email:
+                send_email_notification(opponent.player1_email, "Match Booking Confirmed", confirmation_body)
+            if opponent.player2_email:
+                send_email_notification(opponent.player2_email, "Match Booking Confirmed", confirmation_body)
+
+            return {
+                "success": True,
+                "message": "Booking confirmed! Both teams have agreed on the schedule.",
+                "confirmed": True,
+                "booking_details": match.booking_details
+            }
+
+        except Exception as parse_error:
+            print(f"[ERROR] Failed to parse existing booking: {parse_error}")
+            return {"success": False, "message": "Invalid booking format. Please contact admin."}, 400
+
+    except Exception as e:
+        print(f"[ERROR] Booking confirmation failed: {e}")
+        return {"success": False, "message": str(e)}, 500
+
+@bp.route("/confirm-score/<token>", methods=["POST"])
+def confirm_score(token):
+    """Handle score confirmation from team's secure page (no re-entry needed)"""
+    from utils import calculate_match_result, normalize_score_string, send_email_notification
+
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    try:
+        data = request.get_json()
+        match_id = int(data.get("match_id"))
+        action = data.get("action")  # "confirm" or "dispute"
+
+        if not match_id or not action:
+            return {"success": False, "message": "Match ID and action required"}, 400
+
+        # Find the match
+        match = Match.query.get(match_id)
+        if not match:
+            return {"success": False, "message": "Match not found"}, 404
+
+        # Verify team is part of this match
+        if match.team_a_id != team.id and match.team_b_id != team.id:
+            return {"success": False, "message": "Unauthorized"}, 403
+
+        # Check if there's a score to confirm
+        if not match.score_submission_a and not match.score_submission_b:
+            return {"success": False, "message": "No score submitted to confirm"}, 400
+
+        # Get opponent
+        opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+        opponent = Team.query.get(opponent_id)
+
+        # Determine which team submitted the score
+        if match.team_a_id == team.id:
+            # Team A is confirming Team B's score
+            submitted_score = match.score_submission_b
+            submitted_by_team = opponent
+        else:
+            # Team B is confirming Team A's score
+            submitted_score = match.score_submission_a
+            submitted_by_team = opponent
+
+        if action == "confirm":
+            # Confirm the score - both teams agree
+            # Determine canonical A/B perspective score strings
+            try:
+                if match.team_a_id == team.id:
+                    # Opponent (Team B) submitted their perspective
+                    score_b_str = submitted_score
+                    score_a_str = invert_score_string(submitted_score)
+                else:
+                    # Opponent (Team A) submitted their perspective
+                    score_a_str = submitted_score
+                    score_b_str = invert_score_string(submitted_score)
+
+                # Calculate match result from Team A and Team B perspectives
+                sets_a, sets_b, games_a, games_b, winner_code = calculate_match_result(
+                    score_a_str, score_b_str
+                )
+
+                # Update match with confirmed score (canonical A/B)
+                match.score_a = score_a_str
+                match.score_b = score_b_str
+                match.sets_a = sets_a
+                match.sets_b = sets_b
+                match.games_a = games_a
+                match.games_b = games_b
+                match.winner_id = match.team_a_id if winner_code == 'a' else (
+                    match.team_b_id if winner_code == 'b' else None
+                )
+                match.verified = True
+                match.status = "completed"
+                match.stats_calculated = False  # Trigger stats recalculation
+
+                # Update team statistics
+                update_team_stats_from_match(match)
+
+                # NEW: Update knockout bracket winners
+                if knockout_bracket.is_knockout_match(match):
+                    update_bracket_winners(match)
+
+                db.session.commit()
+
+                # Send confirmation emails to both teams
+                winner_name = (
+                    Team.query.get(match.winner_id).team_name if match.winner_id else "Draw"
+                )
+                confirmation_body = f"""Hi!
+
+Match score has been confirmed by both teams:
+
+Match: {team.team_name} vs {opponent.team_name}
+Score: {match.score_a} - {match.score_b}
+Winner: {winner_name}
+
+The score has been verified and recorded in the system.
+
+- BD Padel League
+"""
+                # Send to confirming team
+                if team.player1_email:
+                    send_email_notification(team.player1_email, "Match Score Confirmed", confirmation_body)
+                if team.player2_email:
+                    send_email_notification(team.player2_email, "Match Score Confirmed", confirmation_body)
+
+                # Send to opponent
+                if opponent.player1_email:
+                    send_email_notification(opponent.player1_email, "Match Score Confirmed", confirmation_body)
+                if opponent.player2_email:
+                    send_email_notification(opponent.player2_email, "Match Score Confirmed", confirmation_body)
+
+                return {
+                    "success": True,
+                    "message": "Score confirmed! Match result has been verified and recorded.",
+                    "verified": True,
+                    "winner": winner_name,
+                    "score": f"{match.score_a} - {match.score_b}"
+                }
+
+            except Exception as parse_error:
+                print(f"[ERROR] Failed to parse score for confirmation: {parse_error}")
+                return {"success": False, "message": "Invalid score format. Please contact admin."}, 400
+
+        elif action == "dispute":
+            # Dispute the score - escalate to admin
+            # Clear the disputed score submission
+            if match.team_a_id == team.id:
+                match.score_submission_b = None
+                match.score_submitted_by_b = False
+            else:
+                match.score_submission_a = None
+                match.score_submitted_by_a = False
+            db.session.commit()
+
+            # Send dispute notification to both teams
+            dispute_body = f"""Hi!
+
+The match score has been disputed and requires admin review:
+
+Match: {team.team_name} vs {opponent.team_name}
+Disputed Score: {submitted_score}
+Disputed by: {team.team_name}
+
+The admin will contact both teams to resolve this dispute.
+
+- BD Padel League
+"""
+            # Send to disputing team
+            if team.player1_email:
+                send_email_notification(team.player1_email, "Score Dispute Submitted", dispute_body)
+            if team.player2_email:
+                send_email_notification(team.player2_email, "Score Dispute Submitted", dispute_body)
+
+            # Send to opponent
+            if opponent.player1_email:
+                send_email_notification(opponent.player1_email, "Score Dispute - Admin Review Required", dispute_body)
+            if opponent.player2_email:
+                send_email_notification(opponent.player2_email, "Score Dispute - Admin Review Required", dispute_body)
+
+            return {
+                "success": True,
+                "message": "Score dispute submitted! Admin will review and contact both teams to resolve.",
+                "disputed": True
+            }
+
+        else:
+            return {"success": False, "message": "Invalid action. Use 'confirm' or 'dispute'."}, 400
+
+    except Exception as e:
+        print(f"[ERROR] Score confirmation failed: {e}")
+        return {"success": False, "message": str(e)}, 500
+
+@bp.route("/submit-score/<token>", methods=["POST"])
+def submit_score(token):
+    """Handle score submission from team's secure page"""
+    from utils import calculate_match_result, normalize_score_string, send_email_notification
+
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    try:
+        data = request.get_json()
+        match_id = int(data.get("match_id"))
+        set1 = data.get("set1", "").strip()
+        set2 = data.get("set2", "").strip()
+        set3 = data.get("set3", "").strip()
+
+        if not all([match_id, set1, set2]):
+            return {"success": False, "message": "At least 2 sets are required"}, 400
+
+        # Find the match
+        match = Match.query.get(match_id)
+        if not match:
+            return {"success": False, "message": "Match not found"}, 404
+
+        # Verify team is part of this match
+        is_team_a = match.team_a_id == team.id
+        is_team_b = match.team_b_id == team.id
+
+        if not is_team_a and not is_team_b:
+            return {"success": False, "message": "Unauthorized"}, 403
+
+        # Build score string
+        score_parts = [set1, set2]
+        if set3:
+            score_parts.append(set3)
+        submitted_score = ", ".join(score_parts)
+
+        # Normalize the score
+        try:
+            normalized_score = normalize_score_string(submitted_score)
+        except ValueError as e:
+            return {"success": False, "message": f"Invalid score format: {e}"}, 400
+
+        # Get opponent
+        opponent_id = match.team_b_id if is_team_a else match.team_a_id
+        opponent = Team.query.get(opponent_id)
+
+        # Store submission
+        if is_team_a:
+            match.score_submission_a = normalized_score
+            match.score_submitted_by_a = True
+        else:
+            match.score_submission_b = normalized_score
+            match.score_submitted_by_b = True
+
+        # IMPORTANT: Commit the first submission so it persists to database
+        db.session.commit()
+
+        # Check if opponent also submitted
+        if match.score_submitted_by_a and match.score_submitted_by_b:
+            # Both teams submitted, check if they match
+            if match.score_submission_a == match.score_submission_b:
+                # Scores match! Verify the match
+                team_a = Team.query.get(match.team_a_id)
+                team_b = Team.query.get(match.team_b_id)
+
+                match.score_a = match.score_submission_a
+                match.score_b = match.score_submission_a  # Same score
+                match.verified = True
+                match.status = "completed"
+
+                # Calculate match result
+                result = calculate_match_result(match.score_a)
+                match.sets_a = result["sets_won"]
+                match.sets_b = result["sets_lost"]
+                match.games_a = result["games_won"]
+                match.games_b = result["games_lost"]
+
+                if result["sets_won"] > result["sets_lost"]:
+                    match.winner_id = match.team_a_id
+                elif result["sets_lost"] > result["sets_won"]:
+                    match.winner_id = match.team_b_id
+                else:
+                    match.winner_id = None  # Draw
+
+                # Populate player IDs for this match (who actually played)
+                player1_a = Player.query.filter_by(phone=team_a.player1_phone).first()
+                player2_a = Player.query.filter_by(phone=team_a.player2_phone).first()
+                player1_b = Player.query.filter_by(phone=team_b.player1_phone).first()
+                player2_b = Player.query.filter_by(phone=team_b.player2_phone).first()
+
+                if player1_a:
+                    match.team_a_player1_id = player1_a.id
+                if player2_a:
+                    match.team_a_player2_id = player2_a.id
+                if player1_b:
+                    match.team_b_player1_id = player1_b.id
+                if player2_b:
+                    match.team_b_player2_id = player2_b.id
+
+                # Update all stats (team + player) using centralized function
+                from utils import verify_match_and_calculate_stats
+                verify_match_and_calculate_stats(match, team_a, team_b, db.session)
+
+                # NEW: Update knockout bracket winners
+                if knockout_bracket.is_knockout_match(match):
+                    update_bracket_winners(match)
+
+                db.session.commit()
+
+                # Send confirmation emails
+                winner_name = team_a.team_name if match.winner_id == team_a.id else (team_b.team_name if match.winner_id == team_b.id else "Draw")
+                confirmation_body = f"""Hi!
+
+Match score has been verified by both teams:
+
+{team_a.team_name} vs {team_b.team_name}
+Score: {match.score_a}
+Winner: {winner_name}
+
+Check the leaderboard for updated standings!
+
+- BD Padel League
+"""
+                for t in [team_a, team_b]:
+                    if t.player1_email:
+                        send_email_notification(t.player1_email, "Match Score Verified", confirmation_body)
+                    if t.player2_email:
+                        send_email_notification(t.player2_email, "Match Score Verified", confirmation_body)
+
+                return {
+                    "success": True,
+                    "message": "Score verified! Match complete.",
+                    "verified": True,
+                    "winner": winner_name,
+                    "score": match.score_a
+                }
+            else:
+                # Scores don't match - need admin intervention
+                db.session.commit()
+                return {
+                    "success": True,
+                    "message": "Score submitted but doesn't match opponent's submission. Admin will review.",
+                    "verified": False,
+                    "your_score": normalized_score,
+                    "opponent_score": match.score_submission_a if is_team_b else match.score_submission_b
+                }
+        else:
+            # First team to submit
+            db.session.commit()
+
+            # Notify opponent
+            base_url = "https://goeclectic.xyz"
+            notification_body = f"""Hi!
+
+{team.team_name} has submitted their match score:
+
+Score: {normalized_score}
+
+Please log in to confirm the score:
+{base_url}/my-matches/{opponent.access_token}
+
+- BD Padel League
+"""
+            if opponent.player1_email:
+                send_email_notification(opponent.player1_email, "Match Score Submitted", notification_body)
+            if opponent.player2_email:
+                send_email_notification(opponent.player2_email, "Match Score Submitted", notification_body)
+
+            return {
+                "success": True,
+                "message": f"Score submitted! Waiting for {opponent.team_name} to confirm.",
+                "verified": False,
+                "your_score": normalized_score
+            }
+
+    except Exception as e:
+        print(f"[ERROR] Score submission failed: {e}")
+        return {"success": False, "message": str(e)}, 500
+
+@bp.route("/submit-reschedule/<token>", methods=["POST"])
+def submit_reschedule(token):
+    """Handle reschedule request from team's secure page"""
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    try:
+        data = request.get_json()
+        match_id = int(data.get("match_id"))
+        date = data.get("date", "").strip()
+        time = data.get("time", "").strip()
+
+        if not all([match_id, date, time]):
+            return {"success": False, "message": "Match ID, date, and time are required"}, 400
+
+        # Find the match
+        match = Match.query.get(match_id)
+        if not match:
+            return {"success": False, "message": "Match not found"}, 404
+
+        # Verify team is part of this match
+        if match.team_a_id != team.id and match.team_b_id != team.id:
+            return {"success": False, "message": "Unauthorized"}, 403
+
+        # Check reschedule limit (max 3 per team)
+        if team.reschedules_used >= 3:
+            return {
+                "success": False,
+                "message": "Your team has already used all 3 reschedules. No more subs allowed in league stage."
+            }, 400
+
+        # NEW: Disable reschedules for knockout rounds
+        if knockout_bracket.is_knockout_match(match):
+            return {
+                "success": False,
+                "message": "Rescheduling is not permitted during knockout rounds."
+            }, 400
+
+        # Check if we've reached the round reschedule limit
+        pending_reschedules = get_pending_reschedules()
+        max_per_round = get_max_reschedules_per_round()
+
+        if len(pending_reschedules) >= max_per_round:
+            return {
+                "success": False,
+                "message": f"Maximum reschedule limit reached for this round ({max_per_round} reschedules). Please wait for admin to process pending requests or contact admin for special approval."
+            }, 400
+
+        # Validate reschedule request based on round deadline
+        from datetime import datetime, timedelta
+        today = datetime.now().date()
+        selected_date = datetime.strptime(date, "%Y-%m-%d").date()
+        
+        # Determine the round deadline - use match.round_deadline if set, otherwise calculate
+        if match.round_deadline:
+            round_deadline_date = match.round_deadline.date()
+            # Reschedule request cutoff: 2 days before round deadline
+            reschedule_cutoff = round_deadline_date - timedelta(days=2)
+            # Makeup match deadline: 3 days after round deadline
+            makeup_deadline = round_deadline_date + timedelta(days=3)
+        else:
+            # Fallback to legacy week-based logic
+            current_weekday = today.weekday()  # 0 = Monday, 6 = Sunday
+            if current_weekday == 0:
+                days_until_next_monday = 7
+            else:
+                days_until_next_monday = (7 - current_weekday) % 7
+                if days_until_next_monday == 0:
+                    days_until_next_monday = 7
+            next_monday = today + timedelta(days=days_until_next_monday)
+            round_deadline_date = next_monday + timedelta(days=6)  # Sunday
+            reschedule_cutoff = round_deadline_date - timedelta(days=2)
+            makeup_deadline = round_deadline_date + timedelta(days=3)
+        
+        # Validate reschedule request is before cutoff
+        if today > reschedule_cutoff:
+            return {
+                "success": False,
+                "message": f"Reschedule requests must be submitted by {reschedule_cutoff.strftime('%B %d, %Y')} (2 days before round deadline)"
+            }, 400
+        
+        # Validate selected date is between now and makeup deadline
+        if selected_date < today or selected_date > makeup_deadline:
+            return {
+                "success": False,
+                "message": f"Reschedule date must be between {today.strftime('%Y-%m-%d')} and {makeup_deadline.strftime('%Y-%m-%d')} (makeup deadline)"
+            }, 400
+
+        # Check if this is a valid round for reschedule (1 round limitation)
+        current_round = match.round
+        if current_round is None:
+            return {"success": False, "message": "Cannot reschedule: Invalid round number"}, 400
+
+        # Validate this is not a reschedule of a reschedule (Swiss format protection)
+        existing_reschedules = Reschedule.query.filter_by(
+            match_id=match_id,
+            requester_team_id=team.id,
+            status="pending"
+        ).count()
+
+        if existing_reschedules > 0:
+            return {
+                "success": False,
+                "message": "You already have a pending reschedule request for this match. Please wait for admin approval."
+            }, 400
+
+        # Create reschedule request
+        from datetime import datetime
+        proposed_time_formatted = f"{date} at {time}"
+        req = Reschedule(
+            match_id=match_id,
+            requester_team_id=team.id,
+            proposed_time=proposed_time_formatted,
+            status="pending",
+            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+        db.session.add(req)
+        db.session.commit()
+
+        # Use the dynamically calculated makeup deadline for notification
+        deadline_text = f"⚠️ MAKEUP MATCH DEADLINE: {makeup_deadline.strftime('%A, %B %d')} 23:59"
+
+        # Send email notifications to both teams
+        from utils import send_email_notification
+        opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+        opponent = Team.query.get(opponent_id)
+
+        # Send admin notification
+        admin_email = os.environ.get("ADMIN_EMAIL")
+        if admin_email:
+            admin_body = f"""🔔 NEW RESCHEDULE REQUEST
+
+Team Requesting: {team.team_name}
+Opponent Team: {opponent.team_name if opponent else 'Unknown'}
+
+Match Details:
+- Round: {match.round}
+- Current Match Date: {match.match_datetime.strftime('%a, %b %d, %Y %I:%M %p') if match.match_datetime else 'Not scheduled'}
+- Proposed Date/Time: {proposed_time_formatted}
+- Makeup Match Deadline: {makeup_deadline.strftime('%A, %B %d')} 23:59
+
+Team Reschedules Used: {team.reschedules_used}/2
+
+Status: PENDING APPROVAL
+
+Access the admin panel to approve or deny this request.
+
+- BD Padel League
+"""
+            send_email_notification(admin_email, f"🔔 Reschedule Request - Round {match.round} - {team.team_name}", admin_body)
+
+        # Email to requester team
+        requester_body = f"""Hi {team.team_name},
+
+Your reschedule request has been submitted and is awaiting admin approval.
+
+Match Details:
+- Round: {match.round}
+- Opponent: {opponent.team_name if opponent else 'Unknown'}
+- Proposed Time: {proposed_time_formatted}
+- Deadline: {deadline_text}
+
+Admin will review your request. Both teams will be notified once approved/denied.
+
+Team Reschedules Used: {team.reschedules_used}/2
+
+- BD Padel League
+"""
+        if team.player1_email:
+            send_email_notification(team.player1_email, f"Reschedule Request Submitted - Round {match.round}", requester_body)
+        if team.player2_email:
+            send_email_notification(team.player2_email, f"Reschedule Request Submitted - Round {match.round}", requester_body)
+
+        # Email to opponent team
+        if opponent:
+            opponent_body = f"""Hi {opponent.team_name},
+
+{team.team_name} has submitted a reschedule request for your match.
+
+Match Details:
+- Round: {match.round}
+- Proposed Time: {proposed_time_formatted}
+- Deadline: {deadline_text}
+
+Admin will review this request. You'll be notified once approved/denied.
+
+- BD Padel League
+"""
+            if opponent.player1_email:
+                send_email_notification(opponent.player1_email, f"Reschedule Request - Round {match.round}", opponent_body)
+            if opponent.player2_email:
+                send_email_notification(opponent.player2_email, f"Reschedule Request - Round {match.round}", opponent_body)
+
+        return {
+            "success": True,
+            "message": f"✅ Reschedule submitted for {proposed_time_formatted}! {deadline_text}. If not completed by deadline, automatic walkover to opponent. You'll play 2 matches in the following week (makeup + regular round match). ({team.reschedules_used}/2 used)",
+            "reschedules_used": team.reschedules_used,
+            "reschedules_limit": 2
+        }
+
+    except Exception as e:
+        print(f"[ERROR] Reschedule request failed: {e}")
+        return {"success": False, "message": str(e)}, 500
+
+@bp.route("/get-previous-substitutes/<token>", methods=["GET"])
+def get_previous_substitutes(token):
+    """Get list of previously requested substitutes for a team (only pending/approved)"""
+    team = Team.query.filter_by(access_token=token).first_or_404()
+    
+    # Get unique substitute names from this team's approved substitute requests
+    subs = db.session.query(Substitute).filter(
+        Substitute.team_id == team.id,
+        Substitute.status.in_(["pending", "approved"])
+    ).distinct(Substitute.name).all()
+    
+    result = [{"id": s.id, "name": s.name, "phone": s.phone, "email": s.email} for s in subs]
+    return result
+
+@bp.route("/submit-substitute/<token>", methods=["POST"])
+def submit_substitute(token):
+    """Handle substitute request from team's secure page"""
+    team = Team.query.filter_by(access_token=token).first_or_404()
+
+    try:
+        data = request.get_json()
+        match_id = int(data.get("match_id"))
+        sub_name = data.get("sub_name", "").strip()
+        sub_phone = data.get("sub_phone", "").strip()
+        sub_email = data.get("sub_email", "").strip()
+        replaces_player = data.get("replaces_player", "").strip()
+
+        if not all([match_id, sub_name, sub_phone, sub_email, replaces_player]):
+            return {"success": False, "message": "All fields including which player is being replaced are required"}, 400
+
+        # Find the match
+        match = Match.query.get(match_id)
+        if not match:
+            return {"success": False, "message": "Match not found"}, 404
+
+        # Verify team is part of this match
+        if match.team_a_id != team.id and match.team_b_id != team.id:
+            return {"success": False, "message": "Unauthorized"}, 403
+
+        # NEW: Disable substitutions for knockout rounds
+        if knockout_bracket.is_knockout_match(match):
+            return {
+                "success": False,
+                "message": "Substitution requests are not permitted during knockout rounds."
+            }, 400
+
+        # Check substitute limit (max 2 per team in league stage)
+        if team.subs_used >= 2:
+            return {
+                "success": False,
+                "message": "Your team has already used all 2 substitutes. No more subs allowed in league stage."
+            }, 400
+
+        # Create substitute request
+        from datetime import datetime
+
+        # Get the replaced player's name
+        replaced_player_name = team.player1_name if replaces_player == "1" else team.player2_name
+
+        s = Substitute(
+            team_id=team.id,
+            match_id=match_id,
+            name=sub_name,
+            phone=sub_phone,
+            email=sub_email,
+            replaces_player_number=int(replaces_player),
+            status="pending",
+            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+        db.session.add(s)
+        db.session.commit()
+
+        # Send notifications to all parties
+        from utils import send_email_notification
+
+        # Send admin notification
+        admin_email = os.environ.get("ADMIN_EMAIL")
+        if admin_email:
+            opponent_id = match.team_b_id if match.team_a_id == team.id else match.team_a_id
+            opponent = Team.query.get(opponent_id)
+            admin_body = f"""🔔 NEW SUBSTITUTE REQUEST
+
+Team Requesting: {team.team_name}
+Opponent Team: {opponent.team_name if opponent else 'Unknown'}
+
+Match Details:
+- Round: {match.round}
+- Match Date: {match.match_datetime.strftime('%a, %b %d, %Y %I:%M %p') if match.match_datetime else 'Not scheduled'}
+
+Substitute Information:
+- Name: {sub_name}
+- Phone: {sub_phone}
+- Email: {sub_email}
+- Replacing: {replaced_player_name} (Player {replaces_player})
+
+Team Substitutes Used: {team.subs_used}/2
+
+Status: PENDING APPROVAL
+
+Access the admin panel to approve or deny this request.
+
+- BD Padel League
+"""
+            send_email_notification(admin_email, f"🔔 Substitute Request - Round {match.round} - {team.team_name}", admin_body)
+
+        # Email subject and body
+        subject = f"Substitute Request Submitted - Round {match.round}"
+
+        # Email to Player 1
+        if team.player1_email:
+            body1 = f"""Hello {team.player1_name},
+
+Your substitute request has been submitted and is awaiting admin approval.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Substitute: {sub_name} ({sub_email})
+- Replacing: {replaced_player_name}
+
+Admin will review and approve/deny your request soon. You will receive a confirmation email once processed.
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(team.player1_email, subject, body1)
+
+        # Email to Player 2
+        if team.player2_email:
+            body2 = f"""Hello {team.player2_name},
+
+Your teammate has submitted a substitute request which is awaiting admin approval.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Substitute: {sub_name} ({sub_email})
+- Replacing: {replaced_player_name}
+
+Admin will review and approve/deny the request soon. You will receive a confirmation email once processed.
+
+Thank you!
+Padel League Hub"""
+            send_email_notification(team.player2_email, subject, body2)
+
+        # Email to Substitute
+        sub_body = f"""Hello {sub_name},
+
+You have been requested as a substitute player and the request is awaiting admin approval.
+
+Match Details:
+- Round: {match.round}
+- Team: {team.team_name}
+- Team Players: {team.player1_name} & {team.player2_name}
+- You will replace: {replaced_player_name}
+
+Admin will review and approve/deny the request soon. You will receive a confirmation email once processed.
+
+Thank you for participating!
+Padel League Hub"""
+        send_email_notification(sub_email, subject, sub_body)
+
+        return {
+            "success": True,
+            "message": f"✅ Substitute request submitted! Email notifications sent to all parties. Admin will review your request. ({team.subs_used}/2 substitutes used)",
+            "subs_used": team.subs_used,
+            "subs_limit": 2
+        }
+
+    except Exception as e:
+        print(f"[ERROR] Substitute request failed: {e}")
+        return {"success": False, "message": str(e)}, 500
@@ -0,0 +1,428 @@
+"""
+Public Blueprint for BD Padel League
+Home page, leaderboards, player and team profiles, league stats, the rounds
+and rules pages, plus /health and /metrics.
+"""
+
+from flask import Blueprint, render_template
+from sqlalchemy.orm import joinedload, selectinload
+from models import (
+    db, Team, Match, Substitute, Player, LeagueSettings, LadderTeam, LadderFreeAgent,
+    LadderChallenge, LadderMatch, AmericanoTournament, AmericanoRegistration
+)
+import league_rounds
+
+bp = Blueprint("public", __name__)
+
+
+@bp.route("/health")
+def health():
+    """Fast health check endpoint for deployment monitoring"""
+    return {"status": "ok"}, 200
+
+@bp.route("/metrics")
+def metrics():
+    """Prometheus scrape endpoint (see app_metrics.py)"""
+    import app_metrics
+    from flask import Response
+    if not app_metrics.is_authorized():
+        return Response("Unauthorized\n", status=401, mimetype="text/plain")
+    return Response(app_metrics.render_metrics(), content_type=app_metrics.CONTENT_TYPE_LATEST)
+
+@bp.route("/")
+def index():
+    from datetime import datetime
+
+    league_teams = Team.query.count()
+    ladder_men_teams = LadderTeam.query.filter_by(gender='men').count()
+    ladder_women_teams = LadderTeam.query.filter_by(gender='women').count()
+    ladder_free_agents = LadderFreeAgent.query.count()
+
+    # Get featured Americano tournament for homepage card
+    # Priority: 1) Registration open, 2) In progress, 3) Recently completed
+    featured_tournament = None
+    now = datetime.now()
+
+    # First check for registration open
+    featured_tournament = AmericanoTournament.query.filter(
+        AmericanoTournament.registration_open == True,
+        db.or_(
+            AmericanoTournament.registration_deadline == None,
+            AmericanoTournament.registration_deadline >= now
+        )
+    ).order_by(AmericanoTournament.tournament_date.asc()).first()
+
+    # If none, check for in_progress
+    if not featured_tournament:
+        featured_tournament = AmericanoTournament.query.filter(
+            AmericanoTournament.status == 'in_progress'
+        ).order_by(AmericanoTournament.tournament_date.desc()).first()
+
+    # If none, check for recently completed (within last 7 days)
+    if not featured_tournament:
+        from datetime import timedelta
+        week_ago = now - timedelta(days=7)
+        featured_tournament = AmericanoTournament.query.filter(
+            AmericanoTournament.status == 'completed',
+            AmericanoTournament.completed_at >= week_ago
+        ).order_by(AmericanoTournament.completed_at.desc()).first()
+
+    # Get registration count for featured tournament
+    featured_reg_count = 0
+    if featured_tournament:
+        featured_reg_count = AmericanoRegistration.query.filter_by(
+            tournament_id=featured_tournament.id,
+            status='confirmed'
+        ).count()
+
+    return render_template("index.html",
+                         league_teams=league_teams,
+                         ladder_men_teams=ladder_men_teams,
+                         ladder_women_teams=ladder_women_teams,
+                         ladder_free_agents=ladder_free_agents,
+                         featured_tournament=featured_tournament,
+                         featured_reg_count=featured_reg_count)
+
+@bp.route("/leaderboard")
+def leaderboard():
+    """
+    Leaderboard with proper padel league ranking:
+    1. Status (active teams first, inactive teams last)
+    2. Points (3 for win, 1 for draw, 0 for loss)
+    3. Sets difference
+    4. Games difference
+    5. Wins
+    6. Team name (alphabetical)
+    """
+    teams = Team.query.order_by(
+        Team.status.asc(),  # 'active' comes before 'inactive' alphabetically
+        Team.points.desc(),
+        (Team.sets_for - Team.sets_against).desc(),
+        (Team.games_for - Team.games_against).desc(),
+        Team.wins.desc(),
+        Team.team_name
+    ).all()
+
+    # Check playoff qualification status
+    settings = LeagueSettings.query.first()
+    qualified_team_ids = []
+    team_seeds = {}
+
+    if settings and settings.qualified_team_ids:
+        import json
+        try:
+            qualified_team_ids = json.loads(settings.qualified_team_ids)
+            # Create a seed mapping (team_id -> seed number)
+            for seed, team_id in enumerate(qualified_team_ids, start=1):
+                team_seeds[team_id] = seed
+        except:
+            pass
+
+    return render_template("leaderboard.html", teams=teams, team_seeds=team_seeds, playoff_phase=settings.current_phase if settings else "swiss")
+
+@bp.route("/players")
+def player_leaderboard():
+    """
+    Player leaderboard organized by team ranking
+    Teams are ranked by: Status > Points > Sets Diff > Games Diff > Wins > Team Name
+    Players within each team are sorted by: Points > Wins > Matches Played > Sets Diff > Games Diff
+    Includes all players with stats including substitutes and free agents
+    """
+    # Get teams in ranked order (same as team leaderboard)
+    teams = Team.query.order_by(
+        Team.status.asc(),  # 'active' comes before 'inactive' alphabetically
+        Team.points.desc(),
+        (Team.sets_for - Team.sets_against).desc(),
+        (Team.games_for - Team.games_against).desc(),
+        Team.wins.desc(),
+        Team.team_name
+    ).all()
+    
+    # Build players list grouped by team rank
+    players_by_team = []
+    processed_player_ids = set()
+    
+    for team_rank, team in enumerate(teams, start=1):
+        # Get all players from this team who have stats
+        team_players = Player.query.filter(
+            Player.current_team_id == team.id,
+            db.or_(
+                (Player.wins > 0) | 
+                (Player.losses > 0) | 
+                (Player.draws > 0) |
+                (Player.matches_played > 0)
+            )
+        ).order_by(
+            Player.points.desc(),
+            Player.wins.desc(),
+            Player.matches_played.desc(),
+            (Player.sets_for - Player.sets_against).desc(),
+            (Player.games_for - Player.games_against).desc(),
+            Player.name
+        ).all()
+        
+        # Add substitute indicator and team info
+        for player in team_players:
+            player.is_substitute = db.session.query(Substitute).filter_by(player_id=player.id).first() is not None
+            player.team_rank = team_rank
+            player.team_name = team.team_name
+            processed_player_ids.add(player.id)
+        
+        players_by_team.extend(team_players)
+    
+    # Also include players with stats who aren't currently on any ranked team (substitutes, free agents)
+    other_players = Player.query.filter(
+        Player.id.notin_(processed_player_ids),
+        db.or_(
+            (Player.wins > 0) | 
+            (Player.losses > 0) | 
+            (Player.draws > 0) |
+            (Player.matches_played > 0)
+        )
+    ).order_by(
+        Player.points.desc(),
+        Player.wins.desc(),
+        Player.matches_played.desc(),
+        (Player.sets_for - Player.sets_against).desc(),
+        (Player.games_for - Player.games_against).desc(),
+        Player.name
+    ).all()
+    
+    for player in other_players:
+        player.is_substitute = db.session.query(Substitute).filter_by(player_id=player.id).first() is not None
+        player.team_rank = None
+        player.team_name = None
+    
+    players_by_team.extend(other_players)
+    
+    return render_template("player_leaderboard.html", players=players_by_team)
+
+@bp.route("/player/<int:player_id>")
+def player_profile(player_id: int):
+    """Individual player profile with detailed stats and match history"""
+    player = Player.query.get_or_404(player_id)
+
+    # Get all matches this player participated in
+    matches = Match.query.filter(
+        db.or_(
+            Match.team_a_player1_id == player_id,
+            Match.team_a_player2_id == player_id,
+            Match.team_b_player1_id == player_id,
+            Match.team_b_player2_id == player_id
+        ),
+        Match.status == "completed"
+    ).options(
+        joinedload(Match.team_a),
+        joinedload(Match.team_b),
+        selectinload(Match.team_a_player1),
+        selectinload(Match.team_a_player2),
+        selectinload(Match.team_b_player1),
+        selectinload(Match.team_b_player2),
+    ).order_by(Match.round.desc()).all()
+
+    # Enrich matches with details
+    match_details = []
+    for match in matches:
+        # Determine which team the player was on
+        on_team_a = (match.team_a_player1_id == player_id or match.team_a_player2_id == player_id)
+        player_team = match.team_a if on_team_a else match.team_b
+        opponent_team = match.team_b if on_team_a else match.team_a
+
+        # Determine partner
+        if on_team_a:
+            partner = match.team_a_player2 if match.team_a_player1_id == player_id else match.team_a_player1
+        else:
+            partner = match.team_b_player2 if match.team_b_player1_id == player_id else match.team_b_player1
+
+        # Determine result
+        if on_team_a:
+            won = match.winner_id == match.team_a_id
+            score = match.score_a
+        else:
+            won = match.winner_id == match.team_b_id
+            score = match.score_b
+
+        match_details.append({
+            'match': match,
+            'player_team': player_team,
+            'opponent_team': opponent_team,
+            'partner': partner,
+            'won': won,
+            'score': score
+        })
+
+    # Get current team
+    current_team = Team.query.get(player.current_team_id) if player.current_team_id else None
+
+    # Get substitute info if player is a substitute
+    substitute_info = Substitute.query.filter_by(player_id=player.id).first()
+    substitute_team = Team.query.get(substitute_info.team_id) if substitute_info else None
+    replaced_player_name = None
+    
+    if substitute_info and substitute_team:
+        # Get the replaced player name from team roster
+        # (Don't use match record because it's already been updated with substitute ID)
+        if substitute_info.replaces_player_number == 1:
+            replaced_player_name = substitute_team.player1_name
+        else:  # replaces_player_number == 2
+            replaced_player_name = substitute_team.player2_name
+
+    # Calculate additional stats
+    recent_form = []
+    for detail in match_details[:5]:  # Last 5 matches
+        if detail['won']:
+            recent_form.append('W')
+        elif detail['match'].winner_id is None:
+            recent_form.append('D')
+        else:
+            recent_form.append('L')
+
+    return render_template(
+        "player_profile.html",
+        player=player,
+        current_team=current_team,
+        match_details=match_details,
+        recent_form=recent_form,
+        substitute_info=substitute_info,
+        substitute_team=substitute_team,
+        replaced_player_name=replaced_player_name
+    )
+
+@bp.route("/team/<int:team_id>")
+def team_profile(team_id: int):
+    team = Team.query.get_or_404(team_id)
+    matches = Match.query.filter(
+        (Match.team_a_id == team_id) | (Match.team_b_id == team_id)
+    ).options(
+        joinedload(Match.team_a),
+        joinedload(Match.team_b),
+    ).order_by(Match.round.desc(), Match.id.desc()).all()
+
+    recent = []
+    for m in matches:
+        if m.status == "completed":
+            if m.winner_id is None:
+                recent.append("D")
+            elif m.winner_id == team_id:
+                recent.append("W")
+            else:
+                recent.append("L")
+        if len(recent) >= 5:
+            break
+
+    return render_template(
+        "team.html",
+        team=team,
+        matches=matches,
+        recent_form=recent,
+    )
+
+@bp.route("/stats")
+def league_stats():
+    """League statistics page with various rankings and streaks"""
+    from datetime import datetime, timedelta
+
+    teams = Team.query.all()
+
+    # Calculate streaks for each team
+    team_streaks = {}
+    for team in teams:
+        matches = Match.query.filter(
+            (Match.team_a_id == team.id) | (Match.team_b_id == team.id)
+        ).filter(Match.status == "completed").order_by(Match.round.desc(), Match.id.desc()).all()
+
+        current_streak = 0
+        streak_type = None
+
+        for match in matches:
+            if match.winner_id == team.id:
+                if streak_type == "W" or streak_type is None:
+                    current_streak += 1
+                    streak_type = "W"
+                else:
+                    break
+            elif match.winner_id is None:  # Draw
+                if streak_type == "D" or streak_type is None:
+                    current_streak += 1
+                    streak_type = "D"
+                else:
+                    break
+            else:  # Loss
+                if streak_type == "L" or streak_type is None:
+                    current_streak += 1
+                    streak_type = "L"
+                else:
+                    break
+
+        team_streaks[team.id] = {
+            'streak': current_streak,
+            'type': streak_type or "N/A"
+        }
+
+    # Sort teams by different criteria
+    teams_by_points = sorted(teams, key=lambda t: t.points, reverse=True)
+    teams_by_sets_diff = sorted(teams, key=lambda t: t.sets_for - t.sets_against, reverse=True)
+    teams_by_games_diff = sorted(teams, key=lambda t: t.games_for - t.games_against, reverse=True)
+    teams_by_wins = sorted(teams, key=lambda t: t.wins, reverse=True)
+    teams_by_streak = sorted(teams, key=lambda t: team_streaks[t.id]['streak'], reverse=True)
+
+    # Ladder Statistics
+    ladder_men_teams = LadderTeam.query.filter_by(ladder_type='men').count()
+    ladder_women_teams = LadderTeam.query.filter_by(ladder_type='women').count()
+    ladder_total_teams = ladder_men_teams + ladder_women_teams
+
+    active_challenges = LadderChallenge.query.filter(
+        LadderChallenge.status.in_(['pending_acceptance', 'accepted'])
+    ).count()
+
+    first_day_of_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    ladder_matches_this_month = LadderMatch.query.filter(
+        LadderMatch.verified == True,
+        LadderMatch.completed_at >= first_day_of_month
+    ).count()
+
+    all_ladder_teams = LadderTeam.query.all()
+    ladder_teams_with_matches = [t for t in all_ladder_teams if t.matches_played > 0]
+    ladder_top_performers = []
+    if ladder_teams_with_matches:
+        sorted_by_win_rate = sorted(
+            ladder_teams_with_matches, 
+            key=lambda t: (t.wins / t.matches_played if t.matches_played > 0 else 0, t.wins), 
+            reverse=True
+        )
+        ladder_top_performers = sorted_by_win_rate[:5]
+
+    return render_template(
+        "stats.html",
+        teams=teams,
+        team_streaks=team_streaks,
+        teams_by_points=teams_by_points,
+        teams_by_sets_diff=teams_by_sets_diff,
+        teams_by_games_diff=teams_by_games_diff,
+        teams_by_wins=teams_by_wins,
+        teams_by_streak=teams_by_streak,
+        ladder_total_teams=ladder_total_teams,
+        ladder_men_teams=ladder_men_teams,
+        ladder_women_teams=ladder_women_teams,
+        active_challenges=active_challenges,
+        ladder_matches_this_month=ladder_matches_this_month,
+        ladder_top_performers=ladder_top_performers,
+    )
+
+
+@bp.route("/rounds")
+def rounds():
+    """Display round schedule with Swiss pairing logs (admin only) and playoff bracket"""
+    view = league_rounds.get_rounds_view()
+    return render_template(
+        "rounds.html",
+        rounds_dict=view['rounds_dict'],
+        round_completed_counts=view['round_completed_counts'],
+        pairing_logs=view['pairing_logs'],
+        knockout_rounds=view['knockout_rounds'],
+        approved_subs=view['approved_subs']
+    )
+
+@bp.route("/rules")
+def rules():
+    return render_template("rules.html")
@@ -0,0 +1,283 @@
+"""
+Query Plan Check for BD Padel League
+Runs EXPLAIN on the hot queries (league rounds, team and player match
+history, active ladder challenges, recent ladder results, ladder tables,
+Americano schedules) and fails if any of them reads a table with a
+sequential scan, or doesn't use the index it is meant to exercise - any index
+would do for a filter that starts with season_id, so each query names its own.
+
+The schema comes straight from models.py, so the check needs no data:
+    - SQLite: an in-memory database; EXPLAIN QUERY PLAN must SEARCH every table.
+      sqlite_stat1 is filled with row counts of a league a few seasons in
+      (TABLE_ROWS / DISTINCT_VALUES), so the planner weighs indexes as it
+      would on real data rather than on empty tables.
+    - Postgres: a scratch database given by --postgres URL (or
+      PLAN_CHECK_POSTGRES_URL), e.g. a throwaway `docker run postgres`. Tables
+      are created in a temporary schema inside a transaction that is rolled
+      back, with enable_seqscan off so empty tables still show whether an
+      index can serve the query. Skipped when no URL is given.
+
+League match queries carry the season_id predicate seasons.py adds to every
+live-season read.
+
+Usage: python check_query_plans.py [--postgres URL]
+Exit status is 1 if any plan regressed.
+"""
+
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+from sqlalchemy import create_engine, func, or_, and_, select, text
+
+from models import (
+    db, Team, Match, LadderTeam, LadderChallenge, LadderMatch, AmericanoMatch
+)
+
+SEASON_ID = 1
+TEAM_ID = 7
+PLAYER_ID = 11
+ACTIVE_CHALLENGE_STATUSES = ["pending_acceptance", "accepted"]
+
+# Rows per table and distinct values per column for sqlite_stat1 (others: 1000 / 100)
+TABLE_ROWS = {
+    "match": 20000, "team": 2000, "ladder_team": 500, "ladder_challenge": 5000,
+    "ladder_match": 5000, "americano_match": 5000,
+}
+DISTINCT_VALUES = {
+    "season_id": 10, "round": 12, "phase": 5, "status": 4,
+    "team_a_id": 2000, "team_b_id": 2000,
+    "team_a_player1_id": 4000, "team_a_player2_id": 4000,
+    "team_b_player1_id": 4000, "team_b_player2_id": 4000,
+    "ladder_type": 3, "gender": 3, "current_rank": 200,
+    "challenger_team_id": 500, "challenged_team_id": 500,
+    "verified": 2, "completed_at": 5000, "challenge_id": 5000,
+    "tournament_id": 100, "round_number": 10,
+    # "table.column" overrides. Most league matches end up completed; the status
+    # filters that reach the database look up the rare ones (walkovers), which
+    # sqlite_stat1's per-column averages can only express as more distinct values
+    "match.status": 20,
+}
+
+
+def hot_queries():
+    """
+    [(name, select statement, expected indexes), ...] mirroring the busiest
+    filters in blueprints/ and utils.py. Every expected index must appear in the
+    plan; a tuple stands for "any one of these".
+    """
+    in_season = Match.season_id == SEASON_ID
+    team_indexes = ("ix_match_season_team_a", "ix_match_season_team_b")
+    return [
+        ("league round", select(Match).where(in_season, Match.round == 3),
+            ["ix_match_season_round"]),
+        ("round drafts", select(Match).where(in_season, Match.round == 3, Match.is_draft == True),
+            ["ix_match_season_round"]),
+        ("knockout phase", select(Match).where(in_season, Match.phase == "semifinal"),
+            ["ix_match_season_phase_status"]),
+        ("walkovers", select(Match).where(in_season, Match.status == "walkover")
+            .order_by(Match.round.desc()),
+            ["ix_match_season_status"]),
+        ("team fixtures", select(Match).where(
+            in_season, or_(Match.team_a_id == TEAM_ID, Match.team_b_id == TEAM_ID)),
+            list(team_indexes)),
+        ("player history", select(Match).where(
+            in_season,
+            or_(
+                Match.team_a_player1_id == PLAYER_ID,
+                Match.team_a_player2_id == PLAYER_ID,
+                Match.team_b_player1_id == PLAYER_ID,
+                Match.team_b_player2_id == PLAYER_ID,
+            ),
+            Match.status == "completed",
+        ), ["ix_match_season_team_a_player1", "ix_match_season_team_a_player2",
+            "ix_match_season_team_b_player1", "ix_match_season_team_b_player2"]),
+        # Each branch pins both teams, so either team index serves it
+        ("head to head", select(Match).where(
+            in_season,
+            Match.status == "completed",
+            or_(
+                and_(Match.team_a_id == TEAM_ID, Match.team_b_id == TEAM_ID + 1),
+                and_(Match.team_a_id == TEAM_ID + 1, Match.team_b_id == TEAM_ID),
+            ),
+        ), [team_indexes]),
+        ("season teams", select(Team).where(Team.season_id == SEASON_ID, Team.status == "active"),
+            ["ix_team_season_status"]),
+        ("active challenges", select(func.count()).select_from(LadderChallenge).where(
+            LadderChallenge.status.in_(ACTIVE_CHALLENGE_STATUSES)),
+            ["ix_ladder_challenge_status_type"]),
+        ("ladder active challenges", select(LadderChallenge).where(
+            LadderChallenge.ladder_type == "men",
+            LadderChallenge.status.in_(ACTIVE_CHALLENGE_STATUSES)),
+            ["ix_ladder_challenge_status_type"]),
+        ("team challenge lock", select(LadderChallenge).where(
+            or_(LadderChallenge.challenger_team_id == TEAM_ID,
+                LadderChallenge.challenged_team_id == TEAM_ID),
+            LadderChallenge.status.in_(ACTIVE_CHALLENGE_STATUSES)),
+            ["ix_ladder_challenge_challenger_status", "ix_ladder_challenge_challenged_status"]),
+        ("recent ladder results", select(LadderMatch).where(
+            LadderMatch.ladder_type == "men", LadderMatch.verified == True
+        ).order_by(LadderMatch.completed_at.desc()).limit(10),
+            ["ix_ladder_match_type_verified_completed"]),
+        ("ladder matches this month", select(func.count()).select_from(LadderMatch).where(
+            LadderMatch.verified == True, LadderMatch.completed_at >= datetime(2026, 1, 1)),
+            ["ix_ladder_match_verified_completed"]),
+        ("challenge match", select(LadderMatch).where(LadderMatch.challenge_id == 5),
+            ["ix_ladder_match_challenge"]),
+        ("team pending ladder matches", select(func.count()).select_from(LadderMatch).where(
+            or_(LadderMatch.team_a_id == TEAM_ID, LadderMatch.team_b_id == TEAM_ID),
+            LadderMatch.verified == False,
+            LadderMatch.status.in_(["pending", "pending_opponent_score"])),
+            ["ix_ladder_match_team_a_status", "ix_ladder_match_team_b_status"]),
+        ("ladder table", select(LadderTeam).where(LadderTeam.ladder_type == "men")
+            .order_by(LadderTeam.current_rank),
+            ["ix_ladder_team_type_rank"]),
+        ("ladder rank shift", select(LadderTeam).where(
+            LadderTeam.ladder_type == "men", LadderTeam.current_rank > 3, LadderTeam.current_rank <= 9),
+            ["ix_ladder_team_type_rank"]),
+        ("americano schedule", select(AmericanoMatch).where(AmericanoMatch.tournament_id == 4)
+            .order_by(AmericanoMatch.round_number, AmericanoMatch.id),
+            ["ix_americano_match_tournament_round"]),
+        ("americano completed", select(AmericanoMatch).where(
+            AmericanoMatch.tournament_id == 4, AmericanoMatch.status == "completed"),
+            ["ix_americano_match_tournament_round"]),
+    ]
+
+
+def _explain(conn, prefix, statement):
+    compiled = statement.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.construct_params()
+    if compiled.positiontup:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return conn.exec_driver_sql(f"{prefix} {compiled.string}", params).fetchall()
+
+
+_SQLITE_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+
+
+def sqlite_plan(conn, statement):
+    """
+    (full scans, index lookups, index names) in the SQLite plan; a full scan is
+    "SCAN t", with or without an index
+    """
+    scans, lookups, indexes = [], [], set()
+    for _id, _parent, _unused, detail in _explain(conn, "EXPLAIN QUERY PLAN", statement):
+        if detail.startswith("SCAN ") and detail != "SCAN CONSTANT ROW":
+            scans.append(detail)
+        elif detail.startswith("SEARCH "):
+            lookups.append(detail)
+            indexes.update(_SQLITE_INDEX.findall(detail))
+    return scans, lookups, indexes
+
+
+def postgres_plan(conn, statement):
+    """(Seq Scans, index scans, index names) in the Postgres plan"""
+    plan = _explain(conn, "EXPLAIN (FORMAT JSON)", statement)[0][0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    scans, lookups, indexes = [], [], set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            scans.append(f"Seq Scan on {node.get('Relation Name')}")
+        elif "Index Name" in node:
+            lookups.append(f"{node['Node Type']} using {node['Index Name']}")
+            indexes.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return scans, lookups, indexes
+
+
+def _missing_indexes(expected, used):
+    """Expected indexes (or any-of groups) that the plan doesn't use"""
+    missing = []
+    for entry in expected:
+        choices = entry if isinstance(entry, tuple) else (entry,)
+        if not used.intersection(choices):
+            missing.append(" or ".join(choices))
+    return missing
+
+
+def run_checks(label, conn, explain_plan):
+    failures = 0
+    print(f"\n🔍 {label}")
+    for name, statement, expected in hot_queries():
+        scans, lookups, indexes = explain_plan(conn, statement)
+        missing = _missing_indexes(expected, indexes)
+        if scans or missing:
+            failures += 1
+            problems = scans + [f"not using {index}" for index in missing]
+            print(f"   ❌ {name}: {'; '.join(problems)} (plan: {'; '.join(lookups) or 'no index'})")
+        else:
+            print(f"   ✅ {name}: {'; '.join(lookups)}")
+    return failures
+
+
+def _load_sqlite_stats(conn):
+    """Fill sqlite_stat1 from TABLE_ROWS / DISTINCT_VALUES, assuming independent columns"""
+    conn.exec_driver_sql("ANALYZE")  # creates sqlite_stat1
+    for table in db.metadata.sorted_tables:
+        rows = TABLE_ROWS.get(table.name, 1000)
+        for index in table.indexes:
+            stat, distinct = [rows], 1
+            for column in index.columns:
+                distinct *= DISTINCT_VALUES.get(
+                    f"{table.name}.{column.name}", DISTINCT_VALUES.get(column.name, 100)
+                )
+                stat.append(max(1, round(rows / distinct)))
+            conn.exec_driver_sql(
+                "INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES (?, ?, ?)",
+                (table.name, index.name, " ".join(str(n) for n in stat)),
+            )
+    conn.commit()
+    conn.exec_driver_sql("ANALYZE sqlite_schema")  # reload the statistics
+
+
+def check_sqlite():
+    engine = create_engine("sqlite://")
+    db.metadata.create_all(engine)
+    with engine.connect() as conn:
+        _load_sqlite_stats(conn)
+        return run_checks("SQLite", conn, sqlite_plan)
+
+
+def check_postgres(url):
+    engine = create_engine(url)
+    schema = f"plan_check_{os.getpid()}"
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+            conn.execute(text(f"SET LOCAL search_path TO {schema}"))
+            db.metadata.create_all(conn)
+            conn.execute(text("SET LOCAL enable_seqscan = off"))
+            return run_checks("Postgres", conn, postgres_plan)
+        finally:
+            trans.rollback()
+
+
+def main(argv):
+    postgres_url = os.environ.get("PLAN_CHECK_POSTGRES_URL")
+    if "--postgres" in argv:
+        postgres_url = argv[argv.index("--postgres") + 1]
+    if postgres_url and postgres_url.startswith("postgres://"):
+        postgres_url = postgres_url.replace("postgres://", "postgresql://", 1)
+
+    failures = check_sqlite()
+    if postgres_url:
+        failures += check_postgres(postgres_url)
+    else:
+        print("\n⏭️  Postgres skipped (set PLAN_CHECK_POSTGRES_URL or pass --postgres URL)")
+
+    if failures:
+        print(f"\n❌ {failures} hot queries fall back to a sequential scan or miss their index")
+        return 1
+    print("\n✅ Every hot query is served by its index")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,399 @@
+"""
+Player contact index (player directory) for BD Padel League
+Maintains the player_contact table: one row per player identity across league
+teams, ladder teams, league/ladder free agents and Player records.
+
+Phones are stored normalized (normalize_phone_number) and reversed, so a
+lenient suffix match ("stored number is the tail of the incoming number",
+e.g. local number vs. number with country code) becomes an indexed IN lookup
+on phone_reversed instead of a scan over every team. Emails are stored
+lower-cased and trimmed, so identity checks by email or phone are a single
+probe on an indexed column instead of lower() scans over three tables.
+
+Rows are written by mapper event listeners, so every write path (registration,
+admin edits, deletes) keeps the index current. Importing this module registers
+the listeners; app_factory.py does so at startup.
+"""
+
+from sqlalchemy import event, inspect as sa_inspect, select, union
+from sqlalchemy.orm import aliased
+
+from models import (
+    db, PlayerContact, Team, LadderTeam, FreeAgent, LadderFreeAgent, Player
+)
+from utils import normalize_phone_number
+from data_versions import VersionedCache, mark_changed
+
+# Shortest stored number that may match as a suffix of a longer incoming number
+MIN_SUFFIX_DIGITS = 7
+
+# model -> (owner_type, gender attr, [(slot, name attr, phone attr, email attr), ...])
+INDEXED_MODELS = {
+    Team: ("team", None, [
+        (1, "player1_name", "player1_phone", "player1_email"),
+        (2, "player2_name", "player2_phone", "player2_email"),
+    ]),
+    LadderTeam: ("ladder_team", "gender", [
+        (1, "player1_name", "player1_phone", "player1_email"),
+        (2, "player2_name", "player2_phone", "player2_email"),
+    ]),
+    FreeAgent: ("free_agent", None, [(None, "name", "phone", "email")]),
+    LadderFreeAgent: ("ladder_free_agent", "gender", [(None, "name", "phone", "email")]),
+    Player: ("player", None, [(None, "name", "phone", "email")]),
+}
+
+OWNER_TYPES = [owner_type for owner_type, _gender, _fields in INDEXED_MODELS.values()]
+
+# Identity lookups (Americano registration) check these sources in priority order,
+# reported under the source_type names the registration flow already uses
+IDENTITY_SOURCES = [
+    ("ladder_free_agent", "free_agent"),
+    ("ladder_team", "ladder_team"),
+    ("team", "league_team"),
+]
+
+
+def phone_key(phone):
+    """Normalized digits used for indexing, or None if the phone has no digits"""
+    return normalize_phone_number(phone) if phone else None
+
+
+def email_key(email):
+    """Normalized email used for indexing, or None if empty"""
+    if not email:
+        return None
+    return email.strip().lower() or None
+
+
+def _contact_rows(model, target):
+    """Index rows for one model instance"""
+    owner_type, gender_attr, fields = INDEXED_MODELS[model]
+    gender = getattr(target, gender_attr) if gender_attr else None
+    rows = []
+    for slot, name_attr, phone_attr, email_attr in fields:
+        phone = getattr(target, phone_attr)
+        email = getattr(target, email_attr)
+        normalized_phone = phone_key(phone)
+        normalized_email = email_key(email)
+        if not normalized_phone and not normalized_email:
+            continue
+        rows.append({
+            "owner_type": owner_type,
+            "owner_id": target.id,
+            "slot": slot,
+            "name": getattr(target, name_attr),
+            "phone": phone,
+            "email": email,
+            "gender": gender,
+            "phone_normalized": normalized_phone,
+            "phone_reversed": normalized_phone[::-1] if normalized_phone else None,
+            "email_normalized": normalized_email,
+        })
+    return rows
+
+
+def _delete_rows(connection, owner_type, owner_id):
+    table = PlayerContact.__table__
+    connection.execute(
+        table.delete().where(
+            table.c.owner_type == owner_type,
+            table.c.owner_id == owner_id
+        )
+    )
+
+
+def _sync_rows(connection, model, target):
+    owner_type = INDEXED_MODELS[model][0]
+    _delete_rows(connection, owner_type, target.id)
+    rows = _contact_rows(model, target)
+    if rows:
+        connection.execute(PlayerContact.__table__.insert(), rows)
+
+
+def _indexed_fields_changed(model, target):
+    _owner_type, gender_attr, fields = INDEXED_MODELS[model]
+    attrs = [attr for field in fields for attr in field[1:]]
+    if gender_attr:
+        attrs.append(gender_attr)
+    state = sa_inspect(target)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+def _register_listeners(model):
+    @event.listens_for(model, "after_insert")
+    def _after_insert(mapper, connection, target):
+        _sync_rows(connection, model, target)
+        mark_changed(target, "player_directory")
+
+    @event.listens_for(model, "after_update")
+    def _after_update(mapper, connection, target):
+        if _indexed_fields_changed(model, target):
+            _sync_rows(connection, model, target)
+            mark_changed(target, "player_directory")
+
+    @event.listens_for(model, "after_delete")
+    def _after_delete(mapper, connection, target):
+        _delete_rows(connection, INDEXED_MODELS[model][0], target.id)
+        mark_changed(target, "player_directory")
+
+
+for _model in INDEXED_MODELS:
+    _register_listeners(_model)
+
+
+def lookup_phone(phone):
+    """
+    Resolve a phone number to every indexed owner in one indexed query.
+    A stored number matches if it equals the normalized input or is a suffix of it
+    (at least MIN_SUFFIX_DIGITS long), mirroring the old find_team_by_phone rule.
+
+    Returns: dict owner_type -> list of (owner_id, slot), best match first
+             (exact/longest match, then lowest id)
+    """
+    result = {owner_type: [] for owner_type in OWNER_TYPES}
+
+    normalized = phone_key(phone)
+    if not normalized:
+        return result
+
+    reversed_digits = normalized[::-1]
+    shortest = min(MIN_SUFFIX_DIGITS, len(reversed_digits))
+    candidates = [reversed_digits[:n] for n in range(shortest, len(reversed_digits) + 1)]
+
+    contacts = PlayerContact.query.filter(
+        PlayerContact.phone_reversed.in_(candidates)
+    ).all()
+    contacts.sort(key=lambda c: (-len(c.phone_reversed), c.owner_id, c.slot or 0))
+
+    for contact in contacts:
+        entry = (contact.owner_id, contact.slot)
+        if entry not in result[contact.owner_type]:
+            result[contact.owner_type].append(entry)
+    return result
+
+
+def find_owner_by_phone(phone, owner_type):
+    """Best-matching owner of a given type for a phone, or None (index probe + primary key get)"""
+    model = next(m for m, (t, _gender, _fields) in INDEXED_MODELS.items() if t == owner_type)
+    matches = lookup_phone(phone)[owner_type]
+    if not matches:
+        return None
+    return db.session.get(model, matches[0][0])
+
+
+NOT_FOUND = (None, None, None)
+
+
+def _identity_result(contact):
+    """(source_type, source_id, player_data) for a directory row"""
+    source_type = dict(IDENTITY_SOURCES)[contact.owner_type]
+    return source_type, contact.owner_id, {
+        'name': contact.name,
+        'phone': contact.phone,
+        'email': contact.email,
+        'gender': contact.gender
+    }
+
+
+def _lookup_identities(email_keys, phone_keys):
+    """
+    One indexed probe for any number of normalized emails and phones.
+    Returns: dict ("email" | "phone", key) -> (source_type, source_id, player_data) or NOT_FOUND
+    """
+    results = {("email", key): NOT_FOUND for key in email_keys}
+    results.update({("phone", key): NOT_FOUND for key in phone_keys})
+
+    conditions = []
+    if email_keys:
+        conditions.append(PlayerContact.email_normalized.in_(list(email_keys)))
+    if phone_keys:
+        conditions.append(PlayerContact.phone_normalized.in_(list(phone_keys)))
+    if not conditions:
+        return results
+
+    source_priority = {owner_type: idx for idx, (owner_type, _name) in enumerate(IDENTITY_SOURCES)}
+    contacts = PlayerContact.query.filter(
+        PlayerContact.owner_type.in_(list(source_priority)),
+        db.or_(*conditions)
+    ).all()
+    # Ladder free agents first, then ladder teams, then league teams (lowest id wins ties)
+    contacts.sort(key=lambda c: (source_priority[c.owner_type], c.owner_id, c.slot or 0))
+
+    for contact in contacts:
+        for key in (("email", contact.email_normalized), ("phone", contact.phone_normalized)):
+            if key in results and results[key] == NOT_FOUND:
+                results[key] = _identity_result(contact)
+    return results
+
+
+def find_existing_players(emails=(), phones=()):
+    """
+    Batched identity lookup for registration: every email and phone in one indexed probe.
+    Returns: dict ("email" | "phone", normalized value) -> (source_type, source_id, player_data)
+             or (None, None, None) when not found
+    """
+    email_keys = {key for key in map(email_key, emails) if key}
+    phone_keys = {key for key in map(phone_key, phones) if key}
+    return _lookup_identities(email_keys, phone_keys)
+
+
+def _pick_identity(results, email, phone):
+    """Email match wins over phone match, as in the original sequential lookups"""
+    email_result = results.get(("email", email_key(email)), NOT_FOUND)
+    if email_result[2]:
+        return email_result
+    return results.get(("phone", phone_key(phone)), NOT_FOUND)
+
+
+def find_existing_player(email=None, phone=None):
+    """
+    Identity lookup for registration: one indexed probe on normalized email OR phone.
+    Email matches win over phone matches; within each, ladder free agents come first,
+    then ladder teams, then league teams (same priority as before).
+
+    Returns: (source_type, source_id, player_data) or (None, None, None)
+    player_data contains: {'name': ..., 'phone': ..., 'email': ..., 'gender': ...}
+    """
+    results = find_existing_players(
+        emails=[email] if email else [],
+        phones=[phone] if phone else []
+    )
+    return _pick_identity(results, email, phone)
+
+
+# ============================================================================
+# FREE AGENT DUPLICATES
+# ============================================================================
+# free agent owner_type -> (team model, team owner_type, ladder types to check or None)
+# Ladder free agents are only flagged against Men's/Women's teams: a player in a
+# Mixed team may still look for a Men's/Women's partner.
+FREE_AGENT_TEAM_SOURCES = {
+    "free_agent": (Team, "team", None),
+    "ladder_free_agent": (LadderTeam, "ladder_team", ["men", "women"]),
+}
+
+
+def find_free_agent_team_matches(free_agents, owner_type="free_agent"):
+    """
+    Teams whose roster shares a (normalized) phone or email with each free agent,
+    for any number of free agents in one query.
+
+    Args:
+        free_agents: FreeAgent or LadderFreeAgent instances
+        owner_type: "free_agent" or "ladder_free_agent"
+
+    Returns: dict free agent id -> list of matching teams (lowest id first)
+    """
+    team_model, team_owner_type, ladder_types = FREE_AGENT_TEAM_SOURCES[owner_type]
+    agent_ids = [agent.id for agent in free_agents]
+    matches = {agent_id: [] for agent_id in agent_ids}
+    if not agent_ids:
+        return matches
+
+    agent_contact = aliased(PlayerContact)
+    team_contact = aliased(PlayerContact)
+
+    def _match_on(column):
+        return select(
+            agent_contact.owner_id.label("agent_id"),
+            team_contact.owner_id.label("team_id")
+        ).join(
+            team_contact, getattr(team_contact, column) == getattr(agent_contact, column)
+        ).where(
+            agent_contact.owner_type == owner_type,
+            agent_contact.owner_id.in_(agent_ids),
+            team_contact.owner_type == team_owner_type
+        )
+
+    # One branch per key, so each side of the join can use its index
+    pairs = union(_match_on("phone_normalized"), _match_on("email_normalized")).subquery()
+    query = db.session.query(pairs.c.agent_id, team_model).join(
+        team_model, team_model.id == pairs.c.team_id
+    )
+    if ladder_types:
+        query = query.filter(team_model.ladder_type.in_(ladder_types))
+
+    for agent_id, team in query.order_by(pairs.c.agent_id, team_model.id).all():
+        matches[agent_id].append(team)
+    return matches
+
+
+def group_free_agent_duplicates(free_agents, owner_type="free_agent"):
+    """
+    Split free agents into those already on a team and those still available.
+    Returns: {"duplicate": [{"agent": ..., "teams": [...]}, ...], "available": [agent, ...]}
+    """
+    matches = find_free_agent_team_matches(free_agents, owner_type)
+    groups = {"duplicate": [], "available": []}
+    for agent in free_agents:
+        if matches[agent.id]:
+            groups["duplicate"].append({"agent": agent, "teams": matches[agent.id]})
+        else:
+            groups["available"].append(agent)
+    return groups
+
+
+# ============================================================================
+# IDENTITY LOOKUP CACHE
+# ============================================================================
+# Per-process cache in front of the directory for /api/check-player, valid
+# until the directory's data version changes (see data_versions.py). Caches
+# misses too, so repeated lookups of unknown identifiers don't reach the
+# database.
+
+IDENTITY_CACHE_MAX_ENTRIES = 10000
+
+_identity_cache = VersionedCache("player_directory", max_entries=IDENTITY_CACHE_MAX_ENTRIES)
+
+
+def cached_find_existing_players(emails=(), phones=()):
+    """find_existing_players through the cache; only uncached keys hit the database"""
+    keys = [("email", key) for key in map(email_key, emails) if key]
+    keys += [("phone", key) for key in map(phone_key, phones) if key]
+    return _identity_cache.get_many(keys, lambda missing: _lookup_identities(
+        {value for kind, value in missing if kind == "email"},
+        {value for kind, value in missing if kind == "phone"}
+    ))
+
+
+def cached_find_existing_player(email=None, phone=None):
+    """find_existing_player through the cache"""
+    results = cached_find_existing_players(
+        emails=[email] if email else [],
+        phones=[phone] if phone else []
+    )
+    return _pick_identity(results, email, phone)
+
+
+def rebuild_contact_index():
+    """Rebuild the whole index from source tables (backfill / repair). Returns rows written."""
+    db.session.query(PlayerContact).delete()
+
+    rows = []
+    for model in INDEXED_MODELS:
+        for target in model.query.all():
+            rows.extend(_contact_rows(model, target))
+    if rows:
+        db.session.execute(PlayerContact.__table__.insert(), rows)
+
+    db.session.commit()
+    return len(rows)
+
+
+def ensure_contact_index():
+    """
+    Make sure player_contact exists with the current columns, rebuilding it if not.
+    The table only holds derived data, so an outdated one is dropped and recreated.
+    Returns the number of rows backfilled, or None if nothing needed doing.
+    """
+    inspector = sa_inspect(db.engine)
+    table = PlayerContact.__table__
+
+    if inspector.has_table(table.name):
+        existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+        if set(table.columns.keys()) <= existing_columns:
+            return None
+        table.drop(db.engine)
+
+    table.create(db.engine)
+    return rebuild_contact_index()
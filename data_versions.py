@@ -0,0 +1,186 @@
+"""
+Data Versions for BD Padel League
+Per-process caches of read models (the Americano schedule, ...) are keyed on a
+change counter kept in the database, so a write committed by any worker or
+script is picked up by every worker on its next read.
+
+Each read model has a row in data_version listing the tables it is built from
+(VERSIONED_MODELS). Any ORM write to those tables - flushed objects or bulk
+update()/delete() statements - bumps the row in the same transaction, so the
+new version becomes visible exactly when the write commits. A cache reads the
+version (one primary-key lookup) and rebuilds when it has moved on.
+
+Importing this module registers the listeners; app_factory.py does so at startup.
+"""
+
+import threading
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from models import (
+    db, DataVersion, AmericanoTournament, AmericanoMatch, LadderFreeAgent,
+    Season, Team, Match, Substitute, LeagueSettings, PlayerContact
+)
+
+# read model -> models it is built from. The player directory's rows are
+# written by contact_index.py's listeners, which call mark_changed() themselves.
+VERSIONED_MODELS = {
+    "americano_schedule": (AmericanoTournament, AmericanoMatch, LadderFreeAgent),
+    "league_rounds": (Match, Team, Substitute, LeagueSettings, Season),
+    "player_directory": (PlayerContact,),
+}
+
+_names_by_table = {}
+for _name, _models in VERSIONED_MODELS.items():
+    for _model in _models:
+        _names_by_table.setdefault(_model.__table__.name, set()).add(_name)
+
+
+def current_version(name):
+    """Committed version of a read model (0 before its first write)"""
+    version = db.session.execute(
+        select(DataVersion.version).where(DataVersion.name == name)
+    ).scalar()
+    return version or 0
+
+
+def _bump(connection, names):
+    for name in sorted(names):
+        result = connection.execute(
+            update(DataVersion).where(DataVersion.name == name).values(version=DataVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(DataVersion).values(name=name, version=1))
+
+
+def ensure_versions():
+    """Create the data_version rows, so concurrent first writes only ever update them"""
+    existing = set(db.session.execute(select(DataVersion.name)).scalars())
+    missing = [{"name": name, "version": 0} for name in VERSIONED_MODELS if name not in existing]
+    if missing:
+        db.session.execute(insert(DataVersion), missing)
+    return len(missing)
+
+
+class VersionedCache:
+    """
+    Per-process cache of values built from the database, valid while the read
+    model's data version is unchanged. Values built inside a transaction that
+    has itself written the read model are returned but not cached, since that
+    state may still roll back.
+    """
+
+    def __init__(self, name, max_entries=None):
+        self.name = name
+        self.max_entries = max_entries
+        self._entries = {}  # key -> (version, value)
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Cached value for key, calling build() when missing or outdated; None is never cached"""
+        version = current_version(self.name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version:
+                return entry[1]
+
+        value = build()
+        if value is not None and self._cacheable():
+            with self._lock:
+                self._make_room(version, 1)
+                self._entries[key] = (version, value)
+        return value
+
+    def get_many(self, keys, build_missing):
+        """
+        Cached values for several keys; build_missing(missing_keys) returns a
+        {key: value} dict for the keys without a current entry.
+        """
+        version = current_version(self.name)
+        values = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry and entry[0] == version:
+                    values[key] = entry[1]
+                else:
+                    missing.append(key)
+
+        if missing:
+            fetched = build_missing(missing)
+            if self._cacheable():
+                with self._lock:
+                    self._make_room(version, len(fetched))
+                    for key, value in fetched.items():
+                        self._entries[key] = (version, value)
+            values.update(fetched)
+        return values
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _cacheable(self):
+        return self.name not in db.session.info.get("data_versions_written", ())
+
+    def _make_room(self, version, count):
+        if self.max_entries is None or len(self._entries) + count <= self.max_entries:
+            return
+        for key in [k for k, (v, _value) in self._entries.items() if v != version]:
+            del self._entries[key]
+        if len(self._entries) + count > self.max_entries:
+            self._entries.clear()
+
+
+# ============================================================================
+# BUMPING
+# ============================================================================
+
+def _mark_written(session, names):
+    session.info.setdefault("data_versions_written", set()).update(names)
+
+
+def mark_changed(target, *names):
+    """Bump the named read models when the flush writing target completes"""
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("data_versions_pending", set()).update(names)
+
+
+def _row_changed(_mapper, _connection, target):
+    mark_changed(target, *_names_by_table[target.__table__.name])
+
+
+for _model in {m for models in VERSIONED_MODELS.values() for m in models}:
+    event.listen(_model, "after_insert", _row_changed)
+    event.listen(_model, "after_update", _row_changed)
+    event.listen(_model, "after_delete", _row_changed)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed(session, _flush_context):
+    names = session.info.pop("data_versions_pending", None)
+    if names:
+        _bump(session.connection(), names)
+        _mark_written(session, names)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk_write(execute_state):
+    # update()/delete()/insert() statements skip the mapper events above
+    if not (execute_state.is_update or execute_state.is_delete or execute_state.is_insert):
+        return
+    table = getattr(execute_state.statement, "table", None)
+    names = _names_by_table.get(getattr(table, "name", None))
+    if names:
+        _bump(execute_state.session.connection(), names)
+        _mark_written(execute_state.session, names)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _end_transaction(session):
+    session.info.pop("data_versions_written", None)
+    session.info.pop("data_versions_pending", None)
@@ -0,0 +1,278 @@
+"""
+Deadline Enforcement Engine for BD Padel League
+Applies automatic walkovers to league matches that missed their deadline:
+- Regular matches: round deadline (legacy Sunday 23:59 of the round week)
+- Makeup matches (pending reschedule): round deadline + 3 days (legacy Wednesday)
+
+All candidate matches are loaded in one query, team and player stat deltas are
+aggregated across every walkover and applied together, and the run commits once.
+A dry run computes the same report without touching the database.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy.orm import aliased
+
+from models import db, Match, Team, Player, Reschedule
+from utils import get_round_deadline, get_makeup_deadline
+
+WALKOVER_WIN_SCORE = "6-0, 6-0"
+WALKOVER_LOSS_SCORE = "0-6, 0-6"
+
+STAT_FIELDS = (
+    "wins", "losses", "draws", "points",
+    "sets_for", "sets_against", "games_for", "games_against",
+)
+
+
+def query_deadline_candidates():
+    """
+    Single query for every match that could be due a walkover: not completed,
+    both teams present, outer-joined to its pending reschedule (if any).
+    Returns a list of (match, team_a, team_b, pending_reschedule_or_None) rows.
+    """
+    team_a = aliased(Team)
+    team_b = aliased(Team)
+
+    return db.session.query(Match, team_a, team_b, Reschedule).join(
+        team_a, team_a.id == Match.team_a_id
+    ).join(
+        team_b, team_b.id == Match.team_b_id
+    ).outerjoin(
+        Reschedule, db.and_(
+            Reschedule.match_id == Match.id,
+            Reschedule.status == "pending"
+        )
+    ).filter(
+        Match.status.notin_(["completed", "walkover"])
+    ).order_by(Match.id, Reschedule.id).all()
+
+
+def _team_result_delta(sets_for, sets_against, games_for, games_against, won):
+    """Stat delta for one side of a walkover (walkovers always have a winner)"""
+    return {
+        "wins": 1 if won else 0,
+        "losses": 0 if won else 1,
+        "draws": 0,
+        "points": 3 if won else 0,
+        "sets_for": sets_for,
+        "sets_against": sets_against,
+        "games_for": games_for,
+        "games_against": games_against,
+    }
+
+
+def _roster_phones(team):
+    """Player phones for a team roster, matching update_player_stats_from_match"""
+    phones = [(1, team.player1_phone, team.player1_name, team.player1_email)]
+    if team.player2_phone != team.player1_phone:
+        phones.append((2, team.player2_phone, team.player2_name, team.player2_email))
+    return [entry for entry in phones if entry[1]]
+
+
+def _plan_walkovers(rows, now):
+    """Decide which candidate matches are past their deadline and who wins"""
+    planned = []
+    seen_match_ids = set()
+
+    for match, team_a, team_b, reschedule in rows:
+        # A match with several pending reschedules appears once per reschedule
+        if match.id in seen_match_ids:
+            continue
+        seen_match_ids.add(match.id)
+
+        if reschedule:
+            deadline = get_makeup_deadline(match, reschedule)
+            if not deadline or now <= deadline:
+                continue
+
+            # Makeup walkover - opponent of the requesting team wins
+            if match.team_a_id == reschedule.requester_team_id:
+                requester_team, opponent_team = team_a, team_b
+            else:
+                requester_team, opponent_team = team_b, team_a
+
+            planned.append({
+                "type": "makeup",
+                "match": match,
+                "team_a": team_a,
+                "team_b": team_b,
+                "winner": opponent_team,
+                "reschedule": reschedule,
+                "deadline": deadline,
+                "entry": {
+                    "match_id": match.id,
+                    "round": match.round,
+                    "requester_team": requester_team.team_name,
+                    "opponent_team": opponent_team.team_name,
+                    "deadline": deadline.strftime("%A, %B %d at %H:%M"),
+                    "type": "makeup",
+                },
+            })
+        else:
+            deadline = get_round_deadline(match)
+            if not deadline or now <= deadline:
+                continue
+
+            # Regular walkover - Team A wins by default (admin can override)
+            planned.append({
+                "type": "regular",
+                "match": match,
+                "team_a": team_a,
+                "team_b": team_b,
+                "winner": team_a,
+                "reschedule": None,
+                "deadline": deadline,
+                "entry": {
+                    "match_id": match.id,
+                    "round": match.round,
+                    "team_a": team_a.team_name,
+                    "team_b": team_b.team_name,
+                    "deadline": deadline.strftime("%A, %B %d at %H:%M"),
+                    "type": "regular",
+                },
+            })
+
+    return planned
+
+
+def run_deadline_enforcement(dry_run=False, now=None):
+    """
+    Find every match past its deadline and apply automatic walkovers in one batch.
+
+    Args:
+        dry_run: compute and return the report without changing anything
+        now: reference time (defaults to datetime.now())
+
+    Returns a report dict:
+        regular / makeup: walkovers applied (or that would be applied)
+        team_deltas: team_id -> team name and stat changes
+        player_deltas: phone -> player name and stat changes
+        candidates_checked, dry_run, run_at
+    """
+    now = now or datetime.now()
+
+    rows = query_deadline_candidates()
+    planned = _plan_walkovers(rows, now)
+
+    team_deltas = {}
+    player_deltas = {}
+    # phone -> list of (match, side, slot) links to fill once players are resolved
+    player_links = defaultdict(list)
+
+    for walkover in planned:
+        match = walkover["match"]
+        team_a, team_b = walkover["team_a"], walkover["team_b"]
+        a_wins = walkover["winner"].id == team_a.id
+
+        sets_a, sets_b = (2, 0) if a_wins else (0, 2)
+        games_a, games_b = (12, 0) if a_wins else (0, 12)
+        walkover["result"] = {
+            "winner_id": walkover["winner"].id,
+            "score_a": WALKOVER_WIN_SCORE if a_wins else WALKOVER_LOSS_SCORE,
+            "score_b": WALKOVER_LOSS_SCORE if a_wins else WALKOVER_WIN_SCORE,
+            "sets_a": sets_a,
+            "sets_b": sets_b,
+            "games_a": games_a,
+            "games_b": games_b,
+        }
+
+        # Stats are only counted once per match
+        if match.stats_calculated:
+            continue
+
+        for side, team, delta in (
+            ("a", team_a, _team_result_delta(sets_a, sets_b, games_a, games_b, a_wins)),
+            ("b", team_b, _team_result_delta(sets_b, sets_a, games_b, games_a, not a_wins)),
+        ):
+            team_total = team_deltas.setdefault(
+                team.id, {"team_name": team.team_name, **{f: 0 for f in STAT_FIELDS}}
+            )
+            for field in STAT_FIELDS:
+                team_total[field] += delta[field]
+
+            for slot, phone, name, email in _roster_phones(team):
+                player_total = player_deltas.setdefault(
+                    phone, {
+                        "name": name, "email": email, "team_id": team.id,
+                        "matches_played": 0, **{f: 0 for f in STAT_FIELDS}
+                    }
+                )
+                player_total["matches_played"] += 1
+                for field in STAT_FIELDS:
+                    player_total[field] += delta[field]
+                player_links[phone].append((match, side, slot))
+
+    report = {
+        "run_at": now.strftime("%Y-%m-%d %H:%M:%S"),
+        "dry_run": dry_run,
+        "candidates_checked": len({row[0].id for row in rows}),
+        "regular": [w["entry"] for w in planned if w["type"] == "regular"],
+        "makeup": [w["entry"] for w in planned if w["type"] == "makeup"],
+        "team_deltas": team_deltas,
+        "player_deltas": player_deltas,
+    }
+
+    if dry_run or not planned:
+        return report
+
+    # Apply match results
+    for walkover in planned:
+        match = walkover["match"]
+        match.status = "completed"
+        match.verified = True
+        for field, value in walkover["result"].items():
+            setattr(match, field, value)
+        match.stats_calculated = True
+        if walkover["reschedule"]:
+            walkover["reschedule"].status = "expired_walkover"
+
+    # Apply team deltas (teams are already loaded by the candidate query)
+    teams_by_id = {}
+    for walkover in planned:
+        teams_by_id[walkover["team_a"].id] = walkover["team_a"]
+        teams_by_id[walkover["team_b"].id] = walkover["team_b"]
+    for team_id, delta in team_deltas.items():
+        team = teams_by_id[team_id]
+        for field in STAT_FIELDS:
+            setattr(team, field, (getattr(team, field) or 0) + delta[field])
+
+    # Resolve all players in one query, creating any that don't exist yet
+    if player_deltas:
+        players_by_phone = {
+            p.phone: p for p in Player.query.filter(Player.phone.in_(list(player_deltas))).all()
+        }
+        created_at = now.strftime("%Y-%m-%d %H:%M:%S")
+        for phone, delta in player_deltas.items():
+            if phone not in players_by_phone:
+                player = Player(
+                    name=delta["name"],
+                    phone=phone,
+                    email=delta["email"],
+                    current_team_id=delta["team_id"],
+                    created_at=created_at
+                )
+                db.session.add(player)
+                players_by_phone[phone] = player
+        db.session.flush()
+
+        for phone, delta in player_deltas.items():
+            player = players_by_phone[phone]
+            player.matches_played = (player.matches_played or 0) + delta["matches_played"]
+            for field in STAT_FIELDS:
+                setattr(player, field, (getattr(player, field) or 0) + delta[field])
+
+            # Link players to the matches they were credited for
+            for match, side, slot in player_links[phone]:
+                attr = f"team_{side}_player{slot}_id"
+                if not getattr(match, attr):
+                    setattr(match, attr, player.id)
+
+    db.session.commit()
+
+    print(
+        f"[DEADLINE ENGINE] Applied {len(report['regular'])} regular and "
+        f"{len(report['makeup'])} makeup walkovers at {report['run_at']}"
+    )
+    return report
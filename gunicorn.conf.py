@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for BD Padel League
+Gunicorn reads this file from the working directory on its own; the Procfile /
+render.yaml command lines still choose workers, threads and bind.
+
+Sets up the directory prometheus_client shares between worker processes so
+/metrics reports every worker, not just the one that answered (see app_metrics.py).
+Assumes the app is loaded in the workers (no --preload).
+"""
+
+import os
+import shutil
+
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/padel-league-metrics")
+
+
+def on_starting(server):
+    # Files left by a previous master would be added to this one's totals
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+def child_exit(server, worker):
+    # Drop the dead worker's live gauges (in-progress requests, pool connections)
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
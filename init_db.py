@@ -1,13 +1,19 @@
 """
 Database Initialization Script for Production
-Creates all tables in the database. Run this on first deployment.
+Creates the tables in the database (only those that are missing - existing
+tables are never altered) and builds the player directory. Run this on first
+deployment, or as the release step when web workers run with
+DB_INIT_ON_STARTUP=false.
 
 Usage: python init_db.py
 """
 
 import os
 from dotenv import load_dotenv
-from app import app, db
+from app_factory import create_app, init_db
+from models import db
+
+app = create_app(blueprints=())  # database only, no routes
 
 load_dotenv()
 
@@ -16,19 +22,13 @@ def init_database():
     with app.app_context():
         print("🔧 Initializing database...")
         print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
-        
-        # Create all tables
-        db.create_all()
-        
+
+        # Create missing tables and the derived player directory
+        if not init_db():
+            raise SystemExit("❌ Database initialization failed")
+
         print("✅ Database initialized successfully!")
-        print("📋 Tables created:")
-        print("   - teams")
-        print("   - players")
-        print("   - free_agents")
-        print("   - matches")
-        print("   - reschedules")
-        print("   - substitutes")
+        print(f"📋 {len(db.metadata.tables)} tables in the schema")
 
 if __name__ == "__main__":
     init_database()
-
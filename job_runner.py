@@ -0,0 +1,311 @@
+"""
+Scheduled Job Runner for BD Padel League
+Runs the jobs in scheduled_tasks.py on an APScheduler scheduler with a
+database-backed job store, so schedules survive restarts.
+
+Several processes may run this at once (the dedicated worker plus gunicorn
+workers with RUN_SCHEDULER_IN_WEB=true). A lease row in scheduler_lease elects
+a single leader; only the leader's scheduler is unpaused. As a second guard,
+every run claims its interval in scheduled_job_run with a conditional UPDATE,
+so a job executes at most once per interval even during a leader hand-over.
+"""
+
+import os
+import socket
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from models import db, SchedulerLease, ScheduledJobRun
+
+LEASE_NAME = "scheduler"
+LEASE_SECONDS = int(os.environ.get("SCHEDULER_LEASE_SECONDS", "90"))
+LEASE_RENEW_SECONDS = max(5, LEASE_SECONDS // 3)
+
+# job_id -> (task reference, trigger, trigger args, minimum seconds between runs)
+# Hourly jobs are cron-pinned to a minute, so their run times don't depend on
+# when a leader registered them.
+JOBS = {
+    "match_reminders": (
+        "scheduled_tasks:send_match_reminders", "cron", {"minute": 0}, 50 * 60
+    ),
+    "walkover_warnings": (
+        "scheduled_tasks:send_walkover_warnings", "cron", {"hour": 10, "minute": 0}, 20 * 3600
+    ),
+    "deadline_enforcement": (
+        "scheduled_tasks:enforce_deadlines", "cron", {"hour": 0, "minute": 15}, 20 * 3600
+    ),
+    "ladder_penalties": (
+        "scheduled_tasks:sweep_ladder_penalties", "cron", {"minute": 30}, 50 * 60
+    ),
+}
+
+HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+
+_flask_app = None
+_scheduler = None
+_is_leader = False
+_stop_event = threading.Event()
+
+
+# ============================================================================
+# LEADER ELECTION
+# ============================================================================
+
+def try_acquire_lease():
+    """
+    Acquire or renew the scheduler lease. Returns True if this process is the leader.
+    The UPDATE only succeeds if we already hold the lease or it has expired.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=LEASE_SECONDS)
+
+    result = db.session.execute(text("""
+        UPDATE scheduler_lease
+        SET holder = :holder, expires_at = :expires_at,
+            acquired_at = CASE WHEN holder = :holder THEN acquired_at ELSE :now END
+        WHERE name = :name AND (holder = :holder OR expires_at < :now)
+    """), {"holder": HOLDER_ID, "expires_at": expires_at, "now": now, "name": LEASE_NAME})
+    db.session.commit()
+    if result.rowcount == 1:
+        return True
+
+    if db.session.get(SchedulerLease, LEASE_NAME) is not None:
+        return False
+
+    # First run ever: whoever inserts the row wins
+    try:
+        db.session.add(SchedulerLease(
+            name=LEASE_NAME, holder=HOLDER_ID, expires_at=expires_at, acquired_at=now
+        ))
+        db.session.commit()
+        return True
+    except IntegrityError:
+        db.session.rollback()
+        return False
+
+
+def release_lease():
+    """Give up the lease on shutdown so another process can take over immediately"""
+    db.session.execute(text("""
+        DELETE FROM scheduler_lease WHERE name = :name AND holder = :holder
+    """), {"name": LEASE_NAME, "holder": HOLDER_ID})
+    db.session.commit()
+
+
+def holds_lease():
+    """Check (without renewing) that this process still holds an unexpired lease"""
+    lease = db.session.get(SchedulerLease, LEASE_NAME)
+    db.session.commit()
+    return bool(lease and lease.holder == HOLDER_ID and lease.expires_at > datetime.utcnow())
+
+
+# ============================================================================
+# JOB EXECUTION
+# ============================================================================
+
+def claim_job_run(job_id, min_interval_seconds):
+    """
+    Atomically claim this interval's run of a job.
+    Returns True if the caller should run it, False if it already ran recently.
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=min_interval_seconds)
+
+    result = db.session.execute(text("""
+        UPDATE scheduled_job_run
+        SET last_run_at = :now, holder = :holder, last_status = 'running'
+        WHERE job_id = :job_id AND (last_run_at IS NULL OR last_run_at <= :cutoff)
+    """), {"now": now, "holder": HOLDER_ID, "job_id": job_id, "cutoff": cutoff})
+    db.session.commit()
+    if result.rowcount == 1:
+        return True
+
+    if db.session.get(ScheduledJobRun, job_id) is not None:
+        return False
+
+    try:
+        db.session.add(ScheduledJobRun(
+            job_id=job_id, holder=HOLDER_ID, last_run_at=now, last_status="running"
+        ))
+        db.session.commit()
+        return True
+    except IntegrityError:
+        db.session.rollback()
+        return False
+
+
+def run_job(job_id):
+    """
+    Entry point APScheduler calls for every job (stored by reference in the job store).
+    Skips the run unless this process is the leader and wins the interval claim.
+    """
+    from apscheduler.util import ref_to_obj
+
+    task_ref, _trigger, _trigger_args, min_interval = JOBS[job_id]
+
+    with _flask_app.app_context():
+        if not holds_lease():
+            print(f"[JOB RUNNER] Skipping {job_id}: not the leader")
+            return
+        if not claim_job_run(job_id, min_interval):
+            print(f"[JOB RUNNER] Skipping {job_id}: already ran this interval")
+            return
+
+    started = time.monotonic()
+    status, outcome = "success", None
+    try:
+        with _flask_app.app_context():
+            outcome = ref_to_obj(task_ref)()
+    except Exception as e:
+        status, outcome = "failed", e
+        print(f"[JOB RUNNER] {job_id} failed: {e}")
+    duration_ms = int((time.monotonic() - started) * 1000)
+
+    with _flask_app.app_context():
+        db.session.rollback()  # discard anything a failed task left behind
+        job_run = db.session.get(ScheduledJobRun, job_id)
+        if job_run:
+            job_run.last_finished_at = datetime.utcnow()
+            job_run.last_duration_ms = duration_ms
+            job_run.last_status = status
+            job_run.last_result = str(outcome)[:200] if outcome is not None else None
+            db.session.commit()
+
+    print(f"[JOB RUNNER] {job_id} {status} in {duration_ms} ms")
+
+
+# ============================================================================
+# SCHEDULER LIFECYCLE
+# ============================================================================
+
+def create_scheduler(flask_app):
+    """Build an APScheduler backed by the app database"""
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    jobstores = {
+        "default": SQLAlchemyJobStore(url=flask_app.config["SQLALCHEMY_DATABASE_URI"])
+    }
+    job_defaults = {
+        "coalesce": True,         # collapse missed runs into one
+        "max_instances": 1,
+        "misfire_grace_time": 15 * 60,
+    }
+    return BackgroundScheduler(
+        jobstores=jobstores,
+        job_defaults=job_defaults,
+        timezone=os.environ.get("SCHEDULER_TIMEZONE") or None
+    )
+
+
+def _build_trigger(scheduler, trigger, trigger_args):
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    trigger_class = {"cron": CronTrigger, "interval": IntervalTrigger}[trigger]
+    return trigger_class(timezone=scheduler.timezone, **trigger_args)
+
+
+def _register_jobs(scheduler):
+    """
+    Write job definitions into the job store; only the leader does this.
+    Jobs already stored with the same trigger are left alone, so a new leader
+    keeps their next run time (and any run missed during the hand-over).
+    """
+    for job_id, (_task_ref, trigger, trigger_args, _min_interval) in JOBS.items():
+        new_trigger = _build_trigger(scheduler, trigger, trigger_args)
+        existing = scheduler.get_job(job_id)
+        if existing is not None and str(existing.trigger) == str(new_trigger):
+            continue
+        scheduler.add_job(
+            "job_runner:run_job",
+            trigger=new_trigger,
+            args=[job_id],
+            id=job_id,
+            name=job_id,
+            replace_existing=True,
+        )
+        print(f"[JOB RUNNER] Registered {job_id}: {new_trigger}")
+
+
+def _election_loop():
+    """Renew or contend for the lease; unpause the scheduler only while leader"""
+    global _is_leader
+
+    while not _stop_event.is_set():
+        try:
+            with _flask_app.app_context():
+                leader = try_acquire_lease()
+        except Exception as e:
+            print(f"[JOB RUNNER] Lease check failed: {e}")
+            leader = False
+
+        if leader and not _is_leader:
+            print(f"[JOB RUNNER] {HOLDER_ID} became scheduler leader")
+            _register_jobs(_scheduler)
+            _scheduler.resume()
+        elif not leader and _is_leader:
+            print(f"[JOB RUNNER] {HOLDER_ID} lost scheduler leadership")
+            _scheduler.pause()
+        _is_leader = leader
+
+        _stop_event.wait(LEASE_RENEW_SECONDS)
+
+
+def _ensure_tables():
+    """Create the lease and job-run tables if migrations haven't yet"""
+    SchedulerLease.__table__.create(db.engine, checkfirst=True)
+    ScheduledJobRun.__table__.create(db.engine, checkfirst=True)
+
+
+def start_background_scheduler(flask_app):
+    """
+    Start the scheduler in a background thread of a web process.
+    Safe to call from every gunicorn worker: only the elected leader runs jobs.
+    """
+    global _flask_app, _scheduler
+
+    if _scheduler is not None:
+        return _scheduler
+
+    _flask_app = flask_app
+    with flask_app.app_context():
+        _ensure_tables()
+
+    _scheduler = create_scheduler(flask_app)
+    _scheduler.start(paused=True)
+
+    threading.Thread(target=_election_loop, name="scheduler-election", daemon=True).start()
+    print(f"[JOB RUNNER] Background scheduler started ({HOLDER_ID})")
+    return _scheduler
+
+
+def run_worker(flask_app):
+    """Run the scheduler in the foreground (dedicated worker process) until interrupted"""
+    start_background_scheduler(flask_app)
+    try:
+        while True:
+            time.sleep(60)
+    except (KeyboardInterrupt, SystemExit):
+        print("\n[JOB RUNNER] Shutting down...")
+    finally:
+        shutdown()
+
+
+def shutdown():
+    """Stop the scheduler and hand the lease back"""
+    global _scheduler, _is_leader
+
+    _stop_event.set()
+    if _scheduler is not None:
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
+    if _is_leader and _flask_app is not None:
+        with _flask_app.app_context():
+            release_lease()
+    _is_leader = False
@@ -0,0 +1,211 @@
+"""
+Knockout Bracket Engine for BD Padel League
+Single-elimination brackets of any size (4, 8, 16, 32, ...) kept as an
+implicit binary heap: node 1 is the final and node n is fed by nodes 2n
+(team A) and 2n+1 (team B). A bracket of `size` slots has size - 1 matches,
+the first round being nodes size/2 .. size-1, so the match a winner advances
+to is always node // 2 - no per-slot lookup tables.
+
+A field that isn't a power of two is padded to the next one; the missing
+seeds are byes, which fall to the top seeds. Bracket slots keep their
+familiar labels (QF1, SF2, FINAL, R16-3, ...) and map to heap nodes both ways.
+"""
+
+FINAL_NODE = 1
+THIRD_PLACE_SLOT = "3RD"
+
+# Phase names stored on Match.phase, by depth below the final
+_NAMED_PHASES = ["final", "semifinal", "quarterfinal"]
+_SLOT_PREFIXES = {"semifinal": "SF", "quarterfinal": "QF"}
+_PHASE_TITLES = {"final": "Finals", "semifinal": "Semi-Finals", "quarterfinal": "Quarter-Finals"}
+
+
+def bracket_size(num_teams):
+    """Smallest power of two that fits num_teams (at least 2)"""
+    size = 2
+    while size < num_teams:
+        size *= 2
+    return size
+
+
+def num_rounds(size):
+    return size.bit_length() - 1
+
+
+def node_depth(node):
+    """0 for the final, 1 for the semi-finals, ..."""
+    return node.bit_length() - 1
+
+
+def level_nodes(depth):
+    """Heap nodes of one round, in bracket order (top to bottom)"""
+    return range(2 ** depth, 2 ** (depth + 1))
+
+
+def phase_for_depth(depth):
+    if depth < len(_NAMED_PHASES):
+        return _NAMED_PHASES[depth]
+    return f"round_of_{2 ** (depth + 1)}"
+
+
+def depth_for_phase(phase):
+    """Inverse of phase_for_depth; None for non-bracket phases (swiss, third_place)"""
+    if phase in _NAMED_PHASES:
+        return _NAMED_PHASES.index(phase)
+    if phase and phase.startswith("round_of_"):
+        try:
+            teams = int(phase[len("round_of_"):])
+        except ValueError:
+            return None
+        if teams >= 16 and teams & (teams - 1) == 0:
+            return num_rounds(teams) - 1
+    return None
+
+
+def phase_title(phase):
+    if phase in _PHASE_TITLES:
+        return _PHASE_TITLES[phase]
+    if phase == "third_place":
+        return "3rd Place"
+    depth = depth_for_phase(phase)
+    return f"Round of {2 ** (depth + 1)}" if depth is not None else phase.title()
+
+
+def slot_label(node):
+    """Heap node -> bracket_slot label: 1 -> FINAL, 2 -> SF1, 5 -> QF2, 9 -> R16-2"""
+    depth = node_depth(node)
+    if depth == 0:
+        return "FINAL"
+    number = node - 2 ** depth + 1
+    phase = phase_for_depth(depth)
+    if phase in _SLOT_PREFIXES:
+        return f"{_SLOT_PREFIXES[phase]}{number}"
+    return f"R{2 ** (depth + 1)}-{number}"
+
+
+def slot_node(label):
+    """bracket_slot label -> heap node, or None (3RD place, unknown labels)"""
+    if not label:
+        return None
+    if label in ("FINAL", "F1"):
+        return FINAL_NODE
+    if label.startswith("R") and "-" in label:
+        teams, _, number = label[1:].partition("-")
+        depth = depth_for_phase(f"round_of_{teams}")
+    else:
+        prefix, number = label[:2], label[2:]
+        depth = next((_NAMED_PHASES.index(p) for p, s in _SLOT_PREFIXES.items() if s == prefix), None)
+    if depth is None or not number.isdigit() or not 1 <= int(number) <= 2 ** depth:
+        return None
+    return 2 ** depth + int(number) - 1
+
+
+def is_knockout_match(match):
+    """Playoff matches carry a bracket slot (the 3rd place match included)"""
+    return bool(match.bracket_slot)
+
+
+def advance_target(node):
+    """(next node, 'a' or 'b') for the winner of node; None for the final"""
+    if node <= FINAL_NODE:
+        return None
+    return node // 2, "a" if node % 2 == 0 else "b"
+
+
+def seed_order(size):
+    """
+    Seeds in first-round slot order so that the top seeds only meet late:
+    size 8 -> [1, 8, 4, 5, 2, 7, 3, 6] (1v8, 4v5 | 2v7, 3v6)
+    """
+    order = [1]
+    while len(order) < size:
+        total = 2 * len(order) + 1
+        order = [seed for s in order for seed in (s, total - s)]
+    return order
+
+
+def first_round(team_ids):
+    """
+    First-round matchups for teams listed in seed order:
+    [(node, seed_a, seed_b, team_a_id, team_b_id), ...] in bracket order.
+    team_b_id (and seed_b) are None for a bye.
+    """
+    size = bracket_size(len(team_ids))
+    order = seed_order(size)
+    first_node = size // 2
+    matchups = []
+    for i in range(0, size, 2):
+        seed_a, seed_b = order[i], order[i + 1]
+        if seed_b > len(team_ids):
+            seed_b = None
+        matchups.append((
+            first_node + i // 2,
+            seed_a,
+            seed_b,
+            team_ids[seed_a - 1],
+            team_ids[seed_b - 1] if seed_b else None,
+        ))
+    return matchups
+
+
+def round_offset(node, size):
+    """0 for the first round of a bracket of `size`, up to num_rounds - 1 for the final"""
+    return num_rounds(size) - 1 - node_depth(node)
+
+
+def size_for_matches(matches, num_teams=0):
+    """Bracket size covering num_teams and every stored match's slot"""
+    size = bracket_size(num_teams)
+    for match in matches:
+        node = slot_node(match.bracket_slot)
+        if node:
+            size = max(size, 2 ** node.bit_length())
+    return size
+
+
+def build_bracket(size, matches):
+    """
+    Heap array for a bracket: bracket[node] is a dict with node, slot, phase,
+    match (or None), team_a_id, team_b_id, seed_a, seed_b, winner_id.
+    Rounds not generated yet are filled from the feeder matches' winners.
+    Index 0 is unused.
+    """
+    by_node = {}
+    for match in matches:
+        node = slot_node(match.bracket_slot)
+        if node and node < size:
+            by_node[node] = match
+
+    bracket = [None] * size
+    # Bottom-up so feeder winners are known when a node is filled
+    for node in range(size - 1, 0, -1):
+        match = by_node.get(node)
+        entry = {
+            "node": node,
+            "slot": slot_label(node),
+            "phase": phase_for_depth(node_depth(node)),
+            "match": match,
+            "team_a_id": match.team_a_id if match else None,
+            "team_b_id": match.team_b_id if match else None,
+            "seed_a": match.seed_a if match else None,
+            "seed_b": match.seed_b if match else None,
+            "winner_id": match.winner_id if match else None,
+        }
+        if 2 * node < size:
+            feeder_a, feeder_b = bracket[2 * node], bracket[2 * node + 1]
+            if not match:
+                entry["team_a_id"] = feeder_a["winner_id"]
+                entry["team_b_id"] = feeder_b["winner_id"]
+            entry["source_a"] = f"Winner {feeder_a['slot']}"
+            entry["source_b"] = f"Winner {feeder_b['slot']}"
+        bracket[node] = entry
+    return bracket
+
+
+def bracket_rounds(bracket):
+    """The heap array as columns, first round to final: [(phase, [entries]), ...]"""
+    size = len(bracket)
+    return [
+        (phase_for_depth(depth), [bracket[node] for node in level_nodes(depth)])
+        for depth in range(num_rounds(size) - 1, -1, -1)
+    ]
@@ -0,0 +1,268 @@
+"""
+Ladder Rules for BD Padel League
+Rank changes and penalties for the ladder: rank penalties, holiday status,
+team statistics from verified matches and the winner/loser rank swap.
+Used by the ladder pages and the scheduled penalty sweep.
+"""
+
+from models import db, LadderTeam, LadderSettings
+
+
+def apply_rank_penalty(team, penalty_amount, reason):
+    """
+    Apply rank penalty to a team and adjust other teams accordingly.
+
+    Args:
+        team: LadderTeam object to penalize
+        penalty_amount: Number of ranks to move down (positive number)
+        reason: String describing the penalty reason
+    """
+    from datetime import datetime
+    from utils import send_email_notification
+
+    # Check if penalties are active
+    settings = LadderSettings.query.first()
+    if not settings or not settings.penalties_active:
+        return
+
+    if penalty_amount <= 0:
+        return
+
+    old_rank = team.current_rank
+    new_rank = old_rank + penalty_amount
+
+    teams_in_ladder = LadderTeam.query.filter_by(ladder_type=team.ladder_type).all()
+    max_rank = len(teams_in_ladder)
+
+    if new_rank > max_rank:
+        new_rank = max_rank
+
+    teams_to_adjust = LadderTeam.query.filter(
+        LadderTeam.ladder_type == team.ladder_type,
+        LadderTeam.current_rank > old_rank,
+        LadderTeam.current_rank <= new_rank,
+        LadderTeam.id != team.id
+    ).all()
+
+    for t in teams_to_adjust:
+        t.current_rank -= 1
+
+    team.current_rank = new_rank
+
+    db.session.commit()
+
+    penalty_message = f"""Hi {team.player1_name},
+
+LADDER PENALTY APPLIED
+
+Your team "{team.team_name}" has received a rank penalty on the {team.ladder_type.title()} Ladder.
+
+Penalty Details:
+- Reason: {reason}
+- Previous Rank: #{old_rank}
+- New Rank: #{new_rank}
+- Penalty: {penalty_amount} rank(s) down
+- Date: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
+
+This penalty was automatically applied by the ladder system. If you have any questions or wish to dispute this penalty, please contact the league administrator at goeclecticbd@gmail.com.
+
+Regards,
+BD Padel Ladder Team
+"""
+
+    admin_email = "goeclecticbd@gmail.com"
+    subject = f"Ladder Penalty Applied - {team.team_name}"
+
+    if team.contact_preference_email:
+        if team.player1_email:
+            send_email_notification(team.player1_email, subject, penalty_message)
+        if team.player2_email and team.player2_email != team.player1_email:
+            send_email_notification(team.player2_email, subject, penalty_message)
+        
+        # CC Admin
+        send_email_notification(admin_email, f"CC: {subject}", penalty_message)
+
+
+def calculate_holiday_status(team, settings):
+    """
+    Calculate holiday mode status for a team.
+
+    Args:
+        team: LadderTeam object
+        settings: LadderSettings object
+
+    Returns:
+        Dictionary with holiday status info or None if not on holiday
+    """
+    from datetime import datetime, timedelta
+
+    if not team.holiday_mode_active or not team.holiday_mode_start:
+        return None
+
+    now = datetime.now()
+    grace_period_days = settings.holiday_mode_grace_weeks * 7
+    grace_period_end = team.holiday_mode_start + timedelta(days=grace_period_days)
+
+    days_in_holiday = (now - team.holiday_mode_start).days
+    grace_period_days_remaining = (grace_period_end - now).days
+
+    weeks_beyond_grace = 0
+    penalty_ranks = 0
+    if grace_period_days_remaining < 0:
+        days_beyond_grace = abs(grace_period_days_remaining)
+        weeks_beyond_grace = (days_beyond_grace // 7) + (1 if days_beyond_grace % 7 > 0 else 0)
+        penalty_ranks = weeks_beyond_grace * settings.holiday_mode_weekly_penalty_ranks
+
+    return {
+        'start_date': team.holiday_mode_start,
+        'days_in_holiday': days_in_holiday,
+        'grace_period_days_remaining': max(0, grace_period_days_remaining),
+        'is_in_grace_period': grace_period_days_remaining >= 0,
+        'weeks_beyond_grace': weeks_beyond_grace,
+        'penalty_ranks': penalty_ranks
+    }
+
+
+def update_ladder_team_stats_from_match(match):
+    """Update ladder team statistics after a verified match"""
+    from datetime import datetime
+
+    if match.stats_calculated:
+        return
+
+    team_a = LadderTeam.query.get(match.team_a_id)
+    team_b = LadderTeam.query.get(match.team_b_id)
+
+    if not team_a or not team_b:
+        return
+
+    team_a.sets_for += match.sets_a
+    team_a.sets_against += match.sets_b
+    team_a.games_for += match.games_a
+    team_a.games_against += match.games_b
+
+    team_b.sets_for += match.sets_b
+    team_b.sets_against += match.sets_a
+    team_b.games_for += match.games_b
+    team_b.games_against += match.games_a
+
+    if match.winner_id == team_a.id:
+        team_a.wins += 1
+        team_b.losses += 1
+    elif match.winner_id == team_b.id:
+        team_b.wins += 1
+        team_a.losses += 1
+    else:
+        team_a.draws += 1
+        team_b.draws += 1
+
+    team_a.last_match_date = datetime.now()
+    team_b.last_match_date = datetime.now()
+
+    match.stats_calculated = True
+    db.session.commit()
+
+
+def swap_ladder_ranks(winner_team, loser_team, match):
+    """
+    Swap ladder ranks after a match result.
+    Winner takes loser's rank, and all teams shift accordingly.
+
+    Args:
+        winner_team: LadderTeam object of the winning team
+        loser_team: LadderTeam object of the losing team
+        match: LadderMatch object
+
+    Returns:
+        dict with rank change information for logging and notifications
+    """
+    import logging
+
+    winner_rank = winner_team.current_rank
+    loser_rank = loser_team.current_rank
+    ladder_type = winner_team.ladder_type
+
+    logging.info(f"[RANK SWAP] Match ID {match.id}: {winner_team.team_name} (#{winner_rank}) vs {loser_team.team_name} (#{loser_rank})")
+
+    if winner_rank == loser_rank:
+        logging.warning(f"[RANK SWAP] Equal ranks detected (both #{winner_rank}) - no rank change")
+        return {
+            'winner_old_rank': winner_rank,
+            'winner_new_rank': winner_rank,
+            'loser_old_rank': loser_rank,
+            'loser_new_rank': loser_rank,
+            'teams_affected': []
+        }
+
+    all_teams = LadderTeam.query.filter_by(ladder_type=ladder_type).order_by(LadderTeam.current_rank).all()
+
+    rank_changes = {
+        'winner': {'old': winner_rank, 'new': 0},
+        'loser': {'old': loser_rank, 'new': 0},
+        'teams_affected': []
+    }
+
+    if winner_rank > loser_rank:
+        logging.info(f"[RANK SWAP] Winner challenged UP: #{winner_rank} → #{loser_rank}")
+
+        new_winner_rank = loser_rank
+        new_loser_rank = loser_rank + 1
+
+        for team in all_teams:
+            if team.id == winner_team.id:
+                team.current_rank = new_winner_rank
+                logging.info(f"[RANK SWAP]   {team.team_name}: #{winner_rank} → #{new_winner_rank} (WINNER)")
+            elif team.id == loser_team.id:
+                team.current_rank = new_loser_rank
+                logging.info(f"[RANK SWAP]   {team.team_name}: #{loser_rank} → #{new_loser_rank} (LOSER)")
+            elif loser_rank <= team.current_rank < winner_rank:
+                old_rank = team.current_rank
+                team.current_rank = old_rank + 1
+                logging.info(f"[RANK SWAP]   {team.team_name}: #{old_rank} → #{team.current_rank} (shifted down)")
+                rank_changes['teams_affected'].append({
+                    'team_name': team.team_name,
+                    'old_rank': old_rank,
+                    'new_rank': team.current_rank
+                })
+
+        rank_changes['winner']['new'] = new_winner_rank
+        rank_changes['loser']['new'] = new_loser_rank
+
+    elif winner_rank < loser_rank:
+        logging.warning(f"[RANK SWAP] Winner challenged DOWN (unusual): #{winner_rank} beating #{loser_rank}")
+
+        new_winner_rank = winner_rank
+        new_loser_rank = loser_rank + 1
+
+        for team in all_teams:
+            if team.id == winner_team.id:
+                team.current_rank = new_winner_rank
+                logging.info(f"[RANK SWAP]   {team.team_name}: #{winner_rank} → #{new_winner_rank} (WINNER, no change)")
+            elif team.id == loser_team.id:
+                team.current_rank = new_loser_rank
+                logging.info(f"[RANK SWAP]   {team.team_name}: #{loser_rank} → #{new_loser_rank} (LOSER)")
+            elif team.current_rank > loser_rank:
+                old_rank = team.current_rank
+                team.current_rank = old_rank + 1
+                logging.info(f"[RANK SWAP]   {team.team_name}: #{old_rank} → #{team.current_rank} (shifted down)")
+                rank_changes['teams_affected'].append({
+                    'team_name': team.team_name,
+                    'old_rank': old_rank,
+                    'new_rank': team.current_rank
+                })
+
+        rank_changes['winner']['new'] = new_winner_rank
+        rank_changes['loser']['new'] = new_loser_rank
+
+    db.session.commit()
+    logging.info(f"[RANK SWAP] Rank swap completed successfully")
+
+    ranks_after = {}
+    for team in all_teams:
+        ranks_after[team.current_rank] = team.team_name
+
+    for rank in sorted(ranks_after.keys()):
+        if rank <= max(winner_rank, loser_rank) + 2:
+            logging.info(f"[RANK SWAP]   Rank #{rank}: {ranks_after[rank]}")
+
+    return rank_changes
@@ -0,0 +1,127 @@
+"""
+League Rankings for BD Padel League
+Ranks league teams for playoff qualification and seeding:
+1. Points (3 for a win, 1 for a draw)
+2. Sets differential
+3. Games differential
+4. Head-to-head: a mini-league among the teams still tied, using only the
+   matches they played against each other (points, then sets and games
+   differential). If that separates some teams but not all, the mini-league
+   is re-run on each group that is still tied.
+5. Team ID (registration order), so the order is always deterministic
+
+All completed Swiss results are loaded in one query into a head-to-head
+matrix, so resolving ties costs dictionary lookups rather than a query per pair.
+"""
+
+from collections import namedtuple
+
+from models import db, Team, Match
+
+WIN_POINTS = 3
+DRAW_POINTS = 1
+
+# One team's record against one opponent
+HeadToHead = namedtuple("HeadToHead", ["points", "sets_diff", "games_diff"])
+_NO_RECORD = HeadToHead(0, 0, 0)
+
+
+def load_head_to_head(season_id=None):
+    """
+    {(team_id, opponent_id): HeadToHead} over completed Swiss matches, in one query.
+    Both directions are stored; repeat meetings are summed. Byes are skipped.
+    Defaults to the current season; pass season_id to rank another one.
+    """
+    query = db.session.query(
+        Match.team_a_id, Match.team_b_id, Match.winner_id,
+        Match.sets_a, Match.sets_b, Match.games_a, Match.games_b
+    ).filter(
+        Match.phase == "swiss",
+        Match.status.in_(["completed", "walkover"]),
+        Match.team_b_id.isnot(None)
+    )
+    if season_id is not None:
+        query = query.filter(Match.season_id == season_id).execution_options(all_seasons=True)
+    rows = query.all()
+
+    matrix = {}
+    for team_a_id, team_b_id, winner_id, sets_a, sets_b, games_a, games_b in rows:
+        sets_a, sets_b, games_a, games_b = sets_a or 0, sets_b or 0, games_a or 0, games_b or 0
+        if winner_id == team_a_id:
+            points_a, points_b = WIN_POINTS, 0
+        elif winner_id == team_b_id:
+            points_a, points_b = 0, WIN_POINTS
+        else:
+            points_a = points_b = DRAW_POINTS
+        for key, points, sets_diff, games_diff in (
+            ((team_a_id, team_b_id), points_a, sets_a - sets_b, games_a - games_b),
+            ((team_b_id, team_a_id), points_b, sets_b - sets_a, games_b - games_a),
+        ):
+            previous = matrix.get(key, _NO_RECORD)
+            matrix[key] = HeadToHead(
+                previous.points + points,
+                previous.sets_diff + sets_diff,
+                previous.games_diff + games_diff,
+            )
+    return matrix
+
+
+def _standing_key(team):
+    return (-team.points, -team.sets_diff, -team.games_diff)
+
+
+def _mini_league_key(team, group_ids, matrix):
+    """Totals over the matches a team played against the rest of the tied group"""
+    points = sets_diff = games_diff = 0
+    for opponent_id in group_ids:
+        if opponent_id != team.id:
+            record = matrix.get((team.id, opponent_id), _NO_RECORD)
+            points += record.points
+            sets_diff += record.sets_diff
+            games_diff += record.games_diff
+    return (-points, -sets_diff, -games_diff)
+
+
+def _split_ties(teams, key):
+    """Sort by key and return consecutive groups with equal keys"""
+    teams = sorted(teams, key=lambda t: (key(t), t.id))
+    groups = []
+    previous = object()
+    for team in teams:
+        current = key(team)
+        if groups and current == previous:
+            groups[-1].append(team)
+        else:
+            groups.append([team])
+        previous = current
+    return groups
+
+
+def _resolve_tie(group, matrix):
+    """Order a group of teams level on points, sets and games by head-to-head"""
+    if len(group) == 1:
+        return group
+    group_ids = {team.id for team in group}
+    subgroups = _split_ties(group, lambda t: _mini_league_key(t, group_ids, matrix))
+    if len(subgroups) == 1:
+        # Head-to-head can't separate them: registration order (already sorted by id)
+        return subgroups[0]
+    ordered = []
+    for subgroup in subgroups:
+        ordered.extend(_resolve_tie(subgroup, matrix))
+    return ordered
+
+
+def rank_teams(teams, matrix):
+    """Order teams by the league tiebreakers (see module docstring)"""
+    ranked = []
+    for group in _split_ties(teams, _standing_key):
+        ranked.extend(_resolve_tie(group, matrix))
+    return ranked
+
+
+def get_team_rankings():
+    """Confirmed teams ranked with full tiebreakers: [(team, rank), ...] starting at 1"""
+    teams = Team.query.filter_by(confirmed=True).all()
+    ranked = rank_teams(teams, load_head_to_head())
+    return [(team, rank) for rank, team in enumerate(ranked, start=1)]
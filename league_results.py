@@ -0,0 +1,251 @@
+"""
+League Results for BD Padel League
+Applies confirmed league match results: team and player statistics
+(incrementally, or recalculated from every completed match) and knockout
+bracket advancement.
+"""
+
+from models import db, Team, Match, Player
+import knockout_bracket
+import seasons
+
+
+def update_team_stats_from_match(match):
+    """Update team and player statistics based on match result"""
+    # Check if stats have already been calculated to avoid duplicates
+    if match.stats_calculated:
+        return
+
+    team_a = Team.query.get(match.team_a_id)
+    team_b = Team.query.get(match.team_b_id)
+
+    if not team_a or not team_b:
+        return
+
+    # Update team sets and games statistics
+    team_a.sets_for += match.sets_a
+    team_a.sets_against += match.sets_b
+    team_a.games_for += match.games_a
+    team_a.games_against += match.games_b
+
+    team_b.sets_for += match.sets_b
+    team_b.sets_against += match.sets_a
+    team_b.games_for += match.games_b
+    team_b.games_against += match.games_a
+
+    # Update team wins/losses/draws and points (3 for win, 1 for draw, 0 for loss)
+    if match.winner_id == team_a.id:
+        team_a.wins += 1
+        team_a.points += 3
+        team_b.losses += 1
+    elif match.winner_id == team_b.id:
+        team_b.wins += 1
+        team_b.points += 3
+        team_a.losses += 1
+    else:
+        # Draw
+        team_a.draws += 1
+        team_a.points += 1
+        team_b.draws += 1
+        team_b.points += 1
+
+    # Update player statistics for both teams
+    update_player_stats_from_match(match, team_a, team_b)
+
+    # CRITICAL: Set flag AFTER updating all stats (team and player) to prevent duplicate processing
+    match.stats_calculated = True
+
+
+def update_player_stats_from_match(match, team_a, team_b):
+    """Update individual player statistics based on match result - for ALL players (winners AND losers)"""
+    from datetime import datetime
+
+    # CRITICAL: Prevent duplicate stat updates
+    if match.stats_calculated:
+        return
+
+    # Get or create players for Team A (ALWAYS from team roster)
+    players_a = []
+
+    player1_a = Player.query.filter_by(phone=team_a.player1_phone).first()
+    if not player1_a:
+        # Create player if doesn't exist
+        player1_a = Player(
+            name=team_a.player1_name,
+            phone=team_a.player1_phone,
+            email=team_a.player1_email,
+            current_team_id=team_a.id,
+            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+        db.session.add(player1_a)
+        db.session.flush()
+
+    players_a.append(player1_a)
+    # Link to match for future reference
+    if not match.team_a_player1_id:
+        match.team_a_player1_id = player1_a.id
+
+    if team_a.player2_phone != team_a.player1_phone:
+        player2_a = Player.query.filter_by(phone=team_a.player2_phone).first()
+        if not player2_a:
+            # Create player if doesn't exist
+            player2_a = Player(
+                name=team_a.player2_name,
+                phone=team_a.player2_phone,
+                email=team_a.player2_email,
+                current_team_id=team_a.id,
+                created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
+            db.session.add(player2_a)
+            db.session.flush()
+
+        players_a.append(player2_a)
+        # Link to match for future reference
+        if not match.team_a_player2_id:
+            match.team_a_player2_id = player2_a.id
+
+    # Get or create players for Team B (ALWAYS from team roster)
+    players_b = []
+
+    player1_b = Player.query.filter_by(phone=team_b.player1_phone).first()
+    if not player1_b:
+        # Create player if doesn't exist
+        player1_b = Player(
+            name=team_b.player1_name,
+            phone=team_b.player1_phone,
+            email=team_b.player1_email,
+            current_team_id=team_b.id,
+            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+        db.session.add(player1_b)
+        db.session.flush()
+
+    players_b.append(player1_b)
+    # Link to match for future reference
+    if not match.team_b_player1_id:
+        match.team_b_player1_id = player1_b.id
+
+    if team_b.player2_phone != team_b.player1_phone:
+        player2_b = Player.query.filter_by(phone=team_b.player2_phone).first()
+        if not player2_b:
+            # Create player if doesn't exist
+            player2_b = Player(
+                name=team_b.player2_name,
+                phone=team_b.player2_phone,
+                email=team_b.player2_email,
+                current_team_id=team_b.id,
+                created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            )
+            db.session.add(player2_b)
+            db.session.flush()
+
+        players_b.append(player2_b)
+        # Link to match for future reference
+        if not match.team_b_player2_id:
+            match.team_b_player2_id = player2_b.id
+
+    # Update player stats for Team A (BOTH winners and losers get stats)
+    for player in players_a:
+        player.matches_played += 1
+        player.sets_for += match.sets_a
+        player.sets_against += match.sets_b
+        player.games_for += match.games_a
+        player.games_against += match.games_b
+
+        if match.winner_id == team_a.id:
+            player.wins += 1
+            player.points += 3
+        elif match.winner_id == team_b.id:
+            player.losses += 1
+            # Losers get 0 points (already default)
+        else:
+            player.draws += 1
+            player.points += 1
+
+    # Update player stats for Team B (BOTH winners and losers get stats)
+    for player in players_b:
+        player.matches_played += 1
+        player.sets_for += match.sets_b
+        player.sets_against += match.sets_a
+        player.games_for += match.games_b
+        player.games_against += match.games_a
+
+        if match.winner_id == team_b.id:
+            player.wins += 1
+            player.points += 3
+        elif match.winner_id == team_a.id:
+            player.losses += 1
+            # Losers get 0 points (already default)
+        else:
+            player.draws += 1
+            player.points += 1
+
+
+def recalculate_all_player_stats():
+    """Recalculate player stats for all completed league matches"""
+    # Reset all player stats to 0
+    for player in Player.query.all():
+        player.wins = 0
+        player.losses = 0
+        player.draws = 0
+        player.points = 0
+        player.matches_played = 0
+        player.sets_for = 0
+        player.sets_against = 0
+        player.games_for = 0
+        player.games_against = 0
+    
+    # Player stats are career totals: seasons whose matches were purged count from their summaries
+    for player_id, totals in seasons.purged_player_totals().items():
+        player = db.session.get(Player, player_id)
+        if player:
+            for stat, value in totals.items():
+                setattr(player, stat, value)
+
+    # Get all completed matches (every season) sorted by season, round and id (to maintain order)
+    completed_matches = seasons.all_seasons(Match.query.filter(
+        Match.status == "completed"
+    ).order_by(Match.season_id, Match.round, Match.id)).all()
+    
+    # Recalculate stats for each match
+    for match in completed_matches:
+        team_a = db.session.get(Team, match.team_a_id, execution_options={"all_seasons": True})
+        team_b = db.session.get(Team, match.team_b_id, execution_options={"all_seasons": True})
+        
+        if team_a and team_b:
+            # Use update_player_stats_from_match from app to get proper calculations
+            update_player_stats_from_match(match, team_a, team_b)
+    
+    db.session.commit()
+    return len(completed_matches)
+
+def update_bracket_winners(match):
+    """
+    Automatically advance the winner of a knockout match to the next match in
+    the bracket: node n feeds node n // 2 (even nodes as Team A, odd as Team B),
+    e.g. QF1, QF2 -> SF1 and SF1, SF2 -> FINAL. Only matters when the next
+    round already exists (e.g. a corrected score); otherwise the next round is
+    generated from the winners.
+    """
+    node = knockout_bracket.slot_node(match.bracket_slot)
+    if not match.winner_id or not node:
+        return
+
+    target = knockout_bracket.advance_target(node)
+    if not target:
+        return
+    next_node, side = target
+    next_slot = knockout_bracket.slot_label(next_node)
+
+    # Find the match in the next round with this slot
+    next_match = Match.query.filter_by(
+        phase=knockout_bracket.phase_for_depth(knockout_bracket.node_depth(next_node)),
+        bracket_slot=next_slot
+    ).first()
+    if next_match:
+        if side == "a":
+            next_match.team_a_id = match.winner_id
+        else:
+            next_match.team_b_id = match.winner_id
+        db.session.commit()
+        print(f"[BRACKET] Advanced team {match.winner_id} to {next_slot} ({'Team A' if side == 'a' else 'Team B'})")
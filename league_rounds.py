@@ -0,0 +1,125 @@
+"""
+League Rounds Read Model for BD Padel League
+Everything the public /rounds page shows - the Swiss round accordion, the
+knockout bracket tree and approved substitutes - built from one match query
+plus the team map (and the approved substitutes), into plain snapshots (no ORM
+objects, so they can be shared across requests).
+
+The view is cached per process and rebuilt only when the data version of its
+tables (matches, teams, substitutes, league settings, seasons) changes, so a
+write on any worker shows on every worker's next request (see data_versions.py).
+"""
+
+import json
+from collections import namedtuple
+
+from models import db, Team, Match, Substitute, LeagueSettings
+from data_versions import VersionedCache
+import knockout_bracket
+
+RoundMatch = namedtuple("RoundMatch", [
+    "id", "round", "phase", "bracket_slot", "status", "notes",
+    "team_a_id", "team_b_id", "winner_id", "score_a", "score_b", "seed_a", "seed_b",
+])
+RoundTeam = namedtuple("RoundTeam", [
+    "id", "team_name", "player1_name", "player2_name", "wins", "losses",
+])
+RoundSubstitute = namedtuple("RoundSubstitute", ["name", "replaces_player_number"])
+
+_rounds_cache = VersionedCache("league_rounds")
+
+
+def _knockout_rounds(knockout_matches, teams_by_id, num_qualified):
+    """Bracket columns, first round to final; unplayed rounds derived from feeder winners"""
+    if not knockout_matches:
+        return []
+    size = knockout_bracket.size_for_matches(knockout_matches, num_qualified)
+    columns = []
+    for phase, entries in knockout_bracket.bracket_rounds(
+        knockout_bracket.build_bracket(size, knockout_matches)
+    ):
+        for entry in entries:
+            entry['team_a'] = teams_by_id.get(entry['team_a_id'])
+            entry['team_b'] = teams_by_id.get(entry['team_b_id'])
+        columns.append({
+            'phase': phase,
+            'title': knockout_bracket.phase_title(phase),
+            'entries': entries,
+        })
+    return columns
+
+
+def build_rounds_view():
+    """
+    Load and assemble the rounds page:
+        {
+            'rounds_dict': {round: [{'match', 'team_a', 'team_b'}]} (Swiss rounds),
+            'round_completed_counts': {round: completed or walkover matches},
+            'pairing_logs': {round: Swiss pairing log},
+            'knockout_rounds': [{'phase', 'title', 'entries'}] (knockout_bracket entries
+                               with 'team_a' / 'team_b' added),
+            'approved_subs': {(match id, team id): RoundSubstitute},
+        }
+    """
+    teams_by_id = {
+        row.id: RoundTeam(*row)
+        for row in db.session.query(
+            Team.id, Team.team_name, Team.player1_name, Team.player2_name, Team.wins, Team.losses
+        )
+    }
+
+    rounds_dict = {}
+    round_completed_counts = {}
+    pairing_logs = {}
+    knockout_matches = []
+    for row in db.session.query(
+        Match.id, Match.round, Match.phase, Match.bracket_slot, Match.status, Match.notes,
+        Match.team_a_id, Match.team_b_id, Match.winner_id, Match.score_a, Match.score_b,
+        Match.seed_a, Match.seed_b, Match.pairing_log
+    ).order_by(Match.round, Match.id):
+        match = RoundMatch(*row[:-1])
+        if not match.round:
+            continue
+        if knockout_bracket.is_knockout_match(match):
+            knockout_matches.append(match)
+            continue
+
+        if match.round not in rounds_dict:
+            rounds_dict[match.round] = []
+            round_completed_counts[match.round] = 0
+            pairing_logs[match.round] = row.pairing_log
+
+        rounds_dict[match.round].append({
+            'match': match,
+            'team_a': teams_by_id.get(match.team_a_id),
+            'team_b': teams_by_id.get(match.team_b_id) if match.team_b_id else None,
+        })
+
+        # Count completed matches (including walkovers)
+        if match.status in ('completed', 'walkover'):
+            round_completed_counts[match.round] += 1
+
+    approved_subs = {}
+    for row in db.session.query(
+        Substitute.match_id, Substitute.team_id, Substitute.name, Substitute.replaces_player_number
+    ).filter(Substitute.status == 'approved').order_by(Substitute.id):
+        approved_subs.setdefault((row.match_id, row.team_id), RoundSubstitute(row.name, row.replaces_player_number))
+
+    num_qualified = 0
+    if knockout_matches:
+        settings = LeagueSettings.query.first()
+        if settings and settings.qualified_team_ids:
+            num_qualified = len(json.loads(settings.qualified_team_ids))
+
+    return {
+        'rounds_dict': rounds_dict,
+        'round_completed_counts': round_completed_counts,
+        'pairing_logs': pairing_logs,
+        'knockout_rounds': _knockout_rounds(knockout_matches, teams_by_id, num_qualified),
+        'approved_subs': approved_subs,
+    }
+
+
+def get_rounds_view():
+    """build_rounds_view through the per-process cache"""
+    return _rounds_cache.get("view", build_rounds_view)
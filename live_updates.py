@@ -0,0 +1,172 @@
+"""
+Live Updates for BD Padel League
+Server-Sent Events for Americano tournaments: score entries are published to a
+per-tournament channel and pushed to every open public schedule / leaderboard
+page, which patches the changed match card and leaderboard rows in place.
+
+Streams are off unless LIVE_SSE_ENABLED=true: every open stream holds a server
+thread for up to LIVE_STREAM_MAX_SECONDS, and with gunicorn's sync/threaded
+workers (Procfile: 2 workers x 4 threads) a few viewers would take every thread
+and stall the site. By default the pages poll /tournaments/<id>/schedule.json
+instead - an ETag check that is a cached 304 until a score changes. Enable
+streams only where a worker can hold many idle connections (e.g. gunicorn
+--worker-class gevent), and keep LIVE_MAX_STREAMS below what a process can
+serve; over the cap a viewer gets 503 and its page falls back to polling.
+
+The broker is in-process by default, so events reach viewers connected to the
+same worker as the admin who entered the score. Deployments running several
+workers can install a shared broker with set_broker() - anything with the same
+publish/subscribe/unsubscribe interface (e.g. a Redis pub/sub adapter). Pages
+with a stream still re-check the JSON schedule now and then, so viewers on
+another worker converge.
+"""
+
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+
+LIVE_SSE_ENABLED = os.environ.get("LIVE_SSE_ENABLED", "false").lower() == "true"
+LIVE_MAX_STREAMS = int(os.environ.get("LIVE_MAX_STREAMS", "64"))
+LIVE_STREAM_MAX_SECONDS = int(os.environ.get("LIVE_STREAM_MAX_SECONDS", "300"))
+LIVE_KEEPALIVE_SECONDS = 15
+LIVE_RETRY_MS = 5000
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def tournament_channel(tournament_id):
+    return f"americano:{tournament_id}"
+
+
+class InProcessBroker:
+    """Fan-out pub/sub inside one process; each subscriber gets a bounded queue"""
+
+    def __init__(self):
+        self._subscribers = {}  # channel -> set of queues
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def publish(self, channel, event, data):
+        message = (next(self._ids), event, data)
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # Slow client: drop its backlog, it resyncs from the JSON schedule
+                with subscriber.mutex:
+                    subscriber.queue.clear()
+                subscriber.put_nowait((message[0], "resync", {}))
+        return len(subscribers)
+
+    def subscribe(self, channel):
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, channel, subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def subscriber_count(self, channel=None):
+        with self._lock:
+            if channel is not None:
+                return len(self._subscribers.get(channel, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+_broker = InProcessBroker()
+_open_streams = threading.BoundedSemaphore(LIVE_MAX_STREAMS)
+
+
+def get_broker():
+    return _broker
+
+
+def set_broker(broker):
+    """Swap the broker (shared broker in multi-worker deployments, stub in scripts)"""
+    global _broker
+    _broker = broker
+
+
+def _format_event(event_id, event, data):
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class _EventStream:
+    """
+    Iterable SSE response body. close() (called by the WSGI server when the
+    client goes away or the stream ends) unsubscribes and frees the stream slot,
+    even if iteration never started.
+    """
+
+    def __init__(self, broker, channel):
+        self._broker = broker
+        self._channel = channel
+        self._subscriber = broker.subscribe(channel)
+        self._events = self._generate()
+        self._closed = False
+
+    def _generate(self):
+        yield f"retry: {LIVE_RETRY_MS}\n: connected\n\n"
+        deadline = time.monotonic() + LIVE_STREAM_MAX_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                event_id, event, data = self._subscriber.get(timeout=LIVE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield _format_event(event_id, event, data)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._events)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._events.close()
+        self._broker.unsubscribe(self._channel, self._subscriber)
+        _open_streams.release()
+
+
+def open_stream(tournament_id):
+    """
+    SSE body for one viewer, or None when the process is at LIVE_MAX_STREAMS.
+    The stream never touches the database, so it holds no connection.
+    """
+    if not _open_streams.acquire(blocking=False):
+        return None
+    return _EventStream(_broker, tournament_channel(tournament_id))
+
+
+def publish_score(tournament, match, leaderboard):
+    """
+    Push a recorded score: the match row (schedule.json format), the four
+    players' standings and the new leaderboard order. Call after commit.
+    """
+    players = {match.player1_id, match.player2_id, match.player3_id, match.player4_id}
+    data = {
+        'match': [match.id, match.round_number, match.court_number or 1,
+                  [match.player1_id, match.player2_id, match.player3_id, match.player4_id],
+                  match.status, match.score_team_a, match.score_team_b],
+        # [player id, rank, matches played, wins, draws, losses, total points]
+        'standings': [
+            [entry['player'].id, entry['rank'], entry['matches_played'], entry['wins'],
+             entry['draws'], entry['losses'], entry['total_points']]
+            for entry in leaderboard if entry['player'].id in players
+        ],
+        'order': [entry['player'].id for entry in leaderboard],
+    }
+    return _broker.publish(tournament_channel(tournament.id), "score", data)
@@ -0,0 +1,66 @@
+"""
+Season Management Script
+Lists, archives and starts league seasons (see seasons.py).
+
+Usage:
+    python manage_seasons.py list
+    python manage_seasons.py archive <season_id> [--purge]
+    python manage_seasons.py start "<name>" <YYYY-MM-DD of Round 1 Monday>
+
+Archiving writes the season's final standings and player totals to the
+summary tables and closes team registration; --purge then deletes its teams,
+matches, reschedules and substitutes. The site keeps showing the archived
+season until the next one starts, which takes in anything created meanwhile.
+"""
+
+import sys
+from datetime import datetime
+from dotenv import load_dotenv
+from app_factory import create_app
+from models import db, Season, SeasonTeamSummary
+import seasons
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+def list_seasons():
+    for season in Season.query.order_by(Season.id).all():
+        teams = SeasonTeamSummary.query.filter_by(season_id=season.id).count()
+        flags = " (purged)" if season.purged_at else ""
+        print(f"{season.id:>3}  {season.name:<30} {season.start_date}  {season.status}{flags}"
+              + (f"  {teams} teams archived" if teams else ""))
+
+def main(argv):
+    if not argv or argv[0] not in ("list", "archive", "start"):
+        print(__doc__)
+        return 1
+
+    with app.app_context():
+        try:
+            if argv[0] == "list":
+                list_seasons()
+                return 0
+
+            if argv[0] == "archive":
+                season = seasons.archive_season(int(argv[1]), purge="--purge" in argv[2:])
+                db.session.commit()
+                print(f"✅ Archived {season.name}" + (" and purged its detail rows" if season.purged_at else ""))
+                return 0
+
+            start_date = datetime.strptime(argv[2], "%Y-%m-%d").date()
+            if start_date.weekday() != 0:
+                print("❌ Round 1 must start on a Monday")
+                return 1
+            season = seasons.start_season(argv[1], start_date)
+            db.session.commit()
+            print(f"✅ Started {season.name} (id {season.id}), Round 1 on {season.start_date}")
+            return 0
+
+        except (IndexError, ValueError) as e:
+            db.session.rollback()
+            print(f"❌ {e}")
+            return 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
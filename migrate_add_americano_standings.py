@@ -0,0 +1,45 @@
+"""
+Americano Standings Migration Script
+Creates the americano_standing table on existing databases and backfills it
+from every tournament's completed matches. Safe to re-run: each tournament's
+standings are rebuilt from scratch.
+
+Usage: python migrate_add_americano_standings.py
+"""
+
+import os
+from dotenv import load_dotenv
+from app_factory import create_app
+from models import db, AmericanoStanding, AmericanoTournament
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+def migrate_americano_standings():
+    """Create americano_standing and backfill it from scored matches"""
+    from americano_standings import rebuild_standings
+
+    with app.app_context():
+        print("🔧 Adding americano_standing table to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+
+        try:
+            AmericanoStanding.__table__.create(db.engine, checkfirst=True)
+            print("✅ americano_standing")
+
+            tournaments = AmericanoTournament.query.filter(AmericanoTournament.total_rounds > 0).all()
+            for tournament in tournaments:
+                players = rebuild_standings(tournament.id)
+                print(f"   ✅ Tournament {tournament.id}: {players} players")
+            db.session.commit()
+
+            print(f"✅ Standings backfilled for {len(tournaments)} tournaments!")
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_americano_standings()
@@ -0,0 +1,97 @@
+"""
+Foreign Key Migration Script
+Adds the foreign key constraints declared in models.py to an existing
+Postgres database (new databases get them from db.create_all()).
+
+Each constraint is added NOT VALID - it applies to new writes at once without
+scanning the table - and then validated. If old rows point at rows that no
+longer exist, the orphans are counted and the constraint is left NOT VALID;
+clean them up and re-run to validate. Safe to re-run.
+
+SQLite can't add constraints to existing tables and doesn't enforce them by
+default, so there is nothing to do there: the ORM relationships work without them.
+
+Usage: python migrate_add_foreign_keys.py
+"""
+
+import os
+from dotenv import load_dotenv
+from sqlalchemy import inspect, text
+from app_factory import create_app
+from models import db
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+# (table, column, referenced table) - the referenced column is always id
+FOREIGN_KEYS = [
+    ("match", "team_a_id", "team"),
+    ("match", "team_b_id", "team"),
+    ("match", "winner_id", "team"),
+    ("match", "team_a_player1_id", "player"),
+    ("match", "team_a_player2_id", "player"),
+    ("match", "team_b_player1_id", "player"),
+    ("match", "team_b_player2_id", "player"),
+    ("reschedule", "match_id", "match"),
+    ("reschedule", "requester_team_id", "team"),
+    ("substitute", "team_id", "team"),
+    ("substitute", "match_id", "match"),
+    ("substitute", "player_id", "player"),
+    ("ladder_match", "challenge_id", "ladder_challenge"),
+    ("americano_match", "tournament_id", "americano_tournament"),
+    ("americano_match", "player1_id", "ladder_free_agent"),
+    ("americano_match", "player2_id", "ladder_free_agent"),
+    ("americano_match", "player3_id", "ladder_free_agent"),
+    ("americano_match", "player4_id", "ladder_free_agent"),
+]
+
+def migrate_foreign_keys():
+    """Add foreign key constraints to an existing Postgres database"""
+    with app.app_context():
+        print("🔧 Adding foreign key constraints to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+
+        if db.engine.dialect.name != "postgresql":
+            print("⏭️  Not a Postgres database - foreign keys are only declared in models.py, nothing to do")
+            return
+
+        try:
+            inspector = inspect(db.engine)
+            not_validated = []
+            for table, column, referenced in FOREIGN_KEYS:
+                # Same name db.create_all() gives the constraint on a new database
+                name = f"{table}_{column}_fkey"
+                existing = {fk["name"] for fk in inspector.get_foreign_keys(table)}
+
+                with db.engine.connect() as conn:
+                    with conn.begin():
+                        if name not in existing:
+                            conn.execute(text(
+                                f'ALTER TABLE "{table}" ADD CONSTRAINT {name} '
+                                f'FOREIGN KEY ({column}) REFERENCES "{referenced}" (id) NOT VALID'
+                            ))
+
+                        orphans = conn.execute(text(
+                            f'SELECT COUNT(*) FROM "{table}" t WHERE t.{column} IS NOT NULL '
+                            f'AND NOT EXISTS (SELECT 1 FROM "{referenced}" r WHERE r.id = t.{column})'
+                        )).scalar()
+                        if orphans:
+                            not_validated.append(name)
+                            print(f"   ⚠️  {name}: {orphans} rows reference missing {referenced} rows - left NOT VALID")
+                            continue
+
+                        conn.execute(text(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT {name}'))
+                        print(f"   ✅ {name}")
+
+            if not_validated:
+                print(f"\n⚠️  {len(not_validated)} constraints are enforced for new rows only; "
+                      "fix the orphaned rows and re-run to validate them")
+            print("\n✅ Foreign key migration completed!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_foreign_keys()
@@ -0,0 +1,45 @@
+"""
+Hot Filter Index Migration Script
+Adds the composite indexes behind the busiest filters - league match lookups
+by round, status, team and player (within the season), active ladder
+challenges, recent ladder results, ladder tables in rank order and Americano
+schedules - on existing databases (new databases get them from
+db.create_all()). Safe to re-run.
+
+Run migrate_add_seasons.py first: the match indexes lead with season_id.
+Check the resulting plans with check_query_plans.py.
+
+Usage: python migrate_add_hot_filter_indexes.py
+"""
+
+import os
+from dotenv import load_dotenv
+from app_factory import create_app
+from models import db, Match, LadderTeam, LadderChallenge, LadderMatch, AmericanoMatch
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+INDEXED_MODELS = [Match, LadderTeam, LadderChallenge, LadderMatch, AmericanoMatch]
+
+def migrate_hot_filter_indexes():
+    """Add hot filter indexes to existing database"""
+    with app.app_context():
+        print("🔧 Adding hot filter indexes to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+
+        try:
+            for model in INDEXED_MODELS:
+                for index in sorted(model.__table__.indexes, key=lambda i: i.name):
+                    index.create(db.engine, checkfirst=True)
+                    print(f"✅ {index.name}")
+
+            print("✅ Hot filter indexes added successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_hot_filter_indexes()
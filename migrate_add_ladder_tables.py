@@ -7,12 +7,14 @@ Usage: python migrate_add_ladder_tables.py
 
 import os
 from dotenv import load_dotenv
-from app import app, db
+from app_factory import create_app
 from models import (
-    LadderTeam, LadderFreeAgent, LadderChallenge, LadderMatch,
+    db, LadderTeam, LadderFreeAgent, LadderChallenge, LadderMatch,
     AmericanoTournament, AmericanoMatch, LadderSettings
 )
 
+app = create_app(blueprints=())  # database only, no routes
+
 load_dotenv()
 
 def migrate_ladder_tables():
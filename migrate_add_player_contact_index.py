@@ -0,0 +1,43 @@
+"""
+Player Contact Index Migration Script
+Adds the player_contact table (player directory: normalized email and phone,
+plus reversed-digit phone index, across teams, ladder teams, free agents and
+players) and backfills it.
+
+Safe to re-run: the table only holds derived data. An outdated table is
+recreated, and the index is rebuilt from the source tables each time.
+
+Usage: python migrate_add_player_contact_index.py
+"""
+
+import os
+from dotenv import load_dotenv
+from app_factory import create_app
+from models import db
+from contact_index import ensure_contact_index, rebuild_contact_index
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+def migrate_player_contact_index():
+    """Create and backfill the player_contact table"""
+    with app.app_context():
+        print("🔧 Adding player contact index to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+        
+        try:
+            if ensure_contact_index() is not None:
+                print("✅ player_contact table created")
+            else:
+                print("✅ player_contact table up to date")
+            
+            rows = rebuild_contact_index()
+            print(f"✅ Indexed {rows} player phone(s)")
+            
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_player_contact_index()
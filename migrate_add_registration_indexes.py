@@ -0,0 +1,36 @@
+"""
+Registration Index Migration Script
+Adds the index used by duplicate-registration checks on existing databases
+(new databases get it from db.create_all()). Safe to re-run.
+
+Usage: python migrate_add_registration_indexes.py
+"""
+
+import os
+from dotenv import load_dotenv
+from app_factory import create_app
+from models import db, AmericanoRegistration
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+def migrate_registration_indexes():
+    """Add registration lookup indexes to existing database"""
+    with app.app_context():
+        print("🔧 Adding registration indexes to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+        
+        try:
+            for index in AmericanoRegistration.__table__.indexes:
+                index.create(db.engine, checkfirst=True)
+                print(f"✅ {index.name}")
+            
+            print("✅ Registration indexes added successfully!")
+            
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_registration_indexes()
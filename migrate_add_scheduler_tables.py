@@ -0,0 +1,38 @@
+"""
+Scheduler Tables Migration Script
+Adds the leader-election lease and job-run tables used by job_runner.py.
+APScheduler creates its own apscheduler_jobs table on first start.
+
+Usage: python migrate_add_scheduler_tables.py
+"""
+
+import os
+from dotenv import load_dotenv
+from app_factory import create_app
+from models import db, SchedulerLease, ScheduledJobRun
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+def migrate_scheduler_tables():
+    """Add scheduler tables to existing database"""
+    with app.app_context():
+        print("🔧 Adding scheduler tables to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+        
+        try:
+            SchedulerLease.__table__.create(db.engine, checkfirst=True)
+            ScheduledJobRun.__table__.create(db.engine, checkfirst=True)
+            
+            print("✅ Scheduler tables added successfully!")
+            print("📋 New tables created:")
+            print("   - scheduler_lease")
+            print("   - scheduled_job_run")
+            
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_scheduler_tables()
@@ -0,0 +1,88 @@
+"""
+Seasons Migration Script
+Creates the season and season summary tables, adds season_id to team, match,
+reschedule and substitute, opens "Season 1" (Round 1 on Monday, November 17,
+2025, the league's original start date) and assigns every existing row to it,
+then creates the season composite indexes. Safe to re-run.
+
+Usage: python migrate_add_seasons.py
+"""
+
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+from sqlalchemy import inspect, text
+from app_factory import create_app
+from models import (
+    db, Season, Team, Match, Reschedule, Substitute, SeasonTeamSummary, SeasonPlayerSummary
+)
+from seasons import FIRST_SEASON_NAME, FIRST_SEASON_START
+
+app = create_app(blueprints=())  # database only, no routes
+
+load_dotenv()
+
+SEASON_SCOPED_TABLES = [Team.__table__, Match.__table__, Reschedule.__table__, Substitute.__table__]
+
+def migrate_seasons():
+    """Add seasons to an existing database"""
+    with app.app_context():
+        print("🔧 Adding seasons to database...")
+        print(f"📍 Database URI: {app.config['SQLALCHEMY_DATABASE_URI'][:50]}...")
+
+        try:
+            for table in (Season.__table__, SeasonTeamSummary.__table__, SeasonPlayerSummary.__table__):
+                table.create(db.engine, checkfirst=True)
+                print(f"✅ {table.name}")
+
+            inspector = inspect(db.engine)
+            with db.engine.connect() as conn:
+                with conn.begin():
+                    print("\n📝 Adding season_id columns...")
+                    first_run = False
+                    for table in SEASON_SCOPED_TABLES:
+                        columns = {c["name"] for c in inspector.get_columns(table.name)}
+                        if "season_id" not in columns:
+                            conn.execute(text(
+                                f'ALTER TABLE "{table.name}" ADD COLUMN season_id INTEGER REFERENCES season(id)'
+                            ))
+                            first_run = True
+                        print(f"   ✅ {table.name}.season_id")
+
+                    season_id = conn.execute(text("SELECT MIN(id) FROM season")).scalar()
+                    if season_id is None:
+                        conn.execute(
+                            text("INSERT INTO season (name, start_date, status, created_at) "
+                                 "VALUES (:name, :start_date, 'active', :created_at)"),
+                            {"name": FIRST_SEASON_NAME, "start_date": FIRST_SEASON_START, "created_at": datetime.now()},
+                        )
+                        season_id = conn.execute(text("SELECT MIN(id) FROM season")).scalar()
+                        print(f"\n✅ Created {FIRST_SEASON_NAME} (id {season_id})")
+                        first_run = True
+
+                    # Only on the first run: later, rows without a season were created
+                    # between seasons and join the next one (seasons.start_season)
+                    if first_run:
+                        print("\n📝 Assigning existing rows to the first season...")
+                        for table in SEASON_SCOPED_TABLES:
+                            result = conn.execute(
+                                text(f'UPDATE "{table.name}" SET season_id = :season_id WHERE season_id IS NULL'),
+                                {"season_id": season_id},
+                            )
+                            print(f"   ✅ {table.name}: {result.rowcount} rows")
+
+            print("\n📝 Creating season indexes...")
+            for table in [Season.__table__] + SEASON_SCOPED_TABLES + [SeasonTeamSummary.__table__]:
+                for index in table.indexes:
+                    if "season" in index.name:
+                        index.create(db.engine, checkfirst=True)
+                        print(f"   ✅ {index.name}")
+
+            print("\n✅ Seasons migration completed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error during migration: {e}")
+            raise
+
+if __name__ == "__main__":
+    migrate_seasons()
@@ -3,10 +3,12 @@
 Migration script to add points-based format fields to AmericanoTournament and update AmericanoMatch
 """
 
-from app import app, db
-from models import AmericanoTournament, AmericanoMatch
+from app_factory import create_app
+from models import db, AmericanoTournament, AmericanoMatch
 from sqlalchemy import text
 
+app = create_app(blueprints=())  # database only, no routes
+
 def migrate_americano_points_format():
     with app.app_context():
         try:
@@ -13,7 +13,10 @@ load_dotenv()
 
 def migrate_ladder_match_score_fields():
     """Add score submission fields to ladder_match table"""
-    from app import app, db
+    from app_factory import create_app
+    from models import db
+
+    app = create_app(blueprints=())  # database only, no routes
     
     with app.app_context():
         print("🔧 Adding score submission fields to ladder_match table...")
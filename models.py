@@ -2,8 +2,26 @@ from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
 
+class Season(db.Model):
+    """A league season; Team, Match, Reschedule and Substitute rows belong to one (see seasons.py)"""
+    __tablename__ = 'season'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    start_date = db.Column(db.Date, nullable=False)  # Monday of Round 1
+    status = db.Column(db.String(20), default='active', nullable=False)  # active, archived
+    created_at = db.Column(db.DateTime, nullable=True)
+    archived_at = db.Column(db.DateTime, nullable=True)
+    purged_at = db.Column(db.DateTime, nullable=True)  # Detail rows deleted, summaries only
+
+    __table_args__ = (
+        db.Index('ix_season_status', 'status'),
+    )
+
+
 class Team(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=True)
     team_name = db.Column(db.String(100), nullable=False)
     team_name_canonical = db.Column(db.String(120), index=True)
     player1_name = db.Column(db.String(100))
@@ -46,6 +64,11 @@ class Team(db.Model):
     def matches_played(self):
         return self.wins + self.losses + self.draws
 
+    __table_args__ = (
+        # Live-season team lists and pairing pools
+        db.Index('ix_team_season_status', 'season_id', 'status'),
+    )
+
 class Player(db.Model):
     """Individual player with their own statistics across all matches they've played"""
     id = db.Column(db.Integer, primary_key=True)
@@ -99,17 +122,18 @@ class FreeAgent(db.Model):
 
 class Match(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=True)
     round = db.Column(db.Integer)
-    phase = db.Column(db.String(20), default="swiss")  # swiss, quarterfinal, semifinal, third_place, final
-    team_a_id = db.Column(db.Integer)
-    team_b_id = db.Column(db.Integer, nullable=True)  # Nullable for bye rounds
+    phase = db.Column(db.String(20), default="swiss")  # swiss, round_of_16.., quarterfinal, semifinal, third_place, final
+    team_a_id = db.Column(db.Integer, db.ForeignKey('team.id'))
+    team_b_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=True)  # Nullable for bye rounds
 
     # Scores (format: "6-4, 6-3" or "6-4, 3-6, 10-8")
     score_a = db.Column(db.String(50))
     score_b = db.Column(db.String(50))
 
     # Match result
-    winner_id = db.Column(db.Integer, nullable=True)
+    winner_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=True)
     sets_a = db.Column(db.Integer, default=0)
     sets_b = db.Column(db.Integer, default=0)
     games_a = db.Column(db.Integer, default=0)
@@ -144,39 +168,133 @@ class Match(db.Model):
 
     # Player participation tracking (for individual stats)
     # Stores player IDs who actually played in this match
-    team_a_player1_id = db.Column(db.Integer, nullable=True)  # Team A player 1
-    team_a_player2_id = db.Column(db.Integer, nullable=True)  # Team A player 2
-    team_b_player1_id = db.Column(db.Integer, nullable=True)  # Team B player 1
-    team_b_player2_id = db.Column(db.Integer, nullable=True)  # Team B player 2
+    team_a_player1_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=True)  # Team A player 1
+    team_a_player2_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=True)  # Team A player 2
+    team_b_player1_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=True)  # Team B player 1
+    team_b_player2_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=True)  # Team B player 2
     
     # Bracket metadata for knockout rounds
-    bracket_slot = db.Column(db.String(10), nullable=True)  # QF1, QF2, QF3, QF4, SF1, SF2, F1
-    seed_a = db.Column(db.Integer, nullable=True)  # Seed number for team A (1-8)
-    seed_b = db.Column(db.Integer, nullable=True)  # Seed number for team B (1-8)
+    bracket_slot = db.Column(db.String(10), nullable=True)  # R16-1.., QF1-QF4, SF1, SF2, FINAL, 3RD (see knockout_bracket)
+    seed_a = db.Column(db.Integer, nullable=True)  # Seed number for team A (1-N)
+    seed_b = db.Column(db.Integer, nullable=True)  # Seed number for team B (1-N)
+
+    # Lazy by default; hot paths pick joinedload/selectinload per query
+    team_a = db.relationship('Team', foreign_keys=[team_a_id])
+    team_b = db.relationship('Team', foreign_keys=[team_b_id])
+    winner = db.relationship('Team', foreign_keys=[winner_id])
+    team_a_player1 = db.relationship('Player', foreign_keys=[team_a_player1_id])
+    team_a_player2 = db.relationship('Player', foreign_keys=[team_a_player2_id])
+    team_b_player1 = db.relationship('Player', foreign_keys=[team_b_player1_id])
+    team_b_player2 = db.relationship('Player', foreign_keys=[team_b_player2_id])
+    reschedules = db.relationship('Reschedule', back_populates='match', order_by='Reschedule.id')
+    substitutes = db.relationship('Substitute', back_populates='match', order_by='Substitute.id')
+
+    __table_args__ = (
+        # Round views, pairing history and completion checks within the live season
+        db.Index('ix_match_season_round', 'season_id', 'round'),
+        db.Index('ix_match_season_phase_status', 'season_id', 'phase', 'status'),
+        db.Index('ix_match_season_status', 'season_id', 'status'),
+        # A team's fixtures: (team_a_id = x OR team_b_id = x) combines both
+        db.Index('ix_match_season_team_a', 'season_id', 'team_a_id'),
+        db.Index('ix_match_season_team_b', 'season_id', 'team_b_id'),
+        # Player history over the four participation columns
+        db.Index('ix_match_season_team_a_player1', 'season_id', 'team_a_player1_id'),
+        db.Index('ix_match_season_team_a_player2', 'season_id', 'team_a_player2_id'),
+        db.Index('ix_match_season_team_b_player1', 'season_id', 'team_b_player1_id'),
+        db.Index('ix_match_season_team_b_player2', 'season_id', 'team_b_player2_id'),
+    )
 
 
 class Reschedule(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    match_id = db.Column(db.Integer)
-    requester_team_id = db.Column(db.Integer)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=True)
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id'))
+    requester_team_id = db.Column(db.Integer, db.ForeignKey('team.id'))
     proposed_time = db.Column(db.String(100))
     status = db.Column(db.String(20), default="pending")  # pending/approved/denied
     approved_by_admin = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.String(50))
 
+    match = db.relationship('Match', back_populates='reschedules')
+    requester_team = db.relationship('Team')
+
+    __table_args__ = (
+        db.Index('ix_reschedule_season_status', 'season_id', 'status'),
+    )
+
 
 class Substitute(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    team_id = db.Column(db.Integer)
-    match_id = db.Column(db.Integer)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'))
+    match_id = db.Column(db.Integer, db.ForeignKey('match.id'))
     name = db.Column(db.String(100))
     phone = db.Column(db.String(20))
     email = db.Column(db.String(100), nullable=True)  # Substitute's email address
-    player_id = db.Column(db.Integer, nullable=True)  # Links to Player model
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=True)  # Links to Player model
     replaces_player_number = db.Column(db.Integer, nullable=True)  # 1 or 2 (which team player they're replacing)
     status = db.Column(db.String(20), default="pending")  # pending/approved/denied
     created_at = db.Column(db.String(50))
 
+    match = db.relationship('Match', back_populates='substitutes')
+    team = db.relationship('Team')
+    player = db.relationship('Player')
+
+    __table_args__ = (
+        db.Index('ix_substitute_season_match', 'season_id', 'match_id'),
+    )
+
+
+class SeasonTeamSummary(db.Model):
+    """Read-only final standings of an archived season"""
+    __tablename__ = 'season_team_summary'
+
+    id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    team_id = db.Column(db.Integer, nullable=False)  # Team row may be purged
+    final_rank = db.Column(db.Integer, nullable=False)
+    team_name = db.Column(db.String(100), nullable=False)
+    player1_name = db.Column(db.String(100))
+    player2_name = db.Column(db.String(100))
+    status = db.Column(db.String(20))
+    wins = db.Column(db.Integer, default=0)
+    losses = db.Column(db.Integer, default=0)
+    draws = db.Column(db.Integer, default=0)
+    points = db.Column(db.Integer, default=0)
+    sets_for = db.Column(db.Integer, default=0)
+    sets_against = db.Column(db.Integer, default=0)
+    games_for = db.Column(db.Integer, default=0)
+    games_against = db.Column(db.Integer, default=0)
+    playoff_result = db.Column(db.String(20), nullable=True)  # champion, runner_up, semifinal, ...
+
+    __table_args__ = (
+        db.UniqueConstraint('season_id', 'team_id', name='uq_season_team_summary_team'),
+        db.Index('ix_season_team_summary_rank', 'season_id', 'final_rank'),
+    )
+
+
+class SeasonPlayerSummary(db.Model):
+    """Read-only per-player totals of an archived season, from its completed matches"""
+    __tablename__ = 'season_player_summary'
+
+    id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, db.ForeignKey('season.id'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    matches_played = db.Column(db.Integer, default=0)
+    wins = db.Column(db.Integer, default=0)
+    losses = db.Column(db.Integer, default=0)
+    draws = db.Column(db.Integer, default=0)
+    points = db.Column(db.Integer, default=0)
+    sets_for = db.Column(db.Integer, default=0)
+    sets_against = db.Column(db.Integer, default=0)
+    games_for = db.Column(db.Integer, default=0)
+    games_against = db.Column(db.Integer, default=0)
+
+    __table_args__ = (
+        db.UniqueConstraint('season_id', 'player_id', name='uq_season_player_summary_player'),
+    )
+
 
 class LeagueSettings(db.Model):
     __tablename__ = 'league_settings'
@@ -249,6 +367,12 @@ class LadderTeam(db.Model):
     def matches_played(self):
         return self.wins + self.losses + self.draws
 
+    __table_args__ = (
+        # Ladder tables in rank order, rank shifts and last-place lookups
+        db.Index('ix_ladder_team_type_rank', 'ladder_type', 'current_rank'),
+        db.Index('ix_ladder_team_gender_rank', 'gender', 'current_rank'),
+    )
+
 
 class LadderFreeAgent(db.Model):
     __tablename__ = 'ladder_free_agent'
@@ -292,12 +416,28 @@ class LadderChallenge(db.Model):
     accepted_at = db.Column(db.DateTime, nullable=True)
     completed_at = db.Column(db.DateTime, nullable=True)
 
+    # No FK constraint: a ladder team can be deleted while its finished challenges stay as history
+    challenger = db.relationship(
+        'LadderTeam', primaryjoin='foreign(LadderChallenge.challenger_team_id) == LadderTeam.id'
+    )
+    challenged = db.relationship(
+        'LadderTeam', primaryjoin='foreign(LadderChallenge.challenged_team_id) == LadderTeam.id'
+    )
+
+    __table_args__ = (
+        # Active challenges (status IN pending_acceptance/accepted), overall or per ladder
+        db.Index('ix_ladder_challenge_status_type', 'status', 'ladder_type'),
+        # Challenge locks for one team
+        db.Index('ix_ladder_challenge_challenger_status', 'challenger_team_id', 'status'),
+        db.Index('ix_ladder_challenge_challenged_status', 'challenged_team_id', 'status'),
+    )
+
 
 class LadderMatch(db.Model):
     __tablename__ = 'ladder_match'
     
     id = db.Column(db.Integer, primary_key=True)
-    challenge_id = db.Column(db.Integer, nullable=False)
+    challenge_id = db.Column(db.Integer, db.ForeignKey('ladder_challenge.id'), nullable=False)
     team_a_id = db.Column(db.Integer, nullable=False)
     team_b_id = db.Column(db.Integer, nullable=False)
     ladder_type = db.Column(db.String(10), nullable=False)
@@ -352,6 +492,21 @@ class LadderMatch(db.Model):
     no_show_verified = db.Column(db.Boolean, default=False)
     no_show_notes = db.Column(db.Text, nullable=True)
 
+    challenge = db.relationship('LadderChallenge')
+    # No FK constraint on the teams, as for LadderChallenge
+    team_a = db.relationship('LadderTeam', primaryjoin='foreign(LadderMatch.team_a_id) == LadderTeam.id')
+    team_b = db.relationship('LadderTeam', primaryjoin='foreign(LadderMatch.team_b_id) == LadderTeam.id')
+
+    __table_args__ = (
+        # Recent verified results per ladder (ORDER BY completed_at DESC LIMIT n)
+        db.Index('ix_ladder_match_type_verified_completed', 'ladder_type', 'verified', 'completed_at'),
+        # Verified matches this month, across ladders
+        db.Index('ix_ladder_match_verified_completed', 'verified', 'completed_at'),
+        db.Index('ix_ladder_match_challenge', 'challenge_id'),
+        db.Index('ix_ladder_match_team_a_status', 'team_a_id', 'status'),
+        db.Index('ix_ladder_match_team_b_status', 'team_b_id', 'status'),
+    )
+
 
 class AmericanoTournament(db.Model):
     __tablename__ = 'americano_tournament'
@@ -381,19 +536,24 @@ class AmericanoTournament(db.Model):
     public_description = db.Column(db.Text, nullable=True)
     num_courts = db.Column(db.Integer, default=2)
 
+    matches = db.relationship(
+        'AmericanoMatch', back_populates='tournament',
+        order_by='(AmericanoMatch.round_number, AmericanoMatch.court_number, AmericanoMatch.id)'
+    )
+
 
 class AmericanoMatch(db.Model):
     __tablename__ = 'americano_match'
     
     id = db.Column(db.Integer, primary_key=True)
-    tournament_id = db.Column(db.Integer, nullable=False)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('americano_tournament.id'), nullable=False)
     round_number = db.Column(db.Integer, nullable=False)
     court_number = db.Column(db.Integer, nullable=True)
     
-    player1_id = db.Column(db.Integer, nullable=False)
-    player2_id = db.Column(db.Integer, nullable=False)
-    player3_id = db.Column(db.Integer, nullable=False)
-    player4_id = db.Column(db.Integer, nullable=False)
+    player1_id = db.Column(db.Integer, db.ForeignKey('ladder_free_agent.id'), nullable=False)
+    player2_id = db.Column(db.Integer, db.ForeignKey('ladder_free_agent.id'), nullable=False)
+    player3_id = db.Column(db.Integer, db.ForeignKey('ladder_free_agent.id'), nullable=False)
+    player4_id = db.Column(db.Integer, db.ForeignKey('ladder_free_agent.id'), nullable=False)
     
     # Points-based scoring (Team A = Player1+Player2, Team B = Player3+Player4)
     score_team_a = db.Column(db.Integer, default=0)  # Total points scored by Team A
@@ -408,6 +568,17 @@ class AmericanoMatch(db.Model):
     
     created_at = db.Column(db.DateTime, nullable=True)
 
+    tournament = db.relationship('AmericanoTournament', back_populates='matches')
+    player1 = db.relationship('LadderFreeAgent', foreign_keys=[player1_id])
+    player2 = db.relationship('LadderFreeAgent', foreign_keys=[player2_id])
+    player3 = db.relationship('LadderFreeAgent', foreign_keys=[player3_id])
+    player4 = db.relationship('LadderFreeAgent', foreign_keys=[player4_id])
+
+    __table_args__ = (
+        # A tournament's schedule in round order; also serves tournament_id alone
+        db.Index('ix_americano_match_tournament_round', 'tournament_id', 'round_number'),
+    )
+
 
 class AmericanoRegistration(db.Model):
     __tablename__ = 'americano_registration'
@@ -434,6 +605,35 @@ class AmericanoRegistration(db.Model):
 
     created_at = db.Column(db.DateTime, nullable=True)
 
+    __table_args__ = (
+        # Duplicate-registration checks are scoped to one tournament's confirmed entries
+        db.Index('ix_americano_registration_tournament_status', 'tournament_id', 'status'),
+    )
+
+
+class AmericanoStanding(db.Model):
+    """Running leaderboard totals per player, kept in step with scores (see americano_standings.py)"""
+    __tablename__ = 'americano_standing'
+
+    id = db.Column(db.Integer, primary_key=True)
+    tournament_id = db.Column(db.Integer, db.ForeignKey('americano_tournament.id'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('ladder_free_agent.id'), nullable=False)
+
+    matches_played = db.Column(db.Integer, default=0, nullable=False)
+    wins = db.Column(db.Integer, default=0, nullable=False)
+    draws = db.Column(db.Integer, default=0, nullable=False)
+    losses = db.Column(db.Integer, default=0, nullable=False)
+    total_points = db.Column(db.Integer, default=0, nullable=False)  # points won
+    points_against = db.Column(db.Integer, default=0, nullable=False)  # points conceded
+
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('tournament_id', 'player_id', name='uq_americano_standing_player'),
+        # Leaderboard read: one tournament, best total first
+        db.Index('ix_americano_standing_order', 'tournament_id', 'total_points'),
+    )
+
 
 class LadderSettings(db.Model):
     __tablename__ = 'ladder_settings'
@@ -452,4 +652,64 @@ class LadderSettings(db.Model):
     men_registration_open = db.Column(db.Boolean, default=True)
     women_registration_open = db.Column(db.Boolean, default=True)
     mixed_registration_open = db.Column(db.Boolean, default=True)
-    penalties_active = db.Column(db.Boolean, default=False)
\ No newline at end of file
+    penalties_active = db.Column(db.Boolean, default=False)
+
+class SchedulerLease(db.Model):
+    """Leader-election lease: only the process holding an unexpired lease runs scheduled jobs"""
+    __tablename__ = 'scheduler_lease'
+
+    name = db.Column(db.String(50), primary_key=True)
+    holder = db.Column(db.String(100), nullable=False)  # hostname:pid:nonce of the leader
+    expires_at = db.Column(db.DateTime, nullable=False)
+    acquired_at = db.Column(db.DateTime, nullable=True)
+
+
+class ScheduledJobRun(db.Model):
+    """Last run of each scheduled job; also used to claim a run so each interval executes once"""
+    __tablename__ = 'scheduled_job_run'
+
+    job_id = db.Column(db.String(50), primary_key=True)
+    holder = db.Column(db.String(100), nullable=True)
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    last_finished_at = db.Column(db.DateTime, nullable=True)
+    last_duration_ms = db.Column(db.Integer, nullable=True)
+    last_status = db.Column(db.String(20), nullable=True)  # running, success, failed
+    last_result = db.Column(db.String(200), nullable=True)
+
+
+class DataVersion(db.Model):
+    """Change counter per cached read model, bumped by every write to its source tables (see data_versions.py)"""
+    __tablename__ = 'data_version'
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+class PlayerContact(db.Model):
+    """
+    Player directory: one row per player identity wherever contact details live
+    (league/ladder team rosters, free agents, players), with normalized phone and
+    email for indexed identity lookups. Kept in sync by the mapper event listeners
+    in contact_index.py; rebuild with rebuild_contact_index().
+    """
+    __tablename__ = 'player_contact'
+
+    id = db.Column(db.Integer, primary_key=True)
+    owner_type = db.Column(db.String(20), nullable=False)  # team, ladder_team, free_agent, ladder_free_agent, player
+    owner_id = db.Column(db.Integer, nullable=False)
+    slot = db.Column(db.Integer, nullable=True)  # 1 or 2 for team rosters
+
+    # Contact details as stored on the owner (returned to callers without re-loading it)
+    name = db.Column(db.String(100), nullable=True)
+    phone = db.Column(db.String(20), nullable=True)
+    email = db.Column(db.String(120), nullable=True)
+    gender = db.Column(db.String(10), nullable=True)
+
+    # Normalized lookup keys
+    phone_normalized = db.Column(db.String(20), nullable=True, index=True)
+    phone_reversed = db.Column(db.String(20), nullable=True, index=True)  # digits reversed, for suffix lookups
+    email_normalized = db.Column(db.String(120), nullable=True, index=True)  # lower(trim(email))
+
+    __table_args__ = (
+        db.Index('ix_player_contact_owner', 'owner_type', 'owner_id'),
+    )
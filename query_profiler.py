@@ -0,0 +1,224 @@
+"""
+Query Profiler for BD Padel League
+Counts the SQL statements each request issues and the time spent in the
+database, from SQLAlchemy's before/after_cursor_execute events:
+
+    - every response gets a Server-Timing header (db time and query count,
+      total request time), visible in the browser's network panel;
+    - admins get a small toolbar at the bottom of HTML pages with the
+      request's count, DB time and slowest statements;
+    - /admin/perf lists per-endpoint totals and the slowest statements seen
+      by this worker since it started (or was reset);
+    - statements slower than QUERY_PROFILER_SLOW_MS are logged.
+
+Off unless QUERY_PROFILER_ENABLED=true: when off, no listeners are attached
+and requests pay nothing. Only statement text is kept, never parameters.
+Queries outside a request (scheduler jobs, scripts) are not counted.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+
+from flask import current_app, g, has_request_context, render_template, request, session
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+QUERY_PROFILER_ENABLED = os.environ.get("QUERY_PROFILER_ENABLED", "false").lower() == "true"
+QUERY_PROFILER_SLOW_MS = float(os.environ.get("QUERY_PROFILER_SLOW_MS", "100"))
+SLOWEST_PER_REQUEST = 5
+SLOWEST_OVERALL = 25
+STATEMENT_MAX_CHARS = 500
+
+_STARTS_KEY = "query_profiler_starts"
+
+
+def _shorten(statement):
+    statement = " ".join(statement.split())
+    if len(statement) > STATEMENT_MAX_CHARS:
+        return statement[:STATEMENT_MAX_CHARS] + "..."
+    return statement
+
+
+def _keep_slowest(heap, limit, entry):
+    """Min-heap of the `limit` largest entries (by their first item)"""
+    if len(heap) < limit:
+        heapq.heappush(heap, entry)
+    elif entry[0] > heap[0][0]:
+        heapq.heapreplace(heap, entry)
+
+
+class RequestProfile:
+    """Queries issued while handling one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.db_seconds = 0.0
+        self._slowest = []  # min-heap of (seconds, sequence, statement)
+
+    def record(self, statement, seconds):
+        self.query_count += 1
+        self.db_seconds += seconds
+        _keep_slowest(self._slowest, SLOWEST_PER_REQUEST, (seconds, self.query_count, statement))
+
+    def slowest(self):
+        """[(seconds, statement), ...] slowest first"""
+        return [(seconds, _shorten(statement)) for seconds, _seq, statement in sorted(self._slowest, reverse=True)]
+
+
+class ProfileStore:
+    """Per-endpoint totals and the slowest statements overall, for this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}
+            self._slowest = []  # min-heap of (seconds, sequence, endpoint, statement)
+            self.since = time.time()
+
+    def record(self, endpoint, profile, wall_seconds):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {
+                    "endpoint": endpoint, "requests": 0, "queries": 0, "max_queries": 0,
+                    "db_seconds": 0.0, "max_db_seconds": 0.0, "wall_seconds": 0.0,
+                }
+            stats["requests"] += 1
+            stats["queries"] += profile.query_count
+            stats["max_queries"] = max(stats["max_queries"], profile.query_count)
+            stats["db_seconds"] += profile.db_seconds
+            stats["max_db_seconds"] = max(stats["max_db_seconds"], profile.db_seconds)
+            stats["wall_seconds"] += wall_seconds
+            for seconds, _seq, statement in profile._slowest:
+                _keep_slowest(self._slowest, SLOWEST_OVERALL, (seconds, next(self._sequence), endpoint, statement))
+
+    def endpoints(self):
+        """Endpoint totals, most DB time first, with per-request averages"""
+        with self._lock:
+            rows = [dict(stats) for stats in self._endpoints.values()]
+        for row in rows:
+            row["avg_queries"] = row["queries"] / row["requests"]
+            row["avg_db_ms"] = 1000 * row["db_seconds"] / row["requests"]
+            row["avg_wall_ms"] = 1000 * row["wall_seconds"] / row["requests"]
+            row["max_db_ms"] = 1000 * row["max_db_seconds"]
+        return sorted(rows, key=lambda row: row["db_seconds"], reverse=True)
+
+    def slowest(self):
+        """[(ms, endpoint, statement), ...] slowest first"""
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        return [(1000 * seconds, endpoint, _shorten(statement)) for seconds, _seq, endpoint, statement in entries]
+
+
+_store = ProfileStore()
+
+
+def get_store():
+    return _store
+
+
+def current_profile():
+    """The running request's RequestProfile, or None (profiler off / outside a request)"""
+    if not has_request_context():
+        return None
+    return g.get("query_profile")
+
+
+# ============================================================================
+# SQLALCHEMY EVENTS
+# ============================================================================
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    conn.info.setdefault(_STARTS_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany):
+    starts = conn.info.get(_STARTS_KEY)
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    profile = current_profile()
+    if profile is None:
+        return
+    profile.record(statement, seconds)
+    if seconds * 1000 >= QUERY_PROFILER_SLOW_MS:
+        current_app.logger.warning(
+            f"[SLOW QUERY] {seconds * 1000:.1f} ms in {request.endpoint}: {_shorten(statement)}"
+        )
+
+
+def _handle_error(exception_context):
+    # The statement failed, so after_cursor_execute won't pop its start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_STARTS_KEY):
+        conn.info[_STARTS_KEY].pop()
+
+
+# ============================================================================
+# FLASK HOOKS
+# ============================================================================
+
+def _start_profile():
+    if request.endpoint != "static":
+        g.query_profile = RequestProfile()
+
+
+def _server_timing(profile, wall_seconds):
+    return (
+        f'db;dur={profile.db_seconds * 1000:.1f};desc="{profile.query_count} queries", '
+        f'app;dur={wall_seconds * 1000:.1f}'
+    )
+
+
+def _inject_toolbar(response, profile, wall_seconds):
+    body = response.get_data(as_text=True)
+    position = body.rfind("</body>")
+    if position == -1:
+        return
+    toolbar = render_template(
+        "partials/perf_toolbar.html",
+        profile=profile,
+        db_ms=profile.db_seconds * 1000,
+        wall_ms=wall_seconds * 1000,
+        slowest=[(seconds * 1000, statement) for seconds, statement in profile.slowest()],
+    )
+    response.set_data(body[:position] + toolbar + body[position:])
+
+
+def _finish_profile(response):
+    profile = g.pop("query_profile", None)
+    if profile is None:
+        return response
+    wall_seconds = time.perf_counter() - profile.started
+    _store.record(request.endpoint or "unknown", profile, wall_seconds)
+
+    response.headers["Server-Timing"] = _server_timing(profile, wall_seconds)
+    if (
+        session.get("admin_authenticated")
+        and response.status_code == 200
+        and response.mimetype == "text/html"
+        and not response.is_streamed
+    ):
+        _inject_toolbar(response, profile, wall_seconds)
+    return response
+
+
+def init_app(app):
+    """Attach the profiler when QUERY_PROFILER_ENABLED is set; returns whether it did"""
+    app.config["QUERY_PROFILER_ENABLED"] = QUERY_PROFILER_ENABLED
+    if not QUERY_PROFILER_ENABLED:
+        return False
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    return True
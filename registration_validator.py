@@ -0,0 +1,178 @@
+"""
+Registration Validator for BD Padel League
+Duplicate checks for league team, ladder team and Americano registrations.
+
+Every identifier on the form (both players' emails and phones, plus the
+canonical team name) is checked in a single UNION ALL query: player identities
+are probed on the indexed normalized columns of player_contact, team names on
+the indexed team_name_canonical columns. Matching is on normalized values, so
+"Foo@Example.com " and "foo@example.com" collide, as do local and formatted
+versions of the same phone number.
+"""
+
+from sqlalchemy import literal, null, select, union_all
+
+from models import db, PlayerContact, Team, LadderTeam, AmericanoRegistration
+from contact_index import email_key, phone_key
+from utils import normalize_team_name
+
+PLAYER_LABELS = ("Player 1", "Player 2")
+
+DUPLICATE_TEAM_NAME_MESSAGE = "A team with a similar name already exists. Please choose a unique name."
+
+
+def _roster_select(team_model, owner_type, email_keys, phone_keys, gender=None):
+    """Roster entries of one team type that use any of the given emails or phones"""
+    conditions = []
+    if email_keys:
+        conditions.append(PlayerContact.email_normalized.in_(email_keys))
+    if phone_keys:
+        conditions.append(PlayerContact.phone_normalized.in_(phone_keys))
+
+    query = select(
+        literal("player").label("kind"),
+        PlayerContact.owner_id.label("team_id"),
+        team_model.team_name.label("team_name"),
+        PlayerContact.email_normalized.label("email"),
+        PlayerContact.phone_normalized.label("phone"),
+    ).join(
+        team_model, team_model.id == PlayerContact.owner_id
+    ).where(
+        PlayerContact.owner_type == owner_type,
+        db.or_(*conditions)
+    )
+    if gender:
+        query = query.where(PlayerContact.gender == gender)
+    return query
+
+
+def _team_name_select(team_model, canonical):
+    """Teams of one type already using a canonical team name"""
+    return select(
+        literal("team_name").label("kind"),
+        team_model.id.label("team_id"),
+        team_model.team_name.label("team_name"),
+        null().label("email"),
+        null().label("phone"),
+    ).where(team_model.team_name_canonical == canonical)
+
+
+def _player_keys(players):
+    """[(email, phone), ...] -> [(email_key, phone_key), ...]"""
+    return [(email_key(email), phone_key(phone)) for email, phone in players]
+
+
+def _find_conflicts(player_keys, roster_sources, name_models, canonical):
+    """
+    Run every duplicate check in one query.
+    roster_sources: [(team_model, owner_type, gender or None), ...]
+    name_models: team models whose canonical names must stay unique
+    Returns the matching rows, lowest team id first.
+    """
+    email_keys = sorted({e for e, _p in player_keys if e})
+    phone_keys = sorted({p for _e, p in player_keys if p})
+
+    selects = []
+    if email_keys or phone_keys:
+        selects += [
+            _roster_select(model, owner_type, email_keys, phone_keys, gender)
+            for model, owner_type, gender in roster_sources
+        ]
+    if canonical:
+        selects += [_team_name_select(model, canonical) for model in name_models]
+    if not selects:
+        return []
+
+    rows = db.session.execute(union_all(*selects)).all()
+    return sorted(rows, key=lambda row: row.team_id)
+
+
+def _player_conflict_message(rows, player_keys, team_label, scope_note):
+    """First conflict in form order: P1 email, P1 phone, P2 email, P2 phone"""
+    players = [row for row in rows if row.kind == "player"]
+    for label, (email, phone) in zip(PLAYER_LABELS, player_keys):
+        match = next((row for row in players if email and row.email == email), None)
+        if match:
+            return (f"{label}'s email ({email}) is already registered in {team_label} "
+                    f"'{match.team_name}'. {scope_note}")
+        match = next((row for row in players if phone and row.phone == phone), None)
+        if match:
+            return (f"{label}'s WhatsApp number is already registered in {team_label} "
+                    f"'{match.team_name}'. {scope_note}")
+    return None
+
+
+def validate_league_team(team_name, players):
+    """
+    Duplicate checks for a league team registration.
+    players: [(email, phone), (email, phone)] for Player 1 and Player 2
+    Returns an error message, or None if the team can be registered.
+    """
+    player_keys = _player_keys(players)
+    rows = _find_conflicts(
+        player_keys,
+        roster_sources=[(Team, "team", None)],
+        name_models=[Team],
+        canonical=normalize_team_name(team_name)
+    )
+
+    message = _player_conflict_message(
+        rows, player_keys, "team", "Each player can only be in one team."
+    )
+    if message:
+        return message
+    if any(row.kind == "team_name" for row in rows):
+        return DUPLICATE_TEAM_NAME_MESSAGE
+    return None
+
+
+def validate_ladder_team(team_name, players, gender):
+    """
+    Duplicate checks for a ladder team registration.
+    Team names must be unique across league and ladder teams. Players may also be
+    in a league team; a Mixed ladder player may also be in one Men's/Women's ladder
+    team, so Mixed registrations are only checked against other Mixed teams.
+    Returns an error message, or None if the team can be registered.
+    """
+    player_keys = _player_keys(players)
+    mixed = gender == "mixed"
+    rows = _find_conflicts(
+        player_keys,
+        roster_sources=[(LadderTeam, "ladder_team", "mixed" if mixed else None)],
+        name_models=[Team, LadderTeam],
+        canonical=normalize_team_name(team_name)
+    )
+
+    if any(row.kind == "team_name" for row in rows):
+        return DUPLICATE_TEAM_NAME_MESSAGE
+    if mixed:
+        return _player_conflict_message(
+            rows, player_keys, "mixed team", "Each player can only be in one mixed team."
+        )
+    return _player_conflict_message(
+        rows, player_keys, "ladder team", "Each player can only be in one ladder team."
+    )
+
+
+def validate_tournament_registration(tournament_id, email, phone):
+    """
+    Duplicate check for an Americano registration: one probe on the tournament's
+    confirmed registrations (stored with lower-cased email and normalized phone).
+    Returns an error message, or None if the player can register.
+    """
+    conditions = []
+    if email_key(email):
+        conditions.append(AmericanoRegistration.email == email_key(email))
+    if phone_key(phone):
+        conditions.append(AmericanoRegistration.phone == phone_key(phone))
+    if not conditions:
+        return None
+
+    existing = db.session.query(AmericanoRegistration.id).filter(
+        AmericanoRegistration.tournament_id == tournament_id,
+        AmericanoRegistration.status == 'confirmed',
+        db.or_(*conditions)
+    ).first()
+    if existing:
+        return "You are already registered for this tournament."
+    return None
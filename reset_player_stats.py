@@ -1,8 +1,10 @@
 import os
 os.environ['DATABASE_URL'] = os.environ.get('DATABASE_URL', 'sqlite:///instance/league.db')
 
-from app import app, db
-from models import Team, Match
+from app_factory import create_app
+from models import db, Team, Match
+
+app = create_app(blueprints=())  # database only, no routes
 
 def reset_and_recalculate_team_stats(team_id):
     """Reset team stats and recalculate from all verified matches"""
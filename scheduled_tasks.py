@@ -4,75 +4,88 @@ Scheduled Tasks for BD Padel League
 Handles automated email notifications for:
 - Walkover warnings (before deadlines)
 - Match reminders (24 hours before matches)
+and automated enforcement of:
+- League walkovers for missed deadlines
+- Ladder penalties for unanswered challenges
 
-Run this script periodically (e.g., via cron or background worker)
+Scheduled by job_runner.py (run_scheduled_tasks.py worker), or run once directly.
 """
 
 import os
 from datetime import datetime, timedelta
-from models import db, Match, Team, Reschedule
-from utils import send_email_notification
-from app import app
+from flask import current_app, has_app_context
+from models import db, Match, Team, Reschedule, LadderChallenge, LadderTeam, LadderSettings
+from utils import (
+    send_email_notification,
+    get_round_deadline,
+    get_makeup_deadline,
+    query_open_matches_with_teams,
+    query_reschedules_with_teams,
+)
+from ladder_rules import apply_rank_penalty
+from app_factory import create_app
+
+_app = None
+
+
+def _app_context():
+    """
+    A fresh app context for a task: job_runner's app when it runs the task,
+    otherwise (this file run directly) a database-only app
+    """
+    global _app
+    if has_app_context():
+        return current_app._get_current_object().app_context()
+    if _app is None:
+        _app = create_app(blueprints=())
+    return _app.app_context()
 
 def send_walkover_warnings():
     """
     Send warnings to teams that haven't completed matches before deadlines.
     Run this daily at 10 AM to give teams advance warning.
+
+    Uses one query per deadline type (teams and reschedule state pre-joined),
+    so the sweep costs the same number of queries however many matches are open.
     """
-    with app.app_context():
+    with _app_context():
         now = datetime.now()
         today = now.date()
         
         warnings_sent = 0
         
-        # Check regular matches (Sunday deadline)
-        if today.weekday() >= 4:  # Friday, Saturday, or Sunday
-            # Find matches that are still scheduled and approaching Sunday deadline
-            upcoming_sunday = today + timedelta(days=(6 - today.weekday()))
+        # Check regular matches (round deadline, legacy Sunday)
+        # Matches with a pending reschedule are excluded by the query (they get the makeup deadline)
+        scheduled_matches = query_open_matches_with_teams(["scheduled"])
+        
+        for match, team_a, team_b in scheduled_matches:
+            if match.booking_confirmed:
+                continue
             
-            scheduled_matches = Match.query.filter(
-                Match.status == "scheduled",
-                Match.round.isnot(None)
-            ).all()
+            round_deadline = get_round_deadline(match)
+            if not round_deadline:
+                continue
             
-            for match in scheduled_matches:
-                # Skip if this match has a pending reschedule
-                has_reschedule = Reschedule.query.filter_by(
-                    match_id=match.id,
-                    status="pending"
-                ).first()
-                
-                if has_reschedule:
-                    continue
-                
-                # Get teams
-                team_a = Team.query.get(match.team_a_id)
-                team_b = Team.query.get(match.team_b_id)
-                
-                if not team_a or not team_b:
-                    continue
+            days_until_deadline = (round_deadline.date() - today).days
+            
+            # Send warning if 2 days or less until deadline
+            if 0 <= days_until_deadline <= 2:
+                subject = f"⚠️ URGENT: Match Deadline - {days_until_deadline} Days Left"
                 
-                # Calculate round end date
-                from app import get_round_start_date
-                round_start = get_round_start_date(match.round)
-                if round_start:
-                    round_end = round_start + timedelta(days=6)  # Sunday
-                    days_until_deadline = (round_end - today).days
-                    
-                    # Send warning if 2 days or less until deadline
-                    if 0 <= days_until_deadline <= 2 and not match.booking_confirmed:
-                        warning_body = f"""Hi!
+                # Send to both teams, each with their own opponent
+                for team, opponent in ((team_a, team_b), (team_b, team_a)):
+                    warning_body = f"""Hi!
 
 ⚠️ DEADLINE WARNING - Match Not Completed
 
 Your Round {match.round} match is approaching the deadline!
 
 Match Details:
-- Opponent: {team_b.team_name if match.team_a_id == team_a.id else team_a.team_name}
-- Deadline: Sunday {round_end.strftime('%B %d')} at 23:59
+- Opponent: {opponent.team_name}
+- Deadline: {round_deadline.strftime('%A %B %d')} at 23:59
 - Days Remaining: {days_until_deadline}
 
-⚠️ If not completed by Sunday 23:59, an automatic WALKOVER will be awarded to your opponent.
+⚠️ If not completed by the deadline, an automatic WALKOVER will be awarded to your opponent.
 
 📋 Action Required:
 1. Coordinate with opponent IMMEDIATELY
@@ -81,47 +94,29 @@ Match Details:
 
 - BD Padel League
 """
-                        # Send to both teams
-                        if team_a.player1_email:
-                            send_email_notification(team_a.player1_email, f"⚠️ URGENT: Match Deadline - {days_until_deadline} Days Left", warning_body)
-                        if team_a.player2_email:
-                            send_email_notification(team_a.player2_email, f"⚠️ URGENT: Match Deadline - {days_until_deadline} Days Left", warning_body)
-                        if team_b.player1_email:
-                            send_email_notification(team_b.player1_email, f"⚠️ URGENT: Match Deadline - {days_until_deadline} Days Left", warning_body)
-                        if team_b.player2_email:
-                            send_email_notification(team_b.player2_email, f"⚠️ URGENT: Match Deadline - {days_until_deadline} Days Left", warning_body)
-                        
-                        warnings_sent += 1
+                    if team.player1_email:
+                        send_email_notification(team.player1_email, subject, warning_body)
+                    if team.player2_email:
+                        send_email_notification(team.player2_email, subject, warning_body)
+                
+                warnings_sent += 1
         
-        # Check makeup matches (Wednesday deadline)
-        pending_reschedules = Reschedule.query.filter_by(status="approved").all()
+        # Check makeup matches (round deadline + 3 days, legacy Wednesday)
+        approved_reschedules = query_reschedules_with_teams("approved")
         
-        for reschedule in pending_reschedules:
-            match = Match.query.get(reschedule.match_id)
-            if not match or match.status == "completed":
+        for reschedule, match, requester_team, opponent_team in approved_reschedules:
+            if match.booking_confirmed:
                 continue
             
-            # Parse the proposed time to get the Wednesday deadline
-            if reschedule.proposed_time and " at " in reschedule.proposed_time:
-                try:
-                    date_str = reschedule.proposed_time.split(" at ")[0]
-                    proposed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    
-                    # Find Wednesday of that week
-                    proposed_weekday = proposed_date.weekday()
-                    if proposed_weekday in [0, 1, 2]:
-                        days_to_wednesday = 2 - proposed_weekday
-                        wednesday_deadline = proposed_date + timedelta(days=days_to_wednesday)
-                        days_until_deadline = (wednesday_deadline - today).days
-                        
-                        # Send warning if 1 day or less until Wednesday deadline
-                        if 0 <= days_until_deadline <= 1 and not match.booking_confirmed:
-                            requester_team = Team.query.get(reschedule.requester_team_id)
-                            opponent_id = match.team_b_id if match.team_a_id == requester_team.id else match.team_a_id
-                            opponent_team = Team.query.get(opponent_id)
-                            
-                            if requester_team and opponent_team:
-                                makeup_warning = f"""Hi!
+            makeup_deadline = get_makeup_deadline(match, reschedule)
+            if not makeup_deadline:
+                continue
+            
+            days_until_deadline = (makeup_deadline.date() - today).days
+            
+            # Send warning if 1 day or less until makeup deadline
+            if 0 <= days_until_deadline <= 1:
+                makeup_warning = f"""Hi!
 
 ⚠️ URGENT: MAKEUP MATCH DEADLINE WARNING
 
@@ -129,29 +124,26 @@ Your rescheduled match is approaching the absolute deadline!
 
 Match Details:
 - Round: {match.round}
-- Opponent: {opponent_team.team_name if reschedule.requester_team_id == requester_team.id else requester_team.team_name}
-- Wednesday Deadline: {wednesday_deadline.strftime('%B %d')} at 23:59
+- Opponent: {opponent_team.team_name}
+- Makeup Deadline: {makeup_deadline.strftime('%A %B %d')} at 23:59
 - Days Remaining: {days_until_deadline}
 
-⚠️ If not completed by Wednesday 23:59, an automatic WALKOVER will be awarded to {opponent_team.team_name if reschedule.requester_team_id == requester_team.id else requester_team.team_name}.
+⚠️ If not completed by the deadline, an automatic WALKOVER will be awarded to {opponent_team.team_name}.
 
 This is your FINAL WARNING. Complete the match IMMEDIATELY.
 
 - BD Padel League
 """
-                                # Send to both teams
-                                if requester_team.player1_email:
-                                    send_email_notification(requester_team.player1_email, f"🚨 FINAL WARNING: Makeup Match Deadline - {days_until_deadline} Days", makeup_warning)
-                                if requester_team.player2_email:
-                                    send_email_notification(requester_team.player2_email, f"🚨 FINAL WARNING: Makeup Match Deadline - {days_until_deadline} Days", makeup_warning)
-                                if opponent_team.player1_email:
-                                    send_email_notification(opponent_team.player1_email, f"🚨 FINAL WARNING: Makeup Match Deadline - {days_until_deadline} Days", makeup_warning)
-                                if opponent_team.player2_email:
-                                    send_email_notification(opponent_team.player2_email, f"🚨 FINAL WARNING: Makeup Match Deadline - {days_until_deadline} Days", makeup_warning)
-                                
-                                warnings_sent += 1
-                except:
-                    continue
+                subject = f"🚨 FINAL WARNING: Makeup Match Deadline - {days_until_deadline} Days"
+                
+                # Send to both teams
+                for team in (requester_team, opponent_team):
+                    if team.player1_email:
+                        send_email_notification(team.player1_email, subject, makeup_warning)
+                    if team.player2_email:
+                        send_email_notification(team.player2_email, subject, makeup_warning)
+                
+                warnings_sent += 1
         
         print(f"[SCHEDULED TASK] Sent {warnings_sent} walkover warnings")
         return warnings_sent
@@ -162,7 +154,7 @@ def send_match_reminders():
     Send 24-hour reminders for upcoming matches.
     Run this hourly to catch matches scheduled for tomorrow.
     """
-    with app.app_context():
+    with _app_context():
         now = datetime.now()
         tomorrow = now + timedelta(hours=24)
         
@@ -231,9 +223,62 @@ See you on the court! 🎾
         return reminders_sent
 
 
+def enforce_deadlines():
+    """
+    Apply automatic walkovers for matches past their regular or makeup deadline.
+    Run this daily shortly after midnight, once the previous day's deadlines have passed.
+    """
+    from deadline_engine import run_deadline_enforcement
+
+    with _app_context():
+        report = run_deadline_enforcement()
+        total = len(report['regular']) + len(report['makeup'])
+        print(f"[SCHEDULED TASK] Applied {total} deadline walkovers")
+        return total
+
+
+def sweep_ladder_penalties():
+    """
+    Expire ladder challenges that passed their acceptance deadline without a response
+    and apply the acceptance penalty to the challenged team.
+    Previously this only happened when the challenged team opened their dashboard.
+    Run this hourly.
+    """
+    with _app_context():
+        settings = LadderSettings.query.first()
+        if not settings or not settings.penalties_active:
+            print("[SCHEDULED TASK] Ladder penalties inactive, skipping sweep")
+            return 0
+
+        now = datetime.now()
+        expired = db.session.query(LadderChallenge, LadderTeam).join(
+            LadderTeam, LadderTeam.id == LadderChallenge.challenged_team_id
+        ).filter(
+            LadderChallenge.status == 'pending_acceptance',
+            LadderChallenge.acceptance_deadline < now
+        ).order_by(LadderChallenge.acceptance_deadline).all()
+
+        penalties_applied = 0
+        for challenge, challenged_team in expired:
+            challenge.status = 'expired'
+            # apply_rank_penalty commits, persisting the expiry together with the rank change
+            apply_rank_penalty(
+                challenged_team,
+                settings.acceptance_penalty_ranks,
+                "Failed to respond to a ladder challenge before the acceptance deadline"
+            )
+            penalties_applied += 1
+
+        db.session.commit()
+        print(f"[SCHEDULED TASK] Applied {penalties_applied} ladder acceptance penalties")
+        return penalties_applied
+
+
 if __name__ == "__main__":
     # Run both tasks when script is executed
     print("[SCHEDULED TASKS] Starting automated notifications...")
     send_walkover_warnings()
     send_match_reminders()
+    enforce_deadlines()
+    sweep_ladder_penalties()
     print("[SCHEDULED TASKS] Completed!")
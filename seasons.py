@@ -0,0 +1,315 @@
+"""
+Seasons for BD Padel League
+Every league team, match, reschedule and substitute belongs to a season. Reads
+of those models are scoped to the current season globally: a do_orm_execute
+hook adds a `season_id = <current>` loader criterion to every ORM select, so
+existing queries (and the composite indexes leading with season_id) only ever
+see one season, however many seasons pile up behind it. The current season is
+the most recent one, archived or not: after archiving, the site keeps showing
+it until the next season opens.
+
+New rows are stamped on insert with the active season, read in the inserting
+transaction. Between archiving and the next start there is none, so rows
+created then (archiving closes team registration, so these are rare) have no
+season; start_season takes them into the new season.
+
+Queries that need other seasons opt out with
+    .execution_options(all_seasons=True)
+and filter on season_id themselves.
+
+An archived season keeps its final standings and per-player totals in the
+read-only SeasonTeamSummary / SeasonPlayerSummary tables; archive_season(...,
+purge=True) then deletes its detail rows. Player rows are the cross-season
+identity and keep career totals.
+
+Before the first season exists nothing is scoped. ensure_first_season() opens
+Season 1 and assigns every season-less row to it - init_db does this for a
+fresh database, migrate_add_seasons.py for an existing one.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+
+from sqlalchemy import case, event, func, select, update
+from sqlalchemy.orm import Session, with_loader_criteria
+
+from models import (
+    db, Season, Team, Match, Reschedule, Substitute, LeagueSettings, Player,
+    SeasonTeamSummary, SeasonPlayerSummary,
+)
+import knockout_bracket
+import league_rankings
+
+SEASON_SCOPED_MODELS = (Team, Match, Reschedule, Substitute)
+
+FIRST_SEASON_NAME = "Season 1"
+FIRST_SEASON_START = date(2025, 11, 17)  # the league's original Round 1 Monday
+
+
+# ============================================================================
+# CURRENT SEASON
+# ============================================================================
+
+def _load_season_ids(connection):
+    # Core select on the connection: doesn't re-enter the ORM hook below
+    current_id, active_id = connection.execute(
+        select(func.max(Season.id), func.max(case((Season.status == "active", Season.id))))
+    ).one()
+    return {"current": current_id, "active": active_id}
+
+
+def _season_ids(session):
+    """
+    {"current": most recent season id, "active": most recent active season id},
+    read once per transaction and again after a season changes in it
+    """
+    connection = session.connection()  # begins the transaction if needed
+    season_ids = session.info.get("season_ids")
+    if season_ids is None:
+        season_ids = session.info["season_ids"] = _load_season_ids(connection)
+    return season_ids
+
+
+def get_current_season_id():
+    """Id of the season reads are scoped to (the most recent one), or None before the first season"""
+    return _season_ids(db.session)["current"]
+
+
+def get_current_season():
+    season_id = get_current_season_id()
+    return db.session.get(Season, season_id) if season_id else None
+
+
+def get_active_season_id():
+    """Id of the season new rows join, or None between seasons"""
+    return _season_ids(db.session)["active"]
+
+
+def all_seasons(query):
+    """The query without current-season scoping"""
+    return query.execution_options(all_seasons=True)
+
+
+# ============================================================================
+# SCOPING
+# ============================================================================
+
+@event.listens_for(Session, "do_orm_execute")
+def _scope_to_current_season(execute_state):
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get("all_seasons", False)
+    ):
+        return
+    season_id = _season_ids(execute_state.session)["current"]
+    if season_id is None:
+        return
+    execute_state.statement = execute_state.statement.options(*[
+        with_loader_criteria(model, lambda cls: cls.season_id == season_id, include_aliases=True)
+        for model in SEASON_SCOPED_MODELS
+    ])
+
+
+def _stamp_season(_mapper, connection, target):
+    # Read at insert time, in the inserting transaction, so a row added just
+    # after a season starts on another worker joins the new season
+    if target.season_id is None:
+        target.season_id = _load_season_ids(connection)["active"]
+
+
+for _model in SEASON_SCOPED_MODELS:
+    event.listen(_model, "before_insert", _stamp_season)
+
+
+def _season_changed(_mapper, _connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.pop("season_ids", None)
+
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Season, _event, _season_changed)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_season_ids(session, transaction):
+    # Another worker may archive or start a season before the next transaction
+    if transaction.parent is None:
+        session.info.pop("season_ids", None)
+
+
+# ============================================================================
+# LIFECYCLE
+# ============================================================================
+
+def _assign_unassigned(season_id):
+    """Move every season-less row into the season"""
+    for model in SEASON_SCOPED_MODELS:
+        table = model.__table__
+        db.session.execute(update(table).where(table.c.season_id.is_(None)).values(season_id=season_id))
+
+
+def ensure_first_season():
+    """
+    If no season exists yet, open Season 1 and assign every season-less row to
+    it, as migrate_add_seasons.py does. Returns the new season, or None if there
+    already was one. Caller commits.
+    """
+    if db.session.execute(select(Season.id).limit(1)).first() is not None:
+        return None
+
+    season = Season(
+        name=FIRST_SEASON_NAME, start_date=FIRST_SEASON_START, status="active", created_at=datetime.now()
+    )
+    db.session.add(season)
+    db.session.flush()
+    _assign_unassigned(season.id)
+    return season
+
+
+def start_season(name, start_date):
+    """
+    Open a new season (the previous one must be archived first), take in the
+    rows created since then and reset the league settings to the Swiss phase.
+    Caller commits.
+    """
+    if get_active_season_id() is not None:
+        raise ValueError("Archive the current season before starting a new one")
+
+    season = Season(name=name, start_date=start_date, status="active", created_at=datetime.now())
+    db.session.add(season)
+    db.session.flush()
+    _assign_unassigned(season.id)
+
+    settings = LeagueSettings.query.first()
+    if settings:
+        settings.current_phase = "swiss"
+        settings.playoffs_approved = False
+        settings.qualified_team_ids = None
+        settings.team_registration_open = True
+    db.session.flush()
+    return season
+
+
+def _playoff_results(matches):
+    """{team_id: how far the team got} from a season's knockout matches"""
+    results = {}
+    for match in matches:
+        if match.status not in ("completed", "walkover") or not match.winner_id or not match.team_b_id:
+            continue
+        loser_id = match.team_b_id if match.winner_id == match.team_a_id else match.team_a_id
+        if match.bracket_slot == knockout_bracket.THIRD_PLACE_SLOT:
+            results[match.winner_id] = "third_place"
+            results[loser_id] = "fourth_place"
+        elif knockout_bracket.slot_node(match.bracket_slot) == knockout_bracket.FINAL_NODE:
+            results[match.winner_id] = "champion"
+            results[loser_id] = "runner_up"
+        else:
+            results.setdefault(loser_id, match.phase)
+    return results
+
+
+def _player_totals(matches):
+    """Per-player totals over completed matches, as update_player_stats_from_match counts them"""
+    totals = defaultdict(lambda: defaultdict(int))
+    for match in matches:
+        if match.status != "completed" or not match.team_b_id:
+            continue
+        sides = (
+            (match.team_a_id, match.team_b_id, (match.team_a_player1_id, match.team_a_player2_id),
+             match.sets_a or 0, match.sets_b or 0, match.games_a or 0, match.games_b or 0),
+            (match.team_b_id, match.team_a_id, (match.team_b_player1_id, match.team_b_player2_id),
+             match.sets_b or 0, match.sets_a or 0, match.games_b or 0, match.games_a or 0),
+        )
+        for team_id, opponent_id, player_ids, sets_for, sets_against, games_for, games_against in sides:
+            for player_id in {pid for pid in player_ids if pid}:
+                player = totals[player_id]
+                player["matches_played"] += 1
+                player["sets_for"] += sets_for
+                player["sets_against"] += sets_against
+                player["games_for"] += games_for
+                player["games_against"] += games_against
+                if match.winner_id == team_id:
+                    player["wins"] += 1
+                    player["points"] += 3
+                elif match.winner_id == opponent_id:
+                    player["losses"] += 1
+                else:
+                    player["draws"] += 1
+                    player["points"] += 1
+    return totals
+
+
+def archive_season(season_id, purge=False):
+    """
+    Write a season's summaries, mark it archived and close team registration
+    until the next season starts. With purge=True its teams, matches,
+    reschedules and substitutes are deleted afterwards, leaving only the
+    summaries. Re-running rewrites the summaries (unless already purged).
+    Caller commits.
+    """
+    season = db.session.get(Season, season_id)
+    if season is None:
+        raise ValueError(f"Season {season_id} not found")
+
+    if season.purged_at is None:
+        teams = all_seasons(Team.query.filter(Team.season_id == season_id)).all()
+        matches = all_seasons(Match.query.filter(Match.season_id == season_id)).all()
+
+        SeasonTeamSummary.query.filter_by(season_id=season_id).delete()
+        SeasonPlayerSummary.query.filter_by(season_id=season_id).delete()
+
+        playoff_results = _playoff_results(m for m in matches if knockout_bracket.is_knockout_match(m))
+        ranked = league_rankings.rank_teams(teams, league_rankings.load_head_to_head(season_id))
+        db.session.add_all([
+            SeasonTeamSummary(
+                season_id=season_id, team_id=team.id, final_rank=rank,
+                team_name=team.team_name, player1_name=team.player1_name, player2_name=team.player2_name,
+                status=team.status, wins=team.wins, losses=team.losses, draws=team.draws,
+                points=team.points, sets_for=team.sets_for, sets_against=team.sets_against,
+                games_for=team.games_for, games_against=team.games_against,
+                playoff_result=playoff_results.get(team.id),
+            )
+            for rank, team in enumerate(ranked, start=1)
+        ])
+
+        totals = _player_totals(matches)
+        names = dict(
+            db.session.query(Player.id, Player.name).filter(Player.id.in_(list(totals))).all()
+        ) if totals else {}
+        db.session.add_all([
+            SeasonPlayerSummary(season_id=season_id, player_id=player_id, name=names.get(player_id, ""), **stats)
+            for player_id, stats in totals.items() if player_id in names
+        ])
+
+    season.status = "archived"
+    season.archived_at = season.archived_at or datetime.now()
+
+    settings = LeagueSettings.query.first()
+    if settings:
+        settings.team_registration_open = False
+
+    if purge and season.purged_at is None:
+        # Detail rows go through the ORM so contact index / cache listeners see them
+        for model in (Substitute, Reschedule, Match, Team):
+            for row in all_seasons(model.query.filter(model.season_id == season_id)):
+                db.session.delete(row)
+        season.purged_at = datetime.now()
+
+    db.session.flush()
+    return season
+
+
+def purged_player_totals():
+    """{player_id: {stat: total}} over purged seasons, whose matches no longer exist"""
+    totals = defaultdict(lambda: defaultdict(int))
+    rows = SeasonPlayerSummary.query.join(
+        Season, SeasonPlayerSummary.season_id == Season.id
+    ).filter(Season.purged_at.isnot(None)).all()
+    for row in rows:
+        for stat in ("matches_played", "wins", "losses", "draws", "points",
+                     "sets_for", "sets_against", "games_for", "games_against"):
+            totals[row.player_id][stat] += getattr(row, stat) or 0
+    return totals
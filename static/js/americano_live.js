@@ -0,0 +1,149 @@
+// Live Americano updates for the public schedule and leaderboard pages.
+// Polls /tournaments/<id>/schedule.json (a 304 unless something changed). Where
+// the server enables streams ({ stream: true }) it listens to
+// /tournaments/<id>/live (Server-Sent Events) instead, falls back to polling if
+// the stream is refused, and still re-checks the JSON now and then so pages
+// served by another worker converge.
+(function () {
+  const POLL_INTERVAL_MS = 15000;
+  const RECHECK_INTERVAL_MS = 120000;
+
+  function connect(tournamentId, handlers, stream) {
+    const jsonUrl = `/tournaments/${tournamentId}/schedule.json`;
+    let version = null;
+    let pushedSinceCheck = false;
+    let pollTimer = null;
+
+    function checkSchedule() {
+      return fetch(jsonUrl, { cache: 'no-cache', headers: { 'Accept': 'application/json' } })
+        .then(response => {
+          if (!response.ok) return;
+          const etag = response.headers.get('ETag');
+          if (etag && etag === version) return;
+          // Skip the first load and changes the stream already delivered
+          const resync = version !== null && !pushedSinceCheck;
+          version = etag;
+          pushedSinceCheck = false;
+          if (!resync || !handlers.onResync) return;
+          return response.json().then(data => handlers.onResync(data));
+        })
+        .catch(() => {});
+    }
+
+    function startPolling(interval) {
+      if (pollTimer) clearInterval(pollTimer);
+      pollTimer = setInterval(checkSchedule, interval);
+    }
+
+    checkSchedule();
+
+    if (!stream || !window.EventSource) {
+      startPolling(POLL_INTERVAL_MS);
+      return;
+    }
+
+    const source = new EventSource(`/tournaments/${tournamentId}/live`);
+    startPolling(RECHECK_INTERVAL_MS);
+
+    source.addEventListener('score', event => {
+      const data = JSON.parse(event.data);
+      if (handlers.onScore) handlers.onScore(data);
+      pushedSinceCheck = true;
+    });
+    source.addEventListener('resync', () => checkSchedule());
+    source.onerror = () => {
+      // CLOSED means the server refused the stream (e.g. 503 at capacity, 404 if disabled)
+      if (source.readyState === EventSource.CLOSED) startPolling(POLL_INTERVAL_MS);
+    };
+  }
+
+  // Schedule page: patch one match card from a [id, round, court, players, status, a, b] row
+  function patchMatchCard(row) {
+    const [matchId, , , , status, scoreA, scoreB] = row;
+    const card = document.querySelector(`.match-card[data-match-id="${matchId}"]`);
+    if (!card) return false;
+    if (card.dataset.status === status && card.dataset.score === `${scoreA}-${scoreB}`) return false;
+
+    card.dataset.status = status;
+    card.dataset.score = `${scoreA}-${scoreB}`;
+    const label = card.querySelector('.match-status');
+    const score = card.querySelector('.match-score');
+    if (status === 'completed') {
+      card.classList.remove('border-gray-200');
+      card.classList.add('border-green-200');
+      if (label) {
+        label.textContent = 'COMPLETED';
+        label.classList.remove('text-blue-600', 'text-gray-500');
+        label.classList.add('text-green-600');
+      }
+      if (score) {
+        score.textContent = `${scoreA}-${scoreB}`;
+        score.classList.remove('hidden');
+      }
+    }
+    return true;
+  }
+
+  function roundComplete(round) {
+    const cards = document.querySelectorAll(`.match-card[data-round="${round}"]`);
+    return cards.length > 0 && Array.from(cards).every(card => card.dataset.status === 'completed');
+  }
+
+  function initSchedule(tournamentId, options = {}) {
+    function applyRows(rows) {
+      const rounds = new Set();
+      rows.forEach(row => {
+        const wasComplete = roundComplete(row[1]);
+        if (patchMatchCard(row) && !wasComplete && roundComplete(row[1])) rounds.add(row[1]);
+      });
+      // A finished round moves the "current round" markers: re-render once
+      if (rounds.size) window.location.reload();
+    }
+
+    connect(tournamentId, {
+      onScore: data => applyRows([data.match]),
+      onResync: data => applyRows(data.matches),
+    }, options.stream);
+  }
+
+  // Leaderboard page: update the changed players' rows and reorder the table
+  const MEDALS = { 1: '🥇', 2: '🥈', 3: '🥉' };
+  const RANK_ROW_CLASSES = { 1: 'bg-yellow-50', 2: 'bg-gray-100', 3: 'bg-orange-50' };
+
+  function renderRank(row, rank) {
+    const cell = row.querySelector('.rank-cell');
+    if (cell) {
+      cell.innerHTML = MEDALS[rank]
+        ? `<span class="text-2xl">${MEDALS[rank]}</span>`
+        : `<span class="text-lg font-bold text-gray-600">#${rank}</span>`;
+    }
+    row.classList.remove('bg-yellow-50', 'bg-gray-100', 'bg-orange-50', 'hover:bg-gray-50');
+    row.classList.add(RANK_ROW_CLASSES[rank] || 'hover:bg-gray-50');
+  }
+
+  function initLeaderboard(tournamentId, options = {}) {
+    const body = document.getElementById('leaderboard-body');
+
+    connect(tournamentId, {
+      onScore: data => {
+        if (!body) return window.location.reload();
+        const rows = {};
+        body.querySelectorAll('tr[data-player-id]').forEach(row => { rows[row.dataset.playerId] = row; });
+        if (data.order.some(id => !rows[id])) return window.location.reload();
+
+        data.standings.forEach(([playerId, , played, , , , points]) => {
+          const row = rows[playerId];
+          row.querySelector('.matches-cell').textContent = played;
+          row.querySelector('.points-cell').textContent = points;
+        });
+        data.order.forEach((playerId, index) => {
+          body.appendChild(rows[playerId]);
+          renderRank(rows[playerId], index + 1);
+        });
+      },
+      onResync: () => window.location.reload(),
+    }, options.stream);
+  }
+
+  window.AmericanoLive = { initSchedule, initLeaderboard };
+})();
@@ -2,9 +2,12 @@ import random
 import re
 import os
 import secrets
-from datetime import datetime
+from datetime import datetime, timedelta
 from models import Team, Match, db, LadderFreeAgent, LadderTeam
-from sqlalchemy import func
+from sqlalchemy import func, case
+from sqlalchemy.orm import aliased
+import knockout_bracket
+import seasons
 
 def normalize_team_name(name: str) -> str:
     """Return a canonical form of a team name for duplicate detection.
@@ -572,6 +575,7 @@ def send_email_notification(to_email: str, subject: str, body: str) -> bool:
     """
     import smtplib
     import os
+    import app_metrics
     from email.mime.text import MIMEText
     from email.mime.multipart import MIMEMultipart
 
@@ -608,10 +612,11 @@ def send_email_notification(to_email: str, subject: str, body: str) -> bool:
         msg.attach(MIMEText(body, 'plain'))
 
         # Connect and send
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_username, smtp_password)
-            server.send_message(msg)
+        with app_metrics.email_send_timer():
+            with smtplib.SMTP(smtp_server, smtp_port) as server:
+                server.starttls()
+                server.login(smtp_username, smtp_password)
+                server.send_message(msg)
 
         print(f"[EMAIL] Successfully sent to {to_email}: {subject}")
         return True
@@ -636,16 +641,28 @@ def check_swiss_completion():
     if not settings:
         return (False, 0, 5)
 
+    # Total and finished (completed or bye) matches per Swiss round, in one query
+    round_counts = {
+        round_num: (total, finished)
+        for round_num, total, finished in db.session.query(
+            Match.round,
+            func.count(Match.id),
+            func.sum(case((Match.status.in_(["completed", "bye"]), 1), else_=0))
+        ).filter(
+            Match.phase == "swiss",
+            Match.round.between(1, settings.swiss_rounds_count)
+        ).group_by(Match.round).all()
+    }
+
     # Count how many rounds have ALL matches completed
     completed_rounds = 0
     for round_num in range(1, settings.swiss_rounds_count + 1):
-        round_matches = Match.query.filter_by(round=round_num, phase="swiss").all()
-        if not round_matches:
+        total, finished = round_counts.get(round_num, (0, 0))
+        if not total:
             break
 
         # Check if all matches in this round are completed or bye
-        all_complete = all(m.status in ("completed", "bye") for m in round_matches)
-        if all_complete:
+        if finished == total:
             completed_rounds += 1
         else:
             break
@@ -660,33 +677,15 @@ def get_team_rankings_with_tiebreaker():
     1. Points (descending)
     2. Sets differential (descending)
     3. Games differential (descending)
-    4. Head-to-head record (if 2 teams tied on all above)
+    4. Head-to-head mini-league among the teams still tied
     5. Team ID (registration order)
 
+    See league_rankings for the details.
     Returns: List of (team, rank) tuples sorted by ranking
     """
-    from models import Team
-
-    # Get all confirmed teams
-    teams = Team.query.filter_by(confirmed=True).all()
-
-    # Sort teams by: points desc, sets_diff desc, games_diff desc, id asc
-    teams_sorted = sorted(
-        teams,
-        key=lambda t: (
-            -t.points,
-            -(t.sets_for - t.sets_against),
-            -(t.games_for - t.games_against),
-            t.id
-        )
-    )
+    from league_rankings import get_team_rankings
 
-    # Add rank numbers
-    ranked_teams = []
-    for idx, team in enumerate(teams_sorted, start=1):
-        ranked_teams.append((team, idx))
-
-    return ranked_teams
+    return get_team_rankings()
 
 
 def get_head_to_head_winner(team_a_id, team_b_id):
@@ -709,9 +708,30 @@ def get_head_to_head_winner(team_a_id, team_b_id):
     return None
 
 
+def get_playoff_team_ids(settings):
+    """Qualified team IDs in seed order (approved preview, else the current Top N)"""
+    import json
+
+    if settings.qualified_team_ids:
+        return json.loads(settings.qualified_team_ids)
+    ranked_teams = get_team_rankings_with_tiebreaker()
+    return [t[0].id for t in ranked_teams[:settings.playoff_teams_count or 8]]
+
+
+def get_knockout_round_number(settings, phase, num_teams):
+    """League round number of a knockout phase: Swiss rounds + 1 for the first knockout round"""
+    size = knockout_bracket.bracket_size(num_teams)
+    depth = knockout_bracket.depth_for_phase(phase)
+    if phase == "third_place":
+        depth = 0
+    if depth is None or depth >= knockout_bracket.num_rounds(size):
+        return None
+    return settings.swiss_rounds_count + 1 + knockout_bracket.round_offset(2 ** depth, size)
+
+
 def generate_playoff_preview():
     """
-    Generate playoff preview data showing Top 8 teams and their seeding.
+    Generate playoff preview data showing the Top N teams and their seeding.
     Returns: dict with preview data for admin approval
     """
     from models import LeagueSettings
@@ -720,20 +740,18 @@ def generate_playoff_preview():
     if not settings:
         return None
 
-    # Get ranked teams
+    # Get ranked teams; the top playoff_teams_count qualify (byes pad the bracket)
     ranked_teams = get_team_rankings_with_tiebreaker()
-
-    # Get top 8 teams for playoffs
-    top_8 = ranked_teams[:8] if len(ranked_teams) >= 8 else ranked_teams[:4]
+    qualified = ranked_teams[:settings.playoff_teams_count or 8]
 
     # Build preview data
     preview = {
         'qualified_teams': [],
-        'bracket_preview': [],
+        'bracket_preview': get_bracket_preview([team for team, _ in qualified]),
         'settings': settings
     }
 
-    for team, rank in top_8:
+    for team, rank in qualified:
         preview['qualified_teams'].append({
             'team': team,
             'seed': rank,
@@ -742,223 +760,150 @@ def generate_playoff_preview():
             'games_diff': team.games_diff
         })
 
-    # Generate bracket preview (matchups) with proper bracket ordering:
-    # QF1+QF2 → SF1, QF3+QF4 → SF2, SF winners → Final
-    # This ensures seeds 1 and 2 are on opposite bracket halves
-    if len(top_8) >= 8:
-        preview['bracket_preview'] = [
-            {'match': 'QF1', 'seed_a': 1, 'seed_b': 8, 'team_a': top_8[0][0].team_name, 'team_b': top_8[7][0].team_name},
-            {'match': 'QF2', 'seed_a': 4, 'seed_b': 5, 'team_a': top_8[3][0].team_name, 'team_b': top_8[4][0].team_name},
-            {'match': 'QF3', 'seed_a': 2, 'seed_b': 7, 'team_a': top_8[1][0].team_name, 'team_b': top_8[6][0].team_name},
-            {'match': 'QF4', 'seed_a': 3, 'seed_b': 6, 'team_a': top_8[2][0].team_name, 'team_b': top_8[5][0].team_name},
-        ]
-    elif len(top_8) >= 4:
-        preview['bracket_preview'] = [
-            {'match': 'SF1', 'seed_a': 1, 'seed_b': 4, 'team_a': top_8[0][0].team_name, 'team_b': top_8[3][0].team_name},
-            {'match': 'SF2', 'seed_a': 2, 'seed_b': 3, 'team_a': top_8[1][0].team_name, 'team_b': top_8[2][0].team_name},
-        ]
-
     return preview
 
 
-def generate_playoff_bracket(round_number, phase_type):
+def get_bracket_preview(teams):
     """
-    Generate playoff matches based on phase with proper bracket positioning:
-
-    Bracket Structure (standard 8-team single elimination):
-    - QF1: Seed 1 vs Seed 8  ─┐
-                              ├─ SF1 (winner meets in Final)
-    - QF2: Seed 4 vs Seed 5  ─┘
-    - QF3: Seed 2 vs Seed 7  ─┐
-                              ├─ SF2 (winner meets in Final)
-    - QF4: Seed 3 vs Seed 6  ─┘
+    First-round matchups for teams in seed order, in bracket order: seeds 1 and 2
+    are on opposite halves and only meet in the Final if they keep winning.
+    """
+    return [
+        {
+            'match': knockout_bracket.slot_label(node),
+            'seed_a': seed_a,
+            'seed_b': seed_b,
+            'team_a': teams[seed_a - 1].team_name,
+            'team_b': teams[seed_b - 1].team_name if seed_b else 'BYE',
+        }
+        for node, seed_a, seed_b, _, _ in knockout_bracket.first_round(teams)
+    ]
 
-    This ensures Seeds 1 and 2 are on opposite bracket halves
-    and can only meet in the Final if they keep winning.
 
-    Creates Match records with phase, bracket_slot, seed_a, seed_b fields.
-    Returns: List of created matches
+def generate_playoff_bracket(round_number, phase_type):
+    """
+    Generate the matches of one knockout phase. The bracket is a binary heap
+    (see knockout_bracket): the first round pairs seeds 1vN, N/2 v N/2+1, ...
+    with byes for the top seeds when the field isn't a power of two, and each
+    later match is fed by the two matches below it.
+
+    Each phase is created in one bulk insert. Matches get phase, bracket_slot
+    and (first round) seed_a/seed_b; byes are stored as status "bye" with the
+    seeded team already through.
+    Returns: List of created matches (empty if the phase can't be generated yet)
     """
     from models import LeagueSettings
-    import json
 
     settings = LeagueSettings.query.first()
     if not settings:
         return []
 
+    team_ids = get_playoff_team_ids(settings)
+    if len(team_ids) < 2:
+        return []
+
+    size = knockout_bracket.bracket_size(len(team_ids))
+    first_depth = knockout_bracket.num_rounds(size) - 1
     matches_created = []
 
-    if phase_type == "quarterfinal":
-        # Get qualified team IDs from settings
-        if settings.qualified_team_ids:
-            team_ids = json.loads(settings.qualified_team_ids)
-        else:
-            # Fallback: get top 8 from rankings
-            ranked_teams = get_team_rankings_with_tiebreaker()
-            team_ids = [t[0].id for t in ranked_teams[:8]]
+    if phase_type == "third_place":
+        # Semi-final losers; needs both semis decided
+        semis = {
+            knockout_bracket.slot_node(m.bracket_slot): m
+            for m in Match.query.filter_by(phase="semifinal").all()
+        }
+        sf1, sf2 = semis.get(2), semis.get(3)
+        if sf1 and sf2 and sf1.winner_id and sf2.winner_id and sf1.team_b_id and sf2.team_b_id:
+            sf1_loser = sf1.team_b_id if sf1.winner_id == sf1.team_a_id else sf1.team_a_id
+            sf2_loser = sf2.team_b_id if sf2.winner_id == sf2.team_a_id else sf2.team_a_id
+            matches_created.append(Match(
+                round=round_number,
+                phase="third_place",
+                bracket_slot=knockout_bracket.THIRD_PLACE_SLOT,
+                team_a_id=sf1_loser,
+                team_b_id=sf2_loser,
+                status="scheduled",
+                notes="3rd Place Match"
+            ))
 
-        if len(team_ids) < 8:
+    else:
+        depth = knockout_bracket.depth_for_phase(phase_type)
+        if depth is None or depth > first_depth:
             return []
 
-        # Create quarterfinal matches with proper bracket ordering
-        # Format: (team_a_id, team_b_id, bracket_slot, seed_a, seed_b, notes)
-        matchups = [
-            (team_ids[0], team_ids[7], "QF1", 1, 8, "QF1: Seed 1 vs Seed 8"),
-            (team_ids[3], team_ids[4], "QF2", 4, 5, "QF2: Seed 4 vs Seed 5"),
-            (team_ids[1], team_ids[6], "QF3", 2, 7, "QF3: Seed 2 vs Seed 7"),
-            (team_ids[2], team_ids[5], "QF4", 3, 6, "QF4: Seed 3 vs Seed 6"),
-        ]
-
-        for team_a_id, team_b_id, slot, seed_a, seed_b, notes in matchups:
-            match = Match(
-                round=round_number,
-                phase="quarterfinal",
-                bracket_slot=slot,
-                seed_a=seed_a,
-                seed_b=seed_b,
-                team_a_id=team_a_id,
-                team_b_id=team_b_id,
-                status="scheduled",
-                notes=notes
-            )
-            db.session.add(match)
-            matches_created.append(match)
-
-    elif phase_type == "semifinal":
-        # Check if there were quarterfinals
-        quarters = Match.query.filter_by(phase="quarterfinal").all()
-
-        if quarters and len(quarters) == 4:
-            # Get QF matches by bracket slot for proper SF pairing
-            qf_by_slot = {qf.bracket_slot: qf for qf in quarters}
-            
-            # Verify all QF matches are complete
-            all_complete = all(qf.winner_id for qf in quarters)
-            if not all_complete:
-                return []
-            
-            # SF1: QF1 winner vs QF2 winner (top bracket half)
-            # SF2: QF3 winner vs QF4 winner (bottom bracket half)
-            qf1 = qf_by_slot.get('QF1')
-            qf2 = qf_by_slot.get('QF2')
-            qf3 = qf_by_slot.get('QF3')
-            qf4 = qf_by_slot.get('QF4')
-            
-            if qf1 and qf2 and qf3 and qf4:
-                matchups = [
-                    (qf1.winner_id, qf2.winner_id, "SF1", "SF1: Winner QF1 vs Winner QF2"),
-                    (qf3.winner_id, qf4.winner_id, "SF2", "SF2: Winner QF3 vs Winner QF4"),
-                ]
-
-                for team_a_id, team_b_id, slot, notes in matchups:
-                    match = Match(
+        if depth == first_depth:
+            for node, seed_a, seed_b, team_a_id, team_b_id in knockout_bracket.first_round(team_ids):
+                slot = knockout_bracket.slot_label(node)
+                if team_b_id is None:
+                    matches_created.append(Match(
                         round=round_number,
-                        phase="semifinal",
+                        phase=phase_type,
                         bracket_slot=slot,
+                        seed_a=seed_a,
                         team_a_id=team_a_id,
-                        team_b_id=team_b_id,
-                        status="scheduled",
-                        notes=notes
-                    )
-                    db.session.add(match)
-                    matches_created.append(match)
-        else:
-            # No quarters, use Top 4 directly for semi-finals
-            if settings.qualified_team_ids:
-                team_ids = json.loads(settings.qualified_team_ids)[:4]
-            else:
-                ranked_teams = get_team_rankings_with_tiebreaker()
-                team_ids = [t[0].id for t in ranked_teams[:4]]
-
-            if len(team_ids) >= 4:
-                matchups = [
-                    (team_ids[0], team_ids[3], "SF1", 1, 4, "SF1: Seed 1 vs Seed 4"),
-                    (team_ids[1], team_ids[2], "SF2", 2, 3, "SF2: Seed 2 vs Seed 3"),
-                ]
-
-                for team_a_id, team_b_id, slot, seed_a, seed_b, notes in matchups:
-                    match = Match(
+                        team_b_id=None,
+                        winner_id=team_a_id,
+                        status="bye",
+                        notes=f"{slot}: Seed {seed_a} - bye, advances automatically"
+                    ))
+                else:
+                    matches_created.append(Match(
                         round=round_number,
-                        phase="semifinal",
+                        phase=phase_type,
                         bracket_slot=slot,
                         seed_a=seed_a,
                         seed_b=seed_b,
                         team_a_id=team_a_id,
                         team_b_id=team_b_id,
                         status="scheduled",
-                        notes=notes
-                    )
-                    db.session.add(match)
-                    matches_created.append(match)
-
-    elif phase_type == "third_place":
-        # Get losers from semifinals by bracket slot
-        semis = Match.query.filter_by(phase="semifinal").all()
-        sf_by_slot = {sf.bracket_slot: sf for sf in semis}
-        
-        sf1 = sf_by_slot.get('SF1')
-        sf2 = sf_by_slot.get('SF2')
-        
-        if sf1 and sf2 and sf1.winner_id and sf2.winner_id:
-            # Get losers
-            sf1_loser = sf1.team_b_id if sf1.winner_id == sf1.team_a_id else sf1.team_a_id
-            sf2_loser = sf2.team_b_id if sf2.winner_id == sf2.team_a_id else sf2.team_a_id
-            
-            match = Match(
-                round=round_number,
-                phase="third_place",
-                bracket_slot="3RD",
-                team_a_id=sf1_loser,
-                team_b_id=sf2_loser,
-                status="scheduled",
-                notes="3rd Place Match"
-            )
-            db.session.add(match)
-            matches_created.append(match)
-
-    elif phase_type == "final":
-        # Get winners from semifinals by bracket slot
-        semis = Match.query.filter_by(phase="semifinal").all()
-        sf_by_slot = {sf.bracket_slot: sf for sf in semis}
-        
-        sf1 = sf_by_slot.get('SF1')
-        sf2 = sf_by_slot.get('SF2')
-        
-        if sf1 and sf2 and sf1.winner_id and sf2.winner_id:
-            match = Match(
-                round=round_number,
-                phase="final",
-                bracket_slot="FINAL",
-                team_a_id=sf1.winner_id,
-                team_b_id=sf2.winner_id,
-                status="scheduled",
-                notes="CHAMPIONSHIP FINAL"
-            )
-            db.session.add(match)
-            matches_created.append(match)
-
+                        notes=f"{slot}: Seed {seed_a} vs Seed {seed_b}"
+                    ))
+        else:
+            # Every feeder match (the phase below) must be decided
+            feeders = {
+                knockout_bracket.slot_node(m.bracket_slot): m
+                for m in Match.query.filter_by(phase=knockout_bracket.phase_for_depth(depth + 1)).all()
+            }
+            for node in knockout_bracket.level_nodes(depth):
+                feeder_a, feeder_b = feeders.get(2 * node), feeders.get(2 * node + 1)
+                if not (feeder_a and feeder_b and feeder_a.winner_id and feeder_b.winner_id):
+                    return []
+                slot = knockout_bracket.slot_label(node)
+                notes = f"{slot}: Winner {feeder_a.bracket_slot} vs Winner {feeder_b.bracket_slot}"
+                matches_created.append(Match(
+                    round=round_number,
+                    phase=phase_type,
+                    bracket_slot=slot,
+                    team_a_id=feeder_a.winner_id,
+                    team_b_id=feeder_b.winner_id,
+                    status="scheduled",
+                    notes="CHAMPIONSHIP FINAL" if node == knockout_bracket.FINAL_NODE else notes
+                ))
+
+    db.session.add_all(matches_created)
     db.session.commit()
     return matches_created
 
 
-def get_playoff_bracket_data():
+def load_knockout_bracket(settings=None):
     """
-    Return structured playoff bracket data for template rendering:
-    {
-        'quarterfinals': [match objects],
-        'semifinals': [match objects],
-        'third_place': match object,
-        'final': match object
-    }
+    The stored knockout matches as a heap array (see knockout_bracket.build_bracket)
+    plus the 3rd place match, in one query. Returns (None, None) before playoffs.
     """
-    bracket_data = {
-        'quarterfinals': Match.query.filter_by(phase="quarterfinal").order_by(Match.id).all(),
-        'semifinals': Match.query.filter_by(phase="semifinal").order_by(Match.id).all(),
-        'third_place': Match.query.filter_by(phase="third_place").first(),
-        'final': Match.query.filter_by(phase="final").first()
-    }
+    import json
+
+    matches = Match.query.filter(Match.bracket_slot.isnot(None)).order_by(Match.id).all()
+    if not matches:
+        return None, None
 
-    return bracket_data
+    num_teams = 0
+    if settings and settings.qualified_team_ids:
+        num_teams = len(json.loads(settings.qualified_team_ids))
+    third_place = next(
+        (m for m in matches if m.bracket_slot == knockout_bracket.THIRD_PLACE_SLOT), None
+    )
+    size = knockout_bracket.size_for_matches(matches, num_teams)
+    return knockout_bracket.build_bracket(size, matches), third_place
 
 
 # Function to get pending reschedules - assumed to exist elsewhere or needs definition
@@ -1000,6 +945,162 @@ def check_reschedule_conflicts(proposed_matches):
     return conflicts
 
 
+# ============================================================================
+# ROUND DEADLINE FUNCTIONS
+# ============================================================================
+
+def get_round_start_date(round_number):
+    """
+    Calculate the Monday start date for a given round number
+    Round 1 starts on the current season's start date
+    (November 17, 2025 before seasons existed)
+    """
+    if not round_number:
+        return None
+    season = seasons.get_current_season()
+    round_1_start = season.start_date if season else datetime(2025, 11, 17).date()
+    round_start = round_1_start + timedelta(weeks=round_number - 1)
+    return round_start
+
+
+def get_round_date_range(match):
+    """Calculate the date range for a given match, using round_deadline if available"""
+    if not match or not match.round:
+        return None
+
+    from datetime import datetime, timedelta
+
+    if match.round_deadline:
+        # Range is from today (or round start if deadline is far) to deadline
+        # The user wants round generation date to deadline
+        # Since we don't store generation date explicitly on match, we use 
+        # (deadline - 13 days) to allow a ~2 week window if it was set on Jan 4th for Jan 17th
+        round_end = match.round_deadline
+        round_start = round_end - timedelta(days=13) 
+    else:
+        # Fallback to the weekly schedule from the season's Round 1 Monday
+        round_start = datetime.combine(get_round_start_date(match.round), datetime.min.time())
+        round_end = round_start + timedelta(days=6)
+
+    # Format dates
+    start_str = round_start.strftime("%b %d")
+    end_str = round_end.strftime("%b %d")
+
+    return f"{start_str} - {end_str}"
+
+
+def get_max_reschedules_per_round():
+    """Calculate maximum allowed reschedules per round based on tournament size"""
+    total_teams = Team.query.count()
+    if total_teams <= 12:
+        return max(2, total_teams // 4)  # 25% minimum 2
+    elif total_teams <= 20:
+        return max(3, total_teams // 3)  # 30% minimum 3
+    else:
+        return max(4, total_teams // 3)  # 35% minimum 4
+
+
+def get_round_deadline(match):
+    """
+    Regular deadline for a match: 23:59 on match.round_deadline if set,
+    otherwise the legacy Sunday of the round week.
+    Returns None if the deadline can't be determined.
+    """
+    if not match.round:
+        return None
+
+    if match.round_deadline:
+        return datetime.combine(match.round_deadline.date(), datetime.max.time())
+
+    round_start_date = get_round_start_date(match.round)
+    if not round_start_date:
+        return None
+    sunday_of_week = round_start_date + timedelta(days=6)
+    return datetime.combine(sunday_of_week, datetime.max.time())
+
+
+def get_makeup_deadline(match, reschedule):
+    """
+    Makeup deadline for a rescheduled match: round_deadline + 3 days if set,
+    otherwise the legacy Wednesday of the proposed week (proposal must fall Mon-Wed).
+    Returns None if the deadline can't be determined.
+    """
+    if match.round_deadline:
+        return datetime.combine(
+            match.round_deadline.date() + timedelta(days=3),
+            datetime.max.time()
+        )
+
+    if not reschedule.proposed_time or " at " not in reschedule.proposed_time:
+        return None
+
+    date_str = reschedule.proposed_time.split(" at ")[0]
+    try:
+        proposed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+    proposed_weekday = proposed_date.weekday()
+    if proposed_weekday not in (0, 1, 2):  # Mon, Tue, Wed
+        return None
+
+    wednesday_of_week = proposed_date + timedelta(days=2 - proposed_weekday)
+    return datetime.combine(wednesday_of_week, datetime.max.time())
+
+
+def query_open_matches_with_teams(statuses):
+    """
+    Single query for deadline sweeps: matches in the given statuses that have a round,
+    no pending reschedule (anti-join) and both teams present.
+    Returns a list of (match, team_a, team_b) rows.
+    """
+    from models import Reschedule
+
+    team_a = aliased(Team)
+    team_b = aliased(Team)
+    pending_reschedule = db.session.query(Reschedule.id).filter(
+        Reschedule.match_id == Match.id,
+        Reschedule.status == "pending"
+    ).exists()
+
+    return db.session.query(Match, team_a, team_b).join(
+        team_a, team_a.id == Match.team_a_id
+    ).join(
+        team_b, team_b.id == Match.team_b_id
+    ).filter(
+        Match.status.in_(statuses),
+        Match.round.isnot(None),
+        ~pending_reschedule
+    ).order_by(Match.id).all()
+
+
+def query_reschedules_with_teams(status):
+    """
+    Single query for makeup deadline sweeps: reschedules in the given status joined to
+    their match, the requesting team and the opponent team.
+    Returns a list of (reschedule, match, requester_team, opponent_team) rows.
+    """
+    from models import Reschedule
+
+    requester_team = aliased(Team)
+    opponent_team = aliased(Team)
+    opponent_id = case(
+        (Match.team_a_id == Reschedule.requester_team_id, Match.team_b_id),
+        else_=Match.team_a_id
+    )
+
+    return db.session.query(Reschedule, Match, requester_team, opponent_team).join(
+        Match, Match.id == Reschedule.match_id
+    ).join(
+        requester_team, requester_team.id == Reschedule.requester_team_id
+    ).join(
+        opponent_team, opponent_team.id == opponent_id
+    ).filter(
+        Reschedule.status == status,
+        Match.status.notin_(["completed", "walkover"])
+    ).order_by(Reschedule.id).all()
+
+
 # ============================================================================
 # LADDER UTILITY FUNCTIONS
 # ============================================================================
@@ -1310,100 +1411,28 @@ def adjust_ladder_ranks(team, new_rank, ladder_type):
     }
 
 
-def generate_americano_pairings(player_ids):
+def generate_americano_pairings(player_ids, seed=None):
     """
     Generate Americano tournament pairings where:
     - Each player plays multiple rounds
-    - Partners rotate each round
-    - Opponents change each round
-    - Maximum variety in matchups
-    
+    - Partners rotate each round (no repeats for 4k / 4k+1 players)
+    - Opponents are spread as evenly as possible
+    - Sit-outs are shared fairly when the count isn't a multiple of 4
+
     Args:
         player_ids: List of player IDs (LadderFreeAgent IDs)
-    
+        seed: Optional seed for a reproducible schedule (e.g. tournament ID)
+
     Returns:
         List of rounds, where each round contains matches
         Each match is a tuple: (player1_id, player2_id, player3_id, player4_id)
         Team A = player1 + player2, Team B = player3 + player4
-    
-    Algorithm for 8 players (standard Americano):
-    - 7 rounds total
-    - Each round has 4 players (2v2)
-    - Each player sits out once (when n is divisible by 4, no one sits)
-    - Maximizes partner and opponent variety
-    """
-    import itertools
-    from collections import defaultdict
-    
-    num_players = len(player_ids)
-    
-    if num_players < 4:
-        return []
-    
-    # Track partnerships and oppositions to maximize variety
-    partnerships = defaultdict(int)
-    oppositions = defaultdict(int)
-    
-    def get_partnership_key(p1, p2):
-        return tuple(sorted([p1, p2]))
-    
-    def get_opposition_key(p1, p2, p3, p4):
-        team_a = tuple(sorted([p1, p2]))
-        team_b = tuple(sorted([p3, p4]))
-        return (team_a, team_b) if team_a < team_b else (team_b, team_a)
-    
-    # Calculate number of rounds (each player plays n-1 rounds if even, n rounds if odd)
-    if num_players % 2 == 0:
-        num_rounds = num_players - 1
-    else:
-        num_rounds = num_players
-    
-    rounds = []
-    player_list = player_ids.copy()
-    
-    # Use round-robin tournament algorithm (for doubles)
-    # For 8 players: rounds 1-7, each player plays 7 matches
-    
-    for round_num in range(num_rounds):
-        round_matches = []
-        players_in_round = []
-        
-        # For round-robin, we rotate players but keep one fixed
-        if round_num == 0:
-            # Initial setup
-            players_in_round = player_list.copy()
-        else:
-            # Rotate all players except the first one
-            fixed = player_list[0]
-            rotating = player_list[1:]
-            # Rotate right
-            rotating = [rotating[-1]] + rotating[:-1]
-            players_in_round = [fixed] + rotating
-            player_list = players_in_round.copy()
-        
-        # Create matches for this round
-        # Pair players: (0,1) vs (2,3), (4,5) vs (6,7), etc.
-        num_matches = num_players // 4
-        
-        for i in range(num_matches):
-            idx_start = i * 4
-            if idx_start + 3 < len(players_in_round):
-                p1 = players_in_round[idx_start]
-                p2 = players_in_round[idx_start + 1]
-                p3 = players_in_round[idx_start + 2]
-                p4 = players_in_round[idx_start + 3]
-                
-                match = (p1, p2, p3, p4)
-                round_matches.append(match)
-                
-                # Track partnerships and oppositions
-                partnerships[get_partnership_key(p1, p2)] += 1
-                partnerships[get_partnership_key(p3, p4)] += 1
-                oppositions[get_opposition_key(p1, p2, p3, p4)] += 1
 
-        rounds.append(round_matches)
+    Rounds: n-1 for an even field, n for an odd one (see americano_scheduler.py).
+    """
+    from americano_scheduler import build_americano_schedule
 
-    return rounds
+    return build_americano_schedule(player_ids, seed=seed)
 
 
 # ============================================================================
@@ -1416,144 +1445,26 @@ def find_existing_player_by_email(email):
     Returns: (source_type, source_id, player_data) or (None, None, None)
 
     player_data contains: {'name': ..., 'phone': ..., 'email': ..., 'gender': ...}
+    Single indexed probe on the player directory (see contact_index.py).
     """
+    from contact_index import find_existing_player
+
     if not email:
         return None, None, None
-
-    email_lower = email.lower().strip()
-
-    # Check LadderFreeAgent
-    free_agent = LadderFreeAgent.query.filter(
-        db.func.lower(LadderFreeAgent.email) == email_lower
-    ).first()
-    if free_agent:
-        return 'free_agent', free_agent.id, {
-            'name': free_agent.name,
-            'phone': free_agent.phone,
-            'email': free_agent.email,
-            'gender': free_agent.gender
-        }
-
-    # Check LadderTeam (player1 or player2)
-    ladder_team = LadderTeam.query.filter(
-        db.or_(
-            db.func.lower(LadderTeam.player1_email) == email_lower,
-            db.func.lower(LadderTeam.player2_email) == email_lower
-        )
-    ).first()
-    if ladder_team:
-        if ladder_team.player1_email and ladder_team.player1_email.lower() == email_lower:
-            return 'ladder_team', ladder_team.id, {
-                'name': ladder_team.player1_name,
-                'phone': ladder_team.player1_phone,
-                'email': ladder_team.player1_email,
-                'gender': ladder_team.gender
-            }
-        else:
-            return 'ladder_team', ladder_team.id, {
-                'name': ladder_team.player2_name,
-                'phone': ladder_team.player2_phone,
-                'email': ladder_team.player2_email,
-                'gender': ladder_team.gender
-            }
-
-    # Check league Team (player1 or player2)
-    league_team = Team.query.filter(
-        db.or_(
-            db.func.lower(Team.player1_email) == email_lower,
-            db.func.lower(Team.player2_email) == email_lower
-        )
-    ).first()
-    if league_team:
-        if league_team.player1_email and league_team.player1_email.lower() == email_lower:
-            return 'league_team', league_team.id, {
-                'name': league_team.player1_name,
-                'phone': league_team.player1_phone,
-                'email': league_team.player1_email,
-                'gender': None  # League teams don't have gender
-            }
-        else:
-            return 'league_team', league_team.id, {
-                'name': league_team.player2_name,
-                'phone': league_team.player2_phone,
-                'email': league_team.player2_email,
-                'gender': None
-            }
-
-    return None, None, None
+    return find_existing_player(email=email)
 
 
 def find_existing_player_by_phone(phone):
     """
     Fallback lookup by phone if email not found.
     Returns: (source_type, source_id, player_data) or (None, None, None)
+    Single indexed probe on the player directory (see contact_index.py).
     """
-    if not phone:
-        return None, None, None
+    from contact_index import find_existing_player
 
-    normalized = normalize_phone_number(phone)
-    if not normalized:
+    if not phone:
         return None, None, None
-
-    # Check LadderFreeAgent
-    free_agent = LadderFreeAgent.query.filter(
-        LadderFreeAgent.phone == normalized
-    ).first()
-    if free_agent:
-        return 'free_agent', free_agent.id, {
-            'name': free_agent.name,
-            'phone': free_agent.phone,
-            'email': free_agent.email,
-            'gender': free_agent.gender
-        }
-
-    # Check LadderTeam (player1 or player2)
-    ladder_team = LadderTeam.query.filter(
-        db.or_(
-            LadderTeam.player1_phone == normalized,
-            LadderTeam.player2_phone == normalized
-        )
-    ).first()
-    if ladder_team:
-        if ladder_team.player1_phone == normalized:
-            return 'ladder_team', ladder_team.id, {
-                'name': ladder_team.player1_name,
-                'phone': ladder_team.player1_phone,
-                'email': ladder_team.player1_email,
-                'gender': ladder_team.gender
-            }
-        else:
-            return 'ladder_team', ladder_team.id, {
-                'name': ladder_team.player2_name,
-                'phone': ladder_team.player2_phone,
-                'email': ladder_team.player2_email,
-                'gender': ladder_team.gender
-            }
-
-    # Check league Team (player1 or player2)
-    league_team = Team.query.filter(
-        db.or_(
-            Team.player1_phone == normalized,
-            Team.player2_phone == normalized
-        )
-    ).first()
-    if league_team:
-        if league_team.player1_phone == normalized:
-            return 'league_team', league_team.id, {
-                'name': league_team.player1_name,
-                'phone': league_team.player1_phone,
-                'email': league_team.player1_email,
-                'gender': None
-            }
-        else:
-            return 'league_team', league_team.id, {
-                'name': league_team.player2_name,
-                'phone': league_team.player2_phone,
-                'email': league_team.player2_email,
-                'gender': None
-            }
-
-    return None, None, None
+    return find_existing_player(phone=phone)
 
 
 def ensure_ladder_free_agent(registration):
@@ -1567,12 +1478,12 @@ def ensure_ladder_free_agent(registration):
     Returns:
         LadderFreeAgent object (existing or newly created)
     """
+    from contact_index import find_owner_by_phone
+
     normalized_phone = normalize_phone_number(registration.phone)
 
-    # Check if a LadderFreeAgent already exists with this phone
-    existing = LadderFreeAgent.query.filter(
-        LadderFreeAgent.phone == normalized_phone
-    ).first()
+    # Check if a LadderFreeAgent already exists with this phone (indexed lookup)
+    existing = find_owner_by_phone(normalized_phone, "ladder_free_agent")
 
     if existing:
         # Link registration to existing free agent